@@ -1,45 +1,75 @@
 from __future__ import annotations
 
 import importlib
-from io import BytesIO
+import os
+from types import ModuleType
+from typing import Optional
 
 import streamlit as st
-from PIL import Image
 from dotenv import load_dotenv
 from assets import image_data
 from style.styles import apply_styles
 from components.header import render_header
-from pages import home, sequencing, database, contact_us
+from components.profiler import profile_rerun
+from services.metrics import start_metrics_exporters
+from services.tracing import configure_logging
 
 load_dotenv()
+configure_logging()
+start_metrics_exporters()
 
-home = importlib.reload(home)
-sequencing = importlib.reload(sequencing)
-database = importlib.reload(database)
-contact_us = importlib.reload(contact_us)
+# Imported on first visit, so a session only pays for the pages it opens.
+PAGE_MODULES = {
+    "Home": "pages.home",
+    "Sequencing": "pages.sequencing",
+    "Database": "pages.database",
+    "Contact Us": "pages.contact_us",
+    "Performance": "pages.performance",
+}
 
-FAVICON_IMAGE = Image.open(BytesIO(image_data.favicon_png_bytes()))
 
-st.set_page_config(
-    page_title="Sormanni Sequencing", page_icon=FAVICON_IMAGE, layout="wide"
-)
+def _dev_mode() -> bool:
+    """Hot-reload pages on every rerun: ``SEQUENCE_DEV_MODE=1`` or ``runOnSave``."""
 
-if "active_page" not in st.session_state:
-    st.session_state.active_page = "Home"
+    flag = os.environ.get("SEQUENCE_DEV_MODE", "").strip().lower()
+    return flag in {"1", "true", "yes"} or bool(st.get_option("server.runOnSave"))
 
-query_params = st.query_params
-if "page" in query_params:
-    st.session_state.active_page = query_params["page"]
 
-apply_styles()
+def _load_page(name: str) -> Optional[ModuleType]:
+    module_name = PAGE_MODULES.get(name)
+    if module_name is None:
+        return None
+    module = importlib.import_module(module_name)
+    if _dev_mode():
+        module = importlib.reload(module)
+    return module
 
-render_header()
 
-if st.session_state.active_page == "Home":
-    home.render()
-elif st.session_state.active_page == "Sequencing":
-    sequencing.render()
-elif st.session_state.active_page == "Database":
-    database.render()
-elif st.session_state.active_page == "Contact Us":
-    contact_us.render()
+with profile_rerun() as profiler:
+    with profiler.phase("page_config"):
+        st.set_page_config(
+            page_title="Sormanni Sequencing",
+            page_icon=image_data.favicon_png_bytes(),
+            layout="wide",
+        )
+
+    if "active_page" not in st.session_state:
+        st.session_state.active_page = "Home"
+
+    query_params = st.query_params
+    if "page" in query_params:
+        st.session_state.active_page = query_params["page"]
+    profiler.page = st.session_state.active_page
+
+    with profiler.phase("load_page"):
+        page = _load_page(st.session_state.active_page)
+
+    with profiler.phase("styles"):
+        apply_styles()
+
+    with profiler.phase("header"):
+        render_header()
+
+    if page is not None:
+        with profiler.phase(f"page:{st.session_state.active_page}"):
+            page.render()
@@ -1,2617 +1,65 @@
-"""Embedded binary assets represented in base64."""
+"""Binary image assets, served from ``static/`` and memory-mapped on first use.
 
+The PNGs live in ``static/`` next to ``app.py``. With
+``server.enableStaticServing`` Streamlit serves that directory at
+``app/static/<name>``, so the UI references images by URL
+(:func:`static_url`) and the browser caches them, instead of receiving them as
+base64 inside every rerun's HTML. Python code that needs the raw bytes gets a
+read-only memory map of the file, opened the first time it is asked for.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
 from functools import lru_cache
-import base64
+from pathlib import Path
 
-FAVICON_PNG_BASE64 = (
-    "iVBORw0KGgoAAAANSUhEUgAAACAAAAAcCAMAAAA3HE0QAAAAKlBMVEVHcEwVYIIVYIIVYIIVYIIV"
-    "YIIVYIIVYIIVYIIVYIIVYIIVYIIVYIIVYIKvHSn3AAAADXRSTlMA1ODySL+AGSyrZZcKSb/1ZAAA"
-    "ALdJREFUKJHtU8sOgzAMSxv6Avz/v7u4D1rYdt1plhBN7UR2BCKGGOQDwjFOBSjv/AG0vpQygP3J"
-    "73aZUxbZAD7Y7nxrUrt2gJNoZVr50y4Ocl4EdBAAXQVKA+YCp3mwVxTPQRcc9dUFq+YASxS2Vhfd"
-    "WHXQBs0A56zrIpYoIwCW9Xna7VHSEmBiREEPUFqAieZAKbgFmKADzqXAU/nYrEVxMgUS4pMf++mC"
-    "L/gLfiYIap+26u1HfAEjMAt3vAUIqgAAAABJRU5ErkJggg=="
-)
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_URL_PREFIX = "app/static"
+FAVICON_PNG = "favicon.png"
+SORMANNI_LOGO_PNG = "sormanni_logo.png"
+_LFS_POINTER_PREFIX = b"version https://git-lfs.github.com/spec/"
 
-SORMANNI_LOGO_PNG_BASE64 = (
-    "iVBORw0KGgoAAAANSUhEUgAAC18AAAMACAYAAABhXTwOAAAAAXNSR0IArs4c6QAAAKJlWElmTU0A"
-    "KgAAAAgABgESAAMAAAABAAEAAAEaAAUAAAABAAAAVgEbAAUAAAABAAAAXgEoAAMAAAABAAIAAAEx"
-    "AAIAAAARAAAAZodpAAQAAAABAAAAeAAAAAAAAAXdAAAAAQAABd0AAAABd3d3Lmlua3NjYXBlLm9y"
-    "ZwAAAAOgAQADAAAAAQABAACgAgAEAAAAAQAAC1+gAwAEAAAAAQAAAwAAAAAArDBQXwAAAAlwSFlz"
-    "AADm1gAA5tYBNH+0MAAAActpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1s"
-    "bnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDYuMC4wIj4KICAgPHJkZjpS"
-    "REYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMj"
-    "Ij4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6"
-    "dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iCiAgICAgICAgICAgIHhtbG5zOnht"
-    "cD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0"
-    "aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgICAgIDx4bXA6Q3JlYXRvclRvb2w+d3d3Lmlu"
-    "a3NjYXBlLm9yZzwveG1wOkNyZWF0b3JUb29sPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAg"
-    "PC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4K56DsKAAAQABJREFUeAHs3Ql8FPX9//GZ2Vzch2B2NwFR"
-    "CSDY2latVXt4VP1Va/v7/SoBPAEV6gEkeLW//mxj/22ttQp4Fo8kIJpkbbXXz/bnr5a2tv21Sn9q"
-    "W+RIrIiQwwsQAUOy8/2/B9SCBsgxszu7+5rHYyHZmfl8P9/nbGZ3Zz7zHdtiQgABBBBAAAEEEEAA"
-    "AQQQQAABBBDwVcAYY9fUv3C84yTPMZZ9pGWs8WpglB62bVmd+n+zHs/q1yddx/rt+ufHPllVZbt6"
-    "jgkBBBBAAIGUCCx5ZNVBVkf+h11jRhjb7W+73luUeaHT5K+99NzD2lKSBI0ggAACCCCAAAIIIIAA"
-    "AggggAACCCCAAAIZKKCDqUwIIIAAAggggAACCCCAAAIIIIAAAn4IJBIv93vLbK+wjX2x4h3eg5ir"
-    "jWVueWuw88DcM8vae7AeiyKAAAIIINBtgfvr1xzlWNYsXfzzGa00UY99nSN4VZcLJRzbevDCyWP/"
-    "ZNu26XYjLIgAAggggAACCCCAAAIIIIAAAggggAACCGS5wL4OrGZ5t+keAggggAACCCCAAAIIIIAA"
-    "Aggg4K9ATcOaMy1j366oh/U2ssYc3WC5Zvr0aeOf6G0M1kMAAQQQQOD9AjV1jSdZtvmqnj/9/fMO"
-    "9Luqrlc5ll0xfWrZ4wdalvkIIIAAAggggAACCCCAAAIIIIAAAggggEAuCFB8nQtbmT4igAACCCCA"
-    "AAIIIIAAAggggEBgAomEiWxLNt2torZLfWrEtSzzvZ1btn599uxjOnyKSRgEEEAAgRwUqKl5scjq"
-    "1/E9df1KPfp0PsAYk8jvTFZccMHElhykpMsIIIAAAggggAACCCCAAAIIIIAAAggggMB7An062Ppe"
-    "FH5AAAEEEEAAAQQQQAABBBBAAAEEclDgtscaCwdvNcuMsc7xu/vGtn66/uCNX6o6+eROv2MTDwEE"
-    "EEAg+wVq6xsPN5b5kXp6lF+99e7Q4Bjr9AunjlvlV0ziIIAAAggggAACCCCAAAIIIIAAAggggAAC"
-    "mSbgZFrC5IsAAggggAACCCCAAAIIIIAAAgiEQcAb8XrQm+anQRRee/2zjfWFQ9riP9BIo1w8H4YN"
-    "Tg4IIIBABgncX7c6rsLrXyll3wqvve7rPa80aVm/X5JoPD6DOEgVAQQQQAABBBBAAAEEEEAAAQQQ"
-    "QAABBBDwVYDia185CYYAAggggAACCCCAAAIIIIAAArki8JZp/Kr6enqw/bUvrk003hBsG0RHAAEE"
-    "EMgmgQcffGlYxHb+W30aE1C/hruueey+B58/JKD4hEUAAQQQQAABBBBAAAEEEEAAAQQQQAABBEIt"
-    "QPF1qDcPySGAAAIIIIAAAggggAACCCCAQBgFliTWfFwjU389JbkZ62s1DzX9S0raohEEEEAAgYwW"
-    "qKoyzs689gZjWUcG3JGhkUjkoarly/MCbofwCCCAAAIIIIAAAggggAACCCCAAAIIIIBA6AQovg7d"
-    "JiEhBBBAAAEEEEAAAQQQQAABBBAIu4Dr2ouVY36K8nQsx11677LG0hS1RzMIIIAAAhkqcMj4xq9Z"
-    "xjotNenbJ4xpK/2P1LRFKwgggAACCCCAAAIIIIAAAggggAACCCCAQHgE7PCkQiYIIIAAAggggAAC"
-    "CCCAAAIIIIBA+AVqHlp7muVYj6ch0z/t3PLmp2fPPqYjDW3TJAIIIIBAyAWqE42fsV3zhNKMpDDV"
-    "rVZh/ugZ/3bo5hS2SVMIIIAAAggggAACCCCAAAIIIIAAAggggEBaBRj5Oq38NI4AAggggAACCCCA"
-    "AAIIIIAAAhkn4FhXpynnTxQMGfTNNLVNswgggAACIRZYurTpYBVeP6QUU1l47YkMsnd2zAoxDakh"
-    "gAACCCCAAAIIIIAAAggggAACCCCAAAK+C1B87TspARFAAAEEEEAAAQQQQAABBBBAIFsFFideGKK+"
-    "nZq+/tnX1dY1fiF97dMyAggggEDYBKqqjJMscL3C63g6cjPGmuvlkI62aRMBBBBAAAEEEEAAAQQQ"
-    "QAABBBBAAAEEEEiHAAdE06FOmwgggAACCCCAAAIIIIAAAgggkJECBabzRCWe6lFF97SyLdvcX13X"
-    "NGrPJ/kZAQQQQCB3BQ45oul69T6NFwZZJYdMXD0pd7cAPUcAAQQQQAABBBBAAAEEEEAAAQQQQACB"
-    "XBOg+DrXtjj9RQABBBBAAAEEEEAAAQQQQACB3gsY61O9X9mfNY1ljbBt9+HFi1fk+xORKAgggAAC"
-    "mSpQU9d4kmWMV3yd1slOOp9OawI0jgACCCCAAAIIIIAAAggggAACCCCAAAIIpFCA4usUYtMUAggg"
-    "gAACCCCAAAIIIIAAAghkuoB9eEh6cFz+kMHfCkkupIEAAgggkAaBmsSLUct269R0Ou/IsKvnxraP"
-    "TwMBTSKAAAIIIIAAAggggAACCCCAAAIIIIAAAmkRoPg6Lew0igACCCCAAAIIIIAAAggggAACGSow"
-    "ICx525Z1TW3d2rPCkg95IIAAAgikTiCRMBHLdD5oWXY0da3uuyVj2cP3PZc5CCCAAAIIIIAAAggg"
-    "gAACCCCAAAIIIIBAdglQfJ1d25PeIIAAAggggAACCCCAAAIIIIBAsAIDgw3fo+i2sawlSxMvjO7R"
-    "WiyMAAIIIJDxAm+5a79uGXNKWDpiWyY0FyeFxYQ8EEAAAQQQQAABBBBAAAEEEEAAAQQQQCB7BSi+"
-    "zt5tS88QQAABBBBAAAEEEEAAAQQQQMBnAY02/abPIfsWzrYO6kwm6xcvXpHft0CsjQACCCCQKQLV"
-    "DWs/a1v2f4Ys334hy4d0EEAAAQQQQAABBBBAAAEEEEAAAQQQQACBwAQovg6MlsAIIIAAAggggAAC"
-    "CCCAAAIIIJB1ArZpDFufbNs6vnDo4O+ELS/yQQABBBDwX+CBB56P6bYHyxQ5VMf2jW21+N9bIiKA"
-    "AAIIIIAAAggggAACCCCAAAIIIIAAAuEUCNUB2nASkRUCCCCAAAIIIIAAAggggAACCCCwW8A1TuiK"
-    "r73MjLGuqmlY869sJwQQQACB7BVIJEykMz/vIfWwOGy91ImGtWHLiXwQQAABBBBAAAEEEEAAAQQQ"
-    "QAABBBBAAIGgBCi+DkqWuAgggAACCCCAAAIIIIAAAgggkHUCETf5h5B2yraMff99Dz5/SEjzIy0E"
-    "EEAAgT4KbE82VinESX0ME8jqrjFrAglMUAQQQAABBBBAAAEEEEAAAQQQQAABBBBAIIQCFF+HcKOQ"
-    "EgIIIIAAAggggAACCCCAAAIIhFPgonMn/NWy7L+FMztreMTJSyQSKwtCmh9pIYAAAgj0UqC2vvF0"
-    "Y1v/0cvVg14taYx5LOhGiI8AAggggAACCCCAAAIIIIAAAggggAACCIRFgOLrsGwJ8kAAAQQQQAAB"
-    "BBBAAAEEEEAAgcwQMNaDoU3Utj6+zS24MbT5kRgCCCCAQI8F7n3oH8XGcpdoxXAez7etX188bUJz"
-    "jzvGCggggAACCCCAAAIIIIAAAggggAACCCCAQIYKhPNgbYZikjYCCCCAAAIIIIAAAggggAACCGS/"
-    "QKTDrlEvt4S3p6ayur7xi+HNj8wQQAABBLorULV8eV6e3dmguy5Eu7tOqpezjVmW6jZpDwEEEEAA"
-    "AQQQQAABBBBAAAEEEEAAAQQQSKcAxdfp1KdtBBBAAAEEEEAAAQQQQAABBBDIOIELLxz7ipK+PsSJ"
-    "27ZlapcmVh8a4hxJDQEEEECgGwKHvFJ6g2Vbn+nGoula5Pn2LVvr0tU47SKAAAIIIIAAAggggAAC"
-    "CCCAAAIIIIAAAukQoPg6Heq0iQACCCCAAAIIIIAAAggggAACGS3w0uqyOy1jPRXiTgxNuk5DIrGy"
-    "IMQ5khoCCCCAwH4Eqh9afYplzHX7WSTtsxzbuXL27GM60p4ICSCAAAIIIIAAAggggAACCCCAAAII"
-    "IIAAAikUoPg6hdg0hQACCCCAAAIIIIAAAggggAAC2SFQVWW7trFnqjfbQ9yjY7ebvO+GOD9SQwAB"
-    "BBDYh8CSxJoS23HqNTuyj0XS/rSx7KUXTRm7PO2JkAACCCCAAAIIIIAAAggggAACCCCAAAIIIJBi"
-    "AYqvUwxOcwgggAACCCCAAAIIIIAAAgggkB0C088tW2nZ9pww98YYu6Kmfu2/hzlHckMAAQQQ2Fug"
-    "avnyPNe16/TsyL3nhOc327KaOhxnbngyIhMEEEAAAQQQQAABBBBAAAEEEEAAAQQQQCB1AhRfp86a"
-    "lhBAAAEEEEAAAQQQQAABBBBAIMsEZkwpq7aMtSTE3VJ9nHX/0sTqQ0OcI6khgAACCOwhcEhb/P/p"
-    "10/t8VTYfmx3LXvK7PLDt4QtMfJBAAEEEEAAAQQQQAABBBBAAAEEEEAAAQRSIeCdgGNCAAEEEEAA"
-    "AQQQQAABBBBAAAEEMlYgkTCRt5IvxI3VmXSKCrfP+LdDN6eyM0uXPjcgWdDvKbU5MZXt9rCtp7cO"
-    "tj8198yy9h6ux+IIIIAAAikUWFK/5nMqbP65mgztwCnGsr48c+q4xSlkoSkEEEAAAQQQQAABBBBA"
-    "AAEEEEAAAQQQQCBUAhRfh2pzkAwCCCCAAAIIIIAAAggggAACCBxIYPHiFfn5QwafoYMaU7XsR/QY"
-    "q0fhHuvt0M9/Npb5nZb5+Yyp45/eY14gP96fWD3ecR2vnUGBNOBP0EUzpo6r8CcUURBAAAEE/Ba4"
-    "d1ljaX6eeUbFzSP8ju1XPGNMYua08VP8ikccBBBAAAEEEEAAAQQQQAABBBBAAAEEEEAgEwUovs7E"
-    "rUbOCCCAAAIIIIAAAggggAACCOSgQE3Ni0VWUcc1lm3NUfdH9oDgd7axvnfR1LLHbFs/BTRVN6yd"
-    "pugPBRTel7C2bZ0zfcq4H/kSjCAIIIAAAr4JVC1fnjemtWS5sa1P+hbU50A6mdCU12kfff75ZW/6"
-    "HHpXuJrEi1HL7fyUsc0nLWOX2ZbppxmDjGW/4tjuaj23uqPTfuzS88s2BNE+MRFAAAEEEEAAAQQQ"
-    "QAABBBBAAAEEEEAAge4KUHzdXSmWQwABBBBAAAEEEEAAAQQQQACBtAnU1jeeblnmTlVOe6Nc93Iy"
-    "P3EK3Isv+vcjXu9lgAOuVlO/tkYLTT/ggulbYLNJWkfPPG/cP9KXAi0jgAACCLxfoLp+7U06WH/t"
-    "+58P0e9vO8Y+4aJpZc/4nVNt3ZpTjW1fo7h6r9clVvufXMu2f2O55v7pU8vqgryoav9pMBcBBBBA"
-    "AAEEEEAAAQQQQAABBBBAAAEEclngQAcyc9mGviOAAAIIIIAAAggggAACCCCAQAgEaurXzFct1veV"
-    "ih/HMTYqzDkzppb9KYiu7Rqdu1+HF/uoIOL7FPM5a0f+J2bMOPRtn+IRBgEEEECgDwJL6td8ThXF"
-    "/6UQfrzP9SGT/axqm1kzpoy/dz9L9HhWzYMvlBknuUR3ZTi+xyvvWsH80bWsyy+eOv653q3PWggg"
-    "gAACCCCAAAIIIIAAAggggAACCCCAQO8EnN6txloIIIAAAggggAACCCCAAAIIIIBAsALGGFuF1zeq"
-    "Fu0WteRXQVqJRtD+xf31awIpjvYKmh0rWa58twar06foR1n9Or7XpwisjAACCCDgi8C9yxpLjWUv"
-    "VTC/3ud8yWvvIHaD34XX1Q1rLrIjyf/rfeG1l6F9QsSyV1TXrb1673z5DQEEEEAAAQQQQAABBBBA"
-    "AAEEEEAAAQQQCFaA4utgfYmOAAIIIIAAAggggAACCCCAAAK9FKhpWHuFCqu+0svV97faUB0Q+eV9"
-    "iaax+1uot/MumnrEWhV4z+rt+ilab05N3dpzU9QWzSCAAAIIdCFQtXx5Xl6eVW8sa0QXs8PyVGN+"
-    "p+Xre1pNXeN1trFr1e+Bfe2kYuSpgPvm6oa1i7yLtvoaj/URQAABBBBAAAEEEEAAAQQQQAABBBBA"
-    "AIHuCFB83R0llkEAAQQQQAABBBBAAAEEEEAAgZQK1D7UOMm27ABHZ7ajEdf98eKfNfcPomMzpo6v"
-    "t4xVHURs32La1g/uT6we71s8AiGAAAII9EhgzCsluruDObFHK6V24bctxyo///yyN/1qtrp+7QzL"
-    "Nuq3v5NtrLm1DWu/429UoiGAAAIIIIAAAggggAACCCCAAAIIIIAAAl0LUHzdtQvPIoAAAggggAAC"
-    "CCCAAAIIIIBAmgS8kSuNY5ap+X4BpzCpcNtbdwTWxtv5Grnbejaw+H0PPMhxnUQi8XLQzn3PlAgI"
-    "IIBAlgnUNKw50xjrqjB3S6NTXzmjfJxv72PVD60+RSck7lGfAxqh2r62tr7x9DCbkhsCCCCAAAII"
-    "IIAAAggggAACCCCAAAIIZIcAxdfZsR3pBQIIIIAAAggggAACCCCAAAJZI1CbaPq8OvORVHTIWNaM"
-    "6oY1FwXR1owZh75tJSPliu3biKEB5PnhbebtmwOIS0gEEEAAgX0IVNc1jVJh8xLNDqgIeR8N9+zp"
-    "+unTyu7v2Sr7Xrom8WLUduwH9b6bt++l+jzHMZa7ZMkjqw7qcyQCIIAAAggggAACCCCAAAIIIIAA"
-    "AggggAAC+xGg+Ho/OMxCAAEEEEAAAQQQQAABBBBAAIE0CBhzdSpbVQHcndWJxolBtDnjvMMbNZL3"
-    "rCBi+xbTmCs0Uuh5vsUjEAIIIIDAPgWqli/Ps21TpyLkEftcKO0z7LVuP9e3966qKuNYpmOpas2j"
-    "wXfNjrrtzpzg26EFBBBAAAEEEEAAAQQQQAABBBBAAAEEEMhlgTCPrJHL2+W9vk+aVFWwadMmHZS2"
-    "R7muNdRx7CHe/zpAP0S3pdT/ux/v/Ow9V6SVB70XwLIGat383b8bb1SRPedZWr9Dd3N+693lFfdt"
-    "/bxdz222bfdN17W3apmtlmX0sDfp8ap+fsVx3NbOTqtNy736yiuLXtE6Ol/AhAACCKRWoLS0cnhH"
-    "h1USiVjFrusOs21HD3eY63r/G28fOUz7xWHKaqge/fV493bq2i/a2j/qX++G9sYa4v387qT1tmj/"
-    "5u7+3dv/WZ3ez3p+m/7TPtJ4+8NN+n2z97OW3eQ4u/83xtHzbqttb3+pufme7d56TAgggAACCCCA"
-    "AALdF9g1Gqjtru/+Gr4t+Xxk546PX3jhUd5nPt8nFTffayxzie+BfQqoA0RvJR33mIvLJ6zxKSRh"
-    "EEAAAQS6EKipb7xFh1LndzErLE+97VrmExdPHf+cXwlV16+5wbbsr/sVrxtx3tjudBxyRfmk9457"
-    "d2MdFkEAAQQQQAABBBBAAAEEEEAAAQQQQAABBLotEOQt/rqdRC4vWFIyp1QFfOOTyUipivVGqZAv"
-    "poJn7/8SHYSPv/HG5uJd5X5C0nOWivx2/e+Zeb97k57a6//dv+35777rorWuChCNV5i4a3o3lp5T"
-    "XB0Sf688/90fdsdSYaPlvDNueixWkdR6bVr2RWWlh7VOxYwvJpPWOtUrvtjW1qaT5g8nd7fAvwgg"
-    "gEB3BSZHSktLD+3sTI6zbW+/aGu/aI3WPtLbX+pne3Qyafp7+yJv36X5mv3uvmv3vuqf+7Su2tz3"
-    "MlpPxdi752vNLvaRu/eJu+Pv3ld6+0xvUm67/jemvxWLVaoQ22zQE+u17AY9NiruS1pqfTKZv/rV"
-    "V29u3bUw/yCAAAIIIIAAAgi8J2Bb7qfe+yW1P0xM5ve7U01OD6JZsyNvjunXcbQ+NX40iPh9jalP"
-    "vwMd10kkEi9/orx81I6+xmN9BBBAAIEPCtTWrT1LRy4qPzgnRM/Y9hUXTxn3nF8ZVTes/axtrP/0"
-    "K1434wzv5+ZP1rI13VyexRBAAAEEEEAAAQQQQAABBBBAAAEEEEAAgR4J7K4U69EqLNxzgVn58fig"
-    "w41JercwHq/HEXpMeOex10jUei4bp3YVHHojZ61S0eHzu/93nj/ooCGNK1dW7czGDtMnBBDovsCY"
-    "MVVFHR1vjtc+UvtF29s/HqER/ieoltrbXxZ2P1ImLmlr1GyzWoXjz3v/W5ar/91VbW0jVKBd9c7I"
-    "25nYL3JGIP0C0eiciY6TF09/JmQQlIDeKzpsO/neSHauG9FdCd6dIm8VFm7r2Lp1sLtp001b3n2W"
-    "/xFAIDMEaurW3m3Z1pfTla2KkGfOnDoukGKtmgdfKLMiyRXq2+B09e9A7epA0d3Tp467/EDLMR8B"
-    "BBBAoGcCu+7sYLnP6D3uoJ6tmbqlVSRdN33auHP9avGBB56PdebnPaN4GmAktZNtzLLp08ZfkNpW"
-    "aQ0BBIIVqHLi8S2nBNvGgaPrWO76jRtvXXvgJVkCgdwTiMev0nkeVwOPpWZyXdPU2rpwXWpaoxUE"
-    "skegpKTieA0qNSCdPdLx/ZbW1gUr05kDbe9fINWvk4ICs2LduoWb958VcxFAYG8Brx5xwGf2fi71"
-    "v2nAxFUbNizQQIRM4RQIx+tENaM7mpsX/iGcRr3PipGve2+3jzUnR4qLSydGIu7HjXGOUzHdcdrJ"
-    "HKGiQo0wnbNToYooP6ze6/Fuvb+xNm3a3KFRs/WB2v6LnP7i/T9wYOdzTU23t+esFB1HIMsFSksr"
-    "++nv/SN6HKt95LF6cz22vX1zmbqt8avf3T/op3/+mOUiZpj6erwcjt/dZ0d9dzRi9ubtxlQ8pwP5"
-    "T2veU47jPK0D+o3CUC0QEwIIdEfAtvPma19zcXeWZZnMFHh3v/lu9o6z5y6y0+roKLSKitq1T63w"
-    "LmbZrOV1wYutA3dGdyXwLn6xNus1op93zXtVB3t1UMBeX1RkNnKA711V/kcgTQKOGWO9c1eRdGSg"
-    "j6J33Fff9PQlU8f+3e/2Z5x3eGNtQ+Ol2v80+B3br3jam15W3dD4x5lTypb5FZM4CCCAQK4LLF68"
-    "Il8XDtbr82ZoC6+V29pk/+Rsv7ZVVZVxkvmNSxUv5YXXu/rg2Cf51RfiIIBAOAR0zPRf9V3+R+nO"
-    "Rjl4gwwdqceeByLSnRbtIxAKAWM65+kzRcouptZxvQ3FxVcf3db2/VdCAUASCGSIgI6F36+3MW9A"
-    "rLRNqqFZosanpy0BGj6ggF4n9+p1MumAC/q0QHu79bhlTT7Tsh5O+hSSMAhkvUBJSf5gXYz2P+nu"
-    "qO5YP0s5aJ/BFEaB0aMjAzs60v860Wf3F+QzNoxGfcmJ4uu+6GndkSOviebldZyggy3H6UVynJ46"
-    "Wh9ABqqwQz+aXQWEmsfUhYBcvIL0j8jpI7JTcZSxtm+PvFuQ/bRGf/29itafbGu748UuVucpBBAI"
-    "v4BdXFx55O6LUWyv0Prj+uB35O6//d37yPB3IW0Z9td+cVdRtpeBq2+3sVilRnQ1Ksa2nrZt85Se"
-    "+9/W1ttfTVuGNIwAAghkjoAu8LGG6/1nuPd505tU9Ljrf+1rd03er7t/NpYO8HkF2xpR216vJTdo"
-    "2Y2Os+vnl/Xc6ry89ufXr797j1G2d8fgXwQQ8E/Adu2Baay99jrS37HcxNKlzx174YVHbfOvZ7sj"
-    "TZ9SlqiuX3uqdkHeAclQTo4xd9c8tGbFjHPH6+4sTAgggAACfRUoGDL4e4pxQl/jBLj+267lll/8"
-    "xQlb/WpjzPjGG/Qx+7N+xetpHH3GL/XuOOFd+NTTdVkeAQTCKaBjotfsPveW7vzMxOLieWe1tS36"
-    "ebozoX0EELBKHaczoa/Xp1nWPR14IIAAAghktMDp0Wjpt1tbra9kdC9IHgEEEEAgpwQovu7h5h47"
-    "dk7h1q2RE1WccYYep1tWx1EKocHzehiIxbsU0EHxPQqy7Us1aqVX/LJRRS9PilnF2Pbv2tqGaLTs"
-    "Km8EQyYEEAiZwMEHzzk8Esk7VX+zp2i/eIqK1kb+84C4rWK3kCWcUemYYUpX7zvW6Z6pbUeM9o9/"
-    "1e9P6GKVJ5LJzt+9+updKhZkQgABBBDwQWCg3sMmKs5E74P+7vev3R/4vRG1Y7F5rXreG+lqla6P"
-    "0WdTZ7Xu6LCSUXZ8kCcEAhLQR53+6YbQX/wRyYKiu5XHhUHkYu/In2f6dRyrdj4aRPy+xtTH9oGW"
-    "4yQSiZePKy8ftaOv8VgfAQQQyGUBXXDzefVfo0CGeDLWZRdPG/+cXxnW1jeebizzH37F63WcSOd1"
-    "WveSXq/PigggEBqBeHzeJ3VM9BNhSUgXaV+jXCi+DssGIY9cF/hMLNb/5pYWqyLXIeg/AgggkOkC"
-    "utju2mi0YkVr68IfZnpfyB8BBBBAIDcEKL7uxnYuKZk/ToVtZ2jRM7Zts07SLVAGdGM1FvFPoETF"
-    "LVMVbqo+bKnYZbNGeq34lYpgHs/P73z85ZfvaPavKSIhgEBPBLzR//V3eIpGtD51d7G1NUblMu+M"
-    "HtqTSCzbCwGvCtC7AOgo23bm5+cXeHcO+LO2g4qx7SdaWrb9iZEeeqHKKggggEC3BOyoPotGtah3"
-    "sZEmV+993l0KKl7V77o7gfVnxzF/2rGj6KlNm27a0q2QLIQAAv8UsK2Wdwaq/+dzafnJvqC2rvG3"
-    "06eV6Vas/k4zZhz69n2JpvKI6/5FkQf7G92vaOZD29wdCxQtZbeM9itz4iCAAAJhEViaeGF0Mpms"
-    "tXQNdVhy6iKPh2ZMG1fbxfO9eur+utVxY5sH9F7u3YEmrZNG7/AG+mBCAIEsEHBd+5rd379D05lP"
-    "R6OVH29tXfBUaDIiEQRyW2CeBktY0dKyaFluM9B7BBBAIOMFvPFwavQ5a5U+Z2ngGyYEEEAAAQTC"
-    "LUDx9T62T3Fx5WEqmJim2VNd1z1yH4vxdHoERqrZafrQNa2zM8+Kxyv+pmLPxzXi4OMFBUN+t25d"
-    "1dvpSYtWEcgNAY0yMl5/b/+mv7t/Nabj4yo+874EMaVZQNvBO6GoEWCsT2rbfCMe77/FmHn/pULs"
-    "R43J+4VGY92W5hRpHgEEEMgFAd3xwTpL74tneXcpKCpqd2OxSo2K7eriGOdPkYj7pw0bmnXA8OFk"
-    "LmDQRwR6K6Dx5tfqI+ZZvV3fz/VUPHZ7TWLVUzPKj9D3Tn+nS8rHNtU2NF6qu8Y0+BvZ12iza+oa"
-    "/zBjWtkDvkYlGAIIIJADAosXr8jvTCbr9dnwoBB3d+XOAQMv9Su/quXL85w2p06F1wf7FbMvcVTz"
-    "zufuvgCyLgIhEYjHr5pgTNK7i0CoJg0WdI0SmhyqpEgGgZwWsBeXlFT8fePGhc/mNAOdRwABBDJf"
-    "YKA+Zz0yZkzFcevWLdyc+d2hBwgggAAC2SxA8fUeW7ek5IqDXLfgSypa022FzQmaRTnhHj5h/VEF"
-    "Lh/SptLDXNXevnmHRhz8g37/uapBH2luvvXlsOZNXghkkoCuLp2kC1Imq5Ds8yoOOVp/b5mUfk7m"
-    "qn3jEO0Lz9VJXj063ta+8ffevlEXrTS8+urNrTmJQqcRQACB1AtotD8zUZ9LJ+r/GcmkrdGxS96w"
-    "7UrdpcD6lUbL/mVz86L1qU+LFhEIt4A+aa4KUYb9LDeSuDOx8tgryie95Xde06eUJWrq1p6sow+h"
-    "HV1aJzvuWlq/dsWFU8eFabv4vSmIhwACCPguUDBk8M0Kerzvgf0LuM04dvnss+Pb/Qp5yCulN+hz"
-    "76f9itfXOPpM4ft7d19zYn0EEOi5gC5ovlprpX00/S4y/7fS0sqxGzYsaOpiHk8hgEDqBfrrbnQ/"
-    "1gUbxzQ33/Ja6punRQQQQAABHwXGtbdbGrBi8pkMZuOjKqEQQAABBHwXyPni60mTqgo2bdpyjr6M"
-    "zXRdc5IODkd8VyZgKgX6qbHPajt+VgWiC3SLKV3d7GjkV/enra2Lnk5lIrSFQKYLaKTOY9SHC/T3"
-    "5I1yPUpFYpoous7M7WoXKe9d+8a8vI5bNHr574xxEoWFpp4rhjNzi5I1AghktMBwfU71RsbyLmra"
-    "4y4u1n8XFAx7kru4ZPS2JXmfBOzOyP+ZSFIfPENzf5UJ/d2C+9S9qT51ca8wW4fYFYPeNB/Xkx/b"
-    "a0ZIftGGGOhaVmLxz5qP87NALyTdIw0EEEAgEIGahsazLWPmBhLcp6C6u8MVM8vHPe9TOKu6ofEM"
-    "9fkrfsXzI44+SXAgyw9IYiCQRoGRI6+JWtbO8/TdII1Z7LPpiO6cW6m5V+xzCWYggECqBQ7RSPkP"
-    "6bDb5yjWSzU97SGAAAK+C5wej5dc39xsVfkemYAIIIAAAgj4JBDGK8V96tr+wxx88LziaHTe1zdt"
-    "2rxOxQ8PaiSnU7UGhdf7Z8u0uToaZ39UxaL/qdEGn1Ih6T+i0YqbYrG5GrWXCQEEuhIYMaIipr+T"
-    "qzVK8t/1t6MLFnadKBzV1bI8l7ECERX7naxte3d7u2nR9q7XQwciJ/MemLGblMQRQCCTBby7uGi/"
-    "fJUej+suLq9rn/xTvQ+fN2LEtYMyuV/kjkBfBOz8pD6XhKbw+p2umCnV9Wsu6Uu/9rXu3DPL2pOO"
-    "M0Xzt+xrmXQ/r8q1Iwve2rYw3XnQPgIIIJAJAksTL4xWEXKtcg1lpeAuQ2NVz5wyfolfnksSa0ps"
-    "Yx5QvJw93+CXJXEQQGBvgby8nXO0O/UGlgjlpO/y0zXK7ohQJkdSCOSuwGnRaOm3c7f79BwBBBDI"
-    "HgGdP7k+Hq88O3t6RE8QQAABBLJNIOcOhnojuaqYYWkkYr+kgtwb9GYdy7aNSn/2JWAO1en7a3UO"
-    "YIVeAy9oVOwbS0oqPrKvpXkegVwRGDt2TqEuRpkcj1f8PD/fWq+/E++2uJNypf+53U+7SNt7ih6P"
-    "RaMl61Xwd1M0OmdibpvQewQQQCCtAv21T/YOJC7Lz9/Zps+sD2vffI5uY+zd3YUJAQTSLGBb9m1L"
-    "Hlr94SDSuKR8rG5Vbl8aRGzfYtrm0tr6NRf6Fo9ACCCAQBYKLF68Ir8zmaxX14aHuHsrdw4cqGJG"
-    "f6aq5cvzXNeuU7SR/kQkCgIIILBbYOTIywfqM/KXQ+7R33WTjHwd8o1EerknoEHXrvWOqeVez+kx"
-    "AgggkHUCqmkzD5SUzB+XdT2jQwgggAACWSGQK8XXtnc1lAqv/7B7JFfrAm29wqzYgnSitwKH6aDd"
-    "V1zXekZfvp9TYUuFCg45QdBbTdbLSAGvyDYarbx927ZIsy5GSehilLPUkbyM7AxJ91lAxX5xPa61"
-    "7chK7RP/rGL8S+LxWf37HJgACCCAAAK9FfAKrs/RvvnhZNJ4hdjLvO80kyZVFfQ2IOshgECfBfq5"
-    "jvPDZcsaB/c5UhcBZkwte1jHLO7qYlZonjKWfdfS+rVHhCYhEkEAAQRCJlAwZPAt+vx2fMjS2jOd"
-    "bcaxy2efHd++55N9+fmQtvj/0/qf6ksM1kUAAQS6EsjLK7xYz4f5YpZdaWu/fwUXTXe1BXkOgbQK"
-    "6LSXVaNzYAw0lNbNQOMIIIBA3wVUwzDEdc2j3C2075ZEQAABBBDwXyDbi6/fKbqueMoY81OdxDzB"
-    "f0IiZrqAvnx7I5ctUMFhi4pa/scbAdiyZuVner/IH4GuBSZHdl+MUvE/es3/XVf/X6nlQn8Au+u+"
-    "8GyAAh/XF9l7jenv7RcXc4AyQGlCI4AAAt0TGKTFzvO+07zxxmbdqaDyu7qAcEz3VmUpBBDwWaBs"
-    "Z8S91+eY74XbOtiZr1/+8t4T4fthgGtZicU/a+YivfBtGzJCAIE0C9TWNX5BKXjHWUI72Za5fGZ5"
-    "2fN+Jbikfs3nNMCF7jTIhAACCPgtMDmic3pz/Y4aULyRnZ1mekCxCYsAAr0XGKhzYI+OGVMxtPch"
-    "WBMBBBBAIBwCZqLuFvqAcrHDkQ9ZIIAAAgggsFsgS4uvqxwVF05VwdhfdxddW8ewwRHohoAO5lmf"
-    "9UYAjsX6v6xRX785atSV8W6sxyIIhF7Aey3rNV0VjZasf2e/+FklzZeT0G+5tCfojeo4Swco/6b3"
-    "1Mf1GvpXy/JOfDAhgAACCKRRoFj75et0AWGT9s2PxuPzTlMuvKencYPQdO4J6DtjeXX92tlB9Hzu"
-    "mWXttmVPUewtQcT3I6axrCMLtm29zY9YxEAAAQSyRaC2vvFwY5ul6k9oP5fp/eW+6VPHezn6Mt27"
-    "rLFUd0Tw4mXpOQZfmAiCAAK9FIjHS8q16mG9XD0dq+kiSo6bpgOeNhE4gEDZzp22ivWq+LxyAChm"
-    "I4AAAhkg8EXVgV2XAXmSIgIIIIBADglk2xcNW6PAlcdim1aquLBO2/HIHNqWdNVfgWKN+np9Mpm3"
-    "TqMK1qvg8ER/wxMNgdQIlJRUHK/CrIc7O/Ne0mv6GyrU4oKC1NBnWyveyePT9Bp6NBYr+YdeU19l"
-    "tIhs28T0BwEEMlDAuxjmX42xH9d+ebUeFeybM3ArknLGCujD0cIldY0fDaID06eWvaC/7UuCiO1f"
-    "TPvi6oY1F/kXj0gIIIBA5grc9lhjobFMg3owJKy90PvW39sHDJjnV35Vy5fn5eVZ9bogZ4RfMYmD"
-    "AAII7Cmg45BX7/l72H/WcfexsVhcA1cwIYBA2ARUM/D5eHzz18OWF/kggAACCPRcQPv0b6kA+/Se"
-    "r8kaCCCAAAIIBCOQNcXXsVjlMSo4+J1GgdOBbntCMFxEzTUBHeDL10GzKfr/93qNrYhG512oQWDz"
-    "c82B/maegDcKpvaJy13X+qOyP0ePvMzrBRmHVGC08vpOe7v1ki54+u7BB88rDmmepIUAAgjkksA4"
-    "dXaB9s0bYrF5t5aWVpbkUufpKwJpEijSCKeJZcsavTuF+D7NnFb2Q41QeofvgX0MaBv7zupE40Qf"
-    "QxIKAQQQyEiBQVutW5T40WFNXoXXb+kkQPnss+Pb/cpxdFvJty3LMFiFX6DEQQCBvQRKSuaeqic+"
-    "tteTGfCLziVlVMF4BpCSIgK+Ceg87/Uq1jvbt4AEQgABBBBIl0DEG4izuPjKQ9OVAO0igAACCCCw"
-    "p0DGF1+PGFERU4HhYh3s/ZM69sk9O8fPCPgrYI7W7aWXxGL9dYv3ynnx+Kz+/sYnGgJ9FrC9g0ca"
-    "qf1P3iiYinZSnyMSAIF9CwzWBU/XRSL2er0PLy0tnVu270WZgwACCCCQIoEBuhC1Mpk03l0Klupi"
-    "rPEpapdmEMhJAY32OXZnxL03qM63b9miW5db3rGOsE4DbNckFv+sme/GYd1C5IUAAoEL1NQ3TraM"
-    "uSLwhvrQgI4RXX7h1HGr+hBir1VrGtacqYLua/Z6kl8QQAABHwVc18nIfYz2t5/Q93DOU/r4WiAU"
-    "Aj4KOCrWezAancMFxD6iEgoBBBBIk8Bw2877cXHx1TofwoQAAggggEB6BTK2+HrMmKoiFRR8LT/f"
-    "WivCWXp4t91mQiAVAhr11Sw0pv8/VOj6leHD5wQy0lkqOkIb2SIwK98blV0XBfxdB49+qiv4j8uW"
-    "ntGPjBAoUJYXJJPO83oNPqDRsCdlRNYkiQACCGS3wK59s078rtR3podKS+d9OLu7S+8QSJ+ALtAt"
-    "r2lY++UgMpg9+5iOZLJzqmK/EUR8n2JOKtz2VqhH6Papn4RBAAEEPiBQW994uI4RBnYRzgca7MUT"
-    "ulDonhnTyh7oxapdrnLvssZS3flgiWaq/poJAQQQ8F+guLjyQ4p6uv+RUxPRde2MLBxPjQ6tIJB2"
-    "gUEq1nt4xIhrB6U9ExJAAAEEEOiTgO448mHH6binT0FYGQEEEEAAAR8EMrL4Oh6fe0J7+6Zn1P9v"
-    "6THQBwdCINAbgWIVut5YWBh5KRqt+AZf1ntDyDp9FNBI1/OmRKP9n/dGZdcJP67Y7yMoq/dJIE+v"
-    "wfM1GvZfY7F5D+pEyWF9isbKCCCAAAJ+CHgXqE5LJu1n9Xn1p8XFc4/0IygxEEDgfQLGWlhd3xjI"
-    "bdEvOW/iS5ZtT1eLqp8L56TEZtTUrZ0ezuzICgEEEAhG4LbHGguNZRKKPiSYFvyIav9toNOvwo9I"
-    "Xoyq5cvz8vKseu33R/gVkzgIIIDA+wUcx1yt5zL2Ag8VAn0+Hr9qwvv7xe8IIBAWATMxP7+jRtlk"
-    "7H4mLJLkgQACCKRfwD5Xg8/49p03/f0hAwQQQACBTBTIqOLr0tLKfhpR87vGOL/TdyIOXmTiKy47"
-    "cx6qA2pV+fk7X1Qh7HXeqOzZ2U16FSaBeLziRH2ZeFIjWtbr9Tc2TLmRS84L6LOFfW4kYlbrNbp4"
-    "5MhrojkvAgACCCCQfgFdp2Wd7TjOc9o3L2XfnP4NQgZZJ1DoWKZhceKFQArwZkwp+5mxrdtDrWZb"
-    "d99fv+aoUOdIcggggICPAoPfNAsULpALb/xIU9VEb1muW15ePmqHH/G8GGNeKblR1wKd6Fc84iCA"
-    "AALvF9A5wBI95935JZMnx5jkVZncAXJHIPsFzJd0Z+Prsr+f9BABBBDICYGbNfDMSTnRUzqJAAII"
-    "IBBKgYwpvvYKDZNJ84xG1PS+DHkjuDEhEDaBg1QI+9329s1rY7HKWRoPRqPAMiHgr4AuQJmkg0IJ"
-    "Y6zfKzInvPzlJZqPAnqN5ivcrLy8jibvwqlhw64LpBjJx5QJhQACCOSCgPf97wJv36zvV1VcNJgL"
-    "m5w+pkpAo4COLXCT9wbVXsfmN6/W56v/DSq+D3GLHMtJ3P+T1dy+2QdMQiCAQLgFahsay7XfvyzM"
-    "Wbq2fdmMc8ev9ivHmoY1Z+p9iGJCv0CJgwACXQq4rlupGQVdzsysJy8YMaIillkpky0CuSWgOxt/"
-    "W8V6n8utXtNbBBBAICsF8jTwzA+Li688NCt7R6cQQAABBEIvEPri67Fj5xTqy89tOrj7pDTHh16U"
-    "BBGwrFEaBWZxLLb5mWh0/smAIOCHgPaDY2KxeQ/qApS/6qDQZD9iEgOBFAkM8C6cKipqX6tCvzmq"
-    "x/aKspkQQAABBNIrMEDfr76hiwZX6c4tU5QKt1pN7/ag9ewRmFxT33h5EN2ZPfuYjrxIZKplrNeD"
-    "iO9PTDMust1Z7E8soiCAAALhFLgv0TRWx2UCu9jGl14b6wczp5Qt8yWWglTXNY2yjb1EP/KZ0S9U"
-    "4iCAwAcEvIEbNLjNpR+YkZlPFObnmyszM3WyRiBnBBwV6y2jWC9ntjcdRQCB7BY4yHHyGhhsJrs3"
-    "Mr1DAAEEwioQ6uJrr9hw27bI7/XlR8VaHNwN64uIvPYpcKRtu79WsWFDPD5fBdlMCPRc4J0LUK7X"
-    "fvB57QbPVYRQ77d73kPWyCGBg1Xod1ss1v//NBL2Z3Ko33QVAQQQCLPAGJ3cro/FKn5bUjJ/XJgT"
-    "JTcEMkfA3FqbaDo6iHwvLD98vbGt6YqtAVfDOSm/adX1a2eEMzuyQgABBPomUFPzYlHEdRsUZXDf"
-    "IgW5tv23AZF+8/1qoWr5co0iZur0xjPCr5jEQQABBLoSKCx8W3cTDfP+taus9/ecc9nIkZcP3N8S"
-    "zEMAgbQLDFex3qPx+Kz+ac+EBBBAAAEE+ipw7Ntvb76zr0FYHwEEEEAAgZ4KhLaIT4XXZ6nY8C/q"
-    "0DE97RTLIxAmARUblhvjrubW7mHaKpmRizdyui5AeUb7wm8q436ZkTVZInBAAV2YYn4Tj1f+jAtT"
-    "DmjFAggggECqBD7lusnnNAr2dZY1OZKqRmkHAX8EQleHXGhUmLc48cIQf/q3d5SZU8f9XM8s2vvZ"
-    "cP2mYVHvur9+zVHhyopsEEAAAR8E+nUsVJSP+RApkBDa/75luW55efmoHX41cEhb6U265udEv+IR"
-    "BwEEEOhaYFa+bdveIExZNJlheXmFF2dRh+gKAtkqcJQx/e/L1s7RLwQQQCCXBFRTMTMWq/xyLvWZ"
-    "viKAAAIIpF8ghMXXkyMaee07emP8mXiGp5+IDBDwRaC/d2t3XW33N0Z89cUzq4OUlMwp1X7wYW/k"
-    "dHX0iKzuLJ3LWQHdpvnzluX+TV+C51lWVV7OQtBxBBBAIDQCdpFGwf5uNFryZDx+1YTQpEUiCBxQ"
-    "QKVm4ZsOLzTJwE7e7tzy5rUqhPtj+Lr9XkZFjuUk7v/J6kHvPcMPCCCAQIYL1DY0lqsLs8PdDfvL"
-    "M84dv9qvHGvr1p6l95tKv+IRBwEEENiXQDQ6wLvjYxbePdRUcNxzX1ud5xEIlcA0nZPT3ysTAggg"
-    "gEDmC5hF8fjcEzK/H/QAAQQQQCBTBEJVfD1mTMXQaLT0v4X3VT1CeQY1UzYseYZTQBcVjNWIr8s1"
-    "CvZdI0Zcy4nocG6mNGY1Kz8anXeN60ZWKYlz0pgITSOQEgFdlKIRIc3CaHTzX7RfZCStlKjTCAII"
-    "ILB/AX1ePd6YzmcYBXv/TsxF4EAC+pxzTnX9misPtFxv5s+efUyHMZGplrFe7836qVnHjHN2OPek"
-    "pi1aQQABBIIVuC/RNFYXEN8bbCt9jW7umj617MG+Rnl3/eq6plG6t8QS/c4x+ndR+B8BBIIS0KDX"
-    "5uqggqc57ph4fPPkNOdA8wgg0D2Bm3VX7pO6tyhLIYAAAgiEWKDAdZ2HR4yoiIU4R1JDAAEEEMgi"
-    "gdAUX8fj80e1t1tP6iDLqVnkS1cQ6ErA1on4y/Lzd2rE13lndLUAz+WeQHFx5YdisX5/1pHm76n3"
-    "A3NPgB7nsoAK/T6s/eLvNLrEgtLSyn65bEHfEUAAgXAI7B4FOx4v+YNOPI0JR05kgUDmCdiWfWtN"
-    "feMngsh85rSxLxvbmq7Yqo0L7TS1tq6RW62HdvOQGAIIdEegpubFIsd1E1p2cHeWT9Myfx3g9Pet"
-    "cHHx4hX5tp2sV9n1QWnqD80igEAOCeg757+ou0dma5d1zNO3/XO2GtEvBEIikKfzFA1evUJI8iEN"
-    "BBBAAIFeCmh/Hs/Ptx6eNKmqoJchWA0BBBBAAIFuC4Si+NorOjTG/V9lnbUHWLq9RYJZ8C0NUrLp"
-    "nw9rwz9/9p63tgXTLFEPIHCItsMvdHBx+gGWY3ZWC1TlqeD0q45jntbr4aNZ3VU6h8D+BbzPJBXJ"
-    "pHm2pKTi+P0vylwEEEAAgVQI6CTxcTpQ+Rd9Xv1cKtqjDQSyUCDfstz6+xIrhwfRt5lTx/1c3yEW"
-    "BBHbr5jGNnfUJNZ+xK94xEEAAQRSLlDUeZuGfg7z8ZqtruOWl5eP2uGXTcGQwRoYwOY2zX6BEgcB"
-    "BPYr4DhZX5z8sZKSuQw6td9XATMRCI3AwapX+NGYMVVFocmIRBBAAAEEeitw4qZNm0J93LS3HWM9"
-    "BBBAAIFwCeSlO53i4opTIhHziE7sD0l3LiFuv125tWlU8GbXtV9RAUSLHq3ez3r+Nf38puZtVfHm"
-    "1o6O5NbCwuTm9etfe9OyHk72rE9VeaNHtw1qby8alpdnBiv+IN1Sc7Dj2PqyaeI66O596TxYI/PG"
-    "tL1K1O5oxedqsZ4hv39pk5dn//79T/J7bgjE41dNsKzNtV5hU270mF4i0C2Bca5rPalCv1uKioZ+"
-    "Y926qre7tRYLIYAAAggEJTBcn/t/Ho9Xfqu5ecgNllXlBtUQcRHITgH7kIibr8/85ove/dT97uPO"
-    "LVu+UjBkiL5PmBP9ju1TvCLLtRLLljUec/75ZTpOwYQAAghkjkB13Zoplm0uDXXGxvryxeUT1viV"
-    "Y3X92s8r1jy/4hEHAQQQ2J9ALDb3aB0bP2V/y2TDPJ1r80a/fiIb+kIfEMgBgWPffnvzneond3HK"
-    "gY1NFxFAILsFjLEv13mNFc3NC2qyu6f0DgEEEEAgnQJpLb6ORudN1on8ZTq4QgGvZanA2jyvAucX"
-    "9H+TXJpc12mKRDpf2Ljxdo1UnYqpqnP9emuTWvIe3ZiqnHj8zRKdRB6jouxDVaR9mArmJih3FZTu"
-    "ehR2I0iuL/LfGzYsaMp1hNzrf5UTi22ZZ0zy2+p7v9zrf9A99kb0N69qX7RJ+yf9bG9SnYt+3jXS"
-    "/xv6XXcD0BLG7NS/u0b+t22nU8tv3f28pQtP3HfeH+0BKpLZ9R6l96pBijPMeyjWMK2rh+2NYqj/"
-    "rZF6DPXWZ/JFIKLtcW17++azYrHK6S0tC1b4EpUgCCCAAAK9FXD0vvn1WGzzcY5zxXkbN975em8D"
-    "sR4COSpw9pL6xjnq+21+93/27GM6quuaptmWecayrYP8ju9TvLKOPOsexZrqUzzCIIAAAoEL1Dz4"
-    "QpllJ719V2gn27LvmD6t7CG/ElyaeGF0Mpms1fuJBvtmQgABBIIX0DHWq3UMMAcm+4zS0nkf3rBh"
-    "0V9zoLN0EYGMF9B+aaYGh1nR2rrw7ozvDB1AAAEEclxA5/zv0rnmv3GuOcdfCHQfAQQQCFAgbcXX"
-    "usLoiypce1DFbLoNb65NuwoBn1Hfn1XPn9VV78+2tQ1ZpVHkOjNLosptbrZeVs7e48m9c58cKS0t"
-    "PVTF2Eeonx/SvI/tfphD914ut3/Th707clsg93pfUjKn1HU3L1PPP5N7vfetx68p0kodAHtR/7+k"
-    "xwYVhL2sv6eXdZJw/auv3rWruNq31roZaMSIawfl5XXojgBmtAq0S1W0PUr7v0O0+uEq0p64u1i7"
-    "m8FY7F2BSXL731isoqqlZeiNjLb6Lgv/I4AAAmkTOMN18/+ig5XncLAybduAhjNUwNjW95ckGp++"
-    "qLzsf/3uwsxpY1+urVt7kbGsnyl2SMtXzJSahjVPzJgy/l6/+088BBBAwG+BmpoXi6xIR0JxB/sd"
-    "28d4z5kdedf4FW/x4hX5nclkvY61hPVCHr+6ShwEEAiJQHHxlYfq+Ok5IUkn6DTsZHLX6NcXBt0Q"
-    "8RFAwB8BfSZaGI/Pfa65+bY/+hORKAgggAAC6RGwi3Su+UfR6JxjWltvfzU9OdAqAggggEA2C6Sl"
-    "+Fon6/9FhXINgs2Jwmt9QWtREfLvdA5UD+u3ra0LNMK1pfOi2Tw9nNywwfJGdPYe3gngXVNpaeVw"
-    "WagQ29Xt5Ozj9aT3OHj33Nz6V0WZTa2tw3+ZW73O7d7GYvNUsGQ/IAVvlGSmAwtolGrr//S3skoH"
-    "4p/3/nccZ2Vz8y1e8XXoptde+95WJbXynccH8hs58ppoQUH7JO37vItSVFRsH6GFvAtTBn1gYZ7Y"
-    "U8D7rPItjbb6KWPmXMAX4z1p+DkzBOzL9Nnn8czINTOzjETcfH23GOhlr/cL3VHCKXJdM1QXwuig"
-    "mtNf8wbr8/hwzR2hj+BeMclB3u/aF0f1M+/JHlzPJl1YZH5bXDxvSlvbop/3bFWWRiCnBfK1b6q/"
-    "L7Hyo5eUT/I+5/o6TZ827r9qG9beon3b1b4G9jOYsW9bUte44qJpZc/4GZZYCCCAgO8C/Xbeoc+O"
-    "H/E9rn8BN5uk9e8zZxz6tl8h84cO/r5tdh2n9SskcRBAAIH9CjhOfoW+W6blHOV+Ewtopo5DTNXA"
-    "LP+RujvdBtQRwiKQOwK6I6rzwxEjKo5+7bWFLbnTbXqKAAIIZKXAaNUYqD6t6vTMGxAzK7cHnUIA"
-    "AQSySiDlBzai0fknq/D2ESkWZpXk3p3ZqV9/q5OeP4lEnP/ZuPHWtXvPzt3fNmxY4J1k/tU7j10Q"
-    "JSXzxyWT7gk6+HSiDrZ9Uic3JuSCkIqD7mIU11zY0l4fJ0disZIb9MNX9XC8Z5g+INCuIjndEcB5"
-    "SvuBp1RI99SGDbc1fmCpDH7i1VdvblX63uOJf3ajyikufmOi3is+rveM4/S89zhSj8g/l+GndwTO"
-    "sO3IM7qAa5pGW33f3RYwQiDUAm1tbQv+EeoMczi5MWOqirZvf70kEsmL67PoKH1P0V0L7LEiKdPD"
-    "+78kh3n21/X+jmM/qrsZzWpuXlCzvwWZhwACewmMznPzl+iikC/o+6DvF2SvO3jjVw9pK9UFzkbf"
-    "rUM5FRnbJJYtazz6/PPL3gxlhiSFAAI5L1BTv2aqjk1eHGYIfW69ZMZ543z7jlHT0Hi2paudw9xn"
-    "ckMAgewS8AbpSSZNqPe1fovr2K8Go4rMU1zf7lrgd47EQwCBvQX0dxvLz7cenjSp6pSVK6u8c/9M"
-    "CCCAAAIZKqDzPidroK+bWlqsqzK0C6SNAAIIIBBSgZQWX+v2PCcY4/5UFhqRLrsmHfTeohOo/6X/"
-    "f7pjR9EvN226aUt29TC43rxTnO4VqNd6rejAW0lnp3uqTkZ/Vl9s9b8V957PsmlbYaGhUCXLNmpX"
-    "3dFV8d7BmYc076Su5ufwcyq2tv6gv/FfaQTAX7e17fg/y7qnI/c8qty2Nuvv6rf3qPb6X1x89QDL"
-    "6jzOcXUsy04AAEAASURBVKzP6tfT9PBGx6ZoXwiaVARpfq1iv+tV7HeTfve9aGlXK/yDAAI5I7Bu"
-    "XZU3WuAL7zw+0O94fFZ/2+4/TqOXf0jvWx/W+9ZRWujDehR/YOHceyJP33/u1z65WPvk7+Ze9+kx"
-    "Ar0T0IeXz9c2NHlFFwt7F2Hfa1WdfHLnvcsap+bnWc+onRH7XjJ9c5TX2J0R915lMCV9WdAyAggg"
-    "0LXAkvpV41zLvqfrueF41tjWbTOmjPuRX9nc9+Dzh6jwulbxbL9iEgcBBBA4kIAKry/TMjoGmluT"
-    "jinMGjbsum9x/jC3tju9zXiBEzdt2rRAvbgi43tCBxBAAAEE5sfjFSuamxfWQYEAAggggIBfAikr"
-    "vj744DmHa0RTr/B61y3B/epAmuO4av8JFQnXqkju0Q0bFu5Icz5Z0bxGx96ojix952HFYhVH6Ocz"
-    "9DhLj0/roVs9Zfy0bN26hZszvhd0YL8CxcUVp2jf4BVeU6C1q0jWPGvbzjsj32/7fXPzPdv3C5ij"
-    "M9vavr9NXf/1O4//KCm54qBkskAXohivENt7HKJHLk9esd+Nsdi8T9l23kXNzbe8lssY9B0BBIIV"
-    "eOe96lm14j3em7yLqwoKrONUlH28irI/oRnH6NH/vQVy5wd79z65ItrSMnQ+d3XJnQ1PT/sqYL5X"
-    "Xdf01MxpY//Y10jvX//S88s21DSsucgy9s81L5SFdDqGUl5dv/bXM6eOW/z+/PkdAQQQSJdATc2L"
-    "Ra7VkVD7g9KVw4HatS17xdZB1rUHWq678xcvXpGvO8DUa/nh3V2H5RBAAIG+Cnh3oGpv35yro+0P"
-    "7tevffamTdb3+urI+gggkDoBjZZ6uQYfULEed39LnTotIYAAAsEI6GK4+0pK5j+vASKfC6YFoiKA"
-    "AAII5JpASkbSHD58zmAdyPUKrw/KEuCXVEd4vYoIx7S0LDxdX7YeUsEwhdcBbVwZr9JjoR6ndXQU"
-    "aPQuc46KPGrUXFtATQYe1nXdOwJvhAbSKhCNzrtGhdePK4lcLrxOqmB4uR5zHCc5uqVl0ce0v7xW"
-    "j8cpvO7+y3Pjxjtfb21dkNA+8FI9xui952Na+9vaF67ufpRsXNI+U3fTeCoarZyUjb2jTwggEG6B"
-    "115b2KLREX7c2rrwOu2bP6PC4yE6EXOc6hy/5r33Kfv2cPfA9+zm6ZZ9yyxrVr7vkQmIQHYK5Nu2"
-    "W7/kkVWBHCOZMWX8Yxph+uYw06kqfGF1faP3uZYJAQQQCIWA3a/jLiXi3eUkrNNmN2mmzD2zzLfP"
-    "mYVDhtyqznoXEjIhgAACKRNob990gRrL2WPmKviZO2lSVTYMMJSy1wwNIRAGAZ2LuCsWq/QGX2BC"
-    "AAEEEMhsgf6q1XmktLSSi5AzezuSPQIIIBAagRSMfF3lFBR4J+LNxND0uveJPKWiiltaW4c8olHd"
-    "OnsfhjV7K/Daa9/bqnW9W2vqUeXEYltOVIHLFB2wOkfPZcoBu9+0td32994asF64BbwDp6+/vvlu"
-    "jYI5M9yZBpadTgIa3RHA0n4y7yeMSuy/c3Pzrc8oqvf4z92Fx+6XVOz3JZl/2P/Wwh7RHKp+/zEa"
-    "rZiqAshfhD1b8kMAgWwWqOpsbbWeUg+9x3fi8Vn9jen3KX13OEv7qS/qudHZ3Pt3+jYtFutvtbRU"
-    "nc8I2DmwtemiHwKjzM5IrS4s/oJGglattL/T+uKNXxvTWnKCsa1P+hvZt2hFjmUali1rPPr888ve"
-    "9C0qgRBAAIFeCFQ3rJ2mY4szerFqqlbx3icunnneuH/41WB1XeM5xjJX+hWPOAgggED3BKo0INTm"
-    "q7q3bGBLuYqckoGp9tGDktdf3zJN85bsYz5PI4BAKAXsIp37+lE0OueY1tbbXw1liiSFAAIIINBd"
-    "gcOSSfdBy5r8ect6ONndlVgOAQQQQACBrgQCP8AQi236tgoOzu6q8Qx5Tge3zaPqwyc1qt1x3uij"
-    "FF6HZctVuS0tC57UqINXtrRsLHEc97PK7D49Xg9Lhl3nYRj1umuYjH+2pOSKg954Y/Pj2l/kYuH1"
-    "Cp2ovDI/vz2mEa7Pam5edD+F18G/pPWetLK1ddE3VXh8lK7S/ZBaXKjHa8G3HKoWButv7mcadWJe"
-    "qLIiGQQQyGkB7w4Pej/8b+2f5+o7xCGW5WpkHPtbejyf5TAqwN7yA/VRg9oyIYDAgQR0sOHztQ1r"
-    "Kw+0XG/mV518cmdH0p6mP8bQfjZU/8fujLj39qZ/rIMAAgj4JbCkftU4XQKz2K94AcVZNGPqOF3k"
-    "7s9UW994uK778Y6hMiGAAAIpFYjHt3jnCsentNH3NabjiBXveyrlv2offLUa5XtzyuVpEIE+C4x2"
-    "HKdBdQIpGNyuz7kSAAEEEEBgvwL2v8Ri8W/udxFmIoAAAggg0A2BQIuv4/F5U3T84Lpu5BHSRcxj"
-    "tu0crcKJf1eB7x9CmiRp7RJ4OLlx421PqLjl0uHDh8ZVMH+OnvZGQQ3blWovt7QM+wkbLfsE4vGr"
-    "JhiT/2f17DPZ17t99ugV/a0t8Ip+9bd3rArM7ly//u5N+1yaGYEKeCPqaztUah9YokL4yWosjPvA"
-    "oAwiei0ujMUqVPA3Kz+oRoiLAAII9FagpeW2v+iiwev1mLS7ENtapFh6H83GyVyq/fH3s7Fn9AmB"
-    "YATs79Y2rD4xiNiXnl+2wbbMhYrtje4XykmjfpdX1zdeFsrkSAoBBLJeIJF4uZ9rRTTQhjUoxJ19"
-    "eoDT4dvx9dseayzUiNcqGrKGhLjPpIYAAlkqoLu+XJPmrq3Qub7blcOv0pzHkbqT37+kOQeaRwCB"
-    "XgjoLncna+C57/ViVVZBAAEEEAidgP1Vncv499ClRUIIIIAAAhklEFjxtQqvR+sLSKaOevab3SNd"
-    "e6O33vpMRm1RkrVWrqzaqYL5H6kI8UzHSY5RQd712p4vhIPG+5uo6gxHLmThl4D2d6cZk/xfFbwe"
-    "7lfMEMfRAHWWN7r3v7W0bC/V39p8r+g3xPnmXGrePlCF8D98dx+o12WVHs05AjE7Gh3wi9GjLxuW"
-    "I/2lmwggkIECuwuxF1Z476MqOvyCuuBdLBPawsheEs/XieRv9HJdVkMg1wTyjXHqljyy6qAgOn7R"
-    "1PHax5hQnxhWgfgCFWB/LIj+ExMBBBDYn8A2d8ddmn/U/pZJ87zNEcedUl4+aadfeQx6071VsY72"
-    "Kx5xEEAAge4KlJRUHK9lA7nosLs56Ji2tw+0dKx01//dXS+I5Rwn7YXoQXSLmAjkiIBdGY9XTMuR"
-    "ztJNBBBAIJsFvDuR1KoA+4hs7iR9QwABBBAIViCg4usqxbVrlPrQYNP3Pfp6RfySCtZOZqRr323T"
-    "EnDjxts3qDj0W9qeZSpuOU2PnyuRNBW3mLeN6eSWyml5JQTXqAqvL9aFJo+phUzb3/UUZbMOSy/Q"
-    "LdUmaB95hv6mfmxZ93T0NAjLp1bA2weqEPuG1tbtYzSyTLla/01qM0h9a7pt56kdHYVPlpZWlqS+"
-    "dVpEAAEEeiJwT0dz84KfeRfLRCK2brtsFmhtvd9mx6ST2lWxWGVldvSGXiAQuMAotyOyRJ/XArn1"
-    "+EvFzderB08G3oveN1CoAuzE4sQLjMLae0PWRACBHgpU16+doVWm93C1VC5uHGNmXlg+4UW/Gq2p"
-    "b9RdsuzL/YpHHAQQQKAnAq6b9mLj9c3NQx/2ctbx0l9qf/h8T/L3e9ndo+dWHuN3XOIhgEBqBHQR"
-    "x30lJfPDfBFfaiBoBQEEEMh8Ae9OWI8OG3YdxyUzf1vSAwQQQCAtAoEUX8dim+fqS8cpaelR7xr1"
-    "Rg+50XXzJqr44ZHehWCtkAsYFbf8So+zIxF3gl6f3q3ltqY2ZzvR2nr7q6ltk9aCFNCIjlfrIKlX"
-    "UJ8XZDtpjv2siqcute3tJd4o1xs33ro2zfnQfK8E7ulobV30sHdxkV6zR2qb3q0wb/UqVGasNCmZ"
-    "tLwC7LGZkS5ZIoBArgts2LCgyXuf1feRUllcpf10S3aYmFtisXlfyo6+0AsEAhYw1lkqirsqiFaq"
-    "Tj65UyPreaNyhfn76OEFbpKLlYN4ARATAQQ+IFD7UOMkXe1yxwdmhOoJe8FF08Y/6ldK9yWa9P3Y"
-    "sJ/1C5Q4CCDQIwEVKI5TsfMXe7SSzwvvPif03l1JjQZwWOBzEz0Op4svr+7xSqyAAAJhEejvuu4j"
-    "OgcxPCwJkQcCCCCAQK8FxhcWti/V2oEMjNHrrFgRAQQQQCAjBHwvvo5G50zUgdwbM6L3SlKFDX+2"
-    "7chRKkj7j7a272/LlLzJs/cCGzbc1qiRDea+/XbhKL0C5ivSy72P1v01dSAt5Cd1ut8XlrQs3X7m"
-    "W9p/3CyLbP0Q/luNFH+G9o0f1SjX9zU337Od7Z4dAq2tC1Zqm16uUVYP0UmHKvXqjezo2ft7YQ5N"
-    "Jl0VYM/78Pvn8DsCCCAQVgHv+4jee28tKBh6mPbRVyrPl8Kaazfz0ucku7a4uPJD3VyexRDIaQHH"
-    "tm6sbVh9YhAIF5WP32ibXQXYySDi+xRzcm3dmit8ikUYBBBAoEuBpUufG6AhpROa2b/LBcLwpLGe"
-    "GuDs/Kpfqdz2WGNhxHUbFI+RvPxCJQ4CCPRIQAWK3nkY389H9iCJre3thXtdgKLv3cu0/is9iOH7"
-    "ojq/8KXi4isP9T0wARFAIFUChyWT5iHLmhxJVYO0gwACCCAQjIA+l30hGp3n3T2QCQEEEEAAgR4J"
-    "+HywY3LEtvN0RZBd1KMs0rNwp95Ab9Btxj7Z3HzL6vSkQKvpFNi06aYtLS0LFgwfPtQb+WWWXg8v"
-    "BJWPYv9Zo84+HVR84qZSoMqJx+fdqRa/lspWU9SW0d/CY3q9flKFXydppPjHU9QuzaRBQKOsvqEL"
-    "UW7o6CgYo4tDrtW2b01DGgE3aUeTSec38fjcEwJuiPAIIICArwLr1lW9rX30nfqc6o0O5p2kzuQL"
-    "ZQZGIuZRRgLy9SVCsCwV0IfxPNWk1C9+aM2IILo4fdr4J3QF+k1BxPYrpoYgvKU20XS0X/GIgwAC"
-    "CLxfIJnfzzumo8FDQjtt0l37ppaXT/Lu1OjLNGiLWahAH/MlGEEQQACBHgoUF199sFa5sIer+b34"
-    "/d75oD2Det+7ddHzXXs+l4af83ROtTIN7dIkAgj4J3BGLFby//wLRyQEEEAAgXQJaGC6b+jO52el"
-    "q33aRQABBBDITAFfi6+j0ZJZKt4K/UkyHVBpcl2jouuFVZb13m3GMnMLknWfBVaurNqp27zfq0L8"
-    "CXr9XqACl+f7HPR9ARj1+n0gGfvrrPxYbPNSY+zLM7YLXSeuOg/7R7btHK2/hbO0b/xD14vxbDYK"
-    "vPba97bq4pCbIxHn3VFWN2RXP80wY5zHY7F5Z2RXv+gNAgjkgsDuz6kLFuTnt4/VLZFvUZ/bM7Hf"
-    "+v51uEYCqmMkoEzceuScagH9vZQWOPYSfYcM5A47A+yxX1efnkh1v3rQXqHR6KyLEy8wOmsP0FgU"
-    "AQS6J1Bb13ix7l92UfeWTstSxrLNzAvLJ7zoV+u1DY3l6vOX/YpHHAQQQKCnApFIp3dXp349Xc/H"
-    "5Tv1GXtR1/GSXvH1jq7npeZZDYQyk4uVU2NNKwgEKPAV3S333wOMT2gEEEAAgdQIOPpstqy0dG5Z"
-    "apqjFQQQQACBbBDwrfjaOzigN6JvZgDKL4qKrGPb2hb9OQNyJcWUClR1qvB0WUvLkA+puGWqmm70"
-    "qfm2AQPch32KRZg0CYwZU1UUjfb/kZo/L00pBNKsXuvLVdhxnEaBP6e5+dZnAmmEoBkhoJGwd3ij"
-    "rEYi9jhd2ftVvafvNRpMRnRi30kO0AUGP43FKv9t34swBwEEEAivwPr1d29qbl50tfbRR6oeM8xF"
-    "k/tDPD0eL/nu/hZgHgIIvCdw5pJE4zXv/ebjD+XldrLTzdN3mlDf9eTwfJPURa/BFKD7yEkoBBDI"
-    "IIH76puONLa5Lcwp63v4LTOmjP+xXznel2gaq33pvX7FIw4CCCDQU4F4fFZ/FT6ndSATHed8VMc8"
-    "13WVe2vr7a/qmOGyrual8LkByaSbVqMU9pWmEMhWAe/i6dpodE6Y766Srfb0CwEEEPBbYKjuqvzI"
-    "yJGXD/Q7MPEQQAABBLJTwLfi685O6wYRBXJrXJ/ovfN2N7W0bDx73bqFm32KSZisFKhyVdzS0NKy"
-    "fZIOvF2mEx8tfeumfW9T0+0ZOUph3/qdPWtPmlRV0N6+SSNDW2dnS6900Puvepyp1/opGvX46Wzp"
-    "F/3ou4BXhN3cvEDFcZGxiuaNCuPbrY77nl2fIhSoyKg+Hq/8Yp+isDICCCCQRgHto5taWxd8Vil4"
-    "t2zWSeLMmvTZ42rth72LHJkQQOBAAsb69v2JNZ880GK9mX/puYe1Gdd4F5Ume7N+KtaxjfUFjdbq"
-    "jZLIhAACCPRZYOnS5wY4lptQoP59DhZUAGM91d/u+Jpf4WtqXixy3F19HuxXTOIggAACPRfoN1Pr"
-    "HNTz9fxbI5m0b91/NLNA83VnyHRO9pXe4C/pzIC2EUCgzwKDbDvyyLBh13EXpz5TEgABBBBIu8CR"
-    "+fmF1coikDsTpr13JIAAAggg4KuAL8XXxcVzj9ToqWG+feFOFU2ep0KFr1jWw6E9uejrliWYDwL3"
-    "dGg04B8kk3m6rYj9Nb2GejwKrNbpiESsH/iQDCHSJjAr/403NusEnX1m2lLwt+GXdSHK9NbWoR/V"
-    "iB+/8Dc00bJJoLn5ltdaWhZWuK59hIrlGtS3NJ+E8EW3QFdiJVT4lzUXUviiQhAEEMg4Ae2fH3Cc"
-    "jiP0WdMrIsqwyfwgHp83OsOSJl0EUi6gD155EWPXLX5oTSAXuc88d8KvVeB8Y8o71rMGb9EI4Mf3"
-    "bBWWRgABBD4o0FnQ/y6dMT3ig3NC88wmXQ8zpbx8kn8XP/frWKg+fzQ0PSQRBBDIQYHJER2Hrkxv"
-    "x+0/trXd+qf95aDv16t02DPdx8mL29u3eBdZMyGAQGYLjC8sbF+qLlCsl9nbkewRQAABS+eTJ8fj"
-    "FYHcmRBeBBBAAIHsEvCl+NpxHO/K8byQ0mzXd5wvNjcvrAtpfqQVcoG2tu9vUxH2d2y743AdhPMK"
-    "qXtQwG//WCMUbgx5F0lvnwJVefH4gAc1O+NHyvUuBNAtFm923bwjdCHKEsuqcvfZbWYgsIdAW9uC"
-    "f6hQf6oxzql6es0eszL1R68A++FodG62XFCRqduBvBFAoI8CGzfe+bq+40zxLqpSqK19DJey1XVB"
-    "zxDXdRg1ImXiNJTJAvp7Kc13nKVVVcaXYzfvt1i3puwbOiP8q/c/H6Lf813X1N+XWDk8RDmRCgII"
-    "ZJhATcOaS23LhLmgTbt7e8aMaUes84tWdw4oV6zZfsUjDgIIINAbgWi09Eta77DerOvfOu4BRr3e"
-    "3ZLjmG4t519eXUUy83XMPpDP/V21xnMIIBCMgM7FfSEanXd9MNGJigACCCCQSgF9Wf+OBvTy7kTK"
-    "hAACCCCAwD4F+vxFXlf7nKjop+2zhfTO2KpihDNVOPvL9KZB69kg4BW4tLQsusxxrGPUnye70ydj"
-    "3Du6sxzLhFFgciQW27TEu6oxjNn1MKffJ5Pux5qbF1zrXUzQw3VZHIFdAq2tty4fMCB5lP4mvqEL"
-    "Ud7OcJZC23YeicUq/yXD+0H6CCCAgOVdVKW7FHxEFE9lCofumnSqvkdemSn5kicC6RRQweDnDpnQ"
-    "dG0QOVRV2W6Hm3e+xuRqCSK+TzFHR9z8Wn0GZeQwn0AJg0AuCdxX33SkZeyFYe6z7nRw88ypZT/x"
-    "K8f7Ek1jtc+81694xEEAAQR6K6DvfVf3dl2f1vtHS0vzj7sTa+PG257Qcs92Z9kAlxkfj2/+QoDx"
-    "CY0AAikS0EBI34hGK85KUXM0gwACCCAQnIDu5GLqtU8fE1wTREYAAQQQyHSBPhdf683mP0OKsFUj"
-    "JJ2mYoTfhjQ/0spQgY0bFz6rW9F9Rlcvn6subNhPN55Tsfbv9jOfWaEVqHLi8ZL7NGq+t40zeXpN"
-    "r9OL9Xr9dFvbbX/P5I6QezgEmppub29tXfTNSMT5kDL6n3Bk1essCi3LfVRXLJ/e6wisiAACCIRE"
-    "wLtLgS6Q+bQ+u9wfkpQOmIZGjfhuPD5v/AEXZAEEEFBttPl/NXVrPhUExaXnHtbmWM55ip0MIr5P"
-    "Mc/WKK5zfYpFGAQQyBGBOxMrBzqWm1B3+4e4y38e6HRc71d+NTUvFjnurj4P9iumf3FUZs6EAAI5"
-    "I6AClZPU2WPT2WEVfy+yrIe7/RlX5zoXpDNfr219T053wXq6CWgfgWwRcHRubllp6dyybOkQ/UAA"
-    "AQRyWOAgfa58pLS0sl8OG9B1BBBAAIH9CPSp+Doarfy4TvCHbtRIfaHp0FWl57S1LfrzfvrOLAT6"
-    "ImB0m/c6182boCDeLem6OIhn7uxLA6ybPoF4fNPtOtA5PX0Z9L1l7QcTth05Qq/TakXjDFffSYmw"
-    "h8CGDQuaVNR/ugYgnK7X2pY9ZmXYj3aRTqw8Wlw8/xMZljjpIoAAAh8Q8C6Q0R1/LtFnmMu970Mf"
-    "WCB8T6gQyl6i2yrnhS81MkIgXAL6MJ9n2XZddaJxZBCZXTRl7HJjmW8HEdvHmDcvSTQe72M8QiGA"
-    "QJYL9Hfz7tKQ+UeEuJubksnOKeXlk3b6lmNR523q80d9i+drIGXGhAACOSOgu4emuYjY3tTR0eEd"
-    "F+/2dNBBw+r1fbq52ysEs+CJ8fjcE4IJTVQEEEixwNBk0nlk5MjLB6a4XZpDAAEEEPBdwP5oMmkW"
-    "+x6WgAgggAACWSHQp+Jr1fOFcdRr1VGZmc3NCx7Pii1EJ0It0Nb2/W0qQLxKhSNe4d4et6WzN9n2"
-    "jgdDnTzJdSkQi1V8VQWll3c5MzOefEMXn0xT0fWU5uZbXsuMlMkyUwV0d4klxkSOUv6/zdQ+KO/+"
-    "juP+rKRk/rgM7gOpI4AAAu8JtLYuvNt17dP0+XTTe0+G9Aed2D4uFtt8XUjTI62cFzD+FcP5Y1li"
-    "u6YukTARf8LtHWX96nE3aIjtMN/ZJF93N6tf8siqg/bOnN8QQACBDwpU16+drc9CF3xwTmie0ccg"
-    "e8Yl5018ya+MquvWTLFsc6lf8fyKo5LrsL2f+tU14iCAwD4ENGjTJO3kztzH7JQ8rXOE97766l1v"
-    "9aSxlSurdupC5jt6sk4Qy+rcRJoL14PoFTERyFmBI/PzC70LQbgKLWdfAnQcAQSySOAC3cmTO/Nl"
-    "0QalKwgggIBfAr0uvlaR0lE6EPF5vxLxL479ny0ti5b5F49ICBxYQKMMrmhpGXqsil6/qqV32LZb"
-    "3dx8z/YDr8kSYRJQ4bV3u+2wj/i2HzLzy7y8zg/p4pP6/SzELAR8FWhpueUl7f9O0UmVaxS43dfg"
-    "qQs2QsU8vxw58ppo6pqkJQQQQCA4AV0c81tjOj+pFtYH14pvka/XQcvxvkUjEAK+CURqfAvlX6BT"
-    "tyXXBnLBQlWV7XYm8y7QKeEW/9L1PdJoszNSq2IaTlz7TktABLJHoCax6kPaSSwId4/MTTOnlv3E"
-    "rxxrHnyhTMck7/Erno9x/qRYFF/7CEooBDJDwNVgNekrNPTuBBWJJG/vjVUkYnsjGm7rzbr+rWN/"
-    "kUEi/NMkEgLpFtD318nxeIV37oQJAQQQQCDjBezvx2LzPp3x3aADCCCAAAK+CvS6+FpFSlcok1Cd"
-    "8NJB5p+rCPZGX4UIhkC3Bao6VfT63UjE1YUJ7sJur8aCoRCIRuefrEQy9Qp0HRA2X9aFJ2e+/PId"
-    "6b41Yii2J0mkWqDK1Uir39dIq7oIxfpbqlv3pz1zaF5ex3+NGHHtIH/iEQUBBBBIr0Br6+3P66Ks"
-    "45XFc+nN5ICtF6qO8gdaKlTfLQ+YNQtkvYCxzC/UyfDdzci2v1lbt+bUIDbApece1ma59rmKnQwi"
-    "vh8xjWV9vqa+qcKPWMRAAIHsE7gzsXKg5UYS6lm/EPfuTzu3bP26X/nV1LxYZEWSXp8H+xXTpzhv"
-    "JJOdU32KRRgEEMgQgVGjrozrPJ03wEnaJn2/bNi48fYNvUlgw4YFuqukVdubdX1cx3Fdd76P8QiF"
-    "AAJpFtDANd+Jxys/m+Y0aB4BBBBAoI8C2p/n6zRGoqRkTmkfQ7E6AggggEAWCfSq+Hr48Dk6mGum"
-    "hcxhveNYFyknnYtjQiB9Ahs23NbY24N76cs6t1suLp57pArmH5FCQeZJmNU6oHycCq+9UTnY/2Xe"
-    "BsyqjNvaFvzNcezj1KmlGdqxj+Xn7/yhZc3Sl2cmBBBAIPMFvIuy8vPbvQvMVoS8NydpFKAZIc+R"
-    "9HJQYLvT8WV1e3XIuh4xtv1gTeLFQO7YMWNa2W8sY74Vsj7vlY5tm5uq65pO2OtJfkEAAQQkMCCZ"
-    "d7f+mxBijF0FybNnH9PhW479dt6hWB/xLZ4/gYxt7BmXnDfxJX/CEQUBBDJFoKMj37sVe1qPseuz"
-    "Yp/ufqBjm97AOm56zc1FxcVXH5zeHGgdAQR8FIhoBOz6aLRijI8xCYUAAgggkB6BYmMiPxw7dk5h"
-    "epqnVQQQQACBsAn0qvi6oCDvfHVkYIg606nC66neVekhyolUEEAgAwS80Tgcx/kvpTo0A9LdK0WN"
-    "wpHo6Cj8eGvrgpV7zeAXBNIooPfiHS0tCy/S1b+XK41MvL3w6bFY//uVOyOwpvF1RNMIIOCfwPr1"
-    "d28qLLROU8Sn/YvqfyS9b9w4bNh1Q/yPTEQEei9wRfmktywnWa4IO3ofJZA1iy3T+WAiYSJBRH9p"
-    "zbhv6pPQ/wQR26eY+bp4tn7JI6sO8ikeYRBAIAsEqusbL9PFKd4x67BOvhck19Sv0cjS9sWh67Bt"
-    "3zh9WtlPQ5cXCSGAQKAC3t3kVPg8O9BGDhBc7S9vbl74/9k7E/CoqvP/33NnElaFIJCZCbJoQqC0"
-    "2kXtXqXWtnZ1DWERCCoUFZKAW1tbx6WLGwmgKAqERbKMVmtt7fqr7a+b7d9fW9uikKQKmsxMAFll"
-    "STJzz/+9qMiSZSZz7pz3znzv8/Awc+857/t9Pze5ufee97zn77006/Ewvdtspgaar2Giv8cTu6FH"
-    "oTgIAiDgNgKn0TXqqVGjKjmv0OI2ptALAiAAAloI0FjGRw8c8NgTobGBAAiAAAiAgNGn5Gsqrqr1"
-    "BcqJ543+uC1pba3+y4n78R0EQAAEeiIQCMwdGIt5n6U2o3tqx/BYB72kKacXyVN27rx3P0N9kAQC"
-    "RjRa/bBlyc8Qij4t86kZ4VW0DOAtmjXAPQiAAAgoI7B1a/UeSsD+PBnknIA9csCA9tuUBQ1DIKCI"
-    "QFnJxH9TIjK/Zb+l/OxBq+lWRWEeZyYYFJan3bQTGMPHHeD15XSr07OOqodhwhyv8wI1IKCFwLra"
-    "zWcJQz6gxXmiThUnJK+rf2U8JV4/mqj7NLZ7oWPP3mAa/cEVCIAAEwK0mty1JEVrgZN43FiiAge9"
-    "e9f+N8UubEHVrwepiAc2QAAEuBAQH4rHpb2KLTYQAAEQAAH3E7jG76+c6/4wEAEIgAAIgECqBJJO"
-    "vi4oqPg4VVs9K1XH6vqL10zz4B3q7MESCIBAthCQcqA9SPVhl8XbSpX+LwiHly5zmW7IzUICbW1L"
-    "/ypl/MN21Rm3hU+JPHfTQ/MX3aYbekEABECgOwJ2ArYQni/R8cbu2ujeT4PLC6kCUKFuHfAPAicS"
-    "KJsy/hEh5eMn7tf9XRrGnWvrtlzohI6ZMwu3S1NMI9txJ+wrsSmNL69taKxUYgtGQAAEXEvgodCm"
-    "wZZphigAzlUE/3fbyJbbVUGuqXmtv2V47JhPUWVTkZ0dpimvmDfvnE5F9mAGBEDANQTm5pDUCs1y"
-    "t7S15T2nQgO9e/8j2fmbClsp2DjN4+ksS6E/uoIACPAkQIVfyhfylAZVIAACIAACyRGQy/LzF30s"
-    "uT5oDQIgAAIgkGkEkk6+pgHx6ZwgWJa1MBx+9CAnTdACAiDAn4DfX2FXr2N1PeuNGl1//0VJrJ9A"
-    "pf/eSOE4JwLR6PId4XCeXW2VY0WunlB56GAtkgB7QoRjIAACbiMQDj+w07JiNLFERplqz43F5N1M"
-    "tUFWlhM44InNJwSbmWEwpRAbN2x42e+ErjklRb8XhrjTCduqbJK+e9Y2bP6kKnuwAwIg4D4CA62c"
-    "R0h1MWPldkLytODkyTFVGsWAzhVk62xV9hTZsehv0lWzSopbFdmDGRAAARcR8PsHlpLc0/VKllWG"
-    "EbRUaRBCkD29m5QmjWEEvXpVwDsIgIBqArSA0wM+X+X5qu3CHgiAAAiAQNoJ9DPN+NOnn35DIO2e"
-    "4RAEQAAEQIANgSSTr4MmJf9dwkU9vfz4KVXV/CkXPdABAiDgDgI+36LJpPQed6h9WyVde5+Nxzs+"
-    "SVU3XneTbmgFgbcJBGORSPU3aOUMe6UKKtLolk3m0TKAT48Ycd1gtyiGThAAARDojUBb24Ov0XPU"
-    "l6ndW7211XGc/lZcSastfVCHb/gEgZ4IXF8y6S3DjJdQG26Tv/M7czwbQyFpTxxTvm3dXGhPiPiV"
-    "csOKDNKNpZeSUupW1m4ZrsgkzIAACLiIQE1903Ukl/PEeuUJyWsaGqfStY9dJVTS9IM5U4p+6aIf"
-    "H0gFARBQR0CQqcXqzPXJ0k6Px1zfp57ddAqHhzxJh7Z1czhNu+U4n2/vZWlyBjcgAALpI+ClQksN"
-    "BQULRqXPJTyBAAiAAAg4Q0D4YjFvvWEcWQnGGRewCgIgAAIgwJpAUsnXgcAue8mEAiYRUTEN+R0m"
-    "WiADBEDAJQRoOa/RQlgNJNdNFSMejUaHXrZjxwqWSVIuOfWQqZ+ADIerg1LK2SSlQ7+chBW83+vN"
-    "3UCt7YEkbCAAAiCQEQToevx3SnK+ioLhOCGGJvyKuzICNILIOAJlJRP/TTcEldwCo+rPkw/Em77l"
-    "hK5gUFieDtO+XoSdsK/I5um5plhH95m4X1MEFGZAwA0E1tVuPotuZe7nrFVI4/sqE5LX1b8ynmyu"
-    "ZBjz/76e3xpkqAuSQAAE0kDA7y+3V7zTWo2fJhivaGmpOqQ23GCMbi+Xq7WZvDUaB70p+V7oAQIg"
-    "4AIC+ZZl/oRW3hzgAq2QCAIgAAIg0DOBT/t8g5b03ARHQQAEQAAEMpVAUsnXhmFeygUEDao1tLZW"
-    "/5OLHugAARDgT2Ds2GB/qor2FCkdwV/tEYVxesF7PVUMnkfLCypbntYlsUNmhhKIRpeutyuuUtLf"
-    "XheFeInfX+FIQpOLGEAqCIBAhhGgBOwf0/WYZcISPet9xecrPzfDkCOcDCEwu3T8o5TsZ0/M4rUJ"
-    "I0jVUD/nhKiZMwu3S1NMI9txJ+wrsvklqoCru+KiolBgBgRAoDcCq5/ZfIplmiFqxzdZRRq/3+pr"
-    "vaO3WBI9vn79S4Msw/M0tT8l0T5paSeM7aYppwUnT8Z7q7QAhxMQ4EhA6L4Ha+/s9D7sBJmOjthj"
-    "ZHefE7aTsHmOz1dxQRLt0RQEQOBtAi38QYgP0cqby/jrhEIQAAEQ0E6A/TWdJszdQGMaM7WTggAQ"
-    "AAEQAIG0E0gq+VpKg8vyVvR+3QimnRYcggAIuJpAe/veBylR4iMuCaKDrrml0WjVCpfohUwQSJhA"
-    "OFz1G5pYYCcH7Uq4k/6Gd/h8lefrlwEFIAACIKCOQDjc8k2y9ht1FtVZosTwW9VZgyUQUEvA03F4"
-    "PpWNf0Wt1ZStmVQN9fENG172p2ypCwNzSop+T3Wlg10cYrPLFMYP1jZs/iQbQRACAiDgGAHzkPkI"
-    "GS92zEGqhikh2TIspQnJ8ZwBD5Gs96UqTXF/S0hx1ayS4lbFdmEOBEDAJQQKCio+SFIv0imX3qFv"
-    "3LHjvqgTGnbtWm4nXq9ywnYyNlH9OhlaaAsCbxOg8Yfb6NNLLuBxjd9fOdcFOiERBEAABLQRoGv6"
-    "DDcU9aIxjUcCgYoPawMFxyAAAiAAAloIJJx8TQlHk0jhGVpUnuRU/iIcXrrlpN3YAQIgAALdEKBr"
-    "WAklXl/dzWFuuw9JaV0ajVY/yU0Y9ICAKgKRSNWLpml+luztUGXTYTseGujYQMsADnPYD8yDAAiA"
-    "QBoJPBGPxXKuIoc70+g0UVf2qgMTE22MdiCQTgIzZ559wDJMer4wDqbTbwK+8mM53tpQSHoSaJt0"
-    "k9dfKfo+dfpl0h3T1IES4r20Ylv9ytotw9PkEm5AAAQ0EFhTv+UGcmtX4+e6HUlIvnrqhLAqgWvq"
-    "G8sMYcxSZU+ZHWF8b3Zp0a+U2YMhEAAB1xGwLHmTZtG0cJJV5awGzzKyr7m6v7j4nTFaZ0OFdRDI"
-    "KALWQcsSl1FILigAI5fl5y/6WEbhRzAgAAIgoJBALCYbKc/DripNr/9YbwNoYuBTgcBivJtkfZog"
-    "DgRAAATUEkg4+Zr+jl2g1nVK1uyXHdhAAARAICECgUD5aJoNaVdFcsP2lpTml6PRZc+5QSw0gkAq"
-    "BFpbl7xEs5Un0z2GI9VpUtHWTd/TaRlAe7lRbCAAAiCQMQTeqRA2j2FA9KyqfflqhlggiQuBa0oL"
-    "/yMNWc5FzzE6Ljggm+0KX8q3YFBY0hT2hA22FU5pgGNUjmmupywcoRwADIIACGgnsLp+y9nCEPdp"
-    "F9KDAPrbcLfKhOS1tU2T6IJGK7kx26Tx+0Gi6A5mqiAHBEAgjQTsd+70zGZPSNS5/aqtbdl/nBQQ"
-    "iTywje4xf+SkjwRsC9OUNybQDk1AAASOIdDWVvUqXaem0y7rmN0cP/YzTevJESNu8nEUB00gAAIg"
-    "wIEAFef8CVWWvouDll40jLEsq94wglQkAhsIgAAIgEA2EEg4+do0xflMgGyJRJaiogaTkwEZIMCf"
-    "wJUeGnffQMmdefy1it2WZV4UjS55nr9WKAQBNQSi0apNNDniArLGNonnhEgvwzKAJxDBVxAAAdcT"
-    "iESqn6Jr8Vp+gcipY8dWDOWnC4pA4G0Cc0qLV0lDrGfHQ8rv1tQ2OrL8+5ySoh10vZhGiYCaq/91"
-    "T10Y8uJ1oSbdVRi7F4gjIAACfSJQ8/RrQ01DPEWd+/fJQDo6UULyYHP8napcrV//0iBpyhDZG6jK"
-    "phI7wthuGda0khIRV2IPRkAABFxJgBKSK0i41qQSSsBZkh546fLTfTTEe9rpp98Q6L4FjoAACHRF"
-    "gFbg/AXt/25Xx5jtK/B6O+m+b24OM12QAwIgAAJsCITDQ+6g95I/YyOoGyG0kvKFgcCeH3RzGLtB"
-    "AARAAAQyjECiydeCqgZ9hkns60gH9+UkmKCCDBAAAb8/8E2iwOX61cMJEbvpZfGFbW1LXuihEQ6B"
-    "QEYSoNnKWzwecQEF1+KOAGWV318x0R1aoRIEQAAEEiNw6FC/CnpxGUmsddpaDTx82LArFGEDAbYE"
-    "vB0HryNxLzMTaBoe4/HVdZsdSc6YPWX8/9I7otuZxXy8HGl8b3Voy6eO34lvIAACribQ3rmK9J/B"
-    "NgYHEpJjuQNXULzvYxazZcSNGVdPnRBmpgtyQAAE0khg9Oj5VOhEXJNGlye5oufXf4fDVb8+6YAD"
-    "O6h4xN/I7B8dMJ2MydzOTi/HlXeSiQFtQUALASo68H1y/GMtzpNz+mmfb1CaJpUkJwytQQAEQIAH"
-    "gaCVm2vMoElpzTz0dK+CNC6mlWKmdN8CR0AABEAABDKFQELJ14HA4mIKOJ9D0JSc9QQHHdAAAiDA"
-    "n4DPV34uJTS7YUb7ASGsr4XDS/7BnyoUgoAzBFpaqpo9Huuz9DDqhgHcgUQhNHZskG/FNWdOE6yC"
-    "AAhkMIHdu+/ZS4PnHJcxnpvB2BFaBhCYOfPsA8I6stz6QVbhSGOkaZi1oZD0OKFrdul4u3rLs07Y"
-    "VmGTZux7PVLUrazdMlyFPdgAARDQS2BtXeNCUnC5XhU9eleekLy2rulqquQ/s0evOg5KeVfZtPFp"
-    "SXbUER58ggAIJEags7PfN6jlKYm1dqaVZRl2gmIaCzXpr35NCeffyMu7ZYgzRGEVBDKagIzFOq6i"
-    "917cJk6fBJ2qpd4QCFTMOekAdoAACIAACBwhsHVr9R7T9HyVvuxjjoQKnIoauqZ/mLlOyAMBEAAB"
-    "EEiRQELJ11JaXKrGvmgnZ6UYM7qDAAhkAYHhw28+hRKv6ymRk/sSXYfoxvvLVPlXd+WMLPipQIjc"
-    "CbS0LGsyjPhFpHM7d62k7/0dHXvvdIFOSAQBEACBhAlQ1bBaGsz9bcId0tCQ9JyVn7/oY2lwBRcg"
-    "0GcCs6cVbTKEWNBnA051FMb5b1mNjkxGpWctGTc7Z1O+yzan5Kdql54FR+WY5vpgUCb07itVf+gP"
-    "AiDgDAGq4n+OFMa9zlhXZFVxQvKq+ub3SyGXKVKn0szvBnnG36XSIGyBAAi4j0Bh4YJ+9Jym+d5X"
-    "RgcPjtelk14k0vITivu/6fTZha9T+/Xr0FpxvAtN2AUCriCwY8eKt4Qw7cl83JP1DHqWfRDJeq74"
-    "sYJIEAABTQTC4Qc206tJu2hLGifi9SnYATRhsOHtVWP61B+dQAAEQAAEXEAgwQEo60McYqE/oE9y"
-    "0AENIAAC/Ank5nbYldjOYK60g2baX0bLFv6euU7IA4G0EYhGl7/s8Ug7AfvNtDntoyMpZaXfv/Aj"
-    "feyObiAAAiDAkgAN8NxAwmKcxAkRR/VrTicEWrokUDalaA297l/X5UGNO4Uhbltb3/R5JyRcUzJp"
-    "l2GYpWS70wn7KmxS1diLx0xovlmFLdgAARBIP4Gap18bagqzgTz3S7/3hD0qTUhev/6lQaZhhci7"
-    "veISp63Nktb0khIR5yQKWkAABNJP4OBBz3R6bvSn3/NxHh9qbl7eftwex788Qdc/We24m14c0Dhp"
-    "uWHM5V5wppcocBgE9BCwk/VoTG42eWefrEfX2adoZXKs5KTnRwVeQQAEXECACts10MS4B7hLJY2F"
-    "tGrMRsMIJpibxz0i6AMBEAABEDiRQIIXePH+Ezvq+S6wpKEe8PAKAq4iEAiUf4peTMxnLtpOapoa"
-    "iVT9grlOyAOBtBNoaVn6L3oYpSQhsTvtzpNz6KWEo1X0wEz/YwMBEACBzCAQiVS/QpGs4RQNVdid"
-    "gqWVOZ0RaOmOgKfz0PV0jNsyxiZVT91AlWMD3elOZX9ZadELdM/mSHXtVHQd25cSsO+qqdvy6WP3"
-    "4TMIgAB/AjTZVRjtnatJKeeJ9W3eztg0lQnJ8dz+DwvDmMjsDFmGZVx19dQJYWa6IAcEQCD9BGj5"
-    "dOPG9Ls9zuNBIbyPHLcnTV/i8ZwaBu8rT/f7B9oTILGBAAj0gQCNyT1Nudd28Sbu2xjLsuox9sD9"
-    "NEEfCICATgLh8NBv0ngyq5U8u+Fxsd+/945ujmE3CIAACICAywkkmnw9iUGcu+iP5z8Z6IAEEAAB"
-    "xgTGjg32pxfAj5HEBK9vuoKRN1By01O6vMMvCHAnEA5X/500fp1ehB5mrvWDfv+em5hrhDwQAAEQ"
-    "SIqAxyPupA6HkurkbOOB/fsfxuCys4xhXQGBmTPPPiAsUUKmDiowp86ENEaahlkbCkmPOqPvWZo9"
-    "pfAeSpH8yXt7eH2ikmZeQxihmtBrPl7KoAYEQKAnAmsbmqmyp3FZT200HzuSkHzVVe+LqNJR07Dl"
-    "Wkrqu0qVPVV2aBWFO8qmjUdRFFVAYQcEXEwgP7/8yyRf8wQRuZ6q1+7UgbGt7f4DhmGt1OH7WJ/v"
-    "JMDTXB1sIAACfSEQieR9h8YdftGXvunsQ5XuLwwE9rghUTydWOALBEAABI4hEIxZVtweN3j9mJ1M"
-    "P8pvBwIVlzAVB1kgAAIgAAIpEOg1ObGgYMEoegDJS8GHoq7y9zS701JkDGZAAAQylEB7+x6quiYm"
-    "cA6PXo7eG4ks1f6SljMjaAMBmwBVofgD/b7MpI/c//7f7vdXaB54ws8MCIAACKgj0NJS1UrX3+Xq"
-    "LKqwJC5VYQU2QMBpArOnFW2iBYwpeY7ZJozzD8abgk6oour00hKdZfTuaJsT9tXYFD5DxjY6lYCu"
-    "RiOsgAAIvEugpn7LuXRNuefd7xz/V52QvKq++f2GFNXcYpWGfH6gWfg9brqgBwRAQA8B0xQ36/F8"
-    "1KukqtdLj37T8MHrjdvPyh0aXB91SRUezwoEKi86ugMfQAAEkiQQtHJyOqbR79J/k+yY9ub2ZAta"
-    "7XdK2h3DIQiAAAi4hEA0unyHadrFvJgVwziZn72CzAafr5JD4dOT1WEPCIAACIBAnwn0mnxtWSaT"
-    "i7/4Y5+jREcQAIGsIFBQsOhselmie9nD3lg/GY0O/WZvjXAcBEDgbQLR6NIn6GH0FuY8+pG+h+kf"
-    "Ks4wP1GQBwIgkDgB0/TcR605Ve+dnJd3y5DEI0BLENBHoGzq+Fryvlafgq49U3Xqb61paPpC10dT"
-    "23tNyaRdUgp7QLgzNUsO9pbyswfijdzvKx0EANMg4A4CNU+/NpQerRpIbS5XxaoTkh8KbRpsGlaI"
-    "4h3ILOa2nM749JISEWemC3JAAAQ0EKBEkfPI7ac1uD7qkt4R/pSqXm8+ukPDhzfeeDBMbu2/U1o3"
-    "KSVW4tN6BuDc7QRef/3h3UKYl1McnN59dYmVnrVX5+dXfqDLg9gJAiAAAiBgtLZW/5PuE693AYrB"
-    "QlhPDhu24FQXaIVEEAABEACBBAn0mnxtGCaLCrJUSelfCcaEZiAAAllJIOi1LLmabqxzuIZP2v7i"
-    "8Qiq4osq/lzPEXTxJBCNVt9PLxgf5KnuqKrz/f7Ka49+wwcQAAEQcDkBexlnKma7llEYuQMGdFzM"
-    "SA+kgECPBAaZA66jBi/12Cj9B00qsbJhXWhLgROu50wd/1eaDHubE7aV2RTirrV1Wy5UZg+GQAAE"
-    "lBKgRDIhOzrXkNFxSg2rNaY8IXlQ3PswzeSdqFZmytYsmrQz46qr3hdJ2RIMgAAIZAQBej7kkOy7"
-    "hANMqq7IQcfnAoFFH+LAAxpAwK0EWluXvET5B254pz/I45FPjx49P8+trKEbBEAABJwmQGPJa+l+"
-    "dYXTflK3Lyb06+dZR3ZQ0Ct1mLAAAiAAAiwI9Jp8TQNnjgzKJRt9LGb9O9k+aA8CIJA9BPz+PQtp"
-    "SdqPMI74VcOIf72lpeoQY42QBgJsCUSjLRU0geEnbAUeESZ/UFBw/Wm8NUIdCIAACCROgJ7B7AFl"
-    "NpUOaaLdJYmrR0sQ0EugpOT0Q6YRLyEV+/UqOcn7CMsStcHnn/eedETBjlklRVQ1Xz6jwJRTJkxa"
-    "q35jTeg1n1MOYBcEQKDvBNY2NFYKaVzadwuO91SekLymvnEeXZdmOK48SQeUeH37nCnjf5NkNzQH"
-    "ARDIUAIjRy44k0LTfX3+OyXV/I4DYru6Io2d/la3Finj3FcB1Y0I/kGgVwLhcJW9clV1rw01N6Cx"
-    "kTM7O/ttpOJOveZ2aJYK9yAAAiCgjUBeXl4l5TT/WZuAxB1f4vdXfCvx5mgJAiAAAiDAmUCvN+hU"
-    "cSTAIIDt27cvbWOgAxJAAAQYEhg5sjyfXnZ+l6G0dyUdNE3zsmh0+Y53d+B/EACBZAk8EY/FcmlA"
-    "WrycbM80th8Wj+cG0+gPrkAABEDAUQLbty//Lzl42lEnSRin+72LCwsX9EuiC5qCgFYCs0onNlLy"
-    "2jytIrp2/pkx20fd0fWh1PZS1TCZG+9fRla2pmbJ0d750uqoDYWkx1EvMA4CIJAUAarKfx497/0g"
-    "qU5pbqw6Ibkm9MoHqNRVVZrD6NWdNOTzg0UR63PRaxBoAAIgoJSA12suIoO67504VJs+ytWyOFS/"
-    "FiV+/+IxR0XhAwiAQJ8IRCJD7cr+v+tT5/R2utjv3+vIs3x6w4A3EAABEHCGwKZNwY7OTnkFjSNE"
-    "nPGg1OqdPl8FVvpUihTGQAAEQEAPgV6Tr2ncjEPydZMePPAKAiDgBgIej7ibZn0PYaz1G/byZYz1"
-    "QRoIuILAzp337hfCuozE7uMqmO6bvuHzLXgfV33QBQIgAALJEqBEypXJ9nGw/akHDngnO2gfpkFA"
-    "OQGqGlpnSGONcsOpGpTy1pra5i+maqar/tOnj9ltmnIKHevo6jiHfcIQk9+STd/koAUaQAAEDGPj"
-    "xm15VJW/nljkcuWhOiH5odCmwYblCVG8A5jF3CbM3GklJYLN6ifM+EAOCGQdgUBg8XApxWzNgbdE"
-    "IgftayabjapwP0diXtEsiFaziVdo1gD3IJABBIIxy/Laz7Bv8A9GfjsQqMDKcPxPFBSCAAhoIrBz"
-    "Z7WdeH0l/WP7XvIdNCaNvWx8Z4UZTbTgFgRAAARAQAWBXpOv6aWK9uRrmpnUqiJY2AABEMg8AvSS"
-    "4cMU1RyukdH166FIpHoDV33QBQJuIxAOL91CD6MzSbdkqt0rhIdVJR6mnCALBEDAJQTC4SG0lLJ4"
-    "jYtcmuTyNS5aoAMEEiZwOOd6avvPhNunp6FpmNbGVRtfdqRS3qyS4r/RBNlvpyeUvnkR0rhjTUPj"
-    "5/rWG71AAARUEaBVF0WHp8OepDJOlU0H7ChPSB4U9z5MOic4oDUVk5aQcnpZybhoKkbQFwRAILMI"
-    "WFbcvpcdqDMqese+3DAe7dSpoQvf9G5SVHexP927rhk9en5eup3CHwhkGoG2tvu3023pFRRXO/PY"
-    "6HbNWEcTY7jdRzLHBnkgAALZRCAcrv4TXdMr+ccs87xez9P5+TcO4q8VCkEABEAABLoj0GvyNXXU"
-    "nnxNL+GRfN3dGcR+EMhyAvSSwV6eNZFrWdpJUXLQC3l5Q+0lGbGBAAgoJBAOVz1DgxvfU2hStakv"
-    "0FJRX1ZtFPZAAARAQA+BoCWltVaP75O90kvT80/eiz0gwJtAWdm4w0bcU0Iq9zNTOszj8davXPli"
-    "jhO6ykqLHqB7th87YVuRTZMSsB/fsOFlvyJ7MAMCINAHAjX1TYtpbi3n6n3KE5LX1DfNl0LM6AMu"
-    "Z7tI+Z3ZU4v/x1knsA4CIOAmAoHA3IGU+GwnX+vc9ufmGo/qFNCd70GDYuvoWFt3x9O0f3BnZ79v"
-    "pMkX3IBARhOIRqv+RgFe64IgT5Uy/kxe3i2cVwR2AUZIBAEQyGQCdE1fQe8lV3OPkXJdPmCasfWk"
-    "U3DXCn0gAAIgAAJdE+gxYXHSpKC91OMpXXdN3176g2MvDYENBEAABI4jEAhUltKOzxy3k8+XNo8n"
-    "fvmmTUHuS9rwIQYlIJAEgUhkyO00QP+LJLqktSkNTFGy0VxHEpnSGgicgQAIgAARME1PDf1HVb04"
-    "bHLiqFGVwzgogQYQSIZA2fQzm+jXaG4yfdLU9mO5Q0650wlftFqJzI3nziHbrzlhX5HN/M4cz8ZQ"
-    "SHoU2YMZEACBJAisC205j56dOE+spUu32oTkdbWbzxKGpOdFZpsQvx3kGX8PM1WQAwIgoJmAZQ2c"
-    "RRJG6JUharZurd6jV0PX3publ7fTPe/Kro+mby/9LV1QWLigX/o8whMIZC6Bd1ay1f57nQDh8f37"
-    "t6+ldkjWSwAWmoAACGQngX79htxAl8n/c0H0l/l8lSjo54ITBYkgAAIg0BWBHpOvw+FDA7rqlO59"
-    "pineTLdP+AMBEOBNwK66QVXx72WqkqRZc95448EwU32QBQIZQCBoWVaOPQCku7pMdyyL/f5B13V3"
-    "EPtBAARAwE0EwuElb9CE2BeYaBadndYnmGiBDBBIikBZaXG9MMSqpDqlpbG4ZW1d09eccDV9+pjd"
-    "pintSbNsJ6XSOZl80Gr+thPxwyYIgED3BDZu3JZnWaKBWtjFP3huihOSHwptGmyZZoiCZfHO/T3o"
-    "MmoI7/SSEhF/bx8+gQAIgMCV9uQ03UkgccsylnI+F7GYRVUV5WGdGul53X/woMlvRQWdUOAbBFIg"
-    "MGhQvNxe2TYFE+nqeonfX/GtdDmDHxAAARBwG4GtW4N0j2ZeTrp3ctdOf3d+WFCw8ELuOqEPBEAA"
-    "BEDgZAI9Jl/n5Bzuf3IXHXuE1hcXOiKGTxAAgZ4JSDmwklqc3nMrPUep0sSKaHTZc3q8wysIZA+B"
-    "trb7t9PgQhlFzKQa64ns5bdHjLhu8Il78R0EQAAE3ElA/IiLbtM0Pski5vc9AABAAElEQVRFC3SA"
-    "QLIE5CHvArpx+Uey/RxuL6SQNas2vjzGCT+zSopp6Wb5TSdsq7IpDXl7TW3jRarswQ4IgEDPBGjG"
-    "uujwHK6hVmN7bqnzqPqE5IFWziMUUbHOqLrwHZeWnF5WMi7axTHsAgEQyGICfn/gEnrPXagXgfhx"
-    "W1vVq3o19Ox9+/alVBjC3NhzK+eP0p/WxeQFFXCdRw0PWUDArmpvmuYV9BzrhvujO32+iouz4LQg"
-    "RBAAARDoE4FI5IFtpmmVUudYnwykr5PXssx6v3+xI+9n0xcGPIEACIBA9hHoMfmaKk6zqMJBiVWH"
-    "su/UIGIQAIHuCIwdWzGUjumuutGdvFcM4+DN3R3EfhAAAbUEotHqn9N9woNqrSqzNiInJ+d6ZdZg"
-    "CARAAAS0EpB28jXljHLYBJKvOZwGaOgTgbKycYdF3DOFOu/rkwHnOg3zeLwNK1e+mOOEi9lTxldJ"
-    "YTzthG1FNk3DNDasrtscUGQPZkAABHogsC7UdBPlh329hyZaD1HmWozuekpUJiSvrdtiPxtO1xpY"
-    "F85p8s135kyb8NsuDmEXCIBAlhOgxOsbdSOgFVQe0K0hEf9CWPdRO93PyxMDgcqvJKIXbUAABHon"
-    "0NJS1UpVSO1qqWxXcXonClMIsXHUqErNk2V6Z4oWIAACIKCLQGvrsv+hsWTWhSHeYTPcMOI/tleA"
-    "18UKfkEABEAABJIn0EvytYdF5WuqhoLK18mfW/QAgYwl0N5+5MXvMIYBdghhTg+HHz3IUBskgUDG"
-    "Eujff6g94eE/HAOkqjM3Dh9+8ykctUETCIAACCRDgCa7bKX2LyXTx7m28tzCwgX9nLMPyyDgLIGy"
-    "6Wc20XuOuc566ZP1j+YOPfWuPvXspRMNBkuRmzOHmr3WS1Odh/NNYW4MhaRHpwj4BoFMJ7CmrvGj"
-    "NOh5N+c4pSG+Uza1+A+qNK6r3XyWFMJOzGO1UZw/f/2V8fewEgUxIAACLAj4/ZWfpndaH9Mphm4f"
-    "X2htrf6LTg2J+g6Hl26h3OtfJtreqXb0jKE9Yd6p2GAXBHQQCIeX/ZnDRJTeY5d5liWfys+/cVDv"
-    "bdECBEAABLKTAI1vPEDX9JALov+gYQxc4QKdkAgCIAACIPAOgR6Tr4WIs0i+ppcsFs4YCIAACNgE"
-    "fL4FI+i/co406Ib9O+HwEm5LiHNEBU0goJTA1q3Bw5YlptEgB8fJWsNzcjoXKA0YxkAABEBAEwFK"
-    "nvy1JtcnuBX9Dx3yfPiEnfgKAq4iMGdqcQOVxnuUnWhp3LymvsmRarRll47bQ/drdtVvzpXDLjgQ"
-    "b/wOu/MCQSCQIQQ2btyWR+95GygcR6rsq8BkJyRv21x4rwpbto3Vz2w+xTJNe4CXxQqT78ZF77Ba"
-    "Oi1rZjAo8N79XSj4HwRA4CgBDkm89K7PFVWv34VG19Ul737W+P9n8vPLP6rRP1yDQMYRCIerl1NQ"
-    "G7gHRpMbPyBEbDXppEVcsIEACIAACHRBQHZ2dlxN+1kW8zpWL13TZwUC5Tccuw+fQQAEQAAE+BLo"
-    "MfmaLuo9Hk9XWDTIz+rldLrihh8QAIGTCZimeQvtHXzyEb176OXqX8PhVle9ENZLDN5BQC2Btraq"
-    "f9N7RabV0+TiYcMWnKo2YlgDARAAAS0EfqPFaxdOKRng3C52YxcIuIqAOJRTTgnY3CZv0qONrKmp"
-    "e2WsEzDLSov/H1VRvNUJ28psCvGdmtrGi5TZgyEQAIEjBOhvt2j3tq+l57YxXJE4kZBsHjIfoXiL"
-    "OcVMGTkxaclp86YV7+SkC1pAAAR4EAgEFk+g6+FX9KoRr0WjrU/r1ZCcd6p+/RsaU/1Xcr3Ut6bx"
-    "k5vUW4VFEMhuAh6PmEcTibk9u590UujaPcXnq1h80gHsAAEQAAEQOEJgx44Vb9E1/VL6QgUiuG9i"
-    "CSVgf4q7SugDARAAARAwek6ujsctJtWIBIsK3PiBAQEQ0Etg+PAKP43VzderokvvMbqckq4n4l0e"
-    "xU4QAIG0EIhEht5Djv6ZFmfJORmWm+spT64LWoMACIAAPwKmafyByyoDNKg9kR8hKAKB5AiUlY07"
-    "TNVQS6jXvuR6Ot46zxCe+lBoU64TnspKC6vJ7lNO2FZk0zQ8xuOr6zYHFNmDGRAAASKwtqH5FiGN"
-    "r3GFYSckx4WcqjIhuaa+0V4FaRq3mOnd2m1lU4vpvg4bCIAACJxMQErrRtqruzDTUhe+a6d5lUbV"
-    "yUTTvUdeOmrUwqJ0e4U/EMhkAi0tVYcMw2sn67GfuEYJ2D/0+8u/kMnnA7GBAAiAQCoE6JreTMU/"
-    "7ZX5WOd10PhHDj27P1lQsGBUKvGiLwiAAAiAgPMEenyBkpNjtDsvIREPcmAirdAGBEAgswnk5srb"
-    "KEKG1wPxw3B4CftZ75n904HoQMAmEIxZlj0RwmC3bDI9yFfm5d0yBOcJBEAABNxM4O3BJvECjxgE"
-    "kq95nAioSJHANSWF9gv/a1M040T3jx6wchxZVYTilUa/HHuZz9ecEK7EpjRGmoZZGwpJjxJ7MAIC"
-    "WU6gpr7pYzSB607OGOyE5KtLiv+oSiNN4DiHbN2nyp4qO9IQP9+2pZCdLlXxwQ4IgEBqBEaMuMlH"
-    "1+sZqVlJufeezs6cNSlb0WBg8OB4HSU+RjS4PtalaVmi4tgd+AwCIJA6gUjkgW30KGtPqmOdrEf6"
-    "6BlWPO73L2a72kzqZwMWQAAEQCA1AuFw1a9odS7W7yjeiTA/HveECgsX9EstYvQGARAAARBwkkCP"
-    "ydf0gI7kayfpwzYIgEDCBOxZfTQQdk3CHdLWUG4eNCjmSFJC2kKAIxDIIAJtbUteoNnAD/ELSeYN"
-    "GNBOyxNiAwEQAAF3E6D7sb8yiWACEx2QAQIpE5g9pShkSOORlA2pN3BjTcOWS9SbNYyyS8ftocQe"
-    "u8oMkxXXuohSGOe/ZTV+t4sj2AUCIJAEgVWhTcNofmw9dclJoltam6pOSK55+rWhpjAbKAhWA6SU"
-    "ENjSaVkzg0HBbsJyWk84nIEACHRLwOvtsCv2a7120US9x3buvHd/tyIZH2huXt5Oz8wP6pZIGmb7"
-    "fAtG6NYB/yCQaQTC4aW/pgTsb7sgruF0//2jUaMqB7hAKySCAAiAgBYC0Wje3TSe/KwW50k4pef4"
-    "jx844KFVYbCBAAiAAAhwJdBj8nVnZy6LQTApzXyuAKELBEAgPQToOmBXa3Bk2esUIqDBKnOu/VI1"
-    "BRvoCgIgoJiAlN5vUnUHdpUU6SF+oWHMZZtwoPg0wBwIgECGEqBBpr8xCS2/oOD605hogQwQSJnA"
-    "/iFHqtP9PWVDag0IQ4o1NXWvjFVr9m1rZaXF/48+3eyEbVU2hSFuW1vf9HlV9mAHBLKNQDAoTY/0"
-    "bqTnM7aV9xxJSG7vXEXn+gxO51sYRiwu5NR504p3ctIFLSAAAnwI5OffOIiu11oLB9A1uZMSBrUn"
-    "L6dyVjyeI5MqD6RiQ0FfWj3Uc50COzABAiBwAgFKwL6XrlWhE3Yz/Co/Eo8bjzIUBkkgAAIgwIRA"
-    "0IrFcqeTmFeYCOpJxjy/v5zjyok9acYxEAABEMgaAj0mXw8Y8BaLhEIa4D89a84IAgUBEDiJQF7e"
-    "LUOoWgPDG0pRE4lU/eEkwdgBAiCglUBb2/00wCFv1Cqia+cFgcCgK7s+hL0gAAIg4A4Cphnnknxt"
-    "SJmD6tfu+LGBygQILPxSUXvcNO1K0HsTaJ7OJnmUuNEQCm1yZCJsWel4u3LLU+kMKElfphRyw+q6"
-    "zYEk+6E5CIAAERhT3HgrTeL4IlcYTiQk19Q3llO8l3OLWRrGt64uKf4jN13QAwIgwIcAPevZq05q"
-    "neBKy78/QYmNr/OhkrySlpaqXTSmuS75nmp7UHLo9ah6q5YprIHAOwRkR0cuXS/Fy/yJyBmBQPkN"
-    "/HVCIQiAAAjoIWCvtkI5KPa47Vt6FCTjVSz3+SrPS6YH2oIACIAACKSHQI/J17m53oPpkdGrFyRf"
-    "94oIDUAgcwn063d4LkV3KrMI98XjlhuWF2OGDXJAID0EIpFqO4nnd+nxlrgXGkSqTLw1WoIACIAA"
-    "PwKtrctbqJJ/mIcyieRrHicCKhQRuKaksJkGcPlNOhXGeW9Zud9XFObJZvrlXE07Xz35AJM90hhp"
-    "GmZtKCQ9TBRBBgi4gsDahsbPCCHu4CxWdUJyTf2WcyneexjG/NzsKUX3M9QFSSAAAmwIBL1UyIDB"
-    "Oyu5hA2SFISYpqym7rRqptZtRCwmZ2tVAOcgkKEE7GQ90xSX0iSHvfxDFEsoAftT/HVCIQiAAAjo"
-    "IRCNVm2i8Y4y8k6vCFhv/WiC349GjizPZ60S4kAABEAgCwn0mHzd3Lzcrny9XzcX+mOH5GvdJwH+"
-    "QUAbgbk5NFi3QJv7bhxTAuXd27cvbevmMHaDAAgwIGCahj1opHug40QS59DSUJ85cSe+gwAIgICb"
-    "CNDg0iYeegWSr3mcCKhQSKCstOgJete/QqFJJaaEIRetq9tyqRJjJxgpu3TcHktadtVvFquvnSDv"
-    "7a/COP9gvCnY5THsBAEQOInAmlDTCHqfW0sjl5TMx3ZTmpBc8/RrQ2kCTQNF249ZxG90WHIWvVvj"
-    "PpDMDBvkgEB2EQgE9pZQxGM0R/27SGTZ/2nWoMR9S8uyJjL0rBJjKRihZ3daGfBKTCBMgSG6gkB3"
-    "BFpblzTSvd9VdJzb+MNxkumePIequj5ZULBg1HEH8AUEQAAEQOAogWi0+km6Vt57dAffD6M8HvOp"
-    "SZOCuXwlQhkIgAAIZB+BHpOv38GxgwGWMfgDwuAsQAIIaCDg8w2aRm5ZTcCgl5b/HTzYWqYBB1yC"
-    "AAgkQaC1tfqf9HJxbRJd0tRULEqTI7gBARAAAUcI0LV1syOGkzRKOs5Isguag4ArCOw/1bTvFf7O"
-    "TKywhFizPrR5nBO6rp464UWye5MTtlXZlML41pqGpi+osgc7IJCpBIJBaQpLbqD4ChjHqDQhmSbo"
-    "C6O9czXF68g1sq8chWHEhLCmzptWvLOvNtAPBEAgOwjQdWyx7khpjkiVbg1q/bOo4n2G3x+4RG1c"
-    "sAYCIPAugXC46lma4Hb3u98Z/58fj3tChYULuE0SZIwM0kAABLKNQDTaYq94/mv+cctP7Nq19z7+"
-    "OqEQBEAABLKHQK/J15RkyCH5Onf37j3vz57TgkhBAATeIWAX5mGw3OGJ50MsfmdlgBMP4DsIgAAz"
-    "ApYlv0WS9jGT9dVAYDGqtTI7KZADAiCQDAHBIvmaKgz5klGNtiDgFgILv1TULgxhVx/ktoTx0Lhl"
-    "NoRCmxyprlJWOn451WWtY3yeTCHlhnWhLZwTShnjg7RsITB6YpP9DMZ2ooITCck19c0VFPNl7M6x"
-    "kLfOnjLhT+x0QRAIgAArAoFA5edI0Ic1i2oKh/N+qlmDUveRyNL/JYN/U2q0T8bELX3qhk4gAAIJ"
-    "EQiHh9xBuRQ/S6ixxkak8eMHDniWapQA1yAAAiDAnMATcY9HlJLIV5kLJXlyId3Dl/HXCYUgAAIg"
-    "kB0Eek2+pgFtDsnXBs28/0h2nBJECQIg8C4Bv7/SHqw7+93vHP6nFxS/pdnsz3DQAg0gAAK9E9i+"
-    "fWkbPYRymwFsShn/Ru/q0QIEQAAEuBIQr3BQRpP08jnogAYQcILA7NKi/1Ih1WucsJ2izXMPSu8P"
-    "U7TRbff4QGseHdzSbQP9B0ZYlqgNPv+8V78UKAABfgTWhJrOp0kUQX7KjlGkOCG5pn7LuXRP4th1"
-    "8RjlyX2kJKBZJeOXJNcJrUEABLKRAI293ag7blrViKpeBy3dOlT7p7GEatU2+2DvXBpn+XQf+qEL"
-    "CIBAQgSCVm6uMYOuY80JNdfbaF4gUMHxPYNeKvAOAiAAAu8QaGmp2iWEeQV9PcQdCt3DPxQILPoQ"
-    "d53QBwIgAALZQKDX5GvLslgkX1MSOJKvs+EnEjGCwHEEpD3wzmqLx49U0WWlCWJAAAR6JmBZOfay"
-    "pdt7bpX2o7MCgbkD0+4VDkEABEBAAQFamoRF9Qca2ELlawXnEyb4EpgztehJQ4iHuCmkpPCKmvpG"
-    "Ryq8Xv31CftNy7KrfnMe5PjMmO2j7uB2XqAHBHQTWL++eaSwZC3p8OjW0q1/xQnJNU+/NpTeWTeQ"
-    "P0dWBOg2jt4PvGHmxGfZy8n13hQtQAAEsplAfn7lByj+z2tmsEtK73rNGhxxHw4PfYIMv+6I8SSM"
-    "UnLOTUk0R1MQAIEkCWzdWr3HND1fpW7cVuDsKpIVlID9ya4OYB8IgAAIgIBhhMNL/kEcrnUBiwFS"
-    "Wk/TSsvDXaAVEkEABEAgown0mnxNM7MjHAiQjk9w0AENIAAC6SEwYsRNPvq9/3J6vCXs5cdtbUv/"
-    "mnBrNAQBEGBBoK3t/gM0yHA/CzHviRgq5QBHkpbec4FPIAACIOAMgUhkf5gsc6hKNmjEiOsGOxMl"
-    "rIIADwL7TzEWk5L/46HmqApBn1avD20ed3SPwg+zpk34l+CeICLlrTW1zV9UGDZMgYCrCQSD0ozn"
-    "WhsoiADjQJQmJNMzppAdnWsoXkeuhSlw7JTSLJ112cQ3U7CBriAAAllCwDSPJOXa93Y6t4ftd3c6"
-    "BTjnOxijScPLnbOfmGUaZ/mK318xMbHWaAUCINAXAuHwA5tp3ttc6st68htdk3LoX/3IkeVYTa4v"
-    "Jxp9QAAEsoJAJFK9kcM9XAKwx9BKy7WGcSXfSfAJBIEmIAACIOB2AgkkX5sslsmhP24f8Pkqxrod"
-    "OPSDAAgkRiAnJzbbfgmQWOu0tLJM0wymxROcgAAIKCcgZc4KMtqm3HBKBoUbZk6nFCE6gwAIZCqB"
-    "Rztp8JbFNVUIDwaLMvXHDHEdIbDwS0Xt8XjscvqyixmSoXHLbFj2XFM/J3TNnlpsV/ymwQO2m2mY"
-    "1sZVG18ew1YhhIFAGgmMndB8G7n7fBpdJutKeULyulDjIqorfWmyQpxuTznht8yZWvhnp/3APgiA"
-    "gPsJFBQsGEVRTNEcSXtnp8FupReVTDo64o/S8/NelTb7YIsS7IU9qRMbCICAgwTC4aUN9Pv+gIMu"
-    "VJke5fGYT02aFMxVZRB2QAAEQCDTCESjQxdRTL93QVwX+XwF33eBTkgEARAAgYwl0GvyNRU0a+IT"
-    "vfgSHy1QAgIg4CABKnQm5zhovy+mG1pbl7zUl47oAwIgoJ/A29WvxX36lRyn4DM+34L3HbcHX0AA"
-    "BEDAJQRoktwbHKR6vQLJ1xxOBDQ4SuCa6e/bZggxm5xwq6B17in75D1OBX/Q7JxHtrc4ZV+B3WEe"
-    "j7d+5coXOU0aVhAWTIBAcgTWhJrOl4b8bnK90ttadULyutCW88gmu8FNyqz7aVlpYXV66cIbCICA"
-    "WwlYlqeStGtNvKMxgNqdO6tZrL7r1HnctWv5Pnp+rnHKfuJ25Yzhwyv8ibdHSxAAgb4QCIdbb6V+"
-    "v+xL3/T2kZ/YtWsvt/GS9CKANxAAARDokUAwFo9Le6JiS4/NGBykiT83+XyVJQykQAIIgAAIZCWB"
-    "XpOvYzGDTfI1Ldfzlaw8SwgaBLKMAFW5P59CLmIUdoyuP3cw0gMpIAACfSBgmgceppylaB+6OtaF"
-    "KrZe7ZhxGAYBEAABZwmEnTWfmHUpTV9iLdEKBNxNoGxK0bMUwYMMoyhf29BoV+ZWvl1fMukt07Ls"
-    "gYNDyo2rM/ix3CGn3KnOHCyBgLsIrF/fPFJYspZUs13iVnVC8saN2/IsSzRQzFoTFrv4SXld5MZn"
-    "C3qB1cUx7AIBEACB4wjk5d0yhHZcc9zO9H+RXq+RFRNGKPl6KeGNpx/xcR775eQYC47bgy8gAAIO"
-    "EHgiLmX8KjL8ugPGFZuUC/3+8hmKjcIcCIAACGQMge3bl7ZZlnklBdTOPCj7VcDq/PyF72euE/JA"
-    "AARAICMJ9Jp8bf9Bocj3MYn+s4HA4uFMtEAGCICAQwTo7pBVMiLNFtxIy4Vxrrjm0JmAWRDILALh"
-    "8KMHaYlNbtUcZhUWLuiXWaQRDQiAQDYQoMHjXTzilKfx0AEVIOA8gY69+xbT795fnPeUnAfStGrN"
-    "xsYzkuuVWOtZ0yb8S7JfIl3csrau6WuJRYRWIJA5BIJBacb7WY9TRAHGUSlNSKYKraLD07GG4h3L"
-    "LOZO0xSlsy6b+CYzXZADAiDAlMCAAe32CiOnapb3m5aWpf/SrCEt7qPR6q005vFUWpz16ER8Y8SI"
-    "6wb32AQHQQAEUiYQjS7fQSuLX0aFYA6nbMxxA+LRQGDRhxx3AwcgAAIg4FICbW1LXqDrebkL5A82"
-    "TfOpsWMrhrpAKySCAAiAQEYR6DX5+p1om5lE3c+yrFlMtEAGCICAAwRGj56fRzewjlRO66NcGlsz"
-    "HFtKu4+a0A0EQKCPBDo7cx+jCRV7+9jdiW6nHTzooRex2EAABEDAXQRMU+7moJiu6QM46IAGEEgH"
-    "gXnzzun0ejyl5IvJ5IejUQ81PaJh2XNNjkwom1NaRKuXGBuPeuP3QUgha1ZtfHkMP2lQBALOERhT"
-    "3PhdQxoXOechZcvKE5Jr6psW0zurS1JWpt7ATbNKithNzlEfJiyCAAioIDBpUjCX3ncvVGErNRti"
-    "SWr93dU7HucQr8zzenN1Vzx314mDWhDoI4FIZNn/0by9+X3sns5uA6S0nioouB7FDdJJHb5AAARc"
-    "RSASWbqSinutdoHooo4OgybJBxPNA3RBSJAIAiAAAvwJJHTRpQFtNrPPabmEawkrrRiJDQRAIBMJ"
-    "UGLkFRQXmyQaehH900ik+pVMZI2YQCAbCezcee9+GixfxSt2MY2XHqgBARAAgd4J0D3Snt5bOd/C"
-    "sgxHkj2dVw4PINA3AjNLznxdGoY9KZ3+47NJQ55zyj7p2AojB83Ob1C0m/lEfJKSYR6Pt2Hlyhdz"
-    "TjqCHSCQgQRq6pouMIS4jXloShOS14W2nEfvyL/HMOZnZ08pWsZQFySBAAgwJfDmm3unkrQCzfI2"
-    "RSJVv9SsIa3u366aKP6cVqddO6ughBxv14ewFwRAQCUBqnq/lvIaVqi06ZCtsZaVU2cYV3ocsg+z"
-    "IAACIOB6AoMGxa6nIP7GPRAat/lyILD3du46oQ8EQAAEMolAQsnXVPaVllJgsxX7fIsuYKMGQkAA"
-    "BBQTEHbyNZuNlgN0LIGATZAQAgJZRkBK73IKOcYlbLrP+vzbVf+5KIIOEAABEOidACUfsUi+pnm5"
-    "/XtXixYgkFkE5pSO/ylFxDHRbkFNXaMjk8quL5n0lmHGSyjuQ4zP5kdzhpx6N2N9kAYCSgg8Vvtq"
-    "vmHKWjLGOTlDaULyxo3b8ixLNFDMuUogqjPyetzsnE3vrlhNyFEXHiyBAAg4QMC+ZNzogN2kTJKG"
-    "KuqQhdcui0O17zGUkGPfV2MDARBIA4G8vLxKcvOnNLhK1cVFPl/B91M1gv4gAAIgkKkEmpuXtwth"
-    "2nks27nHSOPOtwUC5V/jrhP6QAAEQCBTCCSUfG2a4q+cAjZNi3tlFU64oAUEXEPAXtaKEnkmcxFM"
-    "L4FfoAocf+CiBzpAAATUEIhEHthGM39/pMaaEiu5sVj/S5RYghEQAAEQSBMByzJpJQH9G907ovK1"
-    "/tMABRoIdOzddxPdz/xFg+ueXQrjkdWhzcU9N+rb0bKSif+mDB174JrtRsu03bSmvunrbAVCGAik"
-    "SCAYlGaOGXuc0uX8KZpysrvShGQatBQdnsM1JHisk6L7YLuT3tmXXlMyaVcf+qILCIBAlhLw+RZe"
-    "TKG/X3P4bbm5eRs1a9DiPhIJ/5gcv6rF+TFOpbS0J+AfIwcfQSCjCWzaFOzo7DSupPdXEe6Bksab"
-    "fL7yK7nrhD4QAAEQ0EUgHF7yBr2PnUL+2RT46oYF5QGK9ZSA7cg72m58YjcIgAAIZC2BhJKvW1tb"
-    "/02EDnChRH/QPkt/KC7iogc6QAAE1BCQMudS+v3OUWMtdStSmvembgUWQAAEOBKgMj/3c9JFgx6o"
-    "OMPphEALCIBArwRokhqLF4xIvu71VKFBhhKYN++cTq/HU0oJkG8yC/EU0zJDodAbA5zQRVW/Vwop"
-    "H3fCtiKbdFmSNTV1r4xVZA9mQIAVgdETGm+nSRCfYyXqeDHKE5LXhZpuokFLjpMqFs8qKeI3Cef4"
-    "84FvIAACzAhQtT66pund6P3/Q1u3Bg/rVaHL+xNxepZeqsv7e37FhwKBSs5/z9+Tik8gkAEEdu6s"
-    "jtCD4uUUSgfzcGjYRKzJz1+oe5IOc0yQBwIgkM0EotHq39E7gpu5M6B77iE0l/yZvLxbhnDXCn0g"
-    "AAIg4HYCCSVfG8YTcQr0/zgFS38o7KVvqKgQNhAAgUwhQDeBl3GJhbQ0RyJDnuGiBzpAAATUEqCq"
-    "9i/S7zmbgWp6qXmhXf1fbZSwBgIgAALOEaAqkFwGjBxJ8HSOHCyDgDoCM0vOfF0KYzZZ5LZk+1kH"
-    "5OH71EV6vKUDnth8CviV4/ey+pZnGJ6GUGhTLitVEAMCKRJY19A8WRji2ymacbq70oTkNXWNH6Xn"
-    "xrudFp2sfbr2/2T2lKIHk+2H9iAAAtlNwO+vPIcIXKCZwiHDiD+iWYNW952dnWtIwB6tIsg5PdOj"
-    "+rXukwD/WUWgtbX6L5TbwHolp3dOyGDTNJ8aO7ZiaFadIAQLAiAAAkkQoDHmKrqbqk2ii66mxf37"
-    "t9v3nsir03UG4BcEQCArCCSYfH2ExZ+YETmHlr65ipkmyAEBEOgjgdGj59MAtXFhH7sr72aacpVh"
-    "BC3lhmEQBECAE4FHuYihAf0cy/KymYDChQt0gAAI8CVAAzEskq/p+tmPLyUoAwHnCVAl6J9S9bxq"
-    "5z0l6UHK62vqGqcl2Suh5teXTHrLMkx71ZCDCXXQ0UgY5x2UOd/T4Ro+QcAJAo/VvppvGdZGsu1x"
-    "wr4Km6oTkleFNg2j62sDaWOzQts7nP7bKTwzaQIvt4k3Kk4jbIAACDhIgEmy7YZodPkOB8Nkb3rH"
-    "jhVv0XMsh3eSnx81qvws9sAgEAQyiEA0WrWCKmCvdUFIRR0dYgONkSaTR+KCsCARBEAABNQREOLQ"
-    "tXRP9y91Fh2zdJnfX3GrY9ZhGARAAARAwEjipln8nBsveslcNXx4hZ+bLugBARBInkBHR/+vUS8W"
-    "lcHo5QcVoMhdl3wU6AECIOAmAlJ6nyC9+/hoFnYSETYQAAEQcAUBy4p3MhGK5GsmJwIy9BFo37P/"
-    "Fqq28md9Crr2TM9VK1eHNhd3fTS1vdeUFv7HELIiNSvO9qYBmMU1DVsucdYLrIOA8wSCQWnmmLHH"
-    "qcY+53ewShOSKUFRmDKnhopDjXGecFIe2oVpTplXcubepHqhMQiAQNYTyM+/YRzdm12uGYQUwkNV"
-    "ArF5PPHl9hiEZhIiHheofq35JMB99hHIzR06n+4xWa023tVZoPvhrwQCe2/v6hj2gQAIgAAIGEY4"
-    "/OhBenVwKbHY5QIed/n95V9wgU5IBAEQAAFXEkg4+ToSGfIXehjYzSzKYV6vsZKZJsgBARDoAwHT"
-    "NK7oQzdHutAg+bM7dtwXdcQ4jIIACLAh0NZ2/wESU8dGkGFMDgQWD2ekB1JAAARAoAcCJoul6mjA"
-    "GiuV9HCWcCg7CMybd06nlJ5SSox8k1PEVJJ1sGmZoVDojQFO6CqbUvwYJZ1TNS62mzCkWLM+tHkc"
-    "W4UQBgIJEBhb3HQH/T5/LoGmupooT0he29B8C9WVtosEsNqElItnlxSyT9ZhBQ1iQAAEjhAQwltJ"
-    "H7w6cdCz23Ph8AObdWrg4ru1dXkLjUGEdOuhc1IaCCw6XbcO+AeBbCKwdWvwsGGY9mQY9qsAUAL2"
-    "bYFAObt74mz6eUGsIAACvAm0tVW9Sjl000kl9zEKWsVM1ObnV57BmyjUgQAIgIA7CSScfE1Ly8Sk"
-    "tH7JLUx6OfBVuvG/mpsu6AEBEEicQGHhgn70EP/ZxHs425JefK5y1gOsgwAI8CEgOP2+08Nv/CI+"
-    "bKAEBEAABLonQKsQsVixhO7b2rtXiSMgkD0E5kwtfINmRMyiiClHktV21kHr0ANOKfJ0HJ5PAb/i"
-    "lH0FdvPicbM+FNrE4pqpIB6YyDICa2o3f1YK45ucw1adkFxT3/QxupTeyTDmJ2ZPLX6IoS5IAgEQ"
-    "YE5g1KjKYTSONke3zHjcWKJbAyf/dE6086Dn6Rx6F1nOiQu0gEA2EIhEHthmmtZUijXGPF7KIxHr"
-    "KQ/DkRWtmMcOeSAAAiCQEIFIpOoX1PC7CTXW22iYacqnAoG5A/XKgHcQAAEQyDwCdNOc1PbzpFqn"
-    "rbF42OerPD9t7uAIBEBAKYFDh8SnyCCXG72WaLT1V0oDhDEQAAG2BOih+EUS909GArHsE6OTASkg"
-    "AALdExDC4pJIeKh7lTgCAtlFYPbU8T+ThtCexHEidUqOnr+2vsmuAqN8mznz7AOWYZaQ4YPKjasy"
-    "KIzzDli5P1BlDnZAIF0EHqt9NV+YYiP5o0mibDelCcmrQpuGUcGqeoqWktFYbf/tMD3XslIEMSAA"
-    "Aq4hEIvJ60nsIJ2CKcn3X21t1c/r1MDNdzhc/XfS9DvduqQUc8eOrRiqWwf8g0C2EWhtXfY/dG1k"
-    "PcnRPiekcQhdJ57Jy7tlSLadI8QLAiAAAokSiESqv09tn0y0vcZ2Z0s5kFNRMo0o4BoEQAAE1BFI"
-    "KvnaNL3P0WzsTnXu1ViyZ2cLIRto5uVoNRZhBQRAIJ0E4nHPRen015MvquK4xjCeiPfUBsdAAAQy"
-    "iwDd29DvPZvt86SECldiAwEQAAHeBOxnMA4KSQcqX3M4EdDAhsDr+S230q3En9gIOipEPlJTu2XC"
-    "0a8KP1xTWvgfIcVChSYdMCUr19VtudQBwzAJAo4QCIWkx2vGNtL1xOeIAzVGlSYkB4PS9EivHfMY"
-    "NfKUWWmniTUl80rO3KvMIgyBAAhkDYGxY4P96b2XnXytdSMN95MAmpOH7VgCNBbBYeLkKR0dxtxj"
-    "deEzCIBAeghEo9UP0HuthvR4S8lLcf/+7fYYCsYtUsKIziAAAhlMQLa3x6+m293NLohxqt9fWekC"
-    "nZAIAiAAAq4hkFTydTj8wE56CHiOaXT5NPPyJ6NHz89jqg+yQAAEuiFAlRPtZEMWm2XF3PCigwUr"
-    "iACBTCFAAwz2bGSLQzx0n+UvKKg4m4MWaAABEACBngjQIHFuT8fTdcw0xeF0+YIfEHADgeDkyTF6"
-    "NzKVRkR3ctJLmTaDDdMMhUJvDHBC1+ypRaspOXG9E7YV2RQWTfRdH9o8TpE9mAEBRwkckM13koML"
-    "HXWSmnHlCcljihtvNaT4Ymqy1Pema1vlnNIiuzoqNhAAARBImkB7+96Z1Ck/6Y5qO7QOGzYU79y7"
-    "YBoOD/kZ7d7SxaG07rIso3zSpCCLZ/y0Bg5nIKCfgJTSS8l6xn/0S+lVwWV+fwVN9sYGAiAAAiDQ"
-    "FYFdu5bvE8JrF17Y19VxXvvkvT7fosm8NEENCIAACLiXQFLJ13aYNMhewzjcszs7+/02EFg8nLFG"
-    "SAMBEDiGwNu/r4JLouGmaHT5y8fIw0cQAIEsILBzZ3WEwvwjl1DpjesXuGiBDhAAARDojgBNFmGx"
-    "LDFdM5F83d1Jwv6sJTBnauEbUshZBIBZdUH5gQPWoSqnToy34+B1ZJvz89zQuGU2hEKbkNji1A8B"
-    "7CohsLZuy4W0vvgtSow5ZER1QvLahsbP0DvvOxySm4rZJyjx+uFUDKAvCIBANhMI0vifrNBNgFat"
-    "Xb5pU7BDtw6e/oNUDEJU69ZGlckDb765Z5puHfAPAtlIoK3t/gP0ju2rFPubLoj/bp+v4mIX6IRE"
-    "EAABENBCgIqZbqZ736vIObN3sifh8FJxxCfy829AkYiT0GAHCIAACCRPIOnk67dnYsto8q7S1uOD"
-    "Usb/d/jwCn/aPMIRCIBACgSOVL1O+lqUgsNuu9JLRrv6LTYQAIEsJMDs9x/J11n4M4iQQcB9BASX"
-    "FYfa3ccOikHAeQJlU4rtVcvs5d25bfPWNDTNcELUzJlnH6Dy0iVk+6AT9hXZPPeg9P5QkS2YAQHl"
-    "BNaFthRIIerIsEe5cXUGlSYkrwk1jaCEl1oaGfWqk5i6JWEYzR2m59rULcECCIBAthLw+/d+nWKf"
-    "qDn+A0LEVmnWwNq9x2OsI4HaV62hRCGaeGUn7GMDARBIN4FotHorTQS0J0DE0+07SX8m6dw4cuSC"
-    "M5Psh+YgAAIgkDUEwuGlP6Hc6x+4IODTTNP71KhRlY6sUuiC+CERBEAABJQR6MODdDBGN9aPK1Pg"
-    "jKGJOTnyt5ip4wxcWAUBtQTkRWrt9d1aPC5+1Pfe6AkCIOBmAh5PzP79p2oz+jcpxSdHjLhusH4l"
-    "UAACIAAC3RPgU/laoPJ196cJR7KcwLb81m8JyWd1j3dPhynlw+vrGx1JBJo9rWgTJVDe8K4vjv/T"
-    "vV5FTX3jZRy1QVN2Ewg+/7zXso4kXo/gSkJ1QnIwKE1hyQ0UbwGzmNstQ0yZV3LmXma6IAcEQMBV"
-    "BORi3XLpvqemtfUhN1Rz1YaqpaXqEFW/fkSbgKOOxQSfb9cXj37FBxAAgbQSCIerfkWru92ZVqd9"
-    "cibzPB7PjwKBuQP71B2dQAAEQCALCEQied+hBOxfuCDUD8Zi1kMu0AmJIAACIMCaQB+Srw3DNK1H"
-    "KSrmsy/FBJqp80J+/qKPsT4DEAcCWU6AEnc+xwOB3NzWVvVvHlqgAgRAIN0E3njjwTD5/HO6/Xbj"
-    "L9fjyT2/m2PYDQIgAAIsCNCKAUM5CKHqXPs56IAGEOBIIDh5cqwzLqZSsqL2SnrH8qHk6ME04y20"
-    "8tmwI4O1c0rH19DinnYFQa4bnRJj9frQ5nFcBUJXdhIY0xa4iyL/NOPolSckj57Y9C2Kl93KQ3Sd"
-    "LJ9TWvR3xucC0kAABJgTCAQWfoIkflKzzLhlxao1a3CF+1jMaye9aF/VSQjzJlcAg0gQyFAC0Wje"
-    "3TRmShVT2W9nSzngMfYqIRAEQAAEtBEIWh6POZ3cv6pNQoKOqfBqmc9XMT/B5mgGAiAAAiDQBYE+"
-    "JV+3tCxrotmXT3Rhj9uukZQo/lv6Y3EFN2HQAwIgYBiBwKLTicMoHizMJ3nogAoQAAF9BASb6wAl"
-    "E9qDZNhAAARAgDEByaIqJr0cbGMMCdJAQDuBa2cUtQhDziQhLFb4eBcIJRa+P/etA44l43g6D11P"
-    "vl5+1x/D/4fGLbNh2XNN/Rhqg6QsJLCufsvFVHXzZs6hq05IXhNqOp9WBwhyi5neuYdoEslKbrqg"
-    "BwRAwF0EqOL0jfoVy59s3778v/p18FewY8d9Ubr+1zJQeoHfX3kOAx2QAAJZSiBotbf3s5/fG/kD"
-    "ENPoelHJXycUggAIgIAeArS6yS7TNO2V7w7qUZC4Vyq0Ux0IVOieuJm4YLQEARAAAWYE+pR8/XYM"
-    "5t30P6vBu27YDqA/FiF6AFhqGHNzummD3SAAAhoIWFacTWV605TPaUAAlyAAAowIeDxxNtcBunf5"
-    "OCM0kAICIAACXREY3dXOdO+Lx41Iun3CHwi4jcCs0uKfG8K4j51uIa+tqWu6ygldM2eefcA04peS"
-    "bc7V8c89ZZ+8x4n4YRMEkiHw2ONNo6Qh1lOfFN4TJ+Mx+baqE5LXr28eKawjSW6e5NU414PK4jfn"
-    "xs1rnfMAyyAAAtlAoKBg0XiaUPN13bFSYYH7dWtwk3/6W7eE9NJcI70bnTdUv9Z7CuA9ywns3n3P"
-    "Xvo9/Bph2McfhbwvEKj8PH+dUAgCIAACegi0ti55icZ7r9HjPSmvubTywo9GjaosSKoXGoMACIAA"
-    "CBwh0OeX6tFo1Sa6AP/MJRzp3bVc6PcP/J/TT78h4BLNkAkCGU/ANI2PMglyT2vr0P/HRAtkgAAI"
-    "aCJgr+xBrl/V5P44t1Sh6DzDCHqP24kvIAACIMCLAIvVS4SIRXlhgRoQ4Elg28jW20jZH9ipE/Lh"
-    "9fWNE53QNat0YqMUxjwnbCu0Wb62ofFyhfZgCgSSIhB8/nlvjkfWUabX8KQ6prGx6oTkYFCa8Vxr"
-    "A4XA7R3xYSFFyYwZRS5ItEnjDwBcgQAIJE3AsqzF1KnPY39JO+y6w/8Lh5f9uetD2NsVgba2Zf+h"
-    "/b/q6lg699G47+UjRy44M50+4QsEQOB4AuHw0i2UrDeL9mqfkHG8spO+eeyq/fn5N4w76Qh2gAAI"
-    "gAAIHCEQDlfX0QfHVv9TiDmfniOeLCxcgFX6FEKFKRAAgewgkOILGGFXv+Z+43/smfx0LOb9RyBQ"
-    "bs8YxQYCIKCZACUXckm+/i0lOcY044B7EAABHgR+w0OGMSgQ2HMWEy2QAQIgAALHEcjLu2UI7Tjl"
-    "uJ16vsSi0dPe1OMaXkHAXQSCkyfHYjExjZIYdzJTPoiWVAutfDY80Aldc6aMr6OYa5ywrcomJbis"
-    "WrOx8QxV9mAHBJIhMLqt4Hs0SeFTyfRJc1vlCcljJzTbk1H4VegTcuGsqUX/SDNfuAMBEMgwAvn5"
-    "N46kIbuZusOi9/6oet2HkyCEsKtf6948pumt0C0C/kEg2wlQst6P6Vp6rws4nEbXjNDYscH+LtAK"
-    "iSAAAiCghUAkMtReWeR3Wpwn4ZT+7nzs4EFPVRJd0BQEQAAEQIAIpJR8TdWv/0bLl210GcmR9Efj"
-    "Gb+/Yt3YsRVDXaYdckEggwjMzaFgPsIjIKm9ogQPDlABAiBAA1RsrgeWZXwcZwQEQAAEOBLIze0Y"
-    "zUEXJSxupwl0lLeJDQRAIBEC184oahFvJ+Ow+r2hGf3vzz2wf1kiMfSljTyUcx31e6kvfdPUZ6jw"
-    "GE/V1LyGweo0AYebtwnUNGz5Ek1OsAcA+W6KE5LXhJrOl4b8Lr+ARUPZlOLH+OmCIhAAAbcR8Hhi"
-    "N9CYne57im3R6JCn3MaOg95wuOrXpMOugK11E0KWFRRcf5pWEXAOAiBgRKMt3yYM9nWB+3bO4cO7"
-    "V3AXCX0gAAIgoI9AMGZZ3ink/w19GhLzTGMu8wOBijmJtUYrEAABEAABm0BKyde2gc5OeTP9t9/+"
-    "7LJtZnu78Z9AoPKrLtMNuSCQEQT8/v52RdcBHIKxLNMNLy84oIIGEMh4Ajk5Hb+lIOMcAqWlBZF8"
-    "zeFEQAMIgMBJBGggtviknRp20HUyqsEtXIKAqwnMKi3+uZDiHn5BiKvX1m+Z6YSusrJxh00jXkK2"
-    "Ob+7OtsY0OmGqmZOnCLY1EDgscebRtG1YB25pvxrrpvahOT165tHCkvWUrQeZhE35cSMucw0QQ4I"
-    "gIALCVDV60GULGFPOtO8iaVYZbLPp0AyqX49KB4/MoGxz4GgIwiAgAoCT8RNs3MqWdqqwpqTNuja"
-    "VebzVcx30gdsgwAIgICbCbS13b+dioReQTG0c49DSvmQz1d+Lned0AcCIAACXAiknHy9c2d1hC6+"
-    "d3EJKEkdBaT9J1QF+9f0b2KSfdEcBEAgBQL0IM4iqZBeSDe3tVW9mkIo6AoCIJBBBF5//eHdlMz3"
-    "Io+QxCd46IAKEAABEDiJAItnJ7peR05Shh0gAAK9EhjoKfyOIYQ94YzVJg2xgqrSvs8JUbNKJzbS"
-    "CifckxsX1NQ1TnMiftgEgWMJBJ9/3uv1GvVUdX74sfuZfVaakBwMSjPez3qcYgwwi/MwlUYpmTGj"
-    "aB8zXZADAiDgQgJU9dquUKe7WvG+w4dz17gQHxvJAwfGajk865KGG0aNqhzABgyEgECWEmhtfehN"
-    "0zQvofAPckdgmsZSv7/8M9x1Qh8IgAAI6CIQjVb9jXxfq8t/4n5Ff8rl+RFN7hyZeB+0BAEQAIHs"
-    "JZBy8rWNLho9VE3/veJijJ8j7f+gB4LvjRhx3WAXxwHpIOAiAuIcDmLpJeLvOOiABhAAAT4EaGLW"
-    "8zzUyHE+34IRPLRABQiAAAi8R4AqX09475u+TzSJrlWfd3gGAfcSKCkRcUN4p1MyMrfq8YOoKm1o"
-    "5bPhgU7QLSstrjekwTsZSBiPrA5tZrG6gBPnADZ5EBi7veAH9Pv/SR5qulShPCF5THHjd+n3/6Iu"
-    "vWncSdXHbygrGf9PjRLgGgRAIGMIXOmh56MK3eHQs+Jju3ffs1e3Djf7b25e3k7vJlcwiGFkPG7N"
-    "ZKADEkAg6wm0ti55iSB8gzsI+juUQ8l69cOHV/i5a4U+EAABENBFIBKp3kC+H9XlPwm/p5tmrIFW"
-    "tPEm0QdNQQAEQCArCShJvqa/DZ2UwDiDCLJfIqGHs9yPVtr8lteb+6rfX1k5dmywfw9tcQgEQCBF"
-    "ArSsyvtTNKGkO70QfkGJIRgBARDIGAJCmIyuCzksrpUZc3IRCAiAgCoCLCpfUzBungCs6lzADgj0"
-    "iUBZybiotCQlYBvxPhlwrtOkfgfeetAx84dzrifbnBMdTzEtMxQKvYEqg479EGS34bV1jV+mpIjF"
-    "nCmoTkiuqWu6gKr938Yw5vrZU4tWM9QFSSAAAi4k4PONupxkn6FZeoz8L9OsISPcC+F9hAJhUOVW"
-    "LKKEG0XjyBlxahAECGgjYCfr0X38cm0CEnRMGv05OeLJSZOCuQl2QTMQAAEQyDoCgwbFF7okR+UC"
-    "v3/3vVl3ghAwCIAACCRJQNlDczhc/XdKpqQHcddvVGFSLmlv39NElbDn4eHA9ecTAbAkYL+w41Ex"
-    "MR6Xf2WJCKJAAAS0Eejs9LK5LpimheRrbT8JcAwCINAVgcLCBfak1fd1dSz9+ySSr9MPHR4ziMCc"
-    "aRN+Kw3jh9xCIk1laxq2zHJCV1nZuMNG3FNCtvc5YV+RzbMOyMP3KbIFMyBwlMCauubT6fdrHe0Q"
-    "R3fy+6A0Ifmx2lfzDVPWUpgeXqGKRmuANZeXJqgBARBwMwFK3rhRt36q1vxkOLz0dd06MsF/OPzA"
-    "Tho/Wc8glvGBwJ6vMdABCSAAAkQgGj1oT6L8A38Y8hO7d++xV03HBgIgAAIg0AUBe6UT0zSvoPu9"
-    "aBeHme0SlYFA5TRmoiAHBEAABFgRUJZ8bUcVjVbRUlhHXmizCrKPYkbRWMQju3bteT0QqAiOGlU5"
-    "rI920A0EQOAEAvn5e8fSrkEn7NbxdX9b27CXdTiGTxAAAb4Eduy4z37Y3cpBIVWKmMRBBzSAAAiA"
-    "wLsE9u/P+RB9pgRs/ZsQHtzH6T8NUOByAq9vLvouhfA/3MKgyrcPra1tcuQ+qGz6mU2UHMQ76VHK"
-    "69fWN9mVybGBgBICK1e+SEuAyzpKuz5NiUFHjKhNSA4Gpen1xDYYVH3PEbl9N3rYMqySq78+YX/f"
-    "TaAnCIAACLxHwOdbNJm+nfveHj2f6B0WEu0UojdNTxWZsxSa7JMpOq/f7FNHdAIBEHCAwKOdVFDq"
-    "SjLc4oBxpSbp2jE/ECi/WqlRGAMBEACBDCLQ0lLVSu9pLqeQOriHJaW12u9f+BHuOqEPBEAABHQR"
-    "UJp8bQdx+HD/6+i/Jl0BOeA3nx4QbqeHma1+f0UVJWEXOuADJkEgywhYLKolUrX+v9GyedpfYGbZ"
-    "yUe4IOAKApSQ8wIToah8zeREQAYIgMDbBDye+HlMWOwPh5ewH2xiwgoyQKBbAsGgsGKWl5J82VVa"
-    "GSRN46nVz2w+pVvxKRyYM7W4QRhiVQom0tBVPrI6tLk4DY7gIgsI5A4ZQlXu5ScZh6o8IXn0hMbb"
-    "KfH6Im4xU/Xx664uLX6Jmy7oAQEQcC8BIeLaq14TvT+0tS1ls5Kce8/me8pbW5c00tjkz97bo+3T"
-    "eVSgivM9hDYwcAwCOghs3760zbJMOwG7XYf/ZHzSNexBn69c++SgZDSjLQiAAAikk0A4vOzPQhgc"
-    "7uV7CVv0NwwzhIKlvWDCYRAAgawloDz5evfue/bSDJ2vUtXo3RlG1R7wq6Ak7Ca/v/JF+jeX/rgM"
-    "yLAYEQ4IpIWAx8Ojkitdq7gkV6aFO5yAAAgkTkAIwWXAyJGKj4mTQEsQAAEQOJ4ADZx89Pg92r5t"
-    "Js+Uv4QNBEAgVQLXTjujzRQee/nIeKq21PaX4z0HzZVqbb5nTR7yLqCLyD/e28PrE2kbbFpmKBR6"
-    "A++eeJ0a16lZU9/4FfqTWclZuOqE5HUNzZNpgsW3ucUspFE3p3R8DTdd0AMCIOBeAlQwaCKNxV2s"
-    "OwJ6j/aAbg0Z6n8Jh7joPYALkoI4kIIGEEgPgba2JTS2KcvT4y0VL6I//X34UX7+jSNTsYK+IAAC"
-    "IJDJBMLh6uVUEMwN7wnOoFy5BsO40pPJ5wOxgQAIgEBfCChPvrZFhMNLt9AMnRL619kXUfz7SFpS"
-    "Qa6kPy6vUxL20kBg4SdIs+CvGwpBgAsBQS+F9W+UfE2Vr7GBAAiAwMkETNP468l7tewZSpO9CrR4"
-    "hlMQAAEQ6JKA+HSXu9O/85X0u4RHEMhcArOmFD5PbzW+zy1CKYyplDha5oSusrJxh0XcM4Vs73PC"
-    "viKbZx20DiGZSRHMbDSzpq75dEr4XUuxs31vqToh+bHaV/Mtw9pIMTMbEBSN8YHWvGz8OUTMIAAC"
-    "zhGgMbibybrWazwl5jaHw0OedS7K7LUcjVb/jqL/OwMCXysoWDSegQ5IAAEQeIdAJLKUJiqL1S4A"
-    "crppxihZL+h1gVZIBAEQAAEtBLxe83rKP2NbIOIYKJ/z+wvuOuY7PoIACIAACBABR5KvbbLhcNVv"
-    "6A/E/AynPJxiXCil+SeqMLDt7UTs8k9RzFpfdmU4c4SXAQTohSyLSq7xePzfGYATIYAACDhAoKOj"
-    "w74+UAE2/Ztl8bhm6icBBSAAAroJBALlxaThdN06bP80ie5lDjqgAQQyicC2V4qC9DKD3uXw2kjT"
-    "itX1W852QlXZ9DObqBLXtU7YVmWTbkjnr2lomqHKHuxkD4GVK1/MESJeT28pT+MbtdqE5GBQmjlm"
-    "7HF6kvMzi/kwJYSXXP31CfuZ6YIcEAABFxOwJ+vTe3Z79RLNm6iipDpLs4hMds+h+rVpWdbiTIaM"
-    "2EDAjQQGDYpRsp7hhiJTF/j9u+91I2NoBgEQAIF0EGhpqTpkGN5LydfOdPhL0cetPl9lSYo20B0E"
-    "QAAEMoqAY8nXNiWqgL1aSnFPRhHrPhhKQrATscUffL6KRkrGvjs/v/ID3TfHERDIWgL25ISJDKI/"
-    "0NY2fBsDHZAAAiDAkMCOHSveIlmvc5DGZcIKBxbQAAIgoJ3ARdoVHBVguqESxFG1+AACbiAQDAqr"
-    "0/LOoETNCDO9/U3DDK1+ZvMpTuiaPaUoRAnOjzphW5VNU8qHa2q3TFBlD3ayg0DukFMpwUHYq/Vx"
-    "3ZQnJI8tbrqDfp8/xy5gacy/urT4JXa6IAgEQMDVBGIxuZACyNUcxC4pPes0a8ho95HIwRAF2KI/"
-    "SDlz5MjyfP06oAAEQOBdAs3Ny9uFMK+g79vf3cf3f1EZCFQymDDElxCUgQAIZDeBSOSBbVRwxr5O"
-    "xpmToDoWcpXPt+B9zHVCHgiAAAikjYCjydd2FNFo1Tdp6bOH0xYRA0cUbyHJ+LZpyn9RNexNlIx9"
-    "e0FBxQcZSIMEENBOID//xhEkYpB2IYbYjIoc+s8CFIAAcwIsqqpKKccx5wR5IAACWUKAJppySWaK"
-    "d3Tk/CVLsCNMEEgrgWunndFGic7TySmzF/1yvHnIdCxBWhzKKaeETbaTOkjbYMM0Q6HQGwPS+gMB"
-    "Z64lsKa+8Sskvpx1AIoTktfUbv6sFMY3ucVMFQhqyqaOX8tNF/SAAAi4m8CwYQtOpXGouQyiWNnW"
-    "dv8BBjoyWMKjnXSul+sPUPT3eMwb9OuAAhAAgWMJhMNL3qDiLVNoX+zY/Rw/0zjHYwUFi87mqA2a"
-    "QAAEQIADASpu+mtKbP42By29aDhFCM/TeXm3DOmlHQ6DAAiAQFYQcDz5mijKcLialr0Rq7OC6ElB"
-    "yvfRi5GgZRn/oGrY2+jfSprZ+dVJk4K6KxKcpBQ7QCAdBEwzPjodfnr3ITf13gYtQAAEspkAPeCy"
-    "SL6m+wgm181s/mlA7CAAArSktZ3wdyEPEuKfO3feu5+HFqgAgcwjMGtK4fOGlHczjKx0bV3T1U7o"
-    "Kisbd9gyTXvJzH1O2FdjU37ggHWosr5ihAAAQABJREFUSo0tWMlkAutD/x0tpLGWYqS8X56b6oTk"
-    "x2pfzRem2EjRephFvKl90GAkqjE7KZADAplAIDfXYydeD9UZC72v6qR3/St0asgW34cPxx+hWBnc"
-    "p8rrRoy4bnC2cEecIOAWAtFo9e/o1v9mF+gdaFnWM4HA4uEu0AqJIAACIKCFACVg30v32fbKJ9y3"
-    "8f36tW+gYofpyDnkzgL6QAAEspxAui6EMhIZ8g268f9RlvO2k6fm0szOn+zatSdCVbE3UFXsK/Cy"
-    "Ist/KrIsfEpmHMUhZC5JlRxYQAMIgEB3BMTL3R1J8/4xafYHdyAAAiBwEoF43Pgi7WQxyErPU38+"
-    "SSB2gAAIKCWwbcv4Oylt89dKjSowJoV8sCbU6MjKYteUFDbTupnXKpDppIl5NXVNVznpALbdTWDl"
-    "yhdzYvF4Pf3+nsY4EqUJyaGQ9HjNGCVeCx+zmA9IU5TM+2rgIDNdkAMCIOB6AnNzKCFjoe4wqNJq"
-    "XWvr8hbdOrLB/65dyynxWqxlEOuwnJzcMgY6IAEEQOAEApFIFU3UlbUn7Ob4dYyU8ccN40pukyY5"
-    "soImEACB7CQgOzpyr6F7Py5j1N2eBXom+arPt+c73TbAARAAARDIEgLpSr4mnMEYJWCX0h8JuqHG"
-    "RgSG0UPQDPqD9ITXm7PD7y//mc9Xed3IkQvOBB0QyGwCkkkFV5P9DWtm/xwgOhDgTyAe53KdEEi+"
-    "5v/jAoUgkAUE5OVcgjRN+ScuWqADBDKVQDAoLE+7OYMSOCPMYuxvWEbo8cebTnVC1+wpRSFDGnZl"
-    "QbYbTSResb6+cSJbgRCmlUDO0FPvp3eNH9cqomfnyhOSD8jmO8nlhT27Tf9Rmixy/ZySIrx7Sj96"
-    "eASBjCfg9w+YQkGerjtQ0zSX6NaQTf5pdd3/z96ZwEdRn/9/vrObBAjIIZjdTTjUBFSsVmsve9ra"
-    "/ltb22o1BBAkqOAFIaD218N2rW2tF0nACwQCKBCi9fz11NZettaftqUWOYKKSHY3iBwqV5Kd7/8z"
-    "aFQ0CdnNzM4zu595vZbNzsz3eT7Pe5bZme883+dbh3iTXsestapm0qTXR4H+SaBzAkrtswcTr+l8"
-    "q6i1/y8cLr5elCKKIQESIAFBBOxZP01TnYP+nd2CZHUqBRp/WFRU9fVON3IlCZAACeQIgQwmX9tE"
-    "DyZgX2g/KMoRvj0MU/VBUvpZ4HJ7IBDYhGrYTZHIrNvsH6mioqsKe2iEu5GATwgozzuGbVCoaLbB"
-    "J8AokwRIwCMCBQX7hJwn9OChQ68Z4BEGuiUBEiABo7R0RgEwnC0FBR7y/1WKFuoggWwmMHly6TbD"
-    "UhMQo+dJHu/jXNYWNBa+b51jH98YqGbB2D8dM+iwIY1ZCCzDaFzwaKyfw6ZpzucE6lc3na20MUNy"
-    "GE4nJC9dteGLhtbfkRezXjx13Jhl8nRREQmQQBYQUOjZvsrrOJCA+/vm5rl+SPDzGpVj/ltaal7E"
-    "sX/IMYNpG9JHRyKR89JuzoYkQAKuEYjFFu61LHUuHOxwzYlzhv8HhenEFHpwLixaIgESIAFnCOBa"
-    "eyOKeU6GNXQDil7wuEbdU1Iys0y0SoojARIgARcJZDj52o4kasVidVfgh+JnLsbla9MYHVSKKduu"
-    "wI/Uo6bZ/hoqYj8eClVdXVJSdZKvA6N4EgABVGiQkHyt8/KO2MIDQgIkQALdEdiy5c6d2I5pPb1f"
-    "AoH9rH7t/WGgAhLIWQJvvhn8JoI/QgYA9dLWrTXNMrRQBQlkP4HK8WV/xMhVgRWp9LglDRswBafz"
-    "y8yzyg4kTdOuKCm2ugwSsE/Mf3NPrfPR06JfCSxa8fxIJCEvhX4k5UldnE1IXta4oVgrtQrRBoRF"
-    "vLa1cMBMYZoohwRIIEsIIFHtywjlZO/DSc71XkPuKVBKBnck33s+ACD3jj4jJoGeEXh7oMZE7C09"
-    "Wc8eTFQfCs04oWeRcS8SIAESyD0CyKt7BAUFf+KDyAdhNukHhw27vL8PtFIiCZAACThOwIPk67di"
-    "iMfrvo+L6suQaNzmeFTZZbAAFbG/iB/Vm5JJtQZVsZvD4VnLURl7alHRlUdnV6iMJkcIjBAQ56ub"
-    "N0f3C9BBCSRAAvIJiBiooZTJ5Gv53xUqJIGsJYD7EVcSHNMBBi1/Tqcd25AACaRP4OV1pXby9e/S"
-    "t+BOS2Wo+ctWNZ3ihvWLy0s3oc/KnrJZ7qL0JUsbNtgVcLjkOIEFC57JCwSCDcAwRCoKZFb818mE"
-    "5OgTTwRR1c9OvB4mLOY92lTl08+O7BWmi3JIgASyhoCIpNd1icS8X2cNUh8FEovN+xvuiZ8SIPm0"
-    "UGj2GQJ0UAIJkEAnBOLxmt9g9Q872SRt1QClAg8OHvydgdKEUQ8JkAAJSCEQiw28Djl1v5Sipxsd"
-    "Y4PB/HpsRxcQFxIgARLILQKeJV/bmHHxfxdGSH8Rf27PLezpR4sf1ghaT0Jl7MWmGXwRSdixSKS6"
-    "MRyunsZk7PS5smXmCOA7LCH5+uXMRUxPJEACPifwihD9Es6dQlBQBgmQQCYJYPDnKPiz79lELLgP"
-    "ekSEEIoggRwiEI0qK9BqTkLIMWFh97GUXn3vvU2uVOavrCi7D7O23SEs5kPkaEPdsbxh4/GHrOSH"
-    "nCNQMHCgXX30E4ID34MOaEcTkke2ROxBIZ+RFrMy9OVTy8uel6aLekiABLKDQHHxbLvitef3Zujf"
-    "t393MBEHFy8IYGZREVXHlbKu9iJ++iQBEugZgXi81p6B/P6e7e3pXqMLCg7cg5nTPc1Z8ZQAnZMA"
-    "CZBAtwSi1v79yQm4/F7f7W4yNp4XiVRdI0MKVZAACZBA5gh4fiGLBOy/mKb5KYTclLmws8cTkg/C"
-    "Wuvz8WO7wE7GRlXsF5AgsRjvk4qLZ5RkT6SMJEsIoIi7cZT3seit3mugAhIgAZ8Q2CJBp2mqkAQd"
-    "1EACJJB7BHDxdhGi9vy+8W3y+ywr+NvcOwqMmAS8JzB5cuk2VHNFR7+R9F7NIQrKWgPW3YescfDD"
-    "G0eYs2HuWQdNOm2q0DKMxgWPxvo5bZj2/EFgyaqm87Shr5Ss1k5Inlwxep1TGpc1bPgqCimJe5iH"
-    "avyLplSMWe5UnLRDAiRAAu8nYFlJ+9zndSW5bfn5g+59vzZ+zhyBRCL2AL4GL2XOY5eevlJUNPPE"
-    "LrdyAwmQgNcE9IEDSfTpyU/Ww3Pjs0OhXdd6DYz+SYAESEAqgR075r9uWWY59O2RqrFDF4qv/hQJ"
-    "2F/q+Mx3EiABEsgFAiIeojc3z92IG4DTkEi8OheguxzjMbhJmQofyy0r8Mp7K2OHw3NGuuyb5kmg"
-    "WwJDhswYgP/ned3ulJGNipWvM8KZTkggKwi8IiEKVLURO4W4BD7UQAIk4A6BSGQakvn0dHesp24V"
-    "15GPtbTcIr6DMfXI2IIE/EEA1Vz/hBqH10lTi0Ei5UsbNk5zQ9fMs8oOIKFyHGzvdsO+EzZRdvLE"
-    "/D1vzHPCFm34i8DShqZjldKLRKvW6m4nE5LvvrepBBXf7QRnEX3aHeyRCfnfA4WFVR2f+U4CJEAC"
-    "ThOIRGYPxzUPivB4u+Ce7I7Nm6P7vVWR697vw2BILeHaTwUC5pxcPxqMnwQkE7CT9Uwz8E3kDYi9"
-    "n+3gB40/QmG5czs+850ESIAESOBQAi0tNc9hAN4krJU+A00ACdgNRUXVxxwaAT+RAAmQQPYSENNR"
-    "bd8AJBK1FajifCFw78te5JmNDJ1h71TGRoGqzXZlbLyWh8PV05iMndljQW+GkZ8fkJI8KCKZkt8J"
-    "EiABXxDYIkElpvKUcv6UgIMaSIAEMkagn131eljG3B3GEWYBeOgwu3AzCZCAywRe3lD2U7gQV4Ee"
-    "Tx3qlq1qOsWN8KdUlL2AhwYXu2HbOZvqoiWrN9j9aVxyhMC8XzUVoOK1XcRioNSQ7YTk1v6Fs5zS"
-    "F33iiWBeQK/C//ehTtl0wg7ifBMd7OXTz47sdcIebZAACZBAZwS0tuYIKGpywLL0XZ3p47rMEmhr"
-    "y18Mj7sy67VTbxPtgQGdbuFKEiABEQTsAnjI05sMMbiMFr3gstpYihyG40WrpDgSIAES8JBAPF7z"
-    "IAar3OqhhJ66HmKa+oG3ivv0tAn3IwESIAH/EhCTfN2BMJGoW44fjE+jI2lTxzq+O0rgGFjDiCi9"
-    "4O1k7PW4kbkrEqmuGDbs6pCjnmiMBN5HIBAwBr1vlScfUSUk4YljOiUBEvAdAZwv4kJEM/layIGg"
-    "DBLIHQLRIJINqwXFm7Ss9v8VpIdSSCAnCUSjytLmwSorzcIA9NFKN957b9MRbuiaOr7sflTAvs0N"
-    "207ZVFrdvqSx6QSn7NGObAIDXrfmQuFHpKp0IyF5REvxTzX6jKXFjOulyydXjF4nTRf1kAAJZA+B"
-    "ESMuG4xo7IGxXi/3bNtW1+K1CPo3jO3bb3oDz1E9n/3CHhBgWdaVPCYkQAKyCcRidY9A4c9kqzyo"
-    "bgD+vW/YsMv7+0ArJZIACZCAJwRisUHfxXXgHzxxnprTk7UuRE4aFxIgARLIfgLikq9t5LFY7T+1"
-    "Dn4YN+7z8dHK/sPgaYRj4H06Ko6vCgbb4uFw1Tq87oxEqsYddVRVkafK6DzrCLS3GyKSB3Fu2ZF1"
-    "cBkQCZCASwS0iPMFksDtB21cSIAESCBjBMLhXeMxYPPojDk8vKMnE4n5rx5+N+5BAiTgNoGp5WWv"
-    "opN/ApIr2932lYp9lPEqbQ1Yd6fSJpV9D+zePRv7P5VKmwzvW4jU+MYFj8b6Zdgv3WWYQH1D0/mY"
-    "avbyDLtNyZ3TCcn1qzechXPO1SmJyMDOOO8srBxfdk8GXNEFCZBADhNoayu4FOF7nYiGR0jJmhw+"
-    "DAJDN+fhmrzNa2GmaUwfMmSGKwMgvY6N/kkgmwjE44N+iH6+3/ggprHBYH49dOLynwsJkAAJkMAH"
-    "CUTbLStZgfVbPrhN2hp9QThcXSVNFfWQAAmQgNMERCZf20G2tNyyJ5GonYkbgTNYBdvpw96dPXUc"
-    "7mcuxUOShkBAJfBjuBaJ2LeHQlXnFxVddVR3LbmNBA5HANOLiEgeRDWGnYfTyu0kQAIkYBNIJttF"
-    "nC9wLSRi8Aq/FSRAArlBYOzYaD7uCa4TFu2DwvRQDgnkNIEp40b/GQCi0iBgwFp5/eqNdoKS48v0"
-    "6ae14drQfrghYnBeFwGOLdjzpugK3V3o5uoeEljUuKkUfaWuDTLooYxud3M6Ifnue5tKUNl9GZwK"
-    "S8BQz/U3+87qFgY3kgAJkEAvCZSWzihAgu2MXppxovlvMBj2eScM0YYzBGKxua+gv/B+Z6ylbwUa"
-    "BubnBy9J3wJbkgAJZIZA1AoEzInw9WJm/PXKy3nITbimVxbYmARIgASymMBbRWqsc9E/tF96mErp"
-    "m0Oh6s9J10l9JEACJNAbAmKTrzuCisfr/myae0/G57l4iaqq1KExu9/1CXa1GjzAbDTN9kQkMus/"
-    "eN2Mm54vjRoV7ZPdsTM6pwlIqdwaDAZEJFM6zZf2SIAEnCfQt29QyvmCydfOH15aJAES6ILAzp27"
-    "pqPj7uguNnuxutWygiu9cEyfJEACXRPYvL7sBmz9bdd7eLRFG7VLGppOdcP7xRNPeNlQagpsI79U"
-    "5gJhlfWrNk6RqY6qekNg3q+aCgKWtRo2BvbGjrttnU1Ijj7xRDAYNBrwvR7qru7UrCML/E3DssrL"
-    "y4fvS60l9yYBEiCB1Ajs3WtegOTWcGqtnN8b/fr28zku4gjIOC5IqsFgpGl54vBQEAmQwCEEtm6t"
-    "2WGaJpL1jL2HbBD4AbkJP7VzEQRKoyQSIAESEEEgHp/3LM6Vl4kQ040I3Mvk4Vqxsbh4Rkk3u3ET"
-    "CZAACfiagPjka5tuLLZwbzxeOwc/Hh/G6/e+Ju5v8Qo/jh/C6yoch98dOLDrtXC46teojl0dCs04"
-    "wd+hUX2GCIhIHsT3V3KlsgwdCrohARLoCYHNm2t3Y79kT/Z1eZ9BKC7pi+s2lznQPAmQgMsEhg69"
-    "ZgCu93/gspuUzKPS20OYGWlbSo24MwmQgOsEolFlaVNNgqNm152l5qDANPTqBY0vuJKgWjmu7FGt"
-    "jPmpScrw3sq4c3HDhpMz7JXuXCYwYLeuhQtXBhY4Id2NhORR24oxyEN/ygl9TtqwlLqscsKY9U7a"
-    "pC0SIAES6IQAnseoOZ2sz/SqNbFYzeOZdkp/hycQj9c8g73+fPg9Xd+jJBzuZ88Qw4UESEA4gebm"
-    "uWswoMYP1eoD+A1cFQrNGiUcKeWRAAmQgGcEEonapUhsvsMzAT13fJRlBX5hz+rT8ybckwRIgAT8"
-    "Q8BXSTyJRM1avM5EMsD5QPyyfzBnrdJ+mPHzK3gIMlepwNpweNYWJGIvCoWqzi8pqRaRZJu15H0a"
-    "GP7vInnQ80XHYgN2ea6CAkiABPxCwK5qKOGcERg8eN8Av0CjThIgAf8SyM8/8COoP0pSBEpZCyXp"
-    "oRYSIIF3CUwtL3sV/QLnYU3bu2u9/wsXcKX5VvJut5S07Xodg9KNv7tl3wG7fUzDbFz88HpePzoA"
-    "U4KJpaubyg1lXCpBS1canE5IXrpq49fw/0xC0uGhIWvjrqnjyu49dCU/kQAJkIDzBCKR6q/D6vHO"
-    "W07NotaaVa9TQ5bRvaVUJcdv9lUIHGOxuJAACUgngAE1mF1O10jXCX1HIqnwAeQc9PWBVkokARIg"
-    "AU8IDB48uBqOn/TEeWpOP7ZnT/D21JpwbxIgARLwBwFfJV93IMUInvsDAWV3OuGHRCc61vPdcwLD"
-    "cTwuQmdPYzKpt0Uis55CB+F1kcjM01GtM+i5OgoQQED3ESDiDXwf2wXooAQSIAGfEMDDg50SpAaD"
-    "FjsZJRwIaiCBLCZQUlJ1EqrKVEkKEefgTc3N8/4gSRO1kAAJHEqgsqLsKa20PXBD2nJ+fUPT5W6I"
-    "mj79tLZgIFBhaOM1N+w7Y1OPDuw1Fzhji1a8JLCocVMpEt9cG0zgSGwOJyQvWbVpOAZRLIM2YUlc"
-    "6rnCQN/ZjjCjERIgARI4DAGc++1kVk8X3I/FjjxycIOnIui8WwKx2MBHsUNTtztlYCNmrDoJM+V+"
-    "OQOu6IIESMABAvH44Gtg5o8OmHLZhDolmTRYlMFlyjRPAiTgXwJr10Zb29qM83EtFpcfhb4I14vT"
-    "5eukQhIgARJIjYAvk6/tELdurdkXj9fWKrXvWPTD253eLamFzr1dJoDpgIyPo4Pwh1qbT4bDu15F"
-    "Vez78ZoWDs8Z6bJvmhdKAN+FPAHSkHzNhQRIgAR6TgA3rK/3fG/39szLS0o4h7oXIC2TAAl4TCBq"
-    "JpPmnRAhatCkaepF0IT8Ky4kQAKSCVSWj/65VsYj8jTquUsbN33EDV2Ty4/dgpinwLbYcxT0jV/S"
-    "sLHSjfhpMzME6utf6mNaViO8HZEZj+l4cTYhecGCZ/JQ4W4V0q6PTEeNW22QBf6mYVnl5eXD97nl"
-    "g3ZJgARIoINAUVHVx/H3Zzs+e/WOPrHb7IQOr/zTb08IRC0Moq7tyZ5u74PnP1e77YP2SYAEnCIQ"
-    "bbes4DhYe8Upi+7Z0Rcgv0BUsQj3YqVlEiABEkidwPbttXbi9fl4+eC6Xc0rLp71ydSjZAsSIAES"
-    "kEvAt8nXHUhjsYV74/GaGqX2HoN1c/BiEnYHHFnvg/A88tt4oepScnM4PGs9bpTqQqGZZ3G6IFkH"
-    "yk01eHiW76b9ntlWPrjo7Fkk3IsESCAzBPCgqS0znrr3ggTEgu734FYSIAESSJ9AKLTrMlyrn56+"
-    "BVdatra3G0tdsUyjJEACjhLADFjaUm1I8tUvO2q498YKtGWtXtD4wsDem/qghakVo/8Xa+s+uEXO"
-    "GiSM3rG4YcPJchRRSSoEdN+2OhzDU1Jpk8l9oc3xhOT8gQN/jnPJpzIZR898qUsrJ4xZ37N9uRcJ"
-    "kAAJ9I6AaSrPq14jgj2YgZazaPTuUGaktWnuWQpHns/IgluCL2JG3FMzEjSdkAAJ9JpAS8st2zB4"
-    "4zwYOtBrYy4bwPnl5lCo+nMuu6F5EiABEvAtgVis9kmc06t9EEA+ZjS4f9iwq0M+0EqJJEACJNAj"
-    "Ar5Pvu6I8q0k7Nq5dhI2flTsjqltHdv4LpLAGDxImamU+ctkUm9HMvaDodCsKZHInKEi1VKUIwRQ"
-    "CV1A1VYtIonSEaA0QgIkkBECmMlBxKCN9vZ2AQNYMoKcTkiABDJMANfgx2GgyU0ZdntYd9D00LZt"
-    "dRxce1hS3IEEZBC4uHzsDsMwK6BG2j3XsQU6aVfRd2Vp3f06pmvWf3PFuDNG+5iG2bj44fUDnDFH"
-    "K5kisHR1UzmSm6dlyl96fpxNSEal9q/j/5PAh4X6jikVZSvSY8RWJEACJJAaARSrKUWLc1Jr5fze"
-    "uB9bihlocX3HRToB+/koNN4lQSf6USUMHJCAghpIwBcEEomap5HYfIV0sTi32LPjrC4unlEiXSv1"
-    "kQAJkIBXBHBOv8O+hvfKf0/9QmMkGGy7D11eAnKHeqqa+5EACZBA1wSyJvm6I0S7kwE/Krdiqhwk"
-    "YRtX4xXr2MZ3sQT6Qdm38CNbr3UygUTsP6IqdnVR0ZVHi1VMYWkRQDU0CYmDIpIo0wLIRiRAAp4Q"
-    "wKAuEeeNQCAg4RzqyTGgUxIgATcJTMvDNfg98GBfk0taNJI4UfmSCwmQgJ8IVFaUPWVoda00zegb"
-    "Om9Jw4Yr3dA1ffppbVoHKgztfbXBruPTo8195sKut3OLNAL1K14owwD2u6XpOlSPswnJS1ZtGq70"
-    "wYeEyDkXtfyn0OzHRDJRh4RiSCC7CViWZQ9CCXgcpWWaVp3HGug+BQJtbcbt2F1C9drzw+E5I1OQ"
-    "zl1JgAQ8JhCL1S2GBD/MdFBkWYFflJbO4AyhHn9n6J4ESEAugfz8QZjhVD0rV+E7yj4difSreecT"
-    "/yABEiABHxPIuuTrjmOBqXL2JBK1tyQSe0chqXcCXv/o2MZ30QTsTkVMG6TnmmbwRVTDXoNpyn7M"
-    "qcpEH7Mei5ORfM3K1z0+YNyRBEjgIAGlLBHVG5NJEQNY+K0gARLIMgLhcN8fI6TTpIWFRMlHY7G5"
-    "/5Kmi3pIgAQOT2BKRSkq6euHD79nZvdQhppb39D0CTe8Th1f+gqyRS+EbQwcEbtULF3VdJFYdRT2"
-    "DoH6+pf66EByNVYc8c5KeX84mpC8YMEzqGSXbDCUcaSwUN+wTKu8vHz4PmG6KIcESCBLCdgzg6II"
-    "wBQB4T2ydeu8JgE6KKGHBLZvr43jOeiqHu7u5m5Bw0jaAwi4kAAJ+IhAYWGyCpWln/KB5I/t2RO4"
-    "zQc6KZEESIAEPCGweXN0P4rafBvOt3siIAWneAZ0RShUbfenciEBEiABXxPI2uTrd4/KwrZYrHYV"
-    "Xp+wLI2HbHolOiBEJFG9q5F/dUUAx+ok/Ohei9ezqIj9ApKxf8SK2F3Rkr8eVZs8nzoECeAiKtjK"
-    "P1pUSAIk0EFASuVrVBxi5euOg8J3EiABRwjg+vpcVEH4jiPGHDaCa7brHTZJcyRAAhkigP+/Oj/Z"
-    "pxLuNmfIZU/d4H7UaljUuHZITxukst+U8aN/iXOq6IotWunb6hs3fjiVuLhv5gmovu3zkcx/SuY9"
-    "99ij4wnJ+QOPwKANdXqPFWRqR21celH5cRsy5Y5+SIAESMCykleAgoBZidRcHg3/ETBNbV+LShgM"
-    "eNGIEZcN9h9BKiaB3CWwadP8A6ZpnodTSMIHFC4Oh6um+0AnJZIACZCAJwTi8VtfxjPlCjhv90RA"
-    "Ck5RAO2ucHjmR1Jowl1JgARIQByBHEi+fpd5S0vdP+Lxuont7Xo4ngX+D7Y0v7uVf/mAwDFIxo7a"
-    "FbHD4epn8Jo2dOg1A3ygmxLfIaA9TxxEIj+Tr985HvyDBEigJwTw2yPivIEp9TwfwNITXtyHBEjA"
-    "HwQikaoxUFqPF/K7ZC047/4yHq95RpYqqiEBEkiFwMSJI3fi3svu5BdxHfWudjUyYOUtxcBgV859"
-    "rbt3o69JPfmuP3F/9TEso/Hee5skV1QWBy2Tgpas2jBOG/riTPpM2ZfDCclLGjZ+HRqqUtbhcgNU"
-    "y7+tcvzolS67oXkSIAESeIdAJDKtH+6F7ORrr5dncD/2F69F0H/qBLZurfsPWj2eekvHW/Rva+uD"
-    "Ke+5kAAJ+InA1q01zcifsKulCruP/yBFDPqejzyBz3xwC9eQAAmQAAnYBJqb5/0efbPflU9D9UGl"
-    "7gdCoRnD5GulQhIgARLonEBOJV93INi2ra4lFqu7saBgUCkuzqfiwdizHdv47hcCGqOf9IK8vNY4"
-    "KvYtLy6e+UUDedl+UZ+7OlVAQOyWAA2UQAIk4CMCuDlNSpBrmklM28mFBEiABHpPoKSkegjyDh+B"
-    "JZHJd8mk+ZPeR0kLJEACXhOYOn70P6DhB17r6MT/2csammZ0sr7Xq6ZPP60N59fxqDf4Wq+NuWeg"
-    "rC1oLHTPPC2nS6B+xQtl6KcUfWycTkhe3vjCCKWNpWDmyoCIdI8F2q3R+4JX96I9m5IACZBAygQs"
-    "q5895bbnSQf4Lbo1ZfFsIIiAlKrl1ozS0hkFgsBQCgmQQA8IxGLz/oaBQFf1YFdPd8EzmzwMqm4Y"
-    "NuzqkKdC6JwESIAEBBNIJGpvxTm9UbDEDmkjTDPQgHwvPgfvIMJ3EiABXxHI6WTVzZuj+2OxmnqM"
-    "4j/NstRJGM1p//jEfXUEKbYQCCZZlvl4OLzrJSRi/6SoqPoYYpFJAB23bd4rU6wc6/1BoAIS8BUB"
-    "XBuIOG/gWkXAOdRXh45iSYAEOiGAxOu+yaR+GJtGd7JZwqrftbTMfUqCEGogARLoPYEp48puwcBp"
-    "+5wjakHd61uWNTZ90g1RU8eXvoIsUjt5SsKU712EqMfVr95wSRcbudoDAvX1L/UxAkn7gZjIgVFv"
-    "I3E0IXnBgmfy2pPJBqRdH+kB8u5c7tJJ49zKyqP3d7cTt5EACZCAswTOt4uWzHbWZlrWtsRiA+9P"
-    "qyUbiSCA552/hZC13otRob17A5O810EFJEACqRKIxWrno809qbbL9P54bhMJBtvuM4xpIp7fZDp+"
-    "+iMBEiCBHhDQyWQQxUiN//ZgX093waCaL0QiO3/uqQg6JwESIIE0CeR08vV7mbW01DyHathXxWLN"
-    "w3FiPwvbVuG177378G/xBEZA4fdNUzdFIrP+F9MNfYXVsGUdM4xCFjBVleZNuKyvBdWQgHgCGDiS"
-    "L0GkaVoCzqESSFADCZBA+gTODyDxeiXafzp9G662tFAx9lpXPdA4CZBARgngOkrnJ/tUwunmjDo+"
-    "vLM8y9INyx5Y50rS55Txo3+JB8Gyq0ZqNW/ZqqZTDo+Ke2SEQN/W2+DnwxnxlZ4TxxOS8wYdcQv+"
-    "n7gyCCK9EN9qBU0XT504+sXe2GBbEiABEkiVQDgc+RbOP6WptnN6f9yPzcMzlXan7dJeRgloXILX"
-    "ZNRjF87wPGgOn9F1AYerSUA4gUBATcd44n8Jl2nL+3Qk0k/EOc8HrCiRBEggBwm0tNyyB+f0cxD6"
-    "Lunh415kTiRSXSFdJ/WRAAmQwPsJMPn6/USM+5KYfuHX8XjthP37C8Lo8LIrAf0FL8EViz4QRK6v"
-    "MJFA/zUcsl+HQrs2IAm7esiQGZIrB+XM8cJxkVC1VUQSZc4cdAZKAllAAA8KRAza0DrA5Oss+D4x"
-    "BBLwkIAKh4vvgP9veaihW9e4VlyaSNQ83e1O3EgCJOA7AhMnjtyJQdLjIFzatcwI3RpYims9FKp2"
-    "ftl8VPN3DUM96bxlxyz20Uo33ntvE/tLHEOanqH6hg14sKQuSq91Zlo5nZBcv7rpbKWNGZlR33Mv"
-    "OBvMmzJu9C963oJ7kgAJkIAzBDBg7WpnLPXKyusHDuQv6pUFNhZBID9/8AoIafFejDoOFQy/7r0O"
-    "KiABEkiVwNatNftwq3wu2r2WattM74/+xCtCoWp79ikuJEACJEACnRDAOX0TzpUXYJPVyWZRq9BP"
-    "u6ikpOokUaIohgRIgAQOQ4DJ190A2rnzxt2YWmcRErE/a1mqFD9IP8Tu/+ymCTcJI/BWtQg9t0+f"
-    "wJZQaNaNmGa9WJjEnJKD4yHgYbsSkUSZUweewZKAzwnYBRslhBAIsPK1hONADSTgUwJIvK6yE6+n"
-    "Cda/S+sgEhW5kAAJZCOBC8vHPI1rqu9Jiw2j7L++dPWmKjd0Rc84o7293ahAZvd2N+w7YRPxl7YG"
-    "rLudsEUb6RFY1rBuNBKvF6bXOjOtnE5IXrTi+ZGG1kuh3pWBD+lSUYZ65s0B6pp027MdCZAACaRL"
-    "AMVjPoNnTx9Pt71z7fRi+5mYc/ZoySsCmzdH9yNxxe4D8HxB8uZVnougABIggbQIoFjdZtzHj0fj"
-    "ZFoGMthIKeuucHjmRzLokq5IgARIwFcEcE7/Ja4Pr/OB6ELk5j0wYsRlg32glRJJgARI4CABJl/3"
-    "8IvQ0lLzIn6Qrkci9kdwozESSaQz0Wnwe7xLqOTbwyhydzd0Xg7EsboG06y/GInMqscI2LG5S8PL"
-    "yJXnyde4qBSRROnlUaBvEiCB1Ajg917EecOyjAOpKefeJEACJHCQABKvZ92F/KZLJfPAPdaPMAXe"
-    "NskaqY0ESKB3BC4sHz0X56KHemfFjdb6piWrNp3uhuVLLijbiurSdgUu5DnLXFBps3xJw0ZMKc0l"
-    "0wTq61/qYxmBRvgdkGnfPfXndELyggXP5AUCwQb4H9JTDRnab5eV1ONmnlXGe64MAacbEiCBdwmg"
-    "v1pC1et29H/Ne1cV//I/AetOxLBPQByfKSqa/QkBOiiBBEggDQKxWN1j6LP7fhpNM9xE9TEM8xeh"
-    "0IxhGXZMdyRAAiTgGwKJxOCfIG/qUemCofHYtrYCzOQSZT6j9INFfSRAAgcJ8GSVxhcBNxpbUBF7"
-    "PqbEPjMYPFAEExfgYdV9eH8jDXNsklkC+fixnoIbxf+gosT9xcWzT86s+1z3Znk+WAFJ+Kx8netf"
-    "Q8ZPAqkTEJF8nUwmPR/Akjo6tiABEvCWQDQYClUthoZp3uro3juuz56LxQaLqMrVvVJuJQES6A0B"
-    "9Jvo/GT+VNh4qTd2XGibhypZDcseWHekC7aNynFjfoXM65vdsO2UTZQfrl3S0HSqU/Zop2cEVN82"
-    "+7dPcr+U4wnJBQMHYhCGIS0Byx4ccdHUiaNf7NmR414kQAIk4BwBDJQ9HvdDX3fOYnqWoOEBu8Jp"
-    "eq3ZSiKBRGL+q9B1jwRtpqlZ/VrCgaAGEkiTAPIibkLT+9NsnslmI00zgIGe0WAmndIXCZAACfiH"
-    "QNQ6cKBgEvRu9IHmr4bDu37sA52USAIkQAIGk697+SXYsuXOnaiGvSIWqykvLEwO09r6GkwuRDUn"
-    "aQ8Texlp1jXHd19/27Ksf6GD88FIZPYpWRehyIBMCYmDGP3MhQRIgAR6TgCDdgp6vrd7e+bl5Uk4"
-    "h7oXIC2TAAk4SqCo6KrCcHjnw0h2rHTUsAvGUNl/Jh6MtLtgmiZJgASEEZg4ceRO3IuPgyxp1zXD"
-    "dWtgKSpPIg/Z+WVLUfP3lTb+6rxlxyz2MQ29+t57m45wzCINdUtgyeqN45HxK/k32vGE5CWrms7T"
-    "hr6yWzDebKyrrBj9gDeu6ZUESIAE1BwwcOX6IxW2mDHUHhzDJfsI1CIk+zfd40V/q6SkutRjEXRP"
-    "AiSQPgHd1mYPpFbPp28iMy3xLOcLkcjOn2fGG72QAAmQgP8I7Nx5426tk+dAuR8Ki34PBTVtrVxI"
-    "gARIQDQBJl87eHg2bZp/IJGY9yskY0+Px2uOwQX+0Uh2wM3IwdHlzQ66oinnCNgdm99C0vyzSML+"
-    "hV1pwjnTtPR+Aqgm5nnla2ga/H5d/EwCJEAC3RFA9Z9B3W3P1Lb29nZpSUqZCp1+SIAEUiSAxOuj"
-    "TLP9CTwUOSvFph7srleiwtofPXBMlyRAAh4RqKwY83/Icf4fj9x36RZZKV9funpjdZc79GJD9Iwz"
-    "2tuSajw6ILb3woyrTRF/aWvAuttVJzR+kMCyhnWjkYy/QDgORxOSlzY0HYvi94sExvx/hWbbdwTq"
-    "oiQSIIEcIDBs2NUh5MVeICDUJ1ta6v4hQAclOEwAzyrXoV/zVw6bTcdcwLL07HQasg0JkIAMAtu3"
-    "3/SGaapzcE7ZLUNR1yrQ3zAnEqmu6HoPbiEBEiCB3CaAGVKeRy6bnccmYJBet8cCXal6GXO4umXE"
-    "jSRAAgIIMPnaxYNgT9OGitj16OCYjFeJaZpj8ONwKX7IVsNti4uuaTp1AnYS9rl4PYfRU4tQCXt4"
-    "6ibY4vAEzD2H38f1PfLtSpCue6EDEiCBbCIgYtCGaR6QcA7NpuPKWEggKwkUF8/6MBKv7QfnH5Ue"
-    "IO6LYtCKqtdcSIAEco1AZUVpLWpMPygvbvXzpavXf8oNXZdcULZVGXoybFtu2HfCJgoIlC9paLrM"
-    "CVu00TmB5cvXFFpGwP7uD+h8DxFrHU1InverpgJUvLb7QgeKiO5dEbsCpjWuvHwsB7m+y4R/kQAJ"
-    "ZJBAMNhm3wtJmG2NVa8zeNwz7SqZNEQcX9z/TwmFZgzLdPz0RwIk4ByB5ua5G5HnIPqetiNazGq1"
-    "qKSk6qSOz3wnARIgARI4lABy2e7HYJWbDl0r8hP6z/QDQ4bMOEKkOooiARIgARBg8nUGvwb2TUk8"
-    "XrcAP2QVSMYO48fsRFR9mQEJD+D1Wgal0FXXBAL48b4IU21sjERm3TxixGUiEu66luuvLbjZxRTT"
-    "3i+BgDXEexVUQAIk4A8C0/Kgs78ArQdisYV7BeigBBIgAcEEUNVlgmUZT0LiKMEyO6RpVMypbG6+"
-    "nfdBHUT4TgI5RABJvlrl59kVVl4SFnae1uaqZQ+sO9INXRdWjPk1+hxEP9hAgngNErBPdSN+2jSM"
-    "ZF7f28HhBMEsHE9IHvC6ZSd9fURYzNrUeurk8uOknYOEYaIcEiABtwgMG3Y5+prUpW7Z76ldVDB9"
-    "IR5vfrin+3M//xFoaan9A1T/W4DyvqYZuEKADkogARLoBYFYrO4R3M//pBcmMtW00LLUA3zOnync"
-    "9EMCJOBHAonE1u9D92PytavjCgoCy6HTLqjJhQRIgATEEWDytXeHRCcSNWtxk3IbErG/HY8PwtTg"
-    "xin4vZiNm5b/hazXvZNGzzgOfTAS/6q2toJNmMZidmnpDAkVKHx/YJB8vUNCEKaZZFK9hANBDSTg"
-    "AwKhUMEgyPT8Zg4Pw0ScP31wyCiRBHKSwNix0fxwuGourrVWAEA/P0DAtfZtmCXod37QSo0kQALu"
-    "EKg85+hdSEQeB+vSqs4Ot9oCy3BOdeUa8OWi2LWI+S/uUHXEagESsBsXNL4grUqxI8F5aWRJw8ZK"
-    "3Flc6KWGw/h2PCG5vqHpfNxOXX4Yvx5sVjUXjh9jVyDnQgIkQAKeEAgG8y/GdZCEPuo6w7gv6QkE"
-    "Os0kAXsglOcL+gGuiESm+aLPwnNYFEACggnEYgOvw/OKXwqWeFAazjnH4jk/+kqjzIeRfrCojwRI"
-    "wCMC9yVNs208nG/2SEAqbr+JZ2B2sjgXEiABEhBHgBebYg5J1Gpurv13PF5TgySEs1FtYAie830c"
-    "xaD+BxJ/i9ceMVJzS4hdIfnWPXuC61AJ277wcOXha64gNU1TROXr9nbFyte58qVjnCTQSwKBQJ6E"
-    "B2EGOgqZfN3LY8nmJJCtBCKROcft2LHr77hMrfZRjOuCQfUdH+mlVBIgAZcIVFaM+T+YvsYl8+mb"
-    "1cbXkDQ6J30DXbeMnnFGu2lqu3/h1a738nzLsflW8m7PVWSRgKUrm8aiQ+k22SE5m5C8qHFTKRIL"
-    "5X2PtPF0odn6XdnHgupIgASym0A0iPhmeR+j2tnW1lrvvQ4qcJvAkCGDVsNHs9t+emB/qGUVTunB"
-    "ftyFBEhANIGolZ9vXIBnFptEy3xL3FfD4V0/9oFOSiQBEiABTwjYM5MqZZ4L5/s8EZCSU3VdKDTz"
-    "rJSacGcSIAESyAABJl9nAHJ6Lu5LojL206iMfSMqY38lHt87WCnrU6iKbT8cwDS1xhvp2WWr9Ajo"
-    "o3ETuRIJ2I+XlMwsS88GWxmGJSL5Gv+PRCRT8htBAiQgn0B7uyFlsAaTr+V/XaiQBDJOIByuvlTr"
-    "5LNwfGrGnafpEJVx2vC6YOvWGh905qUZJJuRAAmkRKCyYjQqLhoPpNQoAzubyrhh6er1n3LD1YXl"
-    "Y5qVPpiALbnS5PlLV23g1PAOfAGWL19TiJLSjTAlt9KjwwnJ837VVBCwLDvRS1oF9Z2BgFVRXj5W"
-    "WsV9B75pNEECJOAXApHI7nJoHem1XjzvWPjqq3e86bUO+nefwNq10VY8ExExCAyDEGcbxvkB96Om"
-    "BxIgATcJbN5cu0tr6xz48EPxuO/h+f633ORB2yRAAiTgZwKx2Nx/Qf90H8RgKhW4t6SkGoP9uZAA"
-    "CZCAHAJMvpZzLA6jZGFbLDbvb6iK/XMkY58Vjw9CZWz9MVTHvgqdZI+i0p2IpNbDBOH7zWD9hWRS"
-    "/QdTWvzAnt7d9wFlOADLklH5GkngQzMcOt2RAAn4lIBS7SKSr/H7w995n36HKJsE3CBgdy6Fw7Me"
-    "QzXJO2FfbiJX58H/IBar/Wfnm7iWBEggZwkU5F2E2F+UFL82DFSlNBsWrNzgyv3jlPFjfm8odaOk"
-    "mN+vRSt169LGTR95/3p+To1Ae36/O9DihNRaZXRvxxOSB+zWtYhA2uAwbSg9dXL5cS9llC6dkQAJ"
-    "kMD7CCBZ7ar3rcr4R3tQbDBozM+4Yzr0jEAwuH8BnHueJIk+zmNDoWI7YZMLCZCAzwm0tMz7L/IU"
-    "piIM3D6LXjD22Vhmzx4oWiXFkQAJkICHBJCDdg/OlT64P9CDLUs/UFR0VaGHuOiaBEiABA4hwOTr"
-    "Q3D46UO0PZGo+z9Ux741kaj9Rjw+cKhpmh9WSlchEfsXiETy9LV+At2JVtUHjK/H9O7/DIdn8iFk"
-    "J4S6WtXerkVUbkWVh+FdaeR6EiABEngvASnnC9M0RJw/38uGf5MACXhBYFoeql1/L5nU/4H3M71Q"
-    "0Buf6LxbjcTrm3tjg21JgASyk0DlOUfvsrQ1DtEdkBQhzlsl+aZahsHvyg1dhar0h7D7ezdsO2Sz"
-    "QKN68YLGFwY6ZC/nzCxd1XSRMvRkwYE7npC8dHVTuaGMS6XFjETDWyvHjXlImi7qIQESyC0CkUg1"
-    "7uPUKV5HjUub1ZiNqNlrHfSfOQJbtty5E8e9PnMeu/aE3+Sru97KLSRAAn4igDyFRvs62weaj9C6"
-    "/cEhQ2Yc4QOtlEgCJEACnhBIJPbOgeO/eOI8Bafor/0QiqctRhNX+mtTkMJdSYAESOAgASZfZ80X"
-    "IWo1N89dE4vVzYvHa87DyKQiTEE+Fj88l+MhYQPeY1kTqpxAxqIK1t9CoSp0FEX5f6kHx6V//0FS"
-    "KreO6IFc7kICJEACIGCWSMCA33EmX0s4ENRAAh4SCIVmnhUOF/4bxWR+Chl9PZSSpmv9L9Pc64dq"
-    "OGnGx2YkQAK9JXDR+OOeUdq4prd2XGh/1rLGJlcSRMrLVbLdCk7EuT3hgm6nTB6bp5PL3UpAd0qk"
-    "RDuLGjadqJWeJ1FbhyanE5IXNW4qxXfl7g77Yt618XQ/1fZ9MXoohARIIGcJ4BzpedVrGz6KDczN"
-    "2YOQw4FbVrs9M0VSAIKPYXbZzwrQQQkkQAIOEIjFBn0XgzskDyp+O0p1XEFBYBk+MFnPgeNOEyRA"
-    "AtlIYGFbe3teOSITP0gT/VnjkKcl4t4qG78JjIkESCA1AkwYTY2Xn/bWicT851EV+05UyB6P9+JA"
-    "wBqNytgXI4h78HrZT8EI1pqPjsqbwuFdvx0+/MqIYJ0ipG3eHN0PIXu9F6OZfO39QaACEvAJASnn"
-    "C/WaT4BRJgmQgMMEIpHZp4RC1Y8rZf4SyXknOGw+U+a2oTPsW7HYQgHXgZkKmX5IgATSITBl/Gg7"
-    "UdWezUvWoo2fLm7c8Gk3RF0y4ZgWbWkkYItIhOk0RCTFfwPVjK/sdCNXdkpg+fI1haZhNWJjv053"
-    "kLDS4YTk+vqX+pjWwZilVZNDIYDkuPLysa0SsFMDCZBA7hIoKak6CdF/2WsCeEb0RCw2919e66D/"
-    "zBPYtm3+C+hXeCTznj/oEX0crgxu/KAnriEBEnCfQLTdMNrHw48fcg++hcEfHJTp/peCHkiABHxK"
-    "4NVXb05Ylnke5IuanbAznMjTuqG4eOYXO9vGdSRAAiSQSQJMvs4kbY99bd06rwmVsRejKvZkvEYZ"
-    "RmAURqJOgazleL2CF5f0CZzZ3h5cU1Q06wvpm8iZlp6PlLMsNTxnaDNQEiCBXhHAAykR5wtUvvb8"
-    "3NkrkGxMAiSQMgEkXI/Fw4AVWlvP4Fzk5w4kJDqp83AfsiVlCGxAAiSQkwSsvlYlzhsbJQWvDSMY"
-    "0GrVgpUbhrqha+qE4/6ABOcb3LDtoM1bUQH8kw7ay2pTyfw+d6Kc2vGCg3Q8IVn3batDzKcIixm3"
-    "Uqqycvzxm4XpohwSIIEcJJBMKrsyG06V3i7JpMGq194eAk+9Y2C0iOOPKvBfC4dnSb5W8vQ40TkJ"
-    "+I0ACsK9ahjWtzHAwy7CJXxR19kzDAoXSXkkQAIk4BmBlpa5T+F8XuWZgJ47DiBRvCEcnjOy5024"
-    "JwmQAAk4T8B03iQt+oVAPH7ry4lEzTIkYl+I1wgkpB6LDo8LoX8hXkzGTv1ADjVN47eRSNV3Um+a"
-    "Oy3Quef5dwsa7GRKzzu6c+eoM1IS8C8BDFKScsO22b8UqZwESCAVAsXFs0/GA8jlSLheg8uVCWjr"
-    "83s2PTMer/lLKgy4LwmQQG4TuOibx71hGZY9xeU+SSSQwVmSZ5rLo1Htynl584ayH+Em9XFJMb9P"
-    "S55l6YZFjWuHvG89P76PQP3qDZfgN3zS+1ZL+uh4QjIqo5fj+ztNUpC2FgycuHlqRdnD0nRRDwmQ"
-    "QO4RKC6eUYKoxwmIfENLy+BfCdBBCR4RwMDov6K/AQk1ni8KFyScKt7zw0ABJOAcgXh83rOwhnsh"
-    "8YupVODekpLqUvFKKZAESIAEPCIQj9ctgOtFHrlPxS0KZSQfjkSmyZ15LpVouC8JkIAvCbjywMiX"
-    "JCjaaGmpeTGRqFuOROzpdjK21smx6PzAtLLKnvJ3BxH1iEAQiXo/R8LM3WPHRvN71CL3dtoiIOSC"
-    "YcOuLhKggxJIgARkE7AHaRRLkKh1m4RzpwQU1EACWUrg/EAkUv1NXEM+ZlnWvxGknbAVyIJgb3i7"
-    "ky4LQmEIJEACmSRwUcWYNdrQ12TSZ098KUN/deRxm1zRFY0qq80KXoBhwvGeaPFonxEBK28pBu5z"
-    "MHMXB2BRw6YTDa1qu9gsYrXTCcn1K14ow3fibhHBHSriH/3NtmsPXcVPJEACJOANAa3NWfAs4HmB"
-    "rjGMqOUNBXoVREDEtQqK5EwcOnRWWBAXSiEBEuglAfQD3osBHnf00kwGmuvBGFz8QFHRVYUZcEYX"
-    "JEACJOBLAoWFSeSKGU/7QPzJWve70wc6KZEESCBLCTD5OksPrBNhYYqg5xOJ2ttRqe68eLz5KHSE"
-    "fBp27Wlw7YQQLt0TuHjHjl2/GzJkxhHd75aTWz2vfG1Tz8trOzYn6TNoEiCBHhMYPvxKu/O/oMcN"
-    "3Nsx2dLSutU987RMAiTgFYFIZM7QSGTWNeFw8SYkLT0EHWd6pcV5v2oeBnR+z3m7tEgCJJArBKZW"
-    "jLkNsa6UFi8SsK+vX7XhM27oumTCMS2mYU6E7aQb9h2yeTaqHM90yFZWmbm9cW1/07AaEZTkajuO"
-    "JiTX17/URweSqxGztP6vnclk+7jy8rGtWfUlYzAkQAK+JDB48HcGYtyShEqgrwYC5nJfQqRoRwnE"
-    "YoPtgksvO2o0PWMFeXnGjPSashUJkIBUAoMHD66Gtiel6uvQhQJ0H1KqfTE+c3BxBxS+kwAJkMB7"
-    "CGzaNP+AUuZ5WLXtPaul/jkZz9p4XSn16FAXCWQ5ASZfZ/kBdi68+5KxWO2TdgIFXqdYVrAICSIX"
-    "KqXuQ1L2buf8ZJWlzxUUBJ7AqNmjsiqqXgaD742I5GvoOKGXobA5CZBAlhNIJvOknCdQ/XBhW5bj"
-    "ZngkkDME7NlRUOX6bFS5Xo6ZZrago/9GBD8qmwDg/mBZPD7QftDChQRIgAR6RWCv2TYdBjb0yojD"
-    "jVE1OGgotWpJY9Mwh00fNHfhuNInUPX7p27YdtDmzcsamz7poL2sMFWYDN6Jp/bHCw7G8YRk1bd9"
-    "PmI+RVjMuLxSlRdPPOFlYboohwRIIEcJ9O27/1KE7vkgFdyn3bF1a82+HD0MDPsQAtF2fJx3yCrv"
-    "PlzBIkbewadnEnCDwNq10dZkUn8btpvdsO+kTfw2jguFZs1x0iZtkQAJkEA2EYjF5r6Cc+W5eIl/"
-    "To3OoLmhUPXnsok/YyEBEvAHASZf++M4iVPZ0nLLtkSibnksVlPer1+yCFMIfRki7anKXhQn1ltB"
-    "p5pm258ikdnDvZUhybspIvkaA5mlJFVKOjjUQgIkcAgBLSVxgkkDhxwXfiABPxKIBouLZ34RI+/v"
-    "wOwocQwCewRRTMKrrx+jOYzmVbFY80WcyvowlLiZBEigRwSuKB/7pmlZ5dhZWqJQsbL0qsZGHehR"
-    "ICnutGX96OtQe+uxFJtlcvc8TNHcsOyBdUdm0qlkX0saNk7XSl0gWKPjCclLVm0Yh4ECF8uLWd84"
-    "taLsYXm6qIgESCAXCdiDb1H1WkAFNr2/vV1zKu5c/BJ2EfOBA8lF2PR6F5szufoIFDGamkmH9EUC"
-    "JOA+gW3b6lrsxGZ4Ej8TDXT+3O63dZ8KPZAACZCAPwnYRTpxT/MdH6gPKmU1lJRUF/tAKyWSAAlk"
-    "EQEmX2fRwfQqFHu6iVis7jFUxK7G61jcpHwEWm7Aq8krTbL8quO0tv5aVHTl0bJ0eaMGT/uEJF8b"
-    "TL725itAryTgGwKCKuRv8Q00CiUBEniHAGY/KQyHq89Bhetl4fCuFssyH8d10GXYYcg7O2XfHw/H"
-    "43svNIz7ktkXGiMiARLwisCFE477DwbPXuWV/278fnFPcqMrDx6iUWW1J4OTkICNGVDELiN0a2Ap"
-    "rplR+Di3l/rGdR8ChBrZFJxNSK5f8UIZZsNbKDDmp1p3v/FDgbooiQRIIEcJvPbargkI3fOH//i5"
-    "XmknwuXoYWDYnRDYsWO+nXhtJ2BLWGZhAHdQghBqIAEScI7A28l6fpgZL4B+24ZweM5I56KnJRIg"
-    "ARLILgLxeA36vfRK+VGpkGVZ95eWziiQr5UKSYAEsoUAk6+z5UgKigM3U/9EEvb38BptmuaH8ZD0"
-    "J/ghXi9IohdSRgQCwceGD78y4oVzST7b2/OkJBGOlcSFWkiABCQSkFIhX7PytcSvBzWRwAcIRIOR"
-    "yMzTQ6GqHyLh+k+m2b4D18APYLfJeGVzwnUHiYcKC5OoaLOwrWMF30mABEjAKQKVFWV3wNYKp+w5"
-    "ZkepHy9dtcGVClmXTDimxbCUnbAldkCLNoyv1zdsQrJM7i63N67tb1iBRhCQPJuFownJ9fUv9TEC"
-    "STvmI4Qd+R3JZHvF9Omn8VpE2IGhHBLIYQIYp2LMERA/frLVXAE6KEEcgcA8SGoXIGtkJLLbnu2G"
-    "CwmQQJYRSCRq7sBv4VIfhDUUt94PoFqq5Ps6H2CkRBIggWwmoNS+SxDfGukxYuDpJ/bsOXidK10q"
-    "9ZEACWQJASZfZ8mBlBpGc/PcNRgFdW08Xnc8Rhh9CDdY16Gj73mpet3UhUqHx7a3B38XiczBDVzu"
-    "Ltu33/QGot8mgEDxqFGzBgnQQQkkQAJyCRwvQRp+OzdJ0EENJEAChxIYMeKywaHQrK9GItXXIdn6"
-    "d6huvUNr80k8Xcf1rvFZvPIPbZHVnxbG483n2TPiZHWUDI4ESMBTAnvNtkshQNrA7oBWakV940sh"
-    "N+BUji/7o6E1BrTLXZTSNy5Ztel0uQrdVdbPyrsLHo5z10uvrDufkNy39TYoQrEFUYtWWlVePPEE"
-    "DplI+IwAAEAASURBVFwVdVgohgRym0AoNPOrIHCi9xT0b5H8ttZ7HVQgjUA8fuvLeG71Cwm6MJvK"
-    "1RJ0UAMJkIDzBPLzB12G3IBnnbfsuMVTk0lt399xIQESIAES6IRALLZwr2Wpc7EJhYfEL9PC4So7"
-    "WZwLCZAACbhOgMnXriOmgw4CLS3z/ouq2FEkY6PisPooOnXmY9trHdtz5H2s1slfDxkyQ1p1oEzj"
-    "F5GA39pqnZDpwOmPBEjAHwRCoRnDoNR+eb4kkwE+IPP8KFBArhOIRKpGFBVVfR1J1t9FwjWmoaxa"
-    "19ZW8BoGR/wKDwjtqe2/hNeAXOSEZPMfY8ab6YZxn9jKrLl4XBgzCWQjgSvKx75pmEm7It4+YfEV"
-    "Gbp9RWOjDrih6+UNo39sKOMxN2w7ZDNPKath2QPrjnTInm/MLGloQhKBMVGwYMcTkusbNlSgT+8i"
-    "cTErdcOU8WWPiNNFQSRAAjlNwDTVVRIA4L6VVa8lHAixGsRURf8wBrefKRYThZEACaRNYPPm6H7c"
-    "M9rJeq+mbSRzDSejH/jKzLmjJxIgARLwF4GWlpoX0S9k94VZ8pWr+Xiu93H5OqmQBEjA7wSYfO33"
-    "I+hT/UjAfiaRqJ05ZMigCH6cz0Ui9iPoBMyVaUFP69MnsNIwznflwawfvhKojCUi+RrfvdP8wIsa"
-    "SYAEMk/ANE0pldx0Mhlk8nXmvwL0mHsE1LBhV4dCoeqP4WHfhEhkVhQJ1iuQbP0PvHZimrKX8eD8"
-    "UWD5Ga5Zx+Eawq5wqXIP0yERJ3ENf3ksVvOjQ9byAwmQAAm4SKCy/PjncPad7aKL9Exr/YU3ddN3"
-    "02vcfatoVFmBA+YF2CvW/Z6ebh1utQWWYUBSzvw2Llu5/iRl6Fs9pX445w4nJC9rWDcalz8LD+fW"
-    "g+1/fvmorbwe8QA8XZIACXRNIByuPg0/i2d0vUdmtuD+9blYrO7xzHijFz8SQFX0p6H7rxK0s/q1"
-    "hKNADSTgDgH8Fm0xTWs8rLe748FJq2oufsc/46RF2iIBEiCBbCKAXK/fIB67KJH0pQDP9X5x1FFV"
-    "RdKFUh8JkIC/CQT9LZ/q/U5g7dpoK2J40H7ZVUaVCk7AIKkL8TDnFL/H1p1+JKp8LRKJ3BiLGSKq"
-    "X3Sn1Y1tmI7keXT8er7gOHCkm+dHgQJIQCYBQeeHLdu33/SGTEpURQJSCZwfGDFi6BGW1adfa2t7"
-    "n0BADVIqgGqc+uDLsowhSplH4lokjAd7GAhoDH/r77Y8OyL8/397EXCx0iFF3vsBkJqYSNT9Qp40"
-    "KiIBEsh2ApXjRt+1dNWGT2ml7IRkMYvSxnVLVm98auq40Y4nOE2eXLptSWPTBGXp3yNgmQO50c+x"
-    "rHGjnRgvOyHZgW/M7Y1r+1uW2QhTfR0w55YJRxOS6+tf6mMZbXbM0mb6eNU09YToGWf4IInDrUNN"
-    "uyRAAhIJ4F7zKgn937j/tatev3OXK5EVNXlPAN/VW9EX8mnvlRhfKi6efXJz89w1ArRQAgmQgMME"
-    "mpvn/R4zCn4X55ybHTbtqDmcD9FHbDWWlFSftnVrTbOjxmmMBEiABLKEAGZD/RkKF9mFDr8lPKRi"
-    "PCNEf9Y0zLCyMFeKgQo/JJRHAtlHgMnX2XdMfRtRIjHfnm6ozn7ZHSzJpL4YFZLth6mDfBtUN8JR"
-    "+WIOKiuuRbXA+m52y9JNJipfez8TiVKKyddZ+g1jWCTQWwJIzPw4HpT11owD7TWrXjtA0VsT+k50"
-    "QNzirYas994fA/cOJk7j2rG/3UHedrALRRuBwFv5ae/+f1bGWw/A9XuSrN+bcJ31rHodIPjGTNMo"
-    "R8WaJ3ttjAZIgARIIE0CewLtl/Wz8uwOfnsmAimLiQTse++55/lTJk06Ie60qKnlZX9a2tD0Y/yC"
-    "Xee0bcfsafXzpavXPzVl3HFZ/RuB794CMBvjGDfnDTmekKz6tt2Bu6OTnZfaK4sWBmFMurB8NBMi"
-    "eoWRjUmABJwmUFR05dG47zzPabup29OJ/v2tVam3Y4tcIxCLDXokFNq1Cd/bUo9jV5al7YJFkzzW"
-    "QfckQAIuEcCs2LciAfs0nG8ws6DkRYUsy7q/tHTG5zdtmo8iFFxIgARIgATeR0AfOJC8sKDA/Aee"
-    "z0nqn32fzIMfPxsK9bs1kTBmdraR60iABEigtwSYfN1bgmzvCoG3R7bPwKjSa9rbrfORJDsNjj7l"
-    "ijMPjSIR6K6ioqrnW1rqcFGSO4tlJZ/HCDPPA0by0DF2xfW3E/8910MBJEACcgjg/CxicAaSwJl8"
-    "Ledrka6SonQbsl0qBN4aLCFizEQqsv237x/xILQCFa9b/CedikmABLKJwBXlY9+sb1xXbliBpxBX"
-    "P0GxFbXlBVY0NuovlZerpNO6Nq8v/cnI45rsvpEvO23bCXv4NQ4a2ly1YOWGU6dPGLPdCZvSbKDq"
-    "+hWIE7O2iV0cT0hGRffxuMaqlBYxBjv8rLKi7LfSdFEPCZAACWB2z2pQEDBThbqNCWP8PvaMQBSV"
-    "cmbVYt/bera/e3thUP24SGT292Kxua+454WWSYAEPCSARy/Bi5RqHwsNJ3qo47CuUUTtE3v2BOZh"
-    "x+mH3Zk7kAAJkEAOEtixY/7rkcicc7RO2rlOR0hGgEE/M1Ao6/9QsfseyTqpjQRIwJ8ETH/Kpupc"
-    "IYDpfPYhuWM5fgQ/jQS0UxG3/WOYTVOJ5pumWjlkyAzRFyNOf9+2bTuYsPOa03bTsIcM8MDH0mjH"
-    "JiRAAllM4KijZhyL8IZJCBHVFf4rQQc1kAAJ5DwB5JmpefH43i+/fR2X80AIgARIwHsCleXHP4cb"
-    "Oju5SdSCORbO2Gtt+r4boqJRZQVaTbsSYMwN+w7ZHJ5vqmV4ou79iGuHAuows2zl+pNQaVn0FNl2"
-    "QvLUcc4lJC9rWDcaNu1K37IWbfxpc6j5OlmiqIYESIAEDAPFZIbgwX6lABZ7lQrIO38LAEMJnRMw"
-    "zb312OL5MxsM+MrT2prVuUquJQESyAYCLS237MH/9bMRi+fnnB7wnBYOV13Sg/24CwmQAAnkJIFY"
-    "7Nb1GDxn91XiGZL0RS8Mh6tPk66S+kiABPxHgMnX/jtmOasYI93/hSTsyZalxqAD83aAyJZpfo7B"
-    "dBx35uCBfV5CzKiq/gkJOqiBBEhADoFgUM6gDNywsvK1nK8GlZBArhJ4HYnX347Ha6oMY2FbrkJg"
-    "3CRAAjIJTKkYvRB9++IqlmhD/wjVgs90g9rkyaXbtKnsysuOV9Z2UO9Z9Q1Ncxy057mpxQ+vH2CZ"
-    "ZiOE9PVcTFcCHE5IXr58TaFlBB6EuwFdufRkvTK2WYY1IXrGGdlUnMETlHRKAiTgPIFk0rocVvs7"
-    "bzk1i3h+sgyJEFk5C0VqJLh3TwnEYgv3Yl9cW4tYLhk1atYgEUooggRIwBUCiUTtZiRgXwjjqLwv"
-    "fVHzMYu1iJlSpZOiPhIggdwkEIvVPYL+2RvkR6/6QOd9qNY9VL5WKiQBEvATASZf++loUetBAi0t"
-    "NS/GYrVXIiFtNBJBFmNlFjxsURNCoarJuXSIcfyekxAvdJwuQQc1kAAJyCFgTycnQQ0elLUFAgER"
-    "A1Uk8KAGEiABTwisMU3zo0i8thOvuJAACZCASAKB1v2XobTKOmHiTFQLvveee54Pu6FrannZn1BX"
-    "OuqGbadsmsq4Yenq9Z9yyp7Xdsx95l3QMMZrHV36dyEhOZnX1y58cEKXPr3ZYCmtJl00/jjJ1d+9"
-    "IUOvJEACnhMYNSqKh/lqhudCkMiGWURrBeigBJ8RCAbbb4PkVgGyB7S26ukCdFACCZCAiwSQgP1L"
-    "zJjkh9lsCjCL9f1HHVVV5CIOmiYBEiABXxOIxwdfi8Tm3/ggiFFaJ1cZxvkBH2ilRBIgAZ8QYPK1"
-    "Tw4UZX6QAEZQbUEiyMVInj0R1Yvv++Ae/lqDGG6LRKpG+Et1+moty3w6/dbOtcTI6k9FItP6OWeR"
-    "lkiABPxPQH9BQgw4P/1769aafRK0UAMJkEBuEbAHf+B1/ZAhgz7W3Dx3Y25Fz2hJgAT8RmDy5JP3"
-    "WIZZDt12tT5JS1F7XnBlY6N2pTN/y7qynyHY30oK+L1akBAfNAyzYcHKDb6vJlPfsNFOpJvw3viE"
-    "/e14QvKSho2VhjpYiU5UqKgq/5MpFWW/EyWKYkiABEjgbQIHDuy2i6sc5TUQ9Cf9L+/jvD4K/vT/"
-    "yiu32YObGiSoxwy4M8eOjeZL0EINJEAC7hFIJAb/BL9bqJgqfikJBFSjYUzLE6+UAkmABEjAEwJR"
-    "KxAwJ8L1i564T83pmZFIiQ8qdacWFPcmARLwjgCTr71jT88OEUAS9oZYrKYclUo/D5P/dcisF2YG"
-    "IAa7klJOLKZpPSUk0AKtCz8rRAtlkAAJeExg2LCrQ5Aw1mMZHe7/1vEH30mABEgggwTW4pr0dMw0"
-    "88O1a6MSKl5lMHS6IgES8CuBiytK/4ukzCqB+j+/R2/6gRu6olFlaVNNgu1mN+w7YRMP0UvyTHM5"
-    "qpkpJ+x5YWPxqvWnwe/NXvjuqU+nE5KXrmwaiwNmV76UtWjjT/3N0T+WJYpqSIAESKCDQBTP2vSs"
-    "jk9evqNYza1e+qdvfxNA0vMtiADj6LxdMCA8snPnbjuBhwsJkEBWE4ha7e35F2DmCD/MAPrZcLjQ"
-    "PkdyIQESIAES6IQACortCAT0Odi0p5PNolahr/IqFMYcJ0oUxZAACfiWAJOvfXvoKPz9BBKJmj/F"
-    "43tPxcO9q7Htzfdv98nnr+bKjzyS5lFFUe2UcVz0l2TooAoSIAGvCQSDbfb5QERyCB6W/d1rHvRP"
-    "AiSQUwTaEe1PUe36VMwu80xORc5gSYAEsoLA1Ioxi7ShlosLRusf1q/c6Mo959TysleRmDIBF6/2"
-    "OVzkogz91WWNTXY/je+W+gdfGmQqczWEF4gV73BC8vLlawq1qVHRzZA1Q5gytlmGNaG8XCXFHgsK"
-    "IwESyGkCkciubwDA8d5DUM/G43V/9l4HFfiVQEtLzXMYN/cHCfqRFDMHOkT000rgQQ0kkK0Etm+/"
-    "6Q2t289HfG/Ij1HPDIdn2YOguZAACZAACXRCYOvWuv8opaZ1sknaKoVr3kVFRTNPlCaMekiABPxH"
-    "gMnX/jtmVNwtgYVtiUTtLRidfzJ2+0u3uwrdiB/5upKS6iFC5TkpC9UT9NNOGkzXFh5Wu/IgPF09"
-    "bEcCJOApgTM99X6ocyZfH8qDn0iABNwjgNlj1Cfj8dofsNq1e5BpmQRIwH0Cwda9l8OLtIpZphEw"
-    "7kUF5YgbBKaMG/1nJKb8yA3bjtnUxk8XN274tGP2MmXoQNsiuDomU+5S9uNCQnJ7fr87oOOElLW4"
-    "28AyksYFF40/LuauG1onARIggfQJoE9fxEAj9HPPTT8KtiSBDgJJKd+jsaHQrLM6VPGdBEggewkk"
-    "EvNxH68rEaHnlfd7QHlBJDL7lB7sx11IgARIICcJxGI1K3E6r/FB8P2VMh8cNWrWIB9opUQSIAHB"
-    "BJh8LfjgUFr6BDA6/8V4fNDn0el5FX7Y96dvyZOWRZalf+yJ5ww7xai3f2TYZafuUC39xKFDZ4U7"
-    "3ciVJEACuUQAo1wNKcnXzZghYEsuwWesJEACnhDYgSr7VfbsMax27Ql/OiUBEnCYwOTJJ+9RliqH"
-    "2b0Om+6dOW0cZRrmysZGHeidoc5bT6kYfQO2PNr5Vu/X4ul5MKDVqgUrNwz1Xk3PFNQ3bKzCnt/u"
-    "2d6e7OV4QvLSVU0XoVL5ZE+i6c6p1tdXThj9WHe7cBsJkAAJeEkgEpl5Op5B4OX58kostuc+z1VQ"
-    "gO8JJBLzfo0g1kkIBAMK8IyPCwmQQC4QwMwNv8Bz/Zt8EGtfra0HiouvONIHWimRBEiABDwhEI8P"
-    "vgaO/+iJ8xSc4lqztLXVuNcwosydTIEbdyUBEjiUAE8gh/Lgp6wiELUSiZpbLcv8GMJq8lNoSP67"
-    "JByeM9JPmtPRallJEcnX0K6CQc3q1+kcRLYhgSwiEApVn4CbLFcqEqaKCYNT/pZqG+5PAiRAAikQ"
-    "aMf57nbTbBuNgR7zDGNhWwptuSsJkAAJiCYwZULZWkOpGeJEKuNzb1obf+iGLlw76qTZNgWJXy+7"
-    "Yd8Jm+jnKMkzzeXRqBbfF1nfsOGjiPlGJ+J2zYbDCcmLGjadqJXGNYG45Y+FgdHXi1NFQSRAAiTw"
-    "HgJamyKqXmMmjPm8t3vPgeGfvSGAsXNiqhV+PhSqsq/NuJAACeQAgURi6/cRph8GXo6yrLwGwzjf"
-    "lQHWOXCoGSIJkEDWE4i2W1ZwHMJ8RXqo6LP8WiSyKypdJ/WRAAnIJSD+gYdcdFTmFwKogv3c/v0F"
-    "dufMQ37RDJ35hmFd6yO9aUk1zbyn0VDEFFJIQPpWWkGwEQmQQNYQME39NSnB4Ebv71K0UAcJkEDW"
-    "Efgdqsh8OBarvbK5+fbXsi46BkQCJEACIFA5rmwJ7jSXSYOhDPWDpQ1NX3ZD18XlY3cYhlkB22IH"
-    "1KCq8ldHHrfJrnwjdql/8CVMNapWQ2CBWJGoHORkQvLy5WsKTcNqRLz9hMXcYmlrYnm5SgrTRTkk"
-    "QAIk8A6B4uLZo/HhG++s8O6PN/r0UXd7556es41AIGCiAqDxqoS4TNOe4ZYLCZBAbhC4L4liEeMR"
-    "62YfxHtmKFT8Mx/opEQSIAES8IRAS8st2/As6jw4P+CJgBSc4rn8DyKR6m+m0IS7kgAJkMA7BJh8"
-    "/Q4K/pHNBHbuvHF3PF57LmL8Hl6WP2LVF5aUVJf6Q2t6KmOxW7ej5cb0WjvdSn1l2LDL+zttlfZI"
-    "gAT8QwA3VmKmFce0dX/1DzkqJQES8AmBdaiM+g1cE/8/zA6z1ieaKZMESIAE0iYQaNt3BRo/n7YB"
-    "dxqaqC58z+JV612ZbaWyouwpJA67Ul3bKRxIwL6+ftWGzzhlz0k7qBiqjANti2HzaCftOmyrJdjW"
-    "PsHJhORkfp87lWEc77DO3pqz0Hs36aLxx8V6a4jtSYAESMBNApZlzYF9Cc/ZlmzeXLvLzVhpO7cI"
-    "bN1asw8Fa+6QELXdZ1tUVH2MBC3UQAIk4D4Bu1iEUqb9TH+f+9565wHnyatRnf/83llhaxIgARLI"
-    "XgJ4FvU0Juyz+2ilLwr9gssjkaox0oVSHwmQgDwCEjqF5FGhomwloJFscgN+3CcgQPGjq6AxmEzq"
-    "rK9+jRvTx4V84foGAgVnCdFCGSRAAhkmgJupEXApZQrL7YnE4GczjIDuSIAEspfAf5F0PT4eH3Ri"
-    "LFbzaPaGychIgARI4FACkyefvEdZqhxr9x66xeNP2jjKNMyVjY3alemJp4wrvREpxI94HGWX7jH1"
-    "VdBQRmN940uhLnfyaEN9w6ZZcG0/5Je6HExInjTphLhTAutXb7gECfuTnLLnlB1Uib+ucsJoP0w3"
-    "7lTItEMCJOBDAkVFVx2FSR0nC5CetKz2OgE6KCHLCCSTQSRf6/0CwgrgOVK1AB2UQAIkkCECsdjc"
-    "f8HV9Ay5640bdLuqJUVFM0/sjRG2JQESIIFsJhCL1dmFDhb4IMYjUJfhwaFDrxngA62USAIkIIgA"
-    "k68FHQxKyQwB/Livxkj5r8CbHypBjAuFZgzLDBmvvCgxD9NMU4upeuvV0aBfEshVAriZspMsUPBN"
-    "xILzYtQnszSI4EURJEACnRNYg2ve85F0fTKSrht4XukcEteSAAlkN4EpE8rWGtpAcqmwRRmf25ts"
-    "irqhCg9+taXaKpEo87Ib9p2xqUKGbl/hVgJ6OhrrGzZ8FOh+nk7bTLVxOiF5UcOmEw2tajOlv6d+"
-    "tKGf6GeW/rSn+3M/EiABEvCKgGkmZ6ArqY9X/t/j98GWlttees9n/kkCjhCwp4rHd/xeR4z10giu"
-    "06YWF19xZC/NsDkJkICPCKCg2j3o25zvA8n9TdN8YNSoWYN8oJUSSYAESMATAoWFySpczz3lifPU"
-    "nB6fl3dgGZpIyRlITT33JgES8IQAk689wU6nXhNIJGr/iBuhz0PHdq+1HMZ/gWkG8NA0e5d9+/L/"
-    "iOjaJUSIm/izSkqq+0rQQg0kQAIZJyBm8AUSwX+b8ejpkARIIJsI/BMVoc7BA4pTcM17P5Ous+nQ"
-    "MhYSIIF0CFSOH70S7Zam09bNNqhO/b0lq5v+nxs+Li4fuwPXlONgu80N+47Y1PoLe5Ibv+OIrV4a"
-    "qX/wJTwkV6thJr+Xplxr7nRC8u2Na/ubhtUIwf1cE52e4Za8tuTE8nKVTK85W5EACZBAZgig6nUh"
-    "Bjpdlhlv3XsxTWNu93twKwmkT0DrZA1aY/ISz5d+yWTe5Z6roAASIIGMEkgk9s6Bw79k1Gl6zspa"
-    "Ww0MVoky9yY9fmxFAiSQ5QQ2bZp/APlZ5+GyMiE/VHVOOFz9Xfk6qZAESEAKAV4ASjkS1JFxAs3N"
-    "c9egY/JLcLwj485TczgNu2ftyKqdO2/cjfCeTg2Ja3v3tyztysNv1xTTMAmQQK8JDB06Kwwjp/fa"
-    "kDMGNKb0ZPK1MyxphQRyiQAGsukH8foKkq5Pi8VqH0LwEh6O5tIxYKwkQAKCCRSafe1EjTXCJJpK"
-    "63uWNW4odkPX1PGj/4HBOD9ww7ZjNpW6fumqDV90zF4ahjSy1HVr2xI0PTqN5plq4nhCcmEyeCc6"
-    "mo7PVAA99GNhUMIFkyadEO/h/tyNBEiABDwjEAi0T4Vzz6vwopjI35uba//uGQg6znoCicT85xHk"
-    "byQEimvbK1k8R8KRoAYSyCSBhW3t7Xnl8NicSa/p+MJv8tcikd0/Sqct25AACZBALhDYurUG53Kz"
-    "HNd0cotFvHMg9PVIwP7KOx/5BwmQAAl0QyDYzTZuIoGsJ4COyX+HwzO/jB/5xxGsyOmAcLN2bCRS"
-    "dWYsVvdYth4QTDHyGOIUkfiI564XgLOdsMSFBEggRwjk5xvn4RwkZUDamldfvdkHo35z5MvBMElA"
-    "PAGFqaX14rY2Y8n27XVMVBJ/vCiQBEjAKwLl5cP3LWtYV24ZgWegYYBXOjrxO8yy1MroE098MXrG"
-    "GRhI4+xyYXnZzUtXb8S9tvqms5Yds2ZqpVbUN7704cryoz25Bl7WuHG20uocxyJy3pDjCclLGjZO"
-    "xwgtu+9D1ILE6x9NHTfa7p/jQgIkQALCCZwfQB9ytYTxrkhc2IykALt4CxcScJNATML3HQEelUxa"
-    "k/G+wM1gaZsESEAWAft5SVHR7PNM0/ojlBXIUneoGgzuvRbP9J/FM/1HDt3CTyRAAiRAAjaBeLzm"
-    "L5HILHtWg3nCiSBvQK8oKqr+aEtLzYvCtVIeCZCAxwSYfO3xAaB77wnE4/OexY3Q2Ui8Q3Kz6uO9"
-    "og8qQGduJdZmbfL127EJGQ2szw6FZgxDRYdXP3gkuIYESCAbCeD8P0VKXDjfs+q1lINBHSQglIBd"
-    "FQDnrUfR8bMwHh+E68OoJVQqZZEACZCAKAIXVhy/ccnqjdOVNlaKEmYYnx25reQ6aPq+07oURjqv"
-    "WPFyZWvgwD9he5TT9h2yV6St1pWNjfpL5eUq6ZDNHplB1fGPIfn9Zz3a2aOdnE5Irm9c9yHDMmo8"
-    "CqdLt9rQT/RXo2/ocgduIAESIAFBBCKRCAbx66OFSBqPe0O8uJBArhBQs9EPcjf7QnLleDNOEniL"
-    "QEvL3Kcw2GgmfvOkD75QyDVYjryDjyMBewOPHwmQAAmQwAcJYObW+eHwrI9iy6QPbhW1Zgi6Vh8s"
-    "Krrq9JaWW/aIUkYxJEACoghIqfIoCgrF5B4B3AD9VSmzEpGj+I+8BUk2Z40dG82Xp8wZRbHYoH/A"
-    "0uvOWOu1lXylguIqQPU6KhogARLolEBx8awPY8OpnW70ZCWTrz3BTqckIJ+AnWD9V3Tez2ptNUbG"
-    "47XfjsfrfsuHjfIPHBWSAAnIIoCquqtw179Eliqo0fp/6lducmUqy4kTR+40TTUBXtrExf22IGWo"
-    "M/ZYm67OpD4kpQ9G4vVq+BTb1/JWQnKZYwnJtzeu7W9YgUbE3DeTrHvgq0WZ+RMynXzfA13chQRI"
-    "gAQ6JYCB81d1uoErSYAEMkFgdDi8W+qsLpmInz5IIGcJoFrqQvSNLpYOAEUzBuJa4cGhQ6+RNOuW"
-    "dGzURwIkkGMEAgE1HR2i/5IeNvK0TjLNdgz840ICJEACXRNg8nXXbLglxwjEYjUNCNnxSlNOYLRv"
-    "1Hbs2P0FJ2zJtBHF9MrqMTna9EVytFAJCZCAmwSQcGEPvBGyqJ1HHnnEk0LEUAYJkIAIAvpfGFlf"
-    "hY6oEUi4/gweMtRt314bFyGNIkiABEjArwT2510B6f8WJt80TGvFohXPj3RD14XlZX9Hv8L33LDt"
-    "nE39wyUrNh7jnL3uLbWqA3dgj1Hd7+Xp1liwNVDhZEJyPyvvLkR0nKdRfdC5pbSeWFl+dOKDm7iG"
-    "BEiABOQRCIVmnwFVp8lTRkUkkDsEUHk+o4P2cocsIyUB+QQKC9vt+/mn5Ss1js/La10KncoHWimR"
-    "BEiABDJOYOvWmn0YqHIuHL+WceepOxyPSt2YfYULCZAACXROgMnXnXPh2hwlgKQWu6LQwzLDt7J6"
-    "ND9GjT0giPvYoqKqjwvSQykkQAIuECgtnVGAUbUTXTCdlkmtrYfWro22ptWYjUiABLKUgHozFovd"
-    "jo6o5iwNkGGRAAmQQMYJVFYevd9IBsrh+I2MO+/e4ZBAINiwYMEzed3vlt7WyoqyW/Hc96H0Wmek"
-    "VV8V1LdnwtOS1RvPNEyjIhO+0vRhJyRPnjy5dFua7T/QbElD02VYKebe5x2BWl87ZfyY37/zmX+Q"
-    "AAmQgHACSiVZ9Vr4MaK87CeAZ0mfjERmfSr7I2WEJEAC7yewadP8A5jJ+jysd+xe6f0+HPx8bjhc"
-    "/V0H7dEUCZAACWQVgUSidjOKD41HUEkfBHZjUdGsLC6W6YMjQIkkIJgAk68FHxxK84aAUoGLkYwn"
-    "sOKOOgdTy2ft/9nW1rxHwX2/N0f9g14xLfPUD67lGhIggWwisHev+S3Ec6SUmEzTtGdg4EICJEAC"
-    "7yXwmXA4wk769xLh3yRAAiTgAIHKicc24f5zmgOmnDbxifyBA37stFHbnsLTjKTZilme9Mtu2HfE"
-    "plZfWdLY9DlHbHVhZN6vmgqUVvd0sVnGaocTkpetXH+SMjSS74UtSv2hMDD6RmGqKIcESIAEuiRQ"
-    "VDTzRPyifrXLHbiBBEggYwQwqwurX2eMNh2RgCwCsdjcVzAIw66W6oNCNvr6UGjmWbIIUg0JkAAJ"
-    "yCEQi9U9hi7L78tR1KWSoGka9xUVXXl0l3twAwmQQM4SyNpEzpw9ogy81wRisVu3Y9SsxIewRZHI"
-    "6yf3OkChBrZvv+kNcH9ckLwJI0ZcNliQHkohARJwmACmM5I0yOK1WGzPEw6HSHMkQAJZQUD9iDNy"
-    "ZMWBZBAkQALCCFRWjGlQhlokTBbkqO8sXdX0DTd0XVw+dgceFNhVv8U+pDa1rnIj9g6b/d/Q05GA"
-    "Hur4LO7d4YTk2xvX9rdMsxFx9pUVK4oeqODE8nLlh+pGstBRDQmQgGcEAgFzDpwrzwTQMQmQwHsJ"
-    "nB2JVI157wr+TQIkkDsEYrHaJxHtd3wQsYln3/cUFVUf4wOtlEgCJEACnhBAAvZNcHy/J85TczrE"
-    "NIONo0ZF+6TWjHuTAAlkOwEmX2f7EWZ8aRGIxWpQhdlYkVZjVxsls3oqNcsSdVHVv62t4FJXDyeN"
-    "kwAJeEbgrWpFxpc8E/ABx+oBw1jY9oHVXEECJEAChhFEtdJ7hw69ZgBhkAAJkAAJOEtA7wvO0Ibx"
-    "L2et9toaCjPr+kUrnh/Za0udGLiwfMzTSD4WO6uCZRhnNza+4lqisKmNazrBImSV8wnJ/ay8uxCc"
-    "qMQkZC22G9ooryw/WuCsc0K+CpRBAiQgjkBJSXUxKu1OECeMgkggdwlgzN7BARG5S4CRk0COE4jH"
-    "a2txb7vSBxiGoKrrg5HItH4+0EqJJEACJOAFAd3Wlo+Caep5L5yn6PO01tZdd6bYhruTAAlkOQEm"
-    "X2f5AWZ4vSEQwPQWen9vLDjdFsnJWZ18nZ+//xFMFSUo+VDPLC2dUeD0caQ9EiAB7wkgkXE2VIip"
-    "VmSaydXeU6ECEiABqQRwfVSan986T6o+6iIBEiABvxKorDx6v0oGxkH/68JiGBIIBFcvWPBMnhu6"
-    "powbXYP+jofdsN1bm0obwT3WfleqX9ff0/R5JNsX91ajG+3dSEheumrDFdA60Q29vbGpDXVt5fgx"
-    "f+mNDbYlARIggUwTaG/XM+EzP9N+6Y8ESKA7Atako46qKupuD24jARLIbgJK7bsEEa6RHiX6dk/S"
-    "up/Ambekk6M+EiCBXCGwfftNb5imOgfny93SY8ag3CmhUPXl0nVSHwmQQOYIMPk6c6zpyWcE4vFb"
-    "X8ZUQPMlyUay4OmS9DitZcuWO3fiYuUPTttN354K7d0bmJR+e7YkARKQSGD48CsjOJ9KSkJ4tbl5"
-    "yJ8ksqImEiABOQTsDp1IpLpCjiIqIQESIIHsIFA58dgmrfU0gdF8PG/gET9xQxeuhXV+sk8lbG92"
-    "w37vbWpX7sNVvv5e77W5Y8HphORlK9efpJW62R216VtFnL9+eX2pPZ0sFxIgARLwDQF7FiIkAUi8"
-    "VvANQwolAXcIqD6BgJrhjm1aJQES8AOBWGzhXsMIfBNat/tA7/hweJZdFIgLCZAACZBAJwSam+du"
-    "RN00u08QE+PJXkxT14bDVZ+VrZLqSIAEMkWAydeZIk0/viQQDO6/AT/wOwWJH1FcPKNEkB4XpOhf"
-    "uGA0bZN4CD/HMKI8V6ZNkA1JQB6B9vbglVAlploRHuDdj/NMuzxSVEQCOUnAwv/JOCJ/Gq+H3n4X"
-    "AwIJ2HdEIrOHixFEISRAAiSQJQSmjh+zGhWRF0oLB9WQr17S0GQ/SHZ8mThx5E48KLCrfrc6brzX"
-    "BtWYxQ+vH9BrM+8xEI1qE8f4E+9ZJeZPpxOSbXaWaTYiwL5igoQQXGNtbbOsydGoEv8QTRI3aiEB"
-    "EvCeQDDYZideD/JeCRWQAAl0QuCyoqKrCjtZz1UkQAI5QsAupuaXZD0ckhtDodln5MihYZgkQAIk"
-    "kDKBWKzmURSNcKUYRcpiummAZ3V50NlgF3zrZjduIgESyBECTCjMkQPNMNMjYFdiVspakl5rd1ol"
-    "kwGRDwudijYQMJF8rfc7Za/3dtRxkcjus3tvhxZIgAQkEBg27PL+6Ij7/+zdCXwcdd3H8ZnZHKVF"
-    "2hRKdjelFJ8eaL0eBG/UR1EfEVCOXpwtRznbJG0BfbwW1EeuNknLWbkEQaCCiI+KogKP4sEhj0qV"
-    "o0Bsk91NW3oAPZLszjzfaSltadpms8f8Z/czr1eaZHbm///93pvO7s78/v85x4RYtsaQzXrf3/oz"
-    "3xFAIC+BV7cMmts8cK5DLb2kEyBL9f1Jff1aXxroYN2owp+r9F7j65r0c6a+n6ITJMfo/d5HdceT"
-    "UanUhkHJZGs8lWr9oL50i7PIF9RGUvsZsnh1nufexsAwQ54OwkAAgbISsDdWN6o492nDktLLlnfL"
-    "LT/85+hixHXapPEabGRfXIy282vTi1RtsI/Ir40d9x41/sUPWZ5V0ILuHXsY2G/FKEh2NjrXK5rx"
-    "A4uoOHtpIEEma3tTzz5x/Kri9ECrCCCAQLEEZuiiutdYrNZpFwEE8hYYHon0npF3KzSAAAKhFkil"
-    "Wh7UZ9uvhyCJKp2HvjsebxwVglgJEQEEEAhEIJkceonOl/0skM5z6FTXDmO9vVU/mjAhYcyEbzmE"
-    "z6YIIFBAgaoCtkVTCJSlQDbrXKvZoJqVnCGDFbx3liX0G0l1dLSsjkYb79cbqimm5KnZr7+qWB7Q"
-    "l67FsyCAQJgFqqpqz9J/5TpTctAHs791dbX92ZR4iKMYAt4p1dU9xp8kKEbmxW7TcWq99vbWtcXs"
-    "J5mctyoeb56u9wI6gW+pbsiI5ZMaGHZRMmldZkQ0BIEAAgiUicD06QdtuvGepZMirvuUUtrHoLT0"
-    "3jVy9z33LDl80qQJBZ+letrkMW233PPCx23POtagnC3PsQ5XPD8uVEwqnPtAodoqVDvFKEi+5a7n"
-    "NbjMOrFQMRasHdv66hmTxv++YO3REAIIIFAigVhssH+OmrsPlcibbhAYiIDnOU0apH4tdxYciB77"
-    "IFA+AirA/m4s1nioTuEa9dm2D+ERnmffO3p04vD29sSmPh5nFQIIIFDhAgm3pqbp5E2brCdUMzTG"
-    "ZAzF9+HVq9e0KcZzTY6T2BBAoLgCFF8X15fWy0Cgq6vlJRXd/FxFN0eZkI5mZxxnQhzFjMFxrJtV"
-    "kGhM8bVyPUyjkI9OJtv8AmwWBBAIqcDIkc17ZTLeXH0QMmlZZFIwxFIMAWe9fyeNYrRMm6UR0G3O"
-    "fhWLNfknT3Qxz4xF70u/VV/f+DCDN8x4PogCAQTKR+DMSWOW3nr3C2fpOHu3UVnZ1gfWu9XfVkwX"
-    "FTounWPwbvnxy6db3b3vU9sHFbr9gbanIpqC3rZTaTboPINZS4ELkm/64bMqNLCuNCtJfxS7/Ytp"
-    "k8ZcOW2yaZERDwIIINAvgdn92oqNEEAgQAHvoHh8zfEapG7We/gARegagQoV8DKZ3lM1AY8muzF+"
-    "IrNDu7vXfU/P0ykV+lyRNgIIILBbAX/ipXh8ztGel9Ux3ahJMvqI2z4nHm96SnfVvbGPB1mFAAIV"
-    "IGDITL4VIE2KIRdw/Q9Ahiz2wYYEUrQwksm636jx9qJ1MICGNQr5Us2cwDFzAHbsgoApAiq8Pl+F"
-    "1wUt4sgztw2DBll35NkGuyOAQAkEamuHfUXHj7+XoKv+dlHlOPZt9fVzh/R3B7ZDAAEEEOifwLTJ"
-    "Y+9Rtej1/du6pFvNveXu575UjB6nH3vQWl2c9ktje4rR/kDatD2vYSD77Wof/1agu3oskPW6fepp"
-    "k8YWrFBaBfTDHNvxC45qA8lnF53q/VNHr+ue6hf572ITViOAAALGCmj2zM8pOH9wEgsCCBguoIF7"
-    "FxoeIuEhgEAJBFauvPZ123aOV1evlqC7PLvwTo5Gm8/LsxF2RwABBMpWQHemfVank2YoQePPKWki"
-    "j4U6pht3172y/eMgMQQME6CQ0LAnhHDMFBg82P2lInvNjOg8v/jarHlbCw6TcHWB7vsFbza/Bt8b"
-    "ja47Ib8m2BsBBIIS8AsUdVwx6iS84rnHH7kblAn9IoBA/wX8W0C6rj1Ve2zs/15F33Kc42Rbit4L"
-    "HSCAAAKVKLCpulln9Z82LHXb8uxFd9zxr7pixDV9yvgnVB5rzPtlz7b3L2ietrdvQdvLr7HlTnX2"
-    "tIIWJHf3+rPrvD2/sAq7t05cZSzLnXL2ieNXFbZlWkMAAQRKI6DjdMHvOFGayOkFgUoU8N4fjc7+"
-    "j0rMnJwRQGBHgTeK9fwZpY0v1nMcr1WDvT6+Ywb8hgACCCCwVUB3pr9b19Pnbf3d3O/2IB3T799v"
-    "vyazJn8wF4zIECgrAYqvy+rpJJliCSxdurBbn9F+Xaz2c2x3SEPDzILOAJVj/yXa3LlJHWVL1Fm/"
-    "utHIum9p9uuqfm3MRgggYJSA42RmKaDCFnDknaFJd1XIOxkaQKDsBdLpliVK8r/MStQ7S6PpJ5kV"
-    "E9EggAAC4ReYPv2gTa7j+MfXdYZlM6I30v2dYsV02pSxC9X2fcVqP5d2VWle2HOWqubOpf9ibesX"
-    "JNu2O/W0497xSqH6uPmu589WW/7sbkYtqnT4r2mTD37MqKAIBgEEEOinQEPD7PfqrgkUcvbTi80Q"
-    "MEFA77GMGUhoggcxIFDJAirWe0D5/7fpBnqvUa351u4ZObK5Aq77m/5sEB8CCJgqkEx2flmx+ZNl"
-    "Gr34d92rrrYWT5iQqDE6UIJDAIGCCxT2QkbBw6NBBMwR0G3LfmJKNIpltCmxFCuOZHL+crX922K1"
-    "P8B2x8Via/1ZL1kQQCBEAsOHz9xH4c4xLORnkskFfzAsJsJBAIE9CKRSrW3axKiTPBocdi0n6Pfw"
-    "xPEwAgggMACBMyeNWaoZL/1bWxq1qKD17Fvuef59xQhq80zMtdVnqO2XitE+bWoeaM/6SiELkm+7"
-    "ben+Kuj+roG2P582eexVBsZFSAgggEC/BFw36896bcTAnX4FzEYIIOAL/Gd9ffO7oUAAAQR8gVRq"
-    "2Dc0sdqDIdCoz2ateyjWC8EzRYgIIBCQwOKs52X9OxosCyiAXLr96OrVay/PZQe2RQCB8AtQfB3+"
-    "55AMSiSQzVYZU2jjeQW+/W6JDHPtxvO87+W6Twm2/5YKnPYqQT90gQACBRKora3yZz0x6Tbjlubd"
-    "W1Sg9GgGAQRKK+D19lrT1eWq0na72972zWSs7+vuHHy22y0TDyKAAAK5C6h49B5drL029z2Luoej"
-    "e0T5Mx0XZZl+7EFrXcs7To0bdSeqoiRb4kZVwfc/06eMLeitUjM13pVKo67Eqeypu+U9rnfa5mL+"
-    "PW3J4wgggICBArHYnANVd80dhgx8bggJgT0I2JGIZ9oEHHsImYcRQKB4Agk3EnFOUvshGFzsfWT1"
-    "6jX+pB8sCCCAAAJ9CKTTC1dqSgOdr/Q29fGwaauaYrEm//WHBQEEKkSAC/QV8kSTZv4CK1demVYr"
-    "Roym0i0r6vPPyPwW0unkfcp1qWGRHpjNupzAM+xJIRwEdiUQj88+QB/EZu/q8YDWr+3t7bkloL7p"
-    "FgEE8hRYtao1pWKiM/NspqC7a/brT0eja0071hU0RxpDAAEEghJ4bR/HP74+FVT/ffZrW5MX/PyF"
-    "2j4fK8DKM6aM/6ua8b9YCifQ0+160wtZkHzbPS+Osi3v5MKFmH9LKjDP2LY79ewTx5s0UC3/xGgB"
-    "AQQqTCDbrISrKixp0kWgXARO3HI+uFzSIQ8EEMhHoKOjZbUGZRyrNtbn005p9rXPicebjDrnXJq8"
-    "6QUBBBDon0AqtcA/P3tW/7YOeivvxlhs1vuDjoL+EUCgNAIUX5fGmV7KRsB+wpBU9jckjiKHsVgz"
-    "bdktRe5kAM3bX+EE3gDY2AWBQARc/1bXgwPpehed6u4FN6xcee3ru3iY1QggEAKBZLLlJ3qPYtQd"
-    "OhzH+u9otPGwEPARIgIIIBAqgVlHju22LXuygl5nUOB1Q191P1XkeJ4vcvsV1byKkl8sdEFyNpvx"
-    "C6/NOrdre1+eNvngxyrqySVZBBAoK4FRo86tU0JnlFVSJINABQloMp9qTcQxs4JSJlUEENiDQEdH"
-    "2990J9JQFOvpGHZ1NNr8gT2kxMMIIIBAxQqkUm0/0GREpt2lsI/nwx6kU3b3xuNz9uvjQVYhgECZ"
-    "CZh1gr7McEmn/AQ0e48RxdeO41VI8bVlDRo09GadLPNnHTdpUSGne6lJARELAgjsLNDQ0PRhnaya"
-    "uPMjwa3RSb5ex7GvCS4CekYAgUIJuG6kWW09V6j28m3Hv8Co2TS/H4/PMGrASb55sT8CCCBggsC0"
-    "KWNf1AA6o2ag8mz73SbYEEP/BDzLKvzgS9s+sX+9l2Yrz7YeOG3SuPml6Y1eEEAAgeII9PYOOlct"
-    "712c1mkVAQRKIeB53tl1dRcPLUVf9IEAAuEQSCZbf6hrzQZO9rWTX61qAO7fb7+m2E6PsAIBBBBA"
-    "YLNAMrmxST/8bwg4DnRd9y7LmhgJQayEiAACeQhQfJ0HHrtWooDztAlZe55Tb0IcpYihvT2xSf0Y"
-    "V6ioAqdTY7HmQ0thQB8IIDAQgYTjutYC7alJ5sxZdPJ/cTI5f7k5EREJAggMVKCr66r1+j99ij+o"
-    "YqBtFGG/d3jeXvOK0C5NIoAAAhUvcPrUsT/SDNhXmwKh16BxpsRCHKUXuOaeJX5h4DtL3/OuevT+"
-    "5dq90zUQTHXmLAgggEA4BcaMmVmrCTeYMTecTx9RI7C9wD61td2hmOV2+6D5GQEEiiuQStVdpB4e"
-    "KW4v+beu68+x6mrrTstKVOXfGi0ggAAC5SiwqLe315qia3Mp07PTabJPx2Lxb5seJ/EhgEB+AhRf"
-    "5+fH3hUmoItI7Wak7L3NjDhKE0Uk4vi3Din8LFH5ha/jp9eqJowq7MwvJfZGoHwEotG1pyobAwdI"
-    "OGGYXaF8/hDIBIEiC6TTbU9oJtREkbvJsXn7nHi88Zgcd2JzBBBAAIF+CLy6jzVXmz3Vj02Lv4lt"
-    "NRS/E3owVWAvt8YvvjflfESv3g9NPnPShNWmehEXAggg0B+BDRuck3VojfZnW7ZBAAGzBVSM02hZ"
-    "M6rNjpLoEECgtAKJjOtWTVafYZgc55Ox2NorS+tDbwgggEB4BFatavULr/27X/eYH7V9cTTadIL5"
-    "cRIhAggMVIDi64HKsV9FCmhkkv+BzIRZfDQLR+UsHR0t/gW8Gw3M+KOa/ZoZFAx8YgipsgUaGs7f"
-    "VyfYLzdQ4ZFUquVJA+MiJAQQyEMglRp6mXZ/JI8mCr6rCqBu4vaUBWelQQQQQMCadeTYbi9rTRLF"
-    "2qA5PMveGHQM9B+ggOeODbD3HbrW+46LT5867s87rOQXBBBAIHwCtu42OTt8YRMxAgjsQmBkNLrX"
-    "1F08xmoEEKhQAd3JcIVtO19U+mH4PN2kYr1pFfpUkTYCCCCwR4FksvUxnZNq3uOGwW+gOT6tW+rr"
-    "Z70r+FCIAAEEiiFA8XUxVGmzbAVUBOx/GFsZdIIqAq+o4mvfWx+G5+ubgSPXvMspbgr6fwT9I7Cj"
-    "gOvW+LPS77/j2uB/0ycrPy4WBBAoO4GEa1mRaTp5ss6g1PbT7SlvUTymzIhpEA2hIIAAAvkJnH7S"
-    "uJfUwhn6CnRgtuN66/PLhL1DLeDYhpzT9X4yfcoYPueE+o+J4BFAwBeIx5uP0kv7O9FAAIHyEXAc"
-    "279rDedFyucpJRMECiKQTM5/WtfZZxaksSI3ovPN1zQ0NL2vyN3QPAIIIBBagXS65VodK28NQQJ7"
-    "O45zb13dxUNDECshIoBAjgKGnKjPMWo2RyBYgWXBdq/TwJ49KOgYSt2/Pgwv1xunm0rdbz/6G1Zd"
-    "bS/sx3ZsggACJRCIxRo/p6OkbhNr3PLXZLLlAeOiIiAEECiIQCo171+6nndeQRorXCOfi8WadJtd"
-    "FgQQQACBQgtMnzLuPs+2Av0c6NnOikLnlVt7gdae5xZqGW5tW/brBqTVXpMdNF2DTPljMODJIAQE"
-    "EMhPwPO8C/Nrgb0RQMA0Ac+z3q07l+pcMQsCCCCwo0Ay2eZfb75hx7VG/jbYde37Ro5sHm5kdASF"
-    "AAIIGCBQUzPsXF2fe8qAUPYUwri99ur5gWUlqNPckxSPIxAyAf5Th+wJI9zgBVT4bMKshhU387X/"
-    "zPf0WN/Stw3B/xW8NQLv+Hi86UtvXcvvCCBQWoF4fMZgfbi6trS99q83DR5JaEuKEvrHxVYIhFJA"
-    "Ayzu1H9zfRm1XNbQMPu9RkVEMAgggECZCOxt9/pFWk8El473WHB9+z0zieDO/iV8u++6a3fuv6Rr"
-    "ehzHm3zSSQeuKWmvdIYAAggUQSAabTxMzR5ehKZpEgEEAhbQGDEGVgT8HNA9AqYKpFIb/Nmvf29q"
-    "fNvi8g7KZKx7LGtiZNs6fkIAAQQQ2CrQ3p7YpIkBjtXvK7euM/W7Bv0eFY+v/Yap8REXAggMTKBq"
-    "YLuxFwKVLOCZUPxbkcXXq1a1pnQLyGtMnIlEsygsHD585m9Xr174aiX/7yB3BIIV2OtS9f/2YGPo"
-    "q3fvac2k8JO+HmEdAgiUl8CmTYPOGzSo+6PK6kBDMqt1XfcOzY5yWEdHy0ZDYiIMBBBAoCwEJk2a"
-    "0HPbPS+ekHWzTyuhUs9C5UV6nBBcJC6LpzqHJEpXkL4hknl6iFudUbl3UOd2Lzpt0vjHc8BhUwQQ"
-    "QMBYAdt2LjZjvLz3tOs6JxgLRWAI5CCgQVo3a/NP5LBLUTbVdZtPaeKcQ5LJ1r8UpQMaRQCBEAss"
-    "6o1Emqdks+6TGlwcNTkRDST5dCwW/3YqZX3F5DiJDQEEEAhKIJmcv7yhYdZUfZ56UDEEda6sX+nr"
-    "/enXVfP0lCZ0+mm/dmAjBBAwXsDog47xegRYqQImFF9Xqr1l2z2Xe1712QLYxzCEkTU1kRbFdIZh"
-    "cREOAhUhEI83fkx3JmgyMVlmvTbxWSEmBIojsGbN5et0S9tTdOH+YfVgymwkEzQ7yhWKx5/NhQUB"
-    "BBBAoIACp076t2Xf/+FzZ7q2fa+aLV3lrWU9euqpY1YUMBWa6reAyp1L+lT3Hdj5kya8fstdz/uF"
-    "//5srSVdPNv68fRJYxdMn1LSbukMAQQQKIqABqqOyWY9U+5oOL+rq+WloiRKowiUWKC+vvEqx7ED"
-    "L77203bdzbNfTy0xAd0hgEAIBDRZRafO5U5ScfNvVAxXbXbI9sWxWOOTqVSbf/6BBQEEEEDgLQKd"
-    "nQt+E402fUXX5a98y0Om/eroGuLtumvtBzo75z9vWnDEgwACuQvoPzULAgjkIuA4lgmzBpoQQy5s"
-    "Bdu2s/OaV/SGyS9yNm5RXKfrNpUTjQuMgBAoc4G6uouHqvD6dqVpSqHj9uJ/0azXjFzdXoSfEShz"
-    "gVSq5Xc6cXK5SWnqAsL5uvB5lEkxEQsCCCBQLgKnTR3/Y+WyoJT5OJbnD6phCUSglDX2u09QZeC/"
-    "2v0WRXn0Jbum+nTdztWvQmdBAAEEQi+g2S7nKAkTzid1Dh9ed0/oQUkAgTcEurrafqYf/2kCiN63"
-    "TNx//5n/ZkIsxIAAAuYJbDmXa/nvB0xf9GHUvrW+fta7TA+U+BBAAIGgBNLp1qs0mObuoPrvb7+K"
-    "cajuWvvA8OEzTZtwsr8psB0CCGwnQPH1dhj8iEB/BPRC2NOf7Yq8TcUWX/uumzZl5+vbqiIbD6h5"
-    "nci7ZsSIC42+PdWAEmMnBAwWGDSo+xqFN9rEEPWa8Q3FRWGCiU8OMSFQRIFUamNCzT9RxC5ybdrW"
-    "jFM37r9/Y32uO7I9AggggMCeBYY4vRfpHd/je96yEFvYfz918jj/FposFS7gee61IijlOapevZ84"
-    "efqxB62tcHrSRwCBMhGIRmeOUBHTaSakozEtC5csSZTymG5C2sRQ3gI6H+q1GZJiRAt3AzPkySAM"
-    "BEwUSCZbFyqu202M7S0x7e04zr3+hERvWc+vCCCAAAJvCHhe1Rn68ZkQgIyvra26WXGaM9NDCNAI"
-    "EQETBSi+NvFZISbTBfYyIMCKLr5evXrhq5rl9jIDnoe+QhhRVdVzkx7gTVJfOqxDoMACsVjTSWrS"
-    "/zJxeVwjbP1ZXlgQQKDiBBapOMk5WWmvNyj1+kjE4kSOQU8IoSCAQPkITJo0oUcFHRNVgP1KMbPS"
-    "h8yM53lnMetwMZXD0/YZUw9O6m/ijhJGPOe0SWP/WML+6AoBBBAoqoDjRM5XByac639d55MXFTVZ"
-    "GkcgAIFIxLlN3Zoyic4ZI0c2Dw+AgS4RQCAkApGIfbYGjTwdgnDH1dZ2q1A8QZ1PCJ4sQkQAgdIL"
-    "dHVdtV7H9GPVcwgmD/COj8ebLy69Ej0igEAhBXhTVkhN2qoQAXuwAYluMCCGQEPYd9+h/ijk5wMN"
-    "Yped20fGYs36kM6CAALFFIjHZx+gcQ7+scDIRYNELjIyMIJCAIGSCHR2ztf7FHt2STrrdyf2kfF4"
-    "o19gwIIAAgggUGCBUyf92zLL2zzwprfATW9rzra+evrUcX/etoKfKl0gk81cIoNSXEy6d/qUccZ+"
-    "9qr0vwPyRwCB3AXi8RmDdbcyQz4b2TcvW3bdmtyzYA8EzBbo6GjZaNvWdYZEuXc2a51jSCyEgQAC"
-    "Bgr4xyzLqvKL9UwZNLJLJR1bj45G1359lxvwAAIIIFDhAjqmL9XkFZPFkDWdQhNtfCcabfq86XES"
-    "HwII7FqA4utd2/AIArsQ8EwovtYHwMpe/Nsw6g3TXHMVvHn19bPeZW58RIZAuAUmTEjUuK57t2Yi"
-    "qDM0kx+l0y2PGhobYSGAQIkEUqkWf/ay+0vUXb+60cCQK6LR5gn92piNEEAAAQRyEph+4pgHNfv1"
-    "NO3k5rRjvzb2bmr/59ir+rUpG1WMwJknvfNfOjdS5MHf9vM9TsTpYIJPAABAAElEQVS/ZSsLAggg"
-    "UDYCrjtkmpLZz4CEstlsZoEBcRACAkURyGS8a9Rwd1Eaz7lRd+bo0YlBOe/GDgggUDECqdQ8fb7y"
-    "TlTCxhfrqQD7G/X1jUdVzJNDoggggECOAslky69U2HxpjrsFsbmjY/oP6usvOCiIzukTAQTyF6D4"
-    "On9DWqgwAc2IMcyAlI0fdVsKI71h+qn6+WUp+hpAH4Mdx7l3+PCZ+wxgX3ZBAIE9CKxZs6ZFH0Q+"
-    "vIfNAnrY2+S6GWa9DkifbhEwTcC2I2fpeJUyKC7dVtu7c8yYmbUGxUQoCCCAQNkITJ867k7L9vxZ"
-    "9XoKlZReR66aNnncWYmEXYSi7kJFSTtBCUybPPYez7aKUrinv70Oy8t87uxJ/7YuqPzoFwEEECi8"
-    "wMSIPhM1F77dAbX4kxUrFr44oD3ZCYEQCKxY0dala2p3mBGqHe3pWXuyGbEQBQIImCqQTLY9pALs"
-    "r5oa33Zx6TK0fXtDw+xx263jRwQQQACB7QTS6bpv673oA9utMvXH4Y5TdZ9/hyZTAyQuBBDYtQDF"
-    "17u24REE+hTQhacD+nyghCv1BqGjhN0Z3ZUKmpr0nBTvts75ZT+utjZym5qw82uGvRFAYHuBWKzp"
-    "JM3cet726wz7eX5X19UvGxYT4SCAQEACyeQ8DZrzTlP3XkAh7NSt3ju9Z/1657s7PcAKBBBAAIGC"
-    "CEyfPP57nmVroKD9fJ4NrrY9+0wVXl+o2Y2NeR3JMyd2L4LA9Eljm/RW47ICN73S8azPTp/6jvYC"
-    "t0tzCCCAQKAC0Wj8OH0mGhNoEG90btvuPBPiIAYEiitgz1f7RryX1bU13U01wbXx4j7htI5A6AVU"
-    "gH2F3ivcE4JEhukOsQ8wEVgInilCRACBgAQSbiZTo8F39j8CCiCXbt/neYNvzGUHtkUAATME+IBp"
-    "xvNAFKER8GfFsKJBh+s4VmfQMZjSvwqantXtQq42JZ4+4viiCkVNmUmlj/BYhUC4BEaObHyPIl5k"
-    "cNRd3d3u5QbHR2gIIBCAgD9jirotyoyUA0/HbopGZx058P3ZEwEEEEBgdwKnTxn7lw1Oz/tVZvIN"
-    "Dcddsbtt+3is17bsG3tcb/y0qWNv6uNxViGwg4BfnD99yvivaKWKsK1NOzw4kF8861HPc95/6pRx"
-    "/xzI7uyDAAIImCygc+uzDYnviWRywR8MiYUwECiaQDrdskSN/6poHeTW8Ph4fM1Rue3C1gggUIEC"
-    "Xm9vzxnK+5kQ5D5eE4F9X3EyEVgInixCRACB0gusWnXFaxr0epx6frX0vefc41TVFvnn9lgQQCBE"
-    "AhRfh+jJItTgBeLxA+KKoiroSDSKNRl0DCb1v2nToEsUT64Xs0uWgkZHXxaPN36sZB3SEQJlKjBq"
-    "1Ll12az9Y6U32NQUVfTwldWrF4bhw5uphMSFQNkK1NYO+7LeE/zdoARt3Zvyxmh05giDYiIUBBBA"
-    "oKwEzp804fXpU8d9a4i912jP8s7StdD7VYz9yi6S7Nbjj2m7mZ5jN0ybMvass08cr7snsCDQf4Hp"
-    "U8a1ZR3n3Zp5/Rf932uHLdfo7/ArQyJjP3361DHLd3iEXxBAAIEyEIjFGj+uu6l9yIRUFMdVJsRB"
-    "DAiUQkDnTP3Zr41Y9H/vQiMCIQgEEDBaYOXKa1/XudPjdT53ndGBbgnuS7oOfVEI4iREBBBAIBAB"
-    "TZD0nO6A4g+qMeJuLHtAuDIabfrkHrbhYQQQMEiA4muDngxCCYNA9mATooxEHIqvt3si1qy5fJ0+"
-    "/PozPBm56I1ctS5e3tPQMHOkkQESFAKhEEhU9fbW3qVQ325wuE8mk0P9GQZYEEAAgZ0E2tsTmzSA"
-    "5CSd28l/NsqdWh/YCr1HiVlWhNuYDYyPvRBAAIF+C0yadMDG06eMv3H6lLHHqqh6hJWNjNMImEMd"
-    "2/mU/+VlrX8b4owdosc/pu2uPn3S2JX9bpwNEXiLwJmTxizVzOtH+n9beuhWfe1xcKiuPPkzXDdt"
-    "cHpH6e/wskmT7Kx+Z0EAAQTKTkBFl3MNSao9nR56nyGxEAYCRRdIJlseMmhA+sfq62cbMQij6PB0"
-    "gAACeQl0ds5/Xtd3T1Ejbl4NlWBnvcf5Tjze/NkSdEUXCCCAQCgF0unWH+lYeUUIgq/S++a74/HZ"
-    "B4QgVkJEAAEJBD6DL88CAiETOMSMeHuZfegtT0Qy2XpLPN50koqI/IuLxi1+cZPnRX46YsR5h/uj"
-    "pY0LkIAQMFwgFlt3rUI0+cRRRh+EzrashPEn4Qx/qgkPgbIW6Opq+btuGeYPGGsxJVEdu46JxZrP"
-    "SaVarjclJuJAAAEEyllAs/75M6y8UM45kpsZAqdNHvOwInn4nnuWn7fR6/5Q1nPH2ZY9TrOr7631"
-    "azcPCPOsf1Rnsv97yinvTJkRNVEggAACxRPQZ7F3qPWjitdDLi3bC3QOKZPLHmyLQMgF9B7Y1rkQ"
-    "72YT8nAc15/9+ngTYiEGBBAwW0CDR36qouZve573DbMjtSKK8c76+gsO6+q6+mXDYyU8BBBAIBCB"
-    "dLrjq7FYg1/z9ZlAAuh/p/t7nnvv6NGJj/sTO/V/N7ZEAIEgBCi+DkKdPkMs4Lw/6DtRqEAm1dl5"
-    "za5uUxxi27xD91zXOkM+z6ilIXm3VpwG3ldVVXOPZU082rIWM4tUcYxptQwFthQq+rdpN3fRAIv5"
-    "qVTrX8yNkMgQQMAUAR0r2nSra53YsY80JSZN3tJSX9/8mF8cbk5MRIIAAggggAAChRDwZ15XO5sL"
-    "sQvRHm0ggAACYRXQuZu5OndsGxD/q5s21RhRgGqABSFUkMDgwZk7N2yIfMefqMaAtL80cuSssR0d"
-    "CxgUacCTQQgImC6gO55eEo+vO0TFzYYM4tql2L62XXV/PD7jw8nkog273IoHEEAAgYoVWJyNRJqn"
-    "ZLPeEyIw+W7b/jN0WHf32kX6fqr/CwsCCJgr4JgbGpEhYKKAF/jM1zoxRVHMLv40dKuQdvkkdvGw"
-    "Kas/H4vFrzQlGOJAwHSBeLxxsmL8jslx6riztKrKTpgcI7EhgIBRAl5VVdYfULLKnKjsQZr16fsT"
-    "JiRqzImJSBBAAAEEEEAAAQQQQACBwgjst19TTIXXJxWmtfxa0U0wvrdmzeXr8muFvREIn8DSpQu7"
-    "Vbjo393QhMXJZu3ZJgRCDAggEAaBhFtT453iXwsyPVq933mP5w32i/VYEEAAAQT6EOjoaFlt284J"
-    "esifrMD05RT/zrWmB0l8CFS6AMXXlf4XQP79FojF5hyoD1X/1u8dirShYvi/IjVdFs2m08Pmy+iP"
-    "ZidjN0ejzeeZHSPRIRC8gAqvP6b/z7cqEhNmJdoViOc49rn6oBaGD2i7yoH1CCBQYoHly69O6kS4"
-    "X4Bt0GL/+5o1675tUECEggACCCCAAAIIIIAAAggURKC62pulhmoL0lh+jWS0+4L8mmBvBMIrEIk4"
-    "fvH1ekMymDZixIVRQ2IhDAQQMFygvb11reNEdGdj61XDQ/XDO0nFeo0hiJMQEUAAgUAEksn5T9u2"
-    "fWYgnefYqQbvLtAx/fAcd2NzBBAooQDF1yXEpquwC7ifMyEDFeo8Y0Ic5saQcKuqvHPk1GtujKok"
-    "tb02FZYeY3KMxIZAkAL19c3v9jz7J/rfMijIOPbct31zMtny6z1vxxYIIIDAjgLJZOv9WnPjjmuD"
-    "/U0zUM1paJj16WCjoHcEEEAAAQQQQAABBBBAoHACI0act7dlOWcXrsWBt6TPXD9KJtuWDbwF9kQg"
-    "3AL+TIOW5d1uRhb2oOrqzLlmxEIUCCAQBoFkct6zum7lT6jhmR+vd5UmAvuE+XESIQIIIBCMgK7v"
-    "36lJ4BYG03v/e1WM1foceZd/N6f+78WWCCBQSgGKr0upTV8hF/CMKL6ORLy/hhyy6OF3dLT9TZ1c"
-    "VvSO8uugSh/QF8fjzZ/Nrxn2RqD8BEaObB6jY90vldlws7Pz0tXVmy40O0aiQwABkwVct6pJ8T1n"
-    "UIy67a5zW0PD+fsaFBOhIIAAAggggAACCCCAAAIDFqiqqlWRlFc34AYKuqPTUtDmaAyBEArovO98"
-    "he2aELoKWS6or587xIRYiAEBBMIhkE633KMJwOaFINoqTQR2bzTaNDoEsRIiAgggEIhAOj1stjp+"
-    "NJDOc+hUrzvxqirr3gkTEjU57MamCCBQIgGKr0sETTfhFlAh4F7K4AgDsljf0bHxnwbEYXwIgwdn"
-    "v6Mg/8/wQGt0cm9xLDbr/YbHSXgIlEwgFptzYDbr/VajOI0fvanbEZ27bNl1a0qGQ0cIIFB2Al1d"
-    "V63Xe4FTTLpjh38SR0Xh3ys7bBJCAAEEEEAAAQQQQACBChRIVKnwutGQxH+ngq3HDYmFMBAITKCj"
-    "Y8ELOvf7s8AC2LHj4badmbbjKn5DAAEEdi+QTA77iibY+s3utzLi0X11rvfuMWNm1hoRDUEggAAC"
-    "xgkkMplM9RSF1WlcaG8JSMfzD69Zs4bBvG9x4VcETBCg+NqEZ4EYjBdwXe9LCnIfAwL9vWUt6jUg"
-    "DuNDWLp0YbeCPFFfGwwPVn9XzoPR6Mx3Gh4n4SFQdAHNMrK/ZWX9Ga8PKHpneXfgXZ9Mtt6fdzM0"
-    "gAACFS+QTrc9oQLsS82CsI+Nx5vONCsmokEAAQQQQAABBBBAAAEEchOIxdZO1h4H5rZXcbbWIP4w"
-    "zJJZnORpFYGdBfzZr41Y9H9zjmX5AzVYEEAAgf4KJDKagXSSZdkv93ePALf7wPr1ESbaCPAJoGsE"
-    "EDBbYOXKK9OqBzteUfr1RUYvGvhzXjzeeIbRQRIcAhUoMKDia27BVIF/KRWeskbhn2ICgU4CPWJC"
-    "HGGJIZVq1Szh/okz45f9bDvyoD/jr/GREiACRRLQAIQRjpP5rZofX6QuCtis/Q/b3hiGY0sBc6Yp"
-    "BBAopkAqlfyu2tcgO3MWvf9tbWiYPc6ciIgEAQQQQAABBBBAAAEEEMhVwDPl/M0LyeTQn+YaPdsj"
-    "UK4C6XTrI7p285QZ+XkHRaNrjjUjFqJAAIGwCHR0tKzWZEITdYeNTSGI+ZRYrPmcEMRJiAgggEAg"
-    "Al1dbX826I5JuzXQtburdUw/dLcb8SACCJRUIOfi65EjmxtUHPVMQ0PT+0oaKZ0hEJDAAQdcEFfX"
-    "nw2o+x26zWbdh3dYwS97FEilWq7XRj/Z44bBb6CZfrO/i8fnHBx8KESAQGkF/OOsbVc9ol4nlLbn"
-    "gfTmbXIc+8RkcpHps+oPJDn2QQCBwAQWZ/3Bfrpt2LrAQti54yGu695hWTOqd36INQgggAACCCCA"
-    "AAIIIICA2QLxePMRKu78dxOi1AxlrZpZ1zUhFmJAwBQBnQMxafbruaa4EAcCCIRHIJVa8JRe488N"
-    "R8Rem+p7PhyOWIkSAQQQKL1AKtV2gz4/3lT6nnPt0R6kQvF7/Yntct2T7RFAoDgCORdf6wL8fymU"
-    "0a5rqUjQP3nFgkB5C2QykfOVYcSALF/r6qozZCYAAzRyCKG6unu6Nl+ewy5BbXqA52Ufq6+f/aGg"
-    "AqBfBEot4M/43ttb9ag+JLyz1H0PpD9dFLi4s3P+XweyL/sggAACuxPQrE/tnuddsLttAnjs0Fhs"
-    "8CUB9EuXCCCAAAIIIIAAAggggEBeAvp8dVFeDRRu59WeF/l+4ZqjJQTKQyCZXL9YmSwzJJsPRKPN"
-    "nzAkFsJAAIEQCeic7q227V0bgpBrXNe7z59oMQSxEiICCCAQiMCQIRm/NuzxQDrPrdNRjuPcrQG+"
-    "VbntxtYIIFAMgZyKr+PxxlEavXfGG4Hs7XnuT1WA/cViBEabCJggMGLEeXtrdJMRt+GxbVvFiYmM"
-    "CS5hi2HZsuvWyO90xR2G2UWGO477y2i06ZNhcyZeBHIV2DLTe/b3Kmgek+u+wWzv/TyZbFsYTN/0"
-    "igAClSCgkfU/UJ4/NCzXi3lfYtgzQjgIIIAAAggggAACCCCwW4GGhtnv1QaGTB7kXd/VddX63QbM"
-    "gwhUpMCiXg2SuNqU1B3HYvZrU54M4kAgZAJ1dXXNCvkx88O2o9msp2I97nRo/nNFhAggEITA0qUL"
-    "u23bOUF9rwii/1z6VO3mf8Riay/PZR+2RQCB4gjkVHyt/7xfVRi120KxB+mD8Y9UgD192zp+QqB8"
-    "BKqqav3BBsMNyeg+Q+IIZRjJZMuvdQy7MiTB76NR0r/QgJdjQhIvYSKQs4B/EUwzvWtQiTUy550D"
-    "2EEF4inXrfbf73gBdE+XCCBQQQK1tdZ5SteUmZ98eUfHwNtGjTq3roKeBlJFAAEEEEAAAQQQQACB"
-    "EAvoDq5zFL5tQAo9VVXZawyIgxAQMFJg0CD7ewrsNROC0/XuL+j27aG4O6MJXsSAAALbBJYsSfT0"
-    "9loT/etI29Ya+9NH4/HBLcZGR2AIIIBAwALJ5PzlnmdNVhhhmBhztudVTQ2YjO4RqHiBfhdf19df"
-    "cJDeMPZVZF2lD6Q3qwD7CsuaGKl4UQDKRiAenzFYNXamjHTXSdpN95cNbkCJpNNDv6bj2G8D6j7H"
-    "bv3BLfa9sVizETOv5xg8myOwW4H6+qZP6SLYI9po/91uaM6DPQplomYpWmFOSESCAALlKtDe3rpW"
-    "70FPUX5Zg3I8IJMZdINB8RAKAggggAACCCCAAAIIINCnQDw++wCdA57S54MlXqk4frh8+dXJEndL"
-    "dwiERmDLORDrZkMC1oCNiD9wgwUBBBDIWWDVqlYVXrv+bKn+9SSjFxUVnq/3KCG5I63RlASHAAJl"
-    "KpBOtz6i1C4MR3r2/HDESZQIlK9Av4uvbbvqa3ojVr0rChVgXxiLNfyMGdF2JcT6sAm47mD/JIsR"
-    "M7LqA9BDy5ZdtyZshubFm8g4jj1Rk568bF5sfUZUpeKr62KxJhU7JfQzCwLhF/DvlhGJWA8qk2Hh"
-    "ycaemUy2huCWceERJVIEENi9QCrV9r/aQoNbzVn0eW9iNNo0zZyIiAQBBBBAAAEEEEAAAQQQ2FnA"
-    "89ym3V3L2nmP4q3Ref3W4rVOywiUh4D+v/r/T4yYWVD/Z0864IAL4uUhSxYIIFBqgWRywR80sVZz"
-    "qfsdSH+mvFcaSOzsgwACCJRCIJVqbdV7w++Xoq98+uB4no8e+yJQGIF+FV+PHNk8RgeVU/vR5ed6"
-    "emof57ZM/ZBiE6MF6uvn7q+/eVNmvbZc115sNFiIguvoaFntON5xCnljiMKeEYut/dno0U0hKlYN"
-    "kS6hlkrAjsebEv7dMsL0IUCvBbemUi2LSoVEPwgggMBWgVRq2Dd0DPrz1t9N+K54rm5omD3OhFiI"
-    "AQEEEEAAAQQQQAABBBB4q8Dw4TP30eeWM966PqDfH+rsbP2/gPqmWwRCI6CZBdsV7P2GBFybyURm"
-    "GhILYSCAQAgF0umWazUJ2E0hDJ2QEUAAAQTeIqCJHc/Vqr+8ZTW/IoAAAjsI9Kv4Opv1vqG9+jXr"
-    "qk5sjXGcyB/q6xuP2qEnfkEgRAKOk/1vhbuPISH3DBrk/cSQWMoiDP+kt45VF4Qsmc92d1u/r6+/"
-    "4KCQxU24CFijRycGqfD6LhVdfzNMHIr3j3V1w84OU8zEigAC5SSQ0KxP3mnKaL1BWQ3RLHK3cUcO"
-    "g54RQkEAAQQQQAABBBBAAIE3BQYNipyj8zlD31wR4A+KoyXA7ukagVAJOI5l0O3S7XP22++it4UK"
-    "kGARQMAogdraoboGbT9lVFAEgwACCCCQs4AmdtyoiTInasfVOe/MDgggUDECeyy+jscbx0vjxFxE"
-    "/JNbGgHyQCzWOH/ChERNLvuyLQJBC9TXN31KhS6nBx3H1v5VJHx/e3vr2q2/870wAslk6816nq8v"
-    "TGsla2WC41T9Wcflz5SsRzpCIE+BeHz2AT09ax/Re4NJeTZV0t0VbzKTsY5fsiTRU9KO6QwBBBDY"
-    "TiCZbHtOJ+pnb7cq8B91fPxgLLYuVINpAkcjAAQQQAABBBBAAAEEECi6gH8tynWtxqJ31K8O7H9o"
-    "Nt8H+7UpGyGAgKUJc/6o8w1/NIRiWHV175mGxEIYCCAQQoH29sQm23b9uzCvDGH4hIwAAgggsJ1A"
-    "V1fLS7pOd5JWudut5kcEEEDgTYE9Fl97nu1fWI+8uUf/f7B1AGpevXrtH7k1df/R2DJYgfr6uUM0"
-    "cOBGRaG/XzMWjaTS7YlYiiEwfHidTsbbfyhG20Vsc4SOyw9qFuGEZU0cyLG5iKHRNAI7CsTjzZ/V"
-    "DKl/8Qv1dnzE+N+6IxHrhFWrWlPGR0qACCBQ9gKpVMsiJWnYXVC8r8RizYeXPT4JIoAAAggggAAC"
-    "CCCAQGgEXnll7YmayCRuQsC27fmzXnsmxEIMCIRIwKDZr70my5pRHSI7QkUAAcMENKnGMg0Km6Kw"
-    "dHdDFgQQQACBMAvoOp0G1tpfD3MOxI4AAsUT2G3xdTTaPEFdT86z+0Nc131Kbfm3zGZBwGgB285e"
-    "pnOiBxkU5JJ0uuVRg+Ipq1D8GW09L/MlnZR/MWSJOSpm/WYs1vCgBgzsH7LYCbciBBJONNr0Tc/z"
-    "fqF09wtZyq4ukJ3mz7YSsrgJFwEEyljA87Jn6T1q2qAUNQDMu3306KZhBsVEKAgggAACCCCAAAII"
-    "IFC5ArbO8c41JP0VNTXDfmBILISBQGgE0unOH6uo5WVDAh4Viw0O1Z0cDXEjDAQQ2E6gq6v1t7qe"
-    "+5XtVvEjAggggEBIBVSA/V1dF9P7VRYEEEBgR4HdFl87juXPer3bbXZsbpe/7a1CpltjsaY7GxrO"
-    "33eXW/EAAgEKaIbWo/V3en6AIezUtWY4ZtbrnVQKuyKdXqhbPnlfUKuvFLblkrR2hG1nnmbmyZJY"
-    "00k/BfzX+Vhszc90wSuhXQrxHqKfPRdqM3uuZiS4u1Ct0Q4CCCBQCIEt71ec6WrLpJnTDuzutniv"
-    "WognmDYQQAABBBBAAAEEEEAgL4FodNbn1YA/mVDgi4qsrm1vT2wKPBACQCB0AouzCrnNoLBNGdBh"
-    "EAmhIIBArgLpdOs8vTfgmlOucGyPAAIImCfgdXe703SZ7lnzQiMiBBAIUmCXRVEjRza+RzNWHl/g"
-    "4Ka6bvWSaLRxYoHbpTkE8hKIxeYcqL/3W9WInVdDhd35tUym+vbCNklrfQmo0PI5PfXH6rHuvh43"
-    "eZ0KXHUrTe+38XjTpdwGz+RnqjJia2iY9Wm9zj+t/0//GcaMNQBnnkat+reFZUEAAQSME3jjtmYL"
-    "DQtsqgbYnmJYTISDAAIIIIAAAggggAACFSZg286FZqTsbfK8quvMiIUoEAifQG9v9c2Keq0hkb8v"
-    "Hm/8jCGxEAYCCIRXQCUIVWfoeu7fw5sCkSOAAAII+AKrVy981bar/LqiVxFBAAEEtgrssvg6my3a"
-    "jJX1uv/bPbpI/+P99muKbQ2E7wgEJzCjWrMH36X+hwcXQ58937xq1RWv9fkIKwsuoIKm3+nYNE0N"
-    "mzSjZH/zrNKo6a/rNnh/ikabjZjhpb+Bs115CIwc2byXXtdbXNd5SBkdENKsfphM1l0U0tgJGwEE"
-    "KkSgtnboxUr1GcPSvbq+/oKDDIuJcBBAAAEEEEAAAQQQQKBCBDTZz2FK9ZNmpOvc3tV11QozYiEK"
-    "BMIn4F8T03Wa75kSue5Oa8jADlNEiAMBBAYioPcG6x3HPk77mjK4ZCBpsA8CCCCAgASSyXnPakDN"
-    "afoxjHVFPIcIIFAEgT6LrzWD6iGatfJLRehv+ya/VFNj/TMWa56hlSbNNrx9jPxc/gJ2PD54kU6g"
-    "fMisVL1NkYh9pVkxlX80yWSLX4T/1RBneohtu09qNgYVZk2MhDgPQg+RQH1987uzWe+PCrlJX2F9"
-    "PX9kyJDsdMtKuCGiJ1QEEKhAAf/W1XrfOkXndEy6hfU+jlOlW2fOqK7Ap4SUEUAAAQQQQAABBBBA"
-    "IGABxzFl1mv/4rvHHdUC/nug+/ALOI7VpoKWXkMy+Uw8PvvfDYmFMBBAIMQCHR0tS3X31UlKIRvi"
-    "NAgdAQQQQEACyWTr/fr232AggAACvkCfxdeqnbpEjxW9gEoztQ7VyagbNFvmIw0Ns9/LU4JAqQWi"
-    "0abL9Hc4rdT97rk/+wZ9COvc83ZsUWiBVKr1u2rzhkK3W7r27EEqyrosFmt4WLMRjyldv/RUeQIz"
-    "qvX6/dVIxHtKuYf5Nfz/uruzX1y6dGF35T2HZIwAAmEUSKdbluhj3H8ZFvth0ehg02IyjIhwEEAA"
-    "AQQQQAABBBBAoNACmhTg7Z7n+TNJGrB4v9C55X8aEAghIBBqAf/amP5fLzYlCc9z55gSC3EggEC4"
-    "BZLJtod0fLs03FkQPQIIIICAL5BKDfuG6h0fRAMBBBDYqfg6Gm3+gN70HVVimo+7rvuUZty+tqHh"
-    "/H1L3DfdVaiAZl1v1Oj5iwxMf2Nvr3W5gXFVTEh6o3Se3ijdGfKED89m3b/rtpvfGDNmZm3IcyF8"
-    "wwTi8VkfUZHdkwrr2xrAEtqZTvUa8HfPy3529eqFrxpGTDgIIIDAbgVSqZZWbfDQbjcq8YM6pn7N"
-    "f30ocbd0hwACCCCAAAIIIIAAAhUsoM8hzUrfiDsAOo43v4KfClJHoMAC5vx/0nFmku42OqrACdIc"
-    "AghUqEA63fYtXVd7oELTJ20EEECgjAQSbiTinKSEXiqjpEgFAQQGILBT8bVtu/6s10EsEb3RPNd1"
-    "a17wi2ItK1EVRBD0WRkCmvH6fBXXGnoy1Lt+1arWVGU8E6ZmmXBTqeSptm0bM7vCwKTsQcrhktdf"
-    "jzwTizV+bmBtsBcC2wRGj24aptfoNs9zfqeTzu/Z9kgof3qut7f6s+n0wpWhjJ6gEUCg0gW8qqrM"
-    "NCG8YhBEledFfjB8+Mx9DIqJUBBAAAEEEEAAAQQQQKBMBXTXv+G27U03IT1d2/pbZ+eC35oQCzEg"
-    "UA4CqdQC/26Lj5qQiz/5iL6aTIiFGBBAoCwEvEym5mTdhP4fZZENSSCAAAIVLKA7tqzWXcKPFcH6"
-    "CmYgdQQqXmCH4ustM5XZ/xmsilenotjWaHTtUyrwCjiWYCXovTgCKrz+pooGr1brO/z9F6e3nFt9"
-    "XR+4rsh5L3YogsDi7ODBmVPU8C+L0HhJm9Tf+xh9iH9QBdh3jBhxYbSkndNZ2Qjo7+fk7m7rOb1G"
-    "z1JSJh4/c7H+ZzbrfWLlyivTuezEtggggIBJAsuXX51UPDNMikmvEQfV1kb899ksCCCAAAIIIIAA"
-    "AggggEBRBTIZTxOsWEOK2km/G/fmaVOv35uzIQII7FFAgysMmkDJPtOfmGSPQbMBAggg0A+BVauu"
-    "eM3zMhO16Wv92JxNEEAAAQQMFujoaPubJkQ07FqdwWCEhkAZCuxQPKWZLIOa9Xon2i0zanq/iMWa"
-    "Ho3Hmz660wasQCBngYSjv6dW/W0lct61RDvoRfk7FAOWCLsf3SxdurDbtjccp03/tx+bh2AT+8Tq"
-    "6t5n4/HmL2tmmL1CEDAhGiAQjTYepmOn/g/Ytyuc/Q0IKd8QNOO19ekVK9q68m2I/RFAAIGgBVKp"
-    "1vt0fL4p6Dje0v8p+vw29S3r+BUBBBBAAAEEEEAAAQQQKJiAf25T5/kvKFiDeTSkGXGT++5bd1ce"
-    "TbArAgj0IZBM1v2PVj/fx0NBrHpbT499ThAd0ycCCJSngO7KqpmvN9/Bg8Fb5fkUkxUCCFSQQDLZ"
-    "cqeO6S0VlDKpIoDAdgJvFl/H440f0/ojtnvMlB8/rpNXv1fh10O6iH+IKUERR7gE/Nufx2JrVZxi"
-    "NZoauU4Wv6iZlnlBNuwJSiYXbXDdqiMV1mOGhTagcHQ8Hep53nc16+/zuruARuBNjAyoIXYqe4F4"
-    "fPYBeu29QYNC/qRkDy+ThF+IROxPr1rVmiqTfEgDAQQQsFw34r+/NeVi5NZn5DrdbWb01l/4jgAC"
-    "CCCAAAIIIIAAAggUUiCbtU5Te0ZMEuA49sIlSxI9hcyPthBAwBdIuLqe0WqKha6rNI0enRhkSjzE"
-    "gQAC4RdIpdruVbHe5eHPhAwQQAABBFKpuouk8AgSCCBQeQJvFl97nv1tw9M/Qh+yn9BF/Lvi8TkH"
-    "Gx4r4RkkEI02T9Dtz59USF80KKydQnFdq9GfaXmnB1gRuEBX11XrVbB5jAJ5PPBgChfASH2gvyEW"
-    "iz+hmbBNHHhTuExpKScB//aJeq293POyfiGff4ucN98r5NSQcRt7zzpO9lMdHS2dxoVGQAgggEAe"
-    "Av77FH2WO0UD+XrzaKagu/qDvRTPbQzyKigrjSGAAAIIIIAAAggggMBmgYTOVXnNhmCsdxxrkSGx"
-    "EAYCZSfgOBu+r6ReMSSx+p6etScaEgthIIBAmQikUsmvKZWHyiQd0kAAAQQqWCCR0aSOkwWwvIIR"
-    "SB2BihTYXFBVX9/0KWX/iRAIOLqIP1kFYUs0G+e9mrX10BDETIgBCkSjjafatufP2jo2wDD22LX+"
-    "rn+WTrf+bI8bskFgAirYXJ3J9HxaAfwqsCCK0rH975qx4SEdU3+puwt8tChd0GgoBPbb76K36S4Y"
-    "F3d3Wy/omKSRmXYZzeJhP+V57sc7Oxd2hOLJIEgEEEAgR4F0uuVxvZ5fmuNuxd788Fis4cvF7oT2"
-    "EUAAAQQQQAABBBBAoLIEYrF1/iQr40zIWufQbvXPG5sQCzEgUI4C/p1Jldf1puSmwe9zFIttSjzE"
-    "gQAC5SCwOOs4vVOVSXs5ZEMOCCCAQCULaLKkFXq/eIIMmHSzkv8QyL3iBDYXX2tkvmkX6vf0RPhx"
-    "H6fZDZ5QweBDDQ2z/IJIFgTeFKivn7u//jZ+bNu2Pyp+7zcfMPOHjY7jmjJTh5lChkS1cuW1rw8f"
-    "PuxoFTfdZUhIhQzjs5ql8vcqwP6NZj3+ZCEbpi2zBerqLh4aizV+rbq652V9GLhM0e5ndsQ5R/do"
-    "d3fmU+n0wpU578kOCCCAQIgENEvKdxXu700KWYUI39RdaD5gUkzEggACCCCAAAIIIIAAAqEXmGtI"
-    "Bq7j2K2GxEIYCJStQG+vdY2SM6SAxXtnfX3jF8oWm8QQQCAQgc7Oa16xbUe1L9bGQAKgUwQQQACB"
-    "ggn4kyVpgtDzC9YgDSGAgPECjgquPqcowzzb6RGu6/xahbZ/1kzYx1qWf8s5lkoWUOHoCY6TeUYG"
-    "XwqDg154L+roWPBCGGIlRstasiTRk07XnaQi1avL0UMF2J9SodTDOqb+r2ZB/kw55khOWwRGjTq3"
-    "TsX2iUGDel7WZB3f0tp9y81Gf88/jUTsz69evfDVcsuNfBBAAIGdBRZnddw7ReuNOeYpnmoNmL1j"
-    "xIjzTB8MuTMnaxBAAAEEEEAAAQQQQMA4gS137vM+YkhgD2jW66WGxEIYCJStwKpVrSlds/ihKQlq"
-    "0IUpA0BMISEOBBAogEAyOf9pNXN2AZqiCQQQQACBgAWSybabFMINAYdB9wggUCIBRx9YEyXqq9jd"
-    "aEY17z7dcm6pim/n+kVlxe6Q9s0SGDly1lgNJviZ/qYXK7IRZkXXdzSK9Wd64fVH7bOESiDhasTa"
-    "TM2A/c1QhZ1bsIerwPxXKsL27zBw0oQJiZrcdmdrUwXq65vfrue0pbe3tl1Fcfob9sr09dL+QTo9"
-    "7DhdBGOmAFP/GIkLAQQKLpBOt7bruG7UiHq93x0TiVQvKHiyNIgAAggggAACCCCAAAIVJ6BzWQYV"
-    "PdrzK+4JIGEEAhLIZjf/f/MC6v6t3X6Cu3y9lYTfEUCgEAKpVOvtmiyJ86iFwKQNBBBAIGCBIUOy"
-    "jZqI808Bh0H3CCBQAgFHJ6tuVT9uCfoqURfeQbrAf6WKyjpUXHaDiszeXaKO6SYgAX8mPZ3ouCyb"
-    "dTTbtX1kQGEMpNuubLbqdO1oygmjgeRQ0fuk022X6m/uXCFkyxjiUOX2gzVr1rZrcMPXotGZoRjY"
-    "UMbPx4BT08CkT+p18ceO4/kz7Tfpa58BN2b8jvaCVGroabobRsb4UAkQAQQQKLBAKtX2Aw0Qu6vA"
-    "zebVnG3b06PRxol5NcLOCCCAAAIIIIAAAgggUNECukvfeAEcYwjCE6lUy+8MiYUwECh7ga6ulr8r"
-    "yV+bkqjjmDQQxBQV4kAAgUIIpFLr/YFmvMcoBCZtIIAAAgEKLF26sNtxnBNUDpYOMAy6RgCBEgg4"
-    "ujivqe49FShZ5VagNFg5zVCR2d9UbPawigaPZ+bWEvxFlbAL//lU0fV5kUjNcxoxdLG6DtPMvKqJ"
-    "saZ3dV21ooRkdFUEAZ1kv17H0C+o6bVFaN6YJvX3GlOh+bds21mmIt6bdIvPQ4wJjkB2KRCPzxgc"
-    "jzdP1+vg0xqY9LA2/JK+nF3uEP4Hsspzlv5fNqrwuowGloX/iSEDBBAorcCgQZsHhy0rba+7703v"
-    "IW6Ix2cfsPuteBQBBBBAAAEEEEAAAQQQ6FtAd+mbrUeMOK+lAabMet3308RaBIooYM7/O13gO86/"
-    "w2QRk6VpBBCoWIFFvdms509i0VmxBCSOAAIIlImA7tCtY7kzSfULvWWSEmkggEAfAptPVPmzo6l4"
-    "cIoe7+ljm3JY9UkVDf5o9eq1KX82bBVif1xFWUacpCsH3FLn4Bdd6zk8W8/nCyq6vkYvVPFSx1CA"
-    "/lp0W/hfFKAdmjBAQMfQX+pv8UMKxZ9RuMwXe5D+z52uYuyndDx9RoW9X6aQyrSnPOFEo7P/QwXy"
-    "t3je4LROBN+sCN9nWpRFiOdVvdYflUy2LixC2zSJAAIIhEqgvb11rQoTTlXQBg1E8eo8z72Nz2Gh"
-    "+lMiWAQQQAABBBBAAAEEjBDYf//Gel3D8j/jmLD8K5kc+iMTAiEGBCpJQBNu/FL5LjEk50gk4vkD"
-    "QlgQQACBggusWNHW5br+bKlWd8Ebp0EEEEAAgZIKvHHHpDkl7ZTOEECgpAJvFiCrePBeXQw/Vr1v"
-    "LGkEpe1suLqboeKsR2OxtS9r1uTLNDL53aUNgd4GKjBixHl7a8bd81V0/ZyeQ802bI0aaFvB7uf9"
-    "PJXqvCjYGOi90ALJZNtz1dXdH1S7xtz6rtA59tHeBBX2flevHe3+HQZ0688z6uouHtrHdqwqgUA8"
-    "PudgDUz5jv/6Ztvub1UgP03dvq0EXRvQhf2yigw/og8vDxoQDCEggAACRgik0y2PqjjhCiOC2RbE"
-    "J+PxNRdu+5WfEEAAAQQQQAABBBBAAIE9C0QizgW6JjBoz1sWfwudg9LA/0S53Um2+HD0gED+Ap4m"
-    "wWnJv5nCtODf3Vbn5PcrTGu0ggACCOwo0NU1/0967zNrx7X8hgACCCAQRoE3Jo+7PYyxEzMCCOxZ"
-    "4M3ia3/TdHrBz3Xi6PP6cfWedw39FqP0If1ix/H+ptlB/xaNNn5Ds7f+e+izKsMEYrE5B+o5urKq"
-    "qma5Zty9WimODnGaz3R3u1Mta3E2xDkQ+i4Eli27bk0qNezzOo76f6eVtPivJZ9U3jcOGtTdpQLg"
-    "X8RizeeMHNncUEkIAeRqx2Kz3q/j46UamPJXz8v+Uydi/ktxhHRgyoAFH/O8zAdVZGjKrCcDToQd"
-    "EUAAgUILDB9e9029NjxV6HbzaU/vFy71X7/yaYN9EUAAAQQQQAABBBBAoHIE6uvnDtHA0vMMyfjV"
-    "np7M9wyJhTAQqDiBmpq6O5R0lyGJD3bdjCnHJkNICAMBBAopoAmHFqm9GwvZJm0hgAACCAQjEInY"
-    "Z+tz7dPB9E6vCCBQTIEdiq/9jvwZ0iIR90P6T/9sMTs2qW2NTn63bduXaPbWv2j21n9p9tZr4vHm"
-    "z44ZM7PWpDgrK5YZ1fX1jUfp+VhsWdmleo7mKv9hITdYoTyOXr164ashz4PwdyuQyOg4OlPH0HO0"
-    "Wc9uNy3PB3XctP9T+V+XzXrL9X/4CRVjf62hYfZ7yzPdUmc1o1qvT0fozg0LZdtuWc6TOq58XQNT"
-    "3lPqSAzp77YhQ7KfTqcXrjQkHsJAAAEEjBJYsiTRo7shnKSgNhgUWI1ev+7YUkBhUFSEggACCCCA"
-    "AAIIIIAAAkYKRCKZ0xWYf1dTAxbvJs7vG/A0EELFCrS3JzbpbpzXmgKga8vnaxKavUyJhzgQQKD8"
-    "BHQNTHf/sB4vv8zICAEEEKgsgY6Olo2anOg4Zf1KZWVOtgiUv0BVXyl2dCx4YfTopg93d1t36fHP"
-    "9bVNGa8bpQOeRip7561fH3lNRW4Puq73c82Q/dtksm1ZGedtQGoJJxZb8zEVbp6oYE7Q174GBFWo"
-    "ELpVHHlcKtXaXqgGacdsgVSq7QbNqP8X23bu1vHkILOjLVp0tlo+VP+nD3Vd91uaoTmlE6MP64Tk"
-    "w5lM9uEVKxa+WLSey6bhhBOPr32f69r/oeK5T8nycBm+TceTCl+8TQJo8v+fVTgE6SOAAAJ7FNBn"
-    "mOc0EGq2XkOu3+PGpdtgvONk/VsFzyhdl/SEAAIIIIAAAggggAAC4RNIVHneumadXzUh9IxlVbWZ"
-    "EAgxIFDZAu51lhX5sgxMKHreP5u1TlMsJp1zqew/D7JHoMwEli5d2N3QMPN41434dzfcv8zSIx0E"
-    "EECgogTS6dZ2TQY7VTWJv1DikYpKnmQRKGOBPouv/Xzb21vXWtbEL8RiDfP0a2MZG+wutbepyG2i"
-    "itwm6uBnaZbRl1S08LBO9D1cVZV5ePnyq5O725nH9iyw334Xva26uvcImWqm3LVHynfknvcK1xb6"
-    "++lVxFOSydbHwhU50eYrkE63PaGBLId0d3s362/72HzbC/v+mqE5JocT9f3ESCTiH1OXKye/GPsR"
-    "17UeT6c7nrWsxdmw55lP/BMmJGpeeWXNex3H+qBed/5Dx8VPymu4bfsXmCq+4nozrY6pKtq3J+mY"
-    "+pd8rNkXAQQQqCSBLYPCmo7UMfQYc/L2zorFmn+h22f+2JyYiAQBBBBAAAEEEEAAAQRMEojH1xyv"
-    "c2QHmRCTztHdm07P+5cJsRADApUs4N8FUdcWbpeBIQO6PQ14TyzSl1vJzwu5I4BA8QQ6Oxd2RKNN"
-    "k3Vu9yH1ssv6nuJFQMsIIIAAAoUS0IRJD6kA+6v6nHtZodqkHQQQCFZgD2/OFmdTKatJM6UtUaHT"
-    "QoVaG2y4gff+dhUJ68s6I5Op8gsHn9PPj+ik25/k8wSFg3t+fvzCwlWrXj0kEnE/vqXguudj8qve"
-    "856h3SKjAv6pKni5P7QZEHheAlsGsljHq7holv7mr1BjNXk1WF47H6B0TtX/kVN1wkDH1IbXNZnx"
-    "03J6UjOG68t+srNz/gvaxoipbQpPPzFSXx97hwrRD7Ms91C9wT5s9eq171XeNTousvQtcN/GjbWn"
-    "r1lz+bq+H2YtAggggMCuBbJnWpbzN31uie56m1I/4n3vgAMu+DODWkvtTn8IIIAAAggggAACCIRD"
-    "QOfL5poTqT3fnFiIBIHKFrDtSIvnZc+SggkzloyNxdZ+SdfT76vsZ4XsEUCgmAKaLfUR1aZcqD78"
-    "uwmyIIAAAgiEWEAF2FfomK47yFsnhDgNQkcAgTcE9lB8vWUrFY5+r6Gh6QnX9X6oz7EHo/emwHj9"
-    "NF5Fg2f7tYHbCgetJ7TuScexn+joaFn65tYV+MN++zXFamqsD+rv5iMqsPzw6tVrDpXLoC2FhSac"
-    "Eynqk5LVbLUn64Xz3qL2QuNhEPA0q2NbNNr4BxUV363jxUFhCDqAGPdWn4freHG4jheW/6U3neu1"
-    "zh/o8px+18zYzrORiPe8CpSf0/F1YwAx5txlff3cIZFIZvPrhXZ+h/86qtdT/7XDX1fr56l1Obdb"
-    "STvIqldMF6VSrf6tXSlNr6Qnn1wRQKBgAltmhmqersPoz9WoKS88+2pQ6/c1O9TnmCGqYE81DSGA"
-    "AAIIIIAAAgggUBYC0ejs//AnLDAkmd+n0y2PGxILYSBQ8QLJ5Lxn4/Hmn+nc+lEmYOjctT9QhOJr"
-    "E54MYkCgjAV0jaxVkyZqQif7xDJOk9QQQACBShDwentrTq+u7n2nrtnpiwUBBMIs0K/iaz/Bzs7W"
-    "/1MB2aG2nVmgIqjTw5x0EWN/o3DQUuGgZWWzmwsHX1V/z8rsn3oj/KzWP2fb7j+SyY0vWdai3iLG"
-    "UtKm6+ouHlpT0/sOx8m+W8WR71LR8buU63sUxH6+xbZaOVPqPIrOk1UPp6nwWoW2LAhsEUin254Y"
-    "PbrpkJ4ee5FOCk7EpV8CQ7TVIf6XCq71zbPczTfv89x4vKlLx5flWpnU8XWZjjudctXPzr+0frXe"
-    "rK7JZnvWJpOLNmibgi/x+IzBkUjNsN7e6jod1/dVB6NUXD9ShdVx/XygwtV3b6RlZaJbjoNbQ/Cs"
-    "zals/ZXvexJ4KZt1Turqmq+7TLAggAACCOQjoMFgD+oWlVfrdWhmPu0UeN8jotF1zem0Na/A7dIc"
-    "AggggAACCCCAAAIIhFjAtrMqZjTlegKzXof4T4nQy1TAde35uiZgRPG1zrN8WLeP/5iuCf6+TLlJ"
-    "CwEEDBGw7Y1ned7gCQrnvYaERBgIIIAAAgMQWLXqitcaGmYfq/qWx1VLMnQATbALAggYItDv4ms/"
-    "3q6uq/wZSM/QB8hf6aTXDRwA+vUs7qOtPiCrD2wtQNat8qx4fLBm8Wx8UcWEL+oxFQxaHX7xYCSS"
-    "7fC86k7Hcf9lyqyuo0cnBvX0vDpCB/1613WjkYg1WjmN9jxn83flpe/dfuGhli3FkcqnkpcePa/T"
-    "k8mWOysZgdz7Fmhvb12rRybpODpZx4Jr9PMb/3f63p61uxRwdJyJ6VH/S4s/U7b/fcsxyC9u1kya"
-    "+r3Knz27Wz/I3Vuj9Wvl/vrmLW17k75vnj3b81wNhtmyXtvtrSLqan8b/TxY7db6P+lE7t7at04/"
-    "DtNXndbXZDKb1/uP6ktba6Xf97Zlh1+2rean/gj4z+iiTKZn7sqV125+zvqzE9sggAACCOxeoKrK"
-    "vliDRD+lrfyT9EYseo39Tjw++7fJ5PynjQiIIBBAAAEEEEAAAQQQQCBQgfr6We/S+bbPBxrEG53r"
-    "XN+LyWTHAybEQgwIILBNIJ2e/7BmgNV5BPvft60N7iddO/Bnv6b4OringJ4RqAgBf8Kp+vrm4xzH"
-    "e0IJD6+IpEkSAQQQKFOBzs75z+tuLqeoyuR+peiUaZqkhUDZC+RUfL1Vw5/Nt77+gsdtu+oOnXj6"
-    "8Nb1fO+/gOrzVNhnH6zvB/t7bSnW82d09Y+nWc2arYrCWJOKBK1VemyNVr5RNOj/7BcQ2mv0Qd4v"
-    "4tS+7jrNBLt5LljHcdZp1eafta7Xcfx+tiyajVUFhN7grb+ruNAvIhyiYkHN2G0PUdHD5t+1zp/B"
-    "ez99jdBXrLt77dv0ffPiOPYbBY7+r5VdYb1FZMd/9Vyt0/NxfGfngt/s+Ai/IbCjgH8cHTHiwkcj"
-    "kd4b9HdzzI6P8luBBfzi6Xod5+p1TH1z8Qulty3bF0n7x7ntH9uylY652zbnp2ILdOr5OtOfobXY"
-    "HdE+AgggUGkC/gBPjaY/SYMq/6zcNw8wMsCgVgOh7tBdJQ4t1h0rDMiREBBAAAEEEEAAAQQQQKCf"
-    "ApGIM1en5ww5Gee1WtZi/06XLAggYJ7AfIV0uyFhHR2Pzzk4mZz3rCHxEAYCCJSpQFdXy0uxWPNJ"
-    "qtX4mVKkWK9Mn2fSQgCByhDQpJ4/VQH2t1Wf8o3KyJgsESg/gQEVX/sMXV1Xv2xZiY/FYuvO1Bu7"
-    "q7TqzQLd8mMKLKNhKsr0Z1jdvGyrBdxaAL2lONAvCNR2b2yzrWDQX7dtH79I299k+/OVW7bdsn7b"
-    "flta4t9cBWSdVLH7F1R4/X+57sv2lSmwcuWVaWX+xWi0caIGVFyvnxmhXJl/CmS9nYD+Lyy27Z5z"
-    "OzuveWW71fyIAAIIIFBAAY2m/2s02vxVDb70P8eZsrzDsva6UsGcb0pAxIEAAggggAACCCCAAAKl"
-    "Fxg5srlBd+uZWvqe++rRXtPb23NrX4+wDgEEghdIpTbeHYsN/m9FckDw0Vi6W6c7W3HMMCAWQkAA"
-    "gTIX8CcvUgH211UN8p0yT5X0EEAAgbIXSCaHXhKPrztEBdhHlX2yJIhAGQrkORIu4eqN3SLLirxb"
-    "Nr8oQx9SQqBfAiq8/ptu4f6Bzs5WCq/7JcZG2wuk022LHSf7Xn1AZpbf7WH4udIEVulYOlGjOydR"
-    "eF1pTz35IoBAEALp9NAW9fvrIPreVZ8aVHquRvgfvavHWY8AAggggAACCCCAAALlL5DJeLOUZY0Z"
-    "mbo3rFx57etmxEIUCCCws8CiXg0sv2bn9UGtcU/RHU+jQfVOvwggUFkCqtP5rq4t/7iysiZbBBBA"
-    "oBwFEm5NjXeKaiWWlmN25IRAuQvkWXy9hSeVmvevVKr1SP12sr5Wljsa+SGwo4D3856e7OG6hXvn"
-    "juv5DYH+C3R2LuxIpdo+r1l/T9Js9Kn+78mWCIReQIM4rZttO/KOdLr1R6HPhgQQQACB0Agk3EjE"
-    "nqZwTbrTgK0XhZu4UBmaPyICRQABBBBAAAEEEECgoALDh8/cR3eXPLugjQ68sZ5IxLl64LuzJwII"
-    "lEKgqqpHk4RZhgySsAdVVfVeUIq86QMBBBCQgNfd7U7Tt2fRQAABBBAIt0B7e+ta3UXlWGWxPtyZ"
-    "ED0ClSdQkOLrrWwqwL5DxVPvVOHg97XO27qe7wiUqUBGef2XCmaPWr164atlmiNplVhAs/7euXFj"
-    "7Tssy16grrMl7p7uECipgN4v/F1fh6vo+oxkct6qknZOZwgggAAC1pbBg54phQ1bn5ERulB5q36x"
-    "t67gOwIIIIAAAggggAACCFSGQE1N1VkapD/UkGzvZsIVQ54JwkBgNwLLll23RseNW3azSakfOnfE"
-    "iPP2LnWn9IcAApUp4Nco2HaVX6xHrUJl/gmQNQIIlJFAV9eCZ3SH2NOVEvWWZfS8kkr5CxS0+Nrn"
-    "8ounksnWaZblHqZf/9dfx4JAGQqs0AzFn9eAA93Ohxe+Mnx+A01pzZrL1+lWUY2O47xfdUd/CDQY"
-    "OkegOAIbVHR9SV3dsEP1nuGx4nRBqwgggAAC/RHQQMJ7/TsQ9GfbEm7zuVis2b/VOAsCCCCAAAII"
-    "IIAAAghUjMCMatv2jPkcYNtOS8XQkygCIRfwvIz//9WUyWyGV1dX+0UzLAgggEBJBFSf86zeQ52i"
-    "zijWK4k4nSCAAALFE0inW+5RHcW84vVAywggUGiBghdfbw0wlVrwlApTP6EC1WN0YHhx63q+I1AG"
-    "Ao/09lrv0wzFvy6DXEjBYIHOzvl/VRH2xzzPO01hrjQ4VEJDoN8Cel/wPzoJ9A4VXSeWLEn09HtH"
-    "NkQAAQQQKJqA51X5BQ7PF62DATXsXd7QMPu9A9qVnRBAAAEEEEAAAQQQQCB0AtHoXlMV9CgTAtds"
-    "Y79JJuc/bUIsxIAAAnsW6Oq6+mVt9ZM9b1maLXQMabasRFVpeqMXBBBAwJ8gse0BOfw3FggggAAC"
-    "4RdIJju/rCx+Gf5MyACByhAoWvH1Vj4VqP508ODsBBUPXqQi7HVb1/MdgRAKqEjQ+3oq1XnEqlWt"
-    "qRDGT8jhFPDS6bbbIhH7YIU/X1/d4UyDqBHwnnYc9wi9LzhaJ4GW4YEAAgggYI5AV9dV613XO1UR"
-    "ZcyJyqp1XfcHo0cnBhkUE6EggAACCCCAAAIIIIBAcQRs3QFwTnGaHkirHrNeD4SNfRAIUEDXoP3r"
-    "J6Yso+PxdSeYEgxxIIBAZQikUsO+oVqGBysjW7JEAAEEyllgcda2Iycrw3+Vc5bkhkC5CBS9+NqH"
-    "Wrp0YbeKB6903exY/dqqr43+ehYEQiTwpOvah+q27N+2rMWm3LosRHyEmq9AR0fLat1NYI7nWX4R"
-    "9h36cvNtk/0RKJGAPhR4p6RSdYd2di74TYn6pBsEEEAAgRwFurra/qz3GZfmuFuxN3/Xpk1rryh2"
-    "J7SPAAIIIIAAAggggAACwQrEYo2fVeHke4KNYmvv3rPpdOvPt/7GdwQQCIeA7rT4mI4jfzYlWk1K"
-    "dqEpsRAHAghUikDCjUSck5TtS5WSMXkigAAC5SqQTM5bpZKg41VnsalccyQvBMpFoCTF11ux0umF"
-    "K1U82Ox52QN1y6XLtX7D1sf4rZtfDwAAQABJREFUjoCZAt4mnay5JJXa8JGurpa/mxkjUVWSgE78"
-    "t+s4erKOoe+xbft/Kil3cg2bgL3Gtr0v19YOO1gDV36g2ywyYCBsTyHxIoBAxQmk08O+o6QfNSlx"
-    "vRe/oL6+8SiTYiIWBBBAAAEEEEAAAQQQKKyAznNeVNgW82rNnz3Xy6sFdkYAgUAENImSSbNfH1Jf"
-    "3/SpQCDoFAEEKlbAn8wrEvGOFcD6ikUgcQQQQKBMBFKpBU8plbPKJB3SQKBsBUpafL1V0S/CTqdb"
-    "vpzNem/XOv+DMEXYW3H4boyAZv77o251eIhGyycsa1GvMYERCAIS0DF0STLZcrSuA/ynfv0rKAgY"
-    "JNCtWOZHItaYZLLt8vb2BKMxDXpyCAUBBBDYvUDCdd3MdG3z6u63K+mjtuPYN9bXz92/pL3SGQII"
-    "IIAAAggggAACCJREIB5vOkTn4k0pUFypGSM1iQALAgiEUSCdHnqf4m43JXbHYfZrU54L4kCgkgQ6"
-    "Otr+pgktKNarpCedXBFAoGwF/EnuNOHdtWWbIIkhUAYCgRRfb3VbsaKtSzO4ztmuCJsReFtx+B6k"
-    "wAoVXZ+dTncerr/PfwYZCH0jsCcBvdn6ZSo17BBtp1uOWH/Z0/Y8jkARBTbq2LnAcbJj/Nd2f3R9"
-    "EfuiaQQQQACBIgl0dV39spq+oEjND7TZ+kgkc7N2tgfaAPshgAACCCCAAAIIIICAmQIqvJ5rSmSa"
-    "gfs6ndPSOS4WBBAIp0Ai45+jNid2+3P19c3vNiceIkEAgUoR0ORyP9QEXi2Vki95IoAAAuUsUFdX"
-    "16z8HivnHMkNgTALBFp8vRVuaxF2d3c2rg/FTVq/bOtjfEegVAIaAarZre0FmzbVjkulWhZZ1uJs"
-    "qfqmHwTyE0i4Kna9T1/v1wWCz2yZtT2/FtkbgRwENHDKXlBVlVHRdUtjZ+fCjhz2ZVMEEEAAAQMF"
-    "9J7idoWlE/TmLHp/84VotOk8cyIiEgQQQAABBBBAAAEEEMhXQO/xR6uNifm2U6D9u3t7q64rUFs0"
-    "gwACAQn09lbfqOt96wLq/q3d6m5enjEDTN4aHL8jgEB5C6RSdRdpttSHyztLskMAAQTKX2DJkkSP"
-    "JrX1J2PsLP9syRCB8AkYUXy9lW316oWvqnCrTbO4HqQCwmNUzPWHrY/xHYEiC/zadbPv8wsH16y5"
-    "3JSTMkVOmebLUSCZbPl1Ot36EX2YPlzH0f8pxxzJyRiB1/yi60ymenPR9fLlVyeNiYxAEEAAAQTy"
-    "FqittfxC53/l3VABG9D7m6tGjmx8TwGbpCkEEEAAAQQQQAABBBAIUEDnL/0ZvKoCDGH7rm9fufLK"
-    "9PYr+BkBBMInsGrVFTpv7d1oSuQqBJ8ajzeOMiUe4kAAgUoSSGRsO+MPcmuvpKzJFQEEEChHAX9S"
-    "W9d1TlBuPeWYHzkhEGYBo4qvt0EmXBUQ/lSFsB+1bfejWv8jfTEL8TYgfiqYgP2UTvB+RrP7fSad"
-    "XviPgjVLQwgELJBMtv1ex9Gj/SJszRT5gMJxAw6J7stEQCeLUzp5/XUV5Y3yB6xwUapMnljSQAAB"
-    "BN4i0N7eulbvIaZptUHvIexBmYx9+5gxM2vfEi6/IoAAAggggAACCCCAQMgERo06t07nmE43JGzP"
-    "8+xWQ2IhDAQQyF9ggZrI5N9M/i3o3Eq1JjGZmX9LtIAAAgjkLtDZec0reo8zWXt25743eyCAAAII"
-    "mCTQ1TX/Tzqm+wOYWRBAwCABQ4uvtwklkwv+oMLYiSogfLsKvi7RI8u2PcpPCAxUYHPR9TEqHDzM"
-    "nyl4oK2wHwKmC/hF2JoJ+4uua49VrPP1tdb0mInPTAG9Bv9Zg1VOqqsbNjqVavu2X5RnZqREhQAC"
-    "CCBQKAG9h3hEJ3KuLFR7hWhHr0fvWb/e+W4h2qINBBBAAAEEEEAAAQQQCE6gt3fQuep97+Ai2L5n"
-    "75fpdMuS7dfwMwIIhFdA10WWaUSFP7GXEYsKsGfU1V081IhgCAIBBCpOQO9xHletzfkVlzgJI4AA"
-    "AmUooGP6tbpOdmsZpkZKCIRWwPji662y/gflZLI1kUoNO8ifqVjrb9fXxq2P8x2B/gjoBMffdMJl"
-    "0htF1z/VPl5/9mMbBMIu0NXV8pIGssyprR0W0/+B05TPM2HPifhLItCj19zFegP/Mb0Gf0iDVe5c"
-    "siTBrWxKQk8nCCCAgBkC6fT6ryuSx82IZmsUdlM0OuvIrb/xHQEEEEAAAQQQQAABBMIl4N/NRkVA"
-    "F5gStW0780yJhTgQQKAwAjrGXFWYlgrSyj61tZtmFKQlGkEAAQQGIKBam5u02w0D2JVdEEAAAQQM"
-    "E6ipGeYPZH7CsLAIB4GKFQhN8fW2Zyjh+jMVq4jwVNetGq2Z2ObqsX9ue5yfEOhTQCM67WM0e9/7"
-    "0um2xdqCous+mVhZ7gLt7YlN+j9wm46h79HJx89qQII/CMGI2++Vu33I8uvUMfPS3l5rtF5zJ6nw"
-    "+rGQxU+4CCCAAAIFE1jUa9sRf+DWhoI1mX9DtuM4N0ajM0fk3xQtIIAAAggggAACCCCAQKkFNmyI"
-    "nKLzkrFS99tXf/6ELTr/9Zu+HmMdAgiEVyCVWvCUov+dKRnofHvjhAmJGlPiIQ4EEKg8geHDh83S"
-    "teE/VV7mZIwAAgiUl4Bf86Pj+QnKamV5ZUY2CIRTIITF19ugu7quWqEp9eepiPCdjmN9RAcXf3aC"
-    "9m1b8FOFC2zQidObLcs+TH8jH9QJVGa6rvA/CNLfQcDTKOeHNCDhGM/LxvV/RTPN2H/QFgxM2IGp"
-    "on551b9FjeO4R+guE6N0zPzmqlWtqYoSIFkEEEAAgT4Fksl5z+p9wpw+Hwxo5ZZCjciNAXVPtwgg"
-    "gAACCCCAAAIIIDBggYSjO/OZ9PmiRalwTnTAzyc7ImCugM53zzcouoZXXlk31aB4CAUBBCpMwL+z"
-    "rSa0ULGel66w1EkXAQQQKDsB1fosc11rihJjosWye3ZJKGwCoS6+3h67s7P1jzq4zFWR7UGaDftd"
-    "+kB9iR5nRuztkSrn5xdUiP9lx+kdpcLSM1KplicrJ3UyRSB3gXR64Ur9X7lG/1c+qltsHqjiqiZ9"
-    "8H4695bYI4QCWcX8a13wOk13k4hrhuvpnZ0LNNNPwg1hLoSMAAIIIFBEAb1PuF4Fzw8UsYucm9Zn"
-    "vmNiscazc96RHRBAAAEEEEAAAQQQQCAwgXh83dE6/3hwYAHs2HHXoEHD7tpxFb8hgEC5CCSTw3Qe"
-    "w9OAcjMWXbv07+ZsmxENUSCAQCUKdHS06M633vHKvacS8ydnBBBAoJwEurpaf6vrdl8pp5zIBYEw"
-    "CpRN8fX2+JoNe4kKyBL+jNh+IbaKyr6px/+6/Tb8XHYCr+kEyp1bZmxtHa9C/Ms7O695peyyJCEE"
-    "iiyQTM5fruKqtlSq7RAVYh+iN2tXqMvnitwtzZdWIKNiNf+N+AW2HYnqtfIz6XTbbbqbxPrShkFv"
-    "CCCAAAJhE/C8qrMUc5dZcdvz4/E5phRumEVDNAgggAACCCCAAAIIGChg2KzXC/1bNhvIREgIIFAQ"
-    "gYSr68RXF6SpwjTyrmi06T8L0xStIIAAAgMTSCYX/EHXCf3BICwIIIAAAiEX0CSL81T3cXfI0yB8"
-    "BEItUBXq6PsRvF+Irc38r0vr6+fub9u9n7Bt+wi9oTz6/9m7FzjJzrJA+OdUd08mE0Imk8l0dXWD"
-    "AwQ2EgVihNUFUfECCoKiMSIIEjULhMl0zyTB/b791vby/b7lNpdMwiUsi7CKaPRTQD5BYUVX1wug"
-    "P9CwwgYYk5nq7pkwkwQyzKXrnO+pXMgkmZm+napz6vS/fr+iq8553+d53v8ZqjrdT78VL0Bjiwhh"
-    "SHUFvhHX8hNZlt2S5yN/oHGwuhdKZYMpEI3Y3d2vu/c3jI5OPbHRSGJXmvxF8fr5vfH6OTKYq1q1"
-    "Vd8br5d/3n29XLPm+Idvv/3th1ethIUTIECAwLIF4vvtA7HT9Ktik6Y/iSBV2alpXZ7Pv/+SS6a/"
-    "q/vRmctenIkECBAgQIAAAQIECPRcoNnc+sxI8j09T7S4BEfi0zPfsbihRhEgMKgCjcaR9+T5uu6n"
-    "JV9QhTXE71m6DY/dn6u4ESBAoDSB2MhwT3xfdmn87vDVpRUhMQECBAgUIZAPD6ev7nSyp8Sv7S4t"
-    "IqAYBAgsTaD2zdcnc3SbBeL5LfffL3/d6GjrO6OJ8Pmxu+vzo6Hw38bxoZPHe1xJgXtjZ4wPx38I"
-    "3DI0lP5JfDTONypZpaII1Exgbm7nl2NJu7v3iYmpDVmWvCDL8hfHDwpfEI3Y59VsuXVZzr/Grh4f"
-    "jmv0wXb73r9IkptP1GVh1kGAAAEC5QnEp2N8rNmcuik+nvL15VXxyMzppYcP3/0bcfT6R57xnAAB"
-    "AgQIECBAgACB6gjE72LeEL+LqURB8buh9/r0zEpcCkUQ6KlAu33zkbGxyZsjSSU+kj1+n/K8sbFr"
-    "LpuZueEzPV244AQIEFhAYHi4cXU06z1Ds94CUE4TIECg4gLdvrno4fnpTif/VJS6vuLlKo9A7QRW"
-    "VfP1w6/eLZ25ueTv4lj3/mubN0+uP348/d74wd9zolnt38XX74zjax4+x7MSBDrxQ9BPxw8jPt69"
-    "P+Yxnb+57bY9x0qoQ0oCBB4QiG/eDsXD999/nx5uNu/+jiTJ4lMFku+L/0Dv7lxzbtzd+i6Qz4b/"
-    "n8f9k41G+sn9+3d8se8lSEiAAAECq0JgeDi5vtNJnxf/zfTUqiy4+9Hl4+PXfGz//hs+UZWa1EGA"
-    "AAECBAgQIECAwEMC8cvgi+KXwT/+0JFSH2XRCL6r1AokJ0CgbwLDw/M3zs8Pb4+Elfi9b/weurv7"
-    "9cv6BiARAQIETiHQbdZrNidf2u3FiNOV+HSAU5TpEAECBAgsQiBe02+L1/RXxGv6h2J4YxFTDCFA"
-    "oCCBVdx8/XDBvXt33RVHPvjAPb5cNTI2tvZpsRn2c+LF6dnxy/zvj4Mb4+7We4HuDrvRbJ1/fM2a"
-    "4x+//fa3H+59ShkIEFiewPT87Gzy9zG3e39zklw+NDY29oyTXjt/KI6vX15ssxYQOBifAhB/QJT9"
-    "Vff1MnbK+IcYX42tgxYo3GkCBAgQGGyB7g/mR0evuSL+2Cf+ij5dW5HVNLKs8d7x8aufbve6ilwR"
-    "ZRAgQIAAAQIECBA4SSB2VozGx7Qqnz76IRsXnHRxPCRQc4E77rix3WpN/k5s8vSqKiw1fq5/+aZN"
-    "W/7jgQN7vlSFetRAgMDqFZid3bU3NrS4In6u+rFQqMr3aav3glg5AQIEViAQr+kfaTa3/mp8r/mr"
-    "KwhjKgECSxTQfH1asJtPzMwk3Y986t53J8l0I3Z3/dY0zS6NZuxnxDegz4iP2r40zm04bQgnFiMw"
-    "1/1ryixLuh9/EF/zTx84sHtuMRONIUCgigK3dB7+2nn50OjoxFPj9fKy+OVK3PPLuq+hUfnZVay+"
-    "wjXdE7X9Q/f1Mgw/PT+fxWulH8xW+HopjQABArUXmJu74Z+bzan/GO/xb6nQYsezbKT7UcI/WaGa"
-    "lEKAAAECBAgQIEBg1Qs0m1sujJ8NVqLpsXsxYtfZXav+ogAgsMoEYrf7nXmeVeV1aGhoaPiauARb"
-    "V9llsFwCBCoo0P0kwVZr6/8Z3x/95wqWpyQCBAgQWILA7OzuX48dsLs9OS9ewjRDCRBYgYDm60Xj"
-    "TWexu+utMbx7/60Hp8U3oo+Px9GMnUQzdnpp/NX0t8WL2OY4xvZBpPu/ZvHD1X+NH2t+MZ7G7qzp"
-    "p8Lr0+32jjsePswzAgTqJXBLZ24u+adYU/f+m/evbXp4YuLwU+OPWKIZO/vO+I/5b4/jF8c9fgnj"
-    "Fu8j7UYj/0K4fDY0Ph1NbfFaef7/jj8CitdRNwIEFisQO8Ifie81Sv/0jKjj+GJrNo7AoAnMzp63"
-    "c2zs8PPiE8y+u0K1f3/8N9oV7fbu361QTUohQIAAAQIECBAgsMoFhqLhMT0aCN17ybf8n2Znd/5F"
-    "yUVIT4BAnwVit/vPtlpTfxw/f392n1OfJl3+0g0btvxfhw7t6W68UqNbeiRe70v/mWx8Wpufydbo"
-    "X5Wl9F4gfpb6prGxyafH/39f0PtsD2bI4/XCrcoC8Z55TxV+z9aIz7ysspPaCFRMID927KxXrl17"
-    "LP6bN+32M/blFr8PP9aXRJIsS6DROCuvwvfo8e/k7mUtoOKT0orXN6DlTQ+Pjt79+KGh5InxDcl9"
-    "90bjvq+XRPPxv4lF1fgjW+77D+ovRwP6l2Otn4+drG+NxsEvZ9maf5mbe8u9A3pBlU2AQB8ENm+e"
-    "XH/sWPakaDp+YvxgLF4v06d2X0PjteRbI/26PpTQzxTdH/zti/9gjdfJJF4nk3jdzD5/9Gj2ufr9"
-    "sLWfrHIRIECAAAECdRB47+994VlZlv5dmWvJk/THr/yZJ3+wzBrkJlCmwHs+8MXfifw/U1YN8QPL"
-    "237+Z57y5KLyx3o+GrGeX1S8ZcT51Kt/5inPWsY8UwgMtMBvfuCLX4vf7jymrEXkaXLDlVc8xa6i"
-    "ZV0AeQkQIECAAAECBAgQIECAAAECBAjUWMDuzD25uNPzsdNrNB/fd39YhksumV5z5513jsfHSbXi"
-    "l8nj0XA3Fs3JE9Fs2IwGw8fF4PiajMe9tB9KP6zgh57EX7UlB6MRcibu++NxfE2jcTCfjbrviOdz"
-    "nc7IPg3WD4F5RIDA0gT27t11V8z4zAP3W06anW7cONkcGem+ZmatOP74eP3pfp144PWz+3gs7o+N"
-    "e+m3eD28O/5iK14jG/Fame+Pgu6IemM36yR2+s/3nzgx0j548M3x2ulGgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAoMmoPm6z1fs1lunu7udfuWB+xmyXz40Pr5p/fz8mvMa"
-    "jc750bS3Pssa50VT3/po4jsvSbJzorHvgQbtPDZPTdY/GCya/h7baDS+ubt2PP9GnDv60PkkGhzT"
-    "2HQkPiC8kUc9+b0R+2vRJHh3BLonz7O7Y/rd8/PH7znrrM5dt9/+9m5D5H3jH4zhKwECBPookN95"
-    "566ZyNe9n+E23ZiYuHv9iRPJ+u7rZpoOnR+778fj7utn9zUyj92zG/ftoB0fTzQcr6Xn3h8sXvlO"
-    "eg3tHos/MonXvfjfuMVr49fiNXK++zhee7sfmXckYt4VMe8aGsoOd79m2dDhkZHkrn37dnY/Ts/r"
-    "5X1W/ocAAQIECBAgsEyB+fxo0ki7f9Bc3i3NfXJTefoyEyBAgEBNBOKn1n8fP145p7TlZOne0nJL"
-    "TIAAAQIECBAgQIAAAQIECBAgQIBArQU0X1f28t7S2b8/+WqU1727ESBAgMCCAtPZvn3JoRjWvbsR"
-    "IECAAAECBAgMqMCrfvbiz0XpTxrQ8pVNgAABAgQIPCDw6iue/AMwCBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgUEeBRh0XZU0ECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAoWkDzddGi4hEgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "UEsBzde1vKwWRYAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA"
-    "0QKar4sWFY8AAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgVoK"
-    "aL6u5WW1KAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEihbQ"
-    "fF20qHgECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECNRSQPN1"
-    "LS+rRREgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgULSA5uui"
-    "RcUjQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKCWApqva3lZ"
-    "LYoAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgaIFNF8XLSoe"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQK1FNB8XcvLalEE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBQtoPm6aFHxCBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBCopYDm61peVosiQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKBoAc3XRYuKR4AAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBALQU0X9fysloUAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQJFC2i+LlpUPAIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEaimg+bqWl9WiCBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAoWkDzddGi4hEgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgUEsBzde1vKwWRYAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA0QKar4sWFY8AAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgVoKaL6u5WW1KAIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEihbQfF20qHgECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECNRSQPN1LS+rRREgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgULSA5uuiRcUjQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKCWApqva3lZLYoAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgaIFNF8XLSoeAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQK1FNB8XcvLalEECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBQtoPm6aFHxCBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBCopYDm61peVosiQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQKBoAc3XRYuKR4AAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIBALQU0X9fysloUAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQJFC2i+LlpUPAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIEaimg+bqWl9WiCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAoWkDzddGi4hEgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgUEsBzde1vKwWRYAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIBA0QKar4sWFY8AAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAgVoKaL6u5WW1KAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIEihbQfF20qHgECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECNRSQPN1LS+rRREgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgULSA5uuiRcUjQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQKCWApqva3lZLYoAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAgaIFNF8XLSoeAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQK1FNB8XcvLalEECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBQtoPm6aFHxCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBCopYDm61peVosiQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QKBoAc3XRYuKR4AAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA"
-    "LQU0X9fysloUAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQJF"
-    "C2i+LlpUPAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEaimg"
-    "+bqWl9WiCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAoWkDz"
-    "ddGi4hEgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgUEsBzde1"
-    "vKwWRYAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA0QKar4sW"
-    "FY8AAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgVoKaL6u5WW1"
-    "KAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEihbQfF20qHgE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECNRSQPN1LS+rRREg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgULSA5uuiRcUjQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKCWApqva3lZLYoAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgaIFNF8XLSoeAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQK1FNB8XcvLalEECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBQtoPm6aFHxCBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBCopYDm61peVosiQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKBoAc3XRYuKR4AAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBALQU0X9fysloUAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQJFC2i+LlpUPAIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEaimg+bqWl9WiCBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAoWkDzddGi4hEgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgUEsBzde1vKwWRYAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA0QKar4sWFY8AAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgVoKaL6u5WW1KAIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEihbQfF20qHgECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECNRSQPN1LS+rRREgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgULSA5uuiRcUjQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQKCWApqva3lZLYoAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAgaIFNF8XLSoeAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQK1FNB8XcvLalEECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBQtoPm6aFHxCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBCopYDm61peVosiQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQKBoAc3XRYuKR4AAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIBALQWGa7kqiyJAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAiUJ"
-    "bNx4/bkjI0efUlL6b6bNsqHDc3M7v/zNAx4QIECAwCkFRkev+bZGIznrlCf7dLDTye86cGDPl/qU"
-    "ThoCAyWwadPW0aGhfGKgilZsaQLd19M0Hc5PLiCOfWPdumNHb7+98/UkufnEyec8JrAcAc3Xy1Ez"
-    "hwABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQInEZgePj4ZUnS+PPTnO7b4Wgk/INI9lN9"
-    "SygRAQIEBlBgYuKaJ3c6jc9G6Y0yyx8aSu5sta76lnb75iNl1iE3gSoKDA2lL0+S9K1VrE1N1ROI"
-    "19O4Paz3Oonvi5MTJ85Kxsa65ybjnh6OMd0m7GjGTr4W9+7zw3meHo6xh7pfkyT7apo22lmWzA0P"
-    "J/v37bv3gMbtkHK7T0DztX8IBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAis"
-    "SoFOJ90WCy+18foB+I1Zds7Px+O3PfDcFwIECBDomUB+/gOhNz2UIk3SNFqw7+vb7v5PGo/z+451"
-    "Okk0bq+Lg5PRgJ234+TeOP+VNM2/kmXpV5Kk85W1ay/48t6900cfiudRnQU0X9f56lobAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQKnFGg2t1wYzXOvOuXJEg42Gnk0gl/+ziS5"
-    "Jdr83AgQIECgYgLRmp2MxvtG3JNLu7XFDtn3NWcnyVBy7NhdWas1Gc3YyedjTNyT/xW7Z39+eLjx"
-    "z/v27fxGd7xbfQQ0X9fnWloJAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQKL"
-    "FGg0hl8fu5qevcjhPR8WG6w+qdkc/4nZ2eT3e55MAgIECBAoWqDRfR2P3bOfFG3ZP3Z/8DTpdPL5"
-    "ZnMymrHzz0RT9mfifefTZ599/mftkl00f3/jab7ur7dsBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECBAgQIECAAAECBAiULNBqXbUuGuBeV3IZj0ofTXvXx0HN14+ScYAAAQIDKzAcr+1Pi8bruCev"
-    "TuNJ7JI9PzY29dl4/td5nv1V7I79idgd+9DArnAVFq75ehVedEsmQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgsJoFsmxdNMAlGyto8Myxsa3PnZnZ/ZcVrE1JBAgQIFCMQPTu5pdF"
-    "qMuiGfua2B27E6/9n8vzxp9Gk/bHLrjgsX99663Tx4tJJUovBDRf90JVTAIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIEKipw+VCjkUzleTXLS9PGdVGZ5utqXh5VESBAoBcCQ9F0"
-    "fWma5pdGU/YbDh266+tjY5OfiGMfPXEi/+Cdd+6a6UVSMZcv0Fj+VDMJECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECAwWALN5sRPRuP1k6padZ7nL2w2py6pan3qIkCAAIGeCzwm"
-    "MrwkGrHfPjKS7Bsbm/p0qzU5PTExdVHPM0uwKAHN14tiMogAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAgToIxM6i2yu+jjRNk6mK16g8AgQIEOiPQPT55pfFHw39SqeTfzGasP+2"
-    "2Zy8OhqxN/QnvSynEtB8fSoVxwgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "qJ1ANKx9XyzqWdVfWP6KjRsnx6pfpwoJECBAoI8CaTRh/9v4A50boxG73WpNfbjZ3Hp5klw10sca"
-    "pAoBzdf+GRAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgsCoEGo3k2gFZ6Fkj"
-    "I8mWAalVmQQIECDQf4Gz8jx/UXxUwu+1Wuv+NXbEnm42t1zY/zJWZ0bN16vzuls1AQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgVUlEE1pT40dQ390cBadvmbjxuvPHZx6VUqAAAEC"
-    "ZQjEe9tY3H8lTRu3xyc8vHt8fPIZZdSxmnJqvl5NV9taCRAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECKxagUZ31+t0cJafnz8ycvwXBqdelRIgQIBAuQLp2jRNrsyy5B/Hxib/anz8"
-    "mh8ot576Ztd8Xd9ra2UECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECITApk1b"
-    "R6Mh7WUDiLE9Sa4aGcC6lUyAAAEC5Qo8O8saH+82YbdaUz9Wbin1y675un7X1IoIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEDhJYGgomYxNr9eedGhQHk60WudcPijFqpMAAQIE"
-    "Kifw7DzPPxRN2H/RbE49q3LVDWhBmq8H9MIpmwABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgACBhQU2brz+3Gi8fs3CI6s5IsvyN0RlaTWrUxUBAgQIDIjAc9M0/7vYBfvDExNTFw1I"
-    "zZUtU/N1ZS+NwggQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQWKnAyMiJX4wY"
-    "61cap6z5aZo8LZrlfqCs/PISIECAQH0EYhfsF3U6+a2t1uSbL7zwdY+pz8r6uxLN1/31lo0AAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgb4JXDWSJPlk39L1KFE0y13Xo9DCEiBA"
-    "gMDqE1iT58m1Q0NrvtBsbn3l6lv+yles+XrlhiIQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIFBBgbGxdT8dZT2+gqUttaQfGh/f9vSlTjKeAAECBAicTiA+WaGVpul7m83JD7Za"
-    "2x53unGOP1pA8/WjTRwhQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKAeAtfW"
-    "YxlJmmV5XdZSk0tiGQQIEKiHQDRhvzjPs8+NjW19RT1W1PtVaL7uvbEMBAgQIECAAAECBAgQIECA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAj0WaDVmvrhSPmMPqftWbo0za9otbbWYRfvnhkJTIAAAQLL"
-    "FlifJOl/Gxub+v1Wa/vGZUdZJRM1X6+SC22ZBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBFaTQJ7Xa6foPE9G8jzdupquobUSIECAQL8F8p9Mks7nRkcnn9fvzIOUT/P1IF0ttRIg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgsKDAxMTWp8WgH1xw4OAN+KXNmydj"
-    "d1I3AgQIECDQG4H4Y5+xRiP501ZrcjpJpvUZn4IZyilQHCJAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAgQIECBAYHAFOp3kDVF9OrgrOG3l5x4/nv/70551ggABAgQIFCMwFE3Yv9Js3v2n"
-    "o6PXbiomZH2iaL6uz7W0EgIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQKrXqDV"
-    "2vr4NE0vrytElqXXXHLJ9Jq6rs+6CBAgQKA6Amma/0Cj0fnbZnPLU6tTVfmVaL4u/xqogAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgACBggTyPJ2K3TpHCgpXuTBpmrQOH7775ZUr"
-    "TEEECBAgUFOB/AlpOhQN2JM/UtMFLnlZmq+XTGYCAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQJVFDj//DecF3VdWcXaiqwpz7Prk2Ra71eRqGIRIECAwJkEzo0//vnQ2NjUa840"
-    "aLWcG14tC7VOAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgTqLXD22cdfG7te"
-    "P7beq+yuLr242bzrR2Znk4/Uf61WSKAaAvHa0k7TdKYa1aji4QJ5txf23O6xuE5r4zqdff/5vHtM"
-    "n+z9GEX8b1jmb2+1Jh/bbu96UxEBBzWGf1SDeuXUTYAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIDANwUuumjLWV//er4lduZcFbdY57WxUM3Xq+JqW2QVBNI0f/vMzK7fqEItali6"
-    "wMTE1IY8TzcmSXZB92uW5RdElHieXPjA141xjR8Xf9zypHi+Cv6IJ1a5zFs0uL+x2dy6dnZ2968t"
-    "M8TAT9N8PfCX0AIIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEDhyZOjl0ZDc"
-    "WkUS3xfNb8+M5rdPraI1WyoBAgSWJbBv385DMbF7X/DWbG65MM9HntRodC6KRu0nxU7a8TWPr8m3"
-    "xuT1CwZYBQPC5FfHxibXxh8k/B+rYLmPWqLm60eROECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAwIAJpNEgtz1J8gEre2XlNhppd/frK1YWxWwCBAgQOFlgdnbPwXjevf/tycfj"
-    "cTo+vu3JWZY9Mx53798Z90vjvi7uq/H2H1qtqRPt9s5fWW2L13y92q649RIgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBComcDo6NYXRuP1U2u2rAWXk+fJT46OTj1xbm7nlxccbAAB"
-    "AgQIrFQg379/xxcjSPf+2/cHmx4eH7/nkizrPCt6s78/jv1w3C+4/1z9/zd2BP9PzebkgdnZXTfV"
-    "f7UPrVDz9UMWHhEgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgMIACsQP0dQNY"
-    "dhElD6VpMhWBthQRTAwCBAgQWKrA9Pz+/clnY1b3/q4kmW6MjR26NE3TH4xPZPixOPbdcW/Evba3"
-    "eB/a02xu/drs7O731XaRj1hYrS/oI9bqKQECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECNRNoNqdit9HkuTVb1qKXk6b5lePjV6+aXVYXDWMgAQIEShGYzmZmbvhMu737jTMzu54z"
-    "Pz8yHo3YV8YnFXwoyjleSkm9TxpLTN81NrZ11bwXa77u/T8qGQgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQ6JFAo5Fc26PQiw2bL3Zgj8at63RGXtej2MISIECAwAoEDh5882y7"
-    "vfM9s7O7XjI0lI4lSfraCPfXKwhZ1alrYm23tFrbHlfVAousS/N1kZpiESBAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECDQN4HR0dc/Ic/zl/Yt4SkSpWnyG0mSHz3Fqb4dihpePzEx"
-    "dXbfEkpEgAABAksW2Ldv56GZmZ3v6O6IHZ9acHGep2+MIIeWHKi6EzblefahVuuqddUtsZjKNF8X"
-    "4ygKAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQJ9FhgaGt4eKYf6nPbkdHed"
-    "OHH8TdFA9/6TD5bweFOnk72yhLxSEiBAgMAyBNrt3V+Ynd35y/Pzx78lGrG3Roi9ywhTxSnPyPN1"
-    "b69iYUXWpPm6SE2xCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBDoi0CrtX1j"
-    "niev7kuy0ySJ/DcfPPi2r8dOnztjSH6aYX06nG5Lkmn9YH3SloYAAQJFCHTfQ6IR+4aZmfVPTtP0"
-    "5fFW8i9FxC05xivHxiZjLfW9ebOt77W1MgIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQK1FciyztWxuHVlLTBNkxONRuPGbv65uRv+Ob78aVm1PJD3KWNjd7+k5BqkJ0CAAIFlCUzP"
-    "t9s73z8zc/4leZ7/dLzHfGlZYSoyKeq/qdmc3FyRcgovQ/N14aQCEiBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECDQS4GJiamzo7Hrdb3MsVDs2PX699rtHXc8OC52LN3x4OOyvkbD"
-    "3nVl5ZaXAAECBIoQmM5mZ3ffcv75658a73NviIhfKyJqv2PEe+R5Uf97k+TyoX7n7kc+zdf9UJaD"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAIHCBDqd5FURbFNhAZcRKJrKHtZs"
-    "HTuW/lkc+6dlhCpsSuT/7lZr8tmFBRSIAAECBEoRuPXW6ePt9q43nTiR/JskSX+rlCJWnvS5Y2MT"
-    "r195mOpF0HxdvWuiIgIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIETiswHT1P"
-    "+bbTnu7DiTTN/zya4v7hEanyaJDb+YhjfX8au43a/brv6hISIECgNwJ33rlrZmZm58/F+94LIsPt"
-    "vcnSy6j5r8enVYz3MkMZsTVfl6EuJwECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECyxIYG7vrx2Pik5c1ubBJjVM2Wa9bN//+aJCbLSzN8gL9WKu1NXZKdSNAgACBugjMzOz+2LFj"
-    "nW+P9fyXAVvTuVmWnPI9c8DW8bByNV8/jMMTAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgSqLBA7O19bcn1faLfP+8iparjttj3H4vhNpzrXx2ONPG9s72M+qQgQIECgDwKHDu25"
-    "Z2Zm1y+ladr9I6SDfUhZSIo8zy9vtaZ+uJBgFQmi+boiF0IZBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAicWSB2dH5OmibffeZRvT6bxw6e09npsqTp8Dvi3JHTne/P8eznNm3a"
-    "OtqfXLIQIECAQD8F2u2dH5yfH3la5PxkP/OuJFc0YL8p3jtr07Ncm4Ws5KKaS4AAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA9QWyLL2+5CoPZdnIb52phnb7rXcmSf6+M43p/bl0"
-    "7dBQuqX3eWQgQIAAgTIEDh588+zMzPofyvP0jWXkX0bOp7dad12xjHmVnKL5upKXRVEECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECJws0Gptvzh2vX7hycf6/Tjy3zQ395Z7F8ob"
-    "43bFmNPujr3Q/ILOv3Z09NpzCoolDAECBAhUTmB6fnZ25y+naf6LUdp85cp7REFZlvxaklw18ojD"
-    "A/lU8/VAXjZFEyBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEFhdAnmebYsVl9nv"
-    "dOzEiZG3LUa93d79hTxPPrKYsT0cs2Fo6MQv9DC+0AQIECBQAYF4z3l3mqY/FZ+6cLQC5Zy2hPjD"
-    "pItarXWvOu2AATpR5jcjA8SkVAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "yhK48MLrmrGR9M+Vlb+bN5qpf/vgwTfPLqGGHUsY25Ohed6YTJLp4Z4EF5QAAQIEKiPQbu/8YJ6n"
-    "PxIFHalMUacoJM/z7fG+NPC9ywO/gFNcG4cIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIEKiRwPDw8S1Jkq4tc0nDw/nupeSfnd31yRj/90uZU/zY/Amt1uGfLD6uiAQIECBQNYHu"
-    "+07sgP2Sau+AnV7cat39wqrZLbUezddLFTOeAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAIG+CVx44eseE43Xr+lbwlMn+ti+fbs/d+pTZzx6wxnP9uFk7H59XR/SSEGAAAECFRCI"
-    "HbA/nqbJFVFKpwLlnLKE2P162ylPDNBBzdcDdLGUSoAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQGC1CYyMjFwZa95Q5rpjJ9Edy8k/M3Pk92LevuXMLW5Oftno6OTziosnEgECBAhU"
-    "WaDd3v2hqO/aCtf4fePj255e4foWLE3z9YJEBhAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgUI7A9HCep1Pl5P5m1n+OnUT/7JvPlvTg5hOxA+meJU3pweBGo9JNeD1YsZAECBBY"
-    "3QIzM7t2xadGvKuqClmW/XxVa1tMXZqvF6NkDAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECfRdote66PJJu7nvikxLmefLWeJqfdGhJD48e7bwjJtyzpEnFD/6RQd9ltHgSEQkQ"
-    "IFBvgXPOmd8Sb1//WNFV/mySXDVS0doWLEvz9YJEBhAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgUIZAND5fW0bek3IeWLt2/QdOer7kh4cO7ek2Xr9nyRMLnpDnWdk7iBe8IiTt"
-    "SL8AAEAASURBVOEIECBA4EwCt92259jQUOOnY8zXzjSupHObWq11Lywp94rTar5eMaEABAgQIECA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgULTA6Ovm8iPkdRcddWrx8z96900eXNufR"
-    "o7MsvSGOdh59pn9HopH9ZRMTU+P9yygTAQIECJQtsG/fztti9+vryq7jVPnzPH3FqY4PwjHN14Nw"
-    "ldRIgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAYJUJNBrJ9SUv+UiaDr+jiBrm"
-    "5nZ+OeL8YRGxVhBjTZYlW1cw31QCBAgQGECBmZnz3xVl/1X1Ss+fv3nz9Nrq1bVwRZqvFzYyggAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgACBPgqMjk59e6T74T6mPEWq/H3t9lvv"
-    "PMWJZR2KZvIdy5pY6KT8qg0btjy20JCCESBAgEDFBaaz2GX6NWmanKhYoY85evRQ91MuBu6m+Xrg"
-    "LpmCCRAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECNRboNHIr4sVpiWuMo9dr3cX"
-    "mX///l1/k+fJ3xQZc6mxIv95a9YMXbXUecYTIECAwGALzM7uvDXL0ndWbRVp2nhx1WpaTD2arxej"
-    "ZAwBAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAn0RGB/fMhGJruhLstMkiSbl"
-    "P45dr//lNKdXcrj03a9j59OtSXLVyEoWYS4BAgQIDJ5AlmW/EVV/vWKVv6hi9SyqHM3Xi2IyiAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgACBfgjk+VA0Bydr+pHrDDl60iQ9O7v/"
-    "D2ND76+cIW8/Tk00m2e/rB+J5CBAgACB6ggcOLB7Lt6DdlWnovsqGR8f3/aUitW0YDmarxckMoAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgX4IbNiw5bGR55f6kesMOf5hdnbX"
-    "J89wfgWnbukkSX7DCgIUMjVN0+siUFpIMEEIECBAYGAE8ny++x70jSoVnOfZc6tUz2Jq0Xy9GCVj"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBDoucDatUOvyfPkvJ4nOkOCaEx+"
-    "6xlOr/jUiRNr3h1B7lpxoJUF+LaxsannryyE2QQIECAwaAKzs3sORs3vq1Ld8b6v+bpKF0QtBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgMhsAll0yviQasa0qudl+7fe8tvazh"
-    "zjvf9LVo8H5XL3MsJnZYX7uYccYQIECAQL0E8rxT+icwPEJU8/UjQDwlQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIDAggJf/epdPxuDxhcc2MMBeZ5HQ9rNJ3qY4r7QjUayO02T"
-    "nuc50zrSNP+BsbFrLjvTGOcIECBAoH4Csfv15+M96O8qtLJvGR29dlOF6lmwlMaCIwwgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBAbwViM+hksrcpFoz+tbVr+7Mj9b59O/dH"
-    "o3dPd9hecLUxIM9Tu18vBsoYAgQI1EwgXv9/s0pLGh4+/u1VqmehWjRfLyTkPAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECPRVoNidfEAme3tMkCwZP37N37667FhxW2IB8R2Gh"
-    "lhkoOt5/Kuw3L3O6aQQIECAwoAJDQ8nvRenzVSk/yxolfw+wNAnN10vzMpoAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgYIFGo38uoJDLjVcp9OZv2Gpk1Yyfmbmhs/E/L9YSYwC"
-    "5g5XYMfxApYhBAECBAgsRSA+geFQmub/Yylzejk23oue1sv4RcfWfF20qHgECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECCxaYGzsmsvyPP3+RU/oycD0jw4c2POlnoQ+Q9BofCt9"
-    "9+so7xcmJqY2nKFMpwgQIECghgJ53vhgVZaV58klVallMXVovl6MkjEECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECPREIBqvr+1J4CUETdNOKU3Q7fb5fxxlfnEJpfZi6GM6neQ1"
-    "vQgsJgECBAhUV6DRSP+kQtU9oUK1LFiK5usFiQwgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQKAXAs3m5OY0TX+qF7GXEPNT7fYN/3MJ4wscOp3Fbp+7Cgy4zFD51s2bp9cuc7Jp"
-    "BAgQIDCAAvv37/hivAe1K1L6BRs3Xn9uRWpZsAzN1wsSGUCAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAQI8EtkXc4R7FXlTYaDx706IG9mhQo3HkvRH6zh6FX2zYTceP3/WKxQ42"
-    "jgABAgTqIdBoJH9VlZUMDZ3YXJVaFqpD8/VCQs4TIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIFC4wMTE1IY0Ta4sPPCSAqZfmZ3d/4dLmlLw4Hb75iMR8p0Fh11yuDzPtyfJtH6y"
-    "JcuZQIAAgcEVyPO0pE9+eLTZ0FD2hEcfreYRb5bVvC6qIkCAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIFBrgU4ne10s8JySF7k7SW7plFxDkmXDNyRJfrTcOtKLW63DLyq3BtkJECBA"
-    "oJ8C8Yc3n+1nvjPlyvNG80znq3RO83WVroZaCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECKwCgYsu2nJWLPPqkpd6z7Fj8+8puYb70s/NveVAmqYfKLuW2AH1urJrkJ8AAQIE+icw"
-    "PJx+rn/ZFsqUX7DQiKqc13xdlSuhDgIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQKrRODeexuvTJK01B0u0zS5+dChPfdUhbzRyHdGLXnJ9TxndHTbd5Vcg/QECBAg0CeBfft2Hsrz"
-    "pN2ndGdMk6aar88I5CQBAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAqtWII3G"
-    "66kyVx+N1yeiz3lPmTU8Mve+fbu7u49+/JHH+/280cjsft1vdPkIECBQokC8J36pxPQnpU7tfH2S"
-    "hocECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBC4T6DVmnpxPPjWMjlil8/f"
-    "b7d3315mDafOne449fG+Hv3xiYlrntzXjJIRIECAQJkCe8tM/mDueG8+/8HHVf/aqHqB6iNAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAoD4C0Vx1fdmryfN0V9k1nCr/zMzOj4ZP"
-    "dwfsMm+NTifdVmYBchMgQIBA/wRi5+u9/ct2pkz5WWc6W6Vzmq+rdDXUQoAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQKDGAs3m1LOSJP93JS/xk7OzO/++5BpOm77RyG847cn+nfj5"
-    "Cy+8rtm/dDIRIECAQFkCWZbOlpX75LzRBK75+mQQjwkQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIJCm+X8oWyFN0x1l13Cm/OvWZb8VDeolN8Kla0dG5l97pjqdI0CAAIF6CDQa"
-    "yaEqrCQ+lWJNFepYTA12vl6MkjEECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CKxIYHx821MiwItXFGTlk/93u33eR1YepncRbrttz7E8T97euwyLi5zn+etHR689Z3GjjSJAgACB"
-    "wRXIvlqR2jVfV+RCKIMAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgQoIZFm2"
-    "LcoodbPIaGremSTTWQU4Figh6zZff2OBQb0+vSFN53++10nEJ0CAAIFyBbIsuavcCh7Mng8/+Kjq"
-    "X0v9ZqbqOOojQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQGDlArGD8qaI8sqV"
-    "R1pRhEN5Pvy+FUXo0+TZ2T0HI9V/61O606ZJ03R7NKsPTDPcaRfiBAECBAicVmB4ODl22pN9PJGm"
-    "1ahjMUvWfL0YJWMIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEFi2QKPR2RKT"
-    "z152gEImpm+bm3vLvYWE6kOQRqPx1khT8i7d+ROazcM/0YflSkGAAAECJQnEzteVaL7O8/RoSQRL"
-    "Tqv5eslkJhAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgsFiBVuuqdUmSv2ax"
-    "43s07tiJE/nbehS7J2H379/xxdgF9E96EnwJQWP36+uXMNxQAgQIEBgwgU6nc7waJeear6txIVRB"
-    "gAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgEC5AmdfGfk3lllDNDH/zp137pop"
-    "s4bl5O50kh3LmVfwnO9sNqe+t+CYwhEgQIBARQTSdDivRilpJXbgXoyFna8Xo2QMAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQLLELh8KEnSyWVMLHRKmjZ2FRqwT8Hm5nb999g1"
-    "/B/7lO60aRqN5NrTnnSCAAECBAZaYGiosaYKC8jzxM7XVbgQaiBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIECBAgAABAgQIECBAoDyBZrP10mimelJ5FdyX+c/279/x2ZJrWEH6dOcKJhcyNc/zFzab"
-    "W55aSDBBCBAgQKBSAvPz+VlVKCj+0EfzdRUuhBoIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIEChPIE3T68rL/mDmdMeDjwbx64YN63836t5fcu1pkgxtL7kG6QkQIECgBwLR9FyJ"
-    "5uv4Q59DPVheT0I2ehJVUAIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEVrVA"
-    "szn5fQHwzJIRbp2Z2fmxkmtYUfpbb50+Hk3sN64oSAGT0zR5+eMe9/pWAaGEIECAAIEKCaRpdn4V"
-    "yolPypipQh2LqUHz9WKUjCFAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAYEkC"
-    "aZqXvut1NAx3d73Ol1R4BQcPDx99Z5T19ZJLO2t+fmhLyTVIT4AAAQLFC2woPuTSI8YfGs0ufVY5"
-    "MzRfl+MuKwECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAIHaCrRa2y9OkvQFJS/w"
-    "wJo1699fcg2FpL/99rcfjh1B31NIsBUFSV93/vlvOG9FIUwmQIAAgUoJZFnjgioUFM3Xdr6uwoVQ"
-    "AwECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC/RfIsvnrI2upG0PmeX7T3r3T"
-    "R/u/+t5kzLLO7ojc6U30RUd97Nq1x69c9GgDCRAgQKDyAo1GMlqFIjudZK4KdSymhlK/wVlMgcYQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIDA4Ao973OtbsXvly0uu+BtJkr29"
-    "5BoKTX/gwJ4vRcAPFhp0WcHyySS5amRZU00iQIAAgcoJxB8rPaEKRaXp/GwV6lhMDZqvF6NkDAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECixI4cWJ4awxcs6jBvRv0vtnZPQd7"
-    "F76cyGma7Cgn88OyPn5sbN1PP+yIJwQIECAwyAKbK1D8PfG+fWcF6lhUCZqvF8VkEAECBAgQIECA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECCwls3Hj9udEgfNVC43p8Pk/ToV09zlFK+HZ7"
-    "11+H79+VkvzhSa99+FPPCBAgQGCABZ5Ydu3x3va/ooa87DoWm1/z9WKljCNAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBA4IwCw8Mnuo3X6884qMcn0zT9SLv91n/pcZrSwmdZWoXd"
-    "r5/Ram39odIQJCZAgACBQgTGx6++IAKNFxJsBUGyLP/8Cqb3farm676TS0iAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECgjgJXjaRpfk3ZK6tIc3LPGGZn9/1BBP9yzxIsMnCep9ct"
-    "cqhhBAgQIFBRgfn5kadXpLTuztcDc9N8PTCXSqEECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIEqiswNnb2FVHd48utMP/H2dkdf15uDb3OfksnSdIbe51lEfF/aHx8W1Wa9hZRriEE"
-    "CBAg8EiBRiN52iOPlfM8tfN1OfCyEiBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBQkkAaDcHXlpT7pLTpzpOe1PbhsWPz707T5O6yF5hlmd2vy74I8hMgQGBlAs9e2fRiZuf5vObr"
-    "YihFIUCAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIEBgEATGxrb+cNRZ9i7I+zds"
-    "WP+7g+C10hoPHdpzT5Lk/2WlcQqYf8XY2PZvKSCOEAQIECDQf4H4w6nkuf1P+6iMB+fmbtz7qKMV"
-    "PtCocG1KI0CAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIEBgIATS7WWXmabpjbfe"
-    "On287Dr6mP+GyDXfx3ynSjUcJWw91QnHCBAgQKDaAs3mlm+NCjeVX2X6l1FDXn4di69A8/XirYwk"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQOARAuPj27o7Xv/gIw73++mRND3+"
-    "rn4nLTNfu7379jzPf7/MGu7Pnf7i5s2T68uvQwUECBAgsDSBxguXNr5no/9HzyL3KLDm6x7BCkuA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIEBgNQhkWef6WGda5lrzPHn3/v03fbXM"
-    "GsrInaaNt5aR9xE5zz1+PH3NI455SoAAAQIVF4hPjHhJFUqMOro7Xw/UTfP1QF0uxRIgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBCojkCrtfXx0TR1eckVdaIBfHfJNZSSfmZm56cj"
-    "cek7hmZZvuWii7acVQqCpAQIECCwZIFmc8uFMem7ljyx+An3tNt3fK74sL2NqPm6t76iEyBAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEKitQOw4PRn3kXIXmH/owIE9Xyq3hvKyp2my"
-    "o7zs92eOGlpHjgz/bNl1yE+AAAECixNoNBovi5FDixvdu1Hx/hF/QHRLp3cZehNZ83VvXEUlQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgUGuBxz/+tecnSfqLZS8ydt5+a9k1lJm/"
-    "3V7/ocj/hTJr6ObO8+z6JJnWj1b2hZCfAAECixDI8/TVixjWhyH5H/YhSeEpvNkVTiogAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgfoLzM+v/fexynNLXunft9u7/rrkGkpOP53F"
-    "7uN7Si4i0qcXj44e/tHy61ABAQIECJxJoNWa/I44/4wzjenTuU6WZd0/IBq4m+brgbtkCiZAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBQrsBFF205K/Y6vqbcKrq7La/uXa8f9G80"
-    "jrwnHn/1wedlfW000mvLyi0vAQIECCxOIP5gZ3JxI3s7Kk2Tv5id3XOwt1l6E13zdW9cRSVAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBQW4EjRxqviOatsZIX+K+zs+f9vyXXUIn0"
-    "7fbNR6KQmytQzPeOjm77rgrUoQQCBAgQOIXAxMTUeBy+4hSn+n4oy9I/6HvSghJqvi4IUhgCBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECq0QgzfPGtvLXmu5Okun58uuoRgXDw/M3"
-    "RiXHy65maCivwL+NshXkJ0CAQDUFOp37XqPXVKC6bGTkxB9VoI5llaD5ellsJhEgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBBYnQKt1tSLkiR/asmrv+fo0TX/teQaKpX+jjtubEdB"
-    "Hyi7qDzPXxo7q15Udh3yEyBAgMDDBR7Y9fq1Dz9a1rP8ow+8b5VVwIryar5eEZ/JBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBFaXQDTXXlf2itM0ufnw4TfeXXYdVcufZelboqa8"
-    "5LqGsiyfLLkG6QkQIEDgEQLx2vwbcejsRxwu5Wmep28rJXFBSTVfFwQpDAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAIG6CzSbU8+KNX5Pyeucj/7iPSXXUMn0c3M7/yka2v572cXl"
-    "efLqVmv7xrLrkJ8AAQIE7hdoNrc+M16bf64iHntnZ/d/tCK1LKsMzdfLYjOJAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAwOoTiB2nr6/Aqm9pt3ffXoE6KlpCZ0cFCluXZfOvq0Ad"
-    "SiBAgACB5PKhNE3fERBDVcBI0zxquaVThVqWW4Pm6+XKmUeAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIEBgFQls2rTlSbHj9I+XveQ8z3eWXUOV88/O3vAnSZJ+vuwao9Hv6omJqbPL"
-    "rkN+AgQIrHaBZnNiMgy+oyIOx7Is+68VqWXZZWi+XjadiQQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIECBAgAABAgRWj8Dw8ND2WG3Zu2b+5ezs7k+tHvVlrTRPkmzXsmYWO2lTp5O8qtiQohEg"
-    "QIDAUgRGR6/5tthp+teXMqeXY6OWd8/O7jnYyxz9iK35uh/KchAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAYYIHx8asvyPPklWUvIXZT3lF2DYOQ/5xzsvfFLuWz5deaX5ckl5fd"
-    "sF8+gwoIECBQgsDmzdNrh4Ya74/UFfkUgvxommb/TwkUhafUfF04qYAECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIE6iXQ6Yy8PlZ0Tpmriubv29rt8z5cZg2Dkvu22/Yci0b1d1ag"
-    "3ieOjY2/pAJ1KIEAAQKrTuDYsbvfFe+d316dhadv279/z77q1LP8SjRfL9/OTAIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQK1F2i1rlqXpsnV5S803Zkk01n5dQxGBVnWuSkq/UYF"
-    "qv3lCtSgBAIECKwqgVZrKl5781dUaNFfz7LhN1aonhWVovl6RXwmEyBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIEKi3QJate1Ws8MKSV3koz4feW3INA5V+dnbPwSj4tytQ9DNbra3P"
-    "qUAdSiBAgMCqEBgbm3xpnuf/d8UWu3tu7i0HKlbTssvRfL1sOhMJECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQI1F1guttftK38VebviKate8uvY7AqSNP8LVFx6buF53l67WDJqZYA"
-    "AQKDKRA7Xv9g7Hjd/cObKvUH3z4/f/w/D6boqauuEu6pK3SUAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAIFSBMbGDv9EmiYXlZL8oaTHh4c7Nz301KPFCrTbu78QTXgfXez4Ho77"
-    "sVZr+8U9jC80AQIEVr1Aszn1vbHj9QeTJF1bJYwsy68+ePBtX69STSutRfP1SgXNJ0CAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIFBTgdixeHvZS4vm79+5444b22XXMaj5G418RwVq"
-    "b+R5VoEd1CsgoQQCBAj0QKDZvOZH49MO/r8Iva4H4ZcdMk3TW+bmdv/xsgNUdKLm64peGGURIECA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQKFNgbGzqe6Lx+bvLrKGbO00bO8uuYZDz"
-    "799/wyei/s+Wv4bs5zZt2jpafh0qIECAQL0EWq3JlzUajT+KVVWs8Tq5+/jxfGu9tO9fjebrOl5V"
-    "ayJAgAABAgQIECBAgAABAgQIECCwTIE0z+eXObWQaXmSFJ3/eCGFLTtIWnL+ZRduIgECBAgQIECA"
-    "AAECBAgQSPI8v7Zshth5+xP79++oQONw2RIryx/XsgK7X6drh4bSLStbidkECBAgcJJA2mpN/Wqe"
-    "J78d95GTjlfiYbz3XHfnnbtmKlFMwUVovi4YVDgCBAgQIECAAAECBAgQIECAAAECgyyQpY25MuvP"
-    "k7zQH8SmSVrqepIk95HIZf6DkpsAAQIECBAgQIAAAQIEli3Qam2/OHa9ftGyAxQ2sVOBpuHCFlNa"
-    "oAsuOP8D0ZhXhZ9TvPbCC1/3mNIgJCZAgEBNBDZuvP7csbGtfxANzv8plpRWb1n5H87M7H5X9eoq"
-    "piLN18U4ikKAAAECBAgQIECAAAECBAgQIECgFgKNNCu0+XmpKNEsXegvAfO02Gbupa4nxhe6nmXk"
-    "N4UAAQIECBAgQIAAAQIECCxLIM+z7q7XZfcWfWF2dsNHl7UAkx4mcOut08fTNL3pYQfLebJhZGTk"
-    "ynJSy0qAAIF6CIyNXXPZyMjxz0TP9U9UdEX7G435X6pobYWUVfY3SIUsQhACBAgQIECAAAECBAgQ"
-    "IECAAAECBIoRyLJkXzGRlhklLTp/uneZlRQ0Lb+9oEDCECBAgAABAgQIECBAgACBvglceOF1zfg0"
-    "p1f0LeFpE+VvTZLp7LSnnViSwNBQ8o6YcO+SJvVgcJ6nU3Fdh3sQWkgCBAjUXGC60WxOxh9HNf5n"
-    "LPTJFV1sJz5p4RX799/01YrWV0hZmq8LYRSEAAECBAgQIECAAAECBAgQIECAQD0Ehs7KPh4r6ZS1"
-    "mjxJuvkLu2VZp7s7VoQt55ZmjY+Vk/n/Z+9e4OS863rxP8/MbhLa0ja37s4kLSkUSg2Ccjl4UBER"
-    "vIJQsSnlWigEekl3N0mL5/w9sr68IjS7SVoKEblflCoiV0VUEG8cRT1oEaXYUDazu03bpBTaJrsz"
-    "v/9v2wJJSZq9zMzzm5n3vl5r5vI83+/n9342k7V85ze6EiBAgAABAgQIECBAgACBxQv09R3eEs9e"
-    "vvgKTTnz1uXLV76nKZUUuU9gYmLsjjzP3pkAx4Zq9c5fTCCHCAQIEOgYgWp122MrlTs/F1/H3xhD"
-    "L0s3eP5bU1Pjn0k3X3OSGb5ujqMqBAgQIECAAAECBAgQIECAAAECBLpC4OW/cN7tecj+vqDF3HlK"
-    "PvPXzex9yUWPrcV6/9zMmvOtlWfZTRe/6NE3zvd4xxEgQIAAAQIECBAgQIAAgRQE1q697JS4o+al"
-    "RWeJw2XX7907em/RObqtf6nU2BnXVPhu4iGEq7rN1noIECDQCoENG0ZXVCpDvxzC7L/EfUae1ooe"
-    "zaqZ5/nHJicnRptVL+U6hq9TvjqyESBAgAABAgQIECBAgAABAgQIEChCoBQ+XETb2PNjmzZtPNz0"
-    "3iF8qOk151Ew/q+YhfSdRzSHECBAgAABAgQIECBAgACB4wr09S17VRzuWnncA9rzxKHZ2XB9e1r1"
-    "VpeJiV1fiSv+SAKrfuLAwPAzE8ghAgECBJIVqFZHnnvo0MG4wUf+a/F7RbJB7wuWf+mee5a9JMtu"
-    "KOyTNdvpY/i6ndp6ESBAgAABAgQIECBAgAABAgQIEOgAgb6Z0u/GXZtva3PURqnR+J2W9Fyx7M1Z"
-    "yG5vSe3jFI1+38xL/WPHedrDBAgQIECAAAECBAgQIEAgUYHRvhhsKIFw77n11p3TCeTo0gj5jhQW"
-    "VirZ/TqF6yADAQLpCVSrVz6tWh36y/gpAXNvlnlkegm/J9Gt8VMzfvbAgTfc+T3PdOkDhq+79MJa"
-    "FgECBAgQIECAAAECBAgQIECAAIHFCrzkJY/+RsiyX1/s+Ys8790vf9Fjv7jIcx/ytFecf/bBLA+/"
-    "+ZAHNfnJkOdvesWms6eaXFY5AgQIECBAgAABAgQIECDQUoFq9eAFscGGljY5cfE4a1b3huYTOy36"
-    "iMnJsc/Fk/9x0QWadmL+UwMDI9/ftHIKESBAoMMFKpWRJ1erwx8LofS3IeQ/3hnLCffmeeP8yclr"
-    "vtYZeZuT0vB1cxxVIUCAAAECBAgQIECAAAECBAgQINBVAieXZuY+2vdLbVrUHfE/Jv9KK3vddWrp"
-    "uvixjP/Wyh5H1P5KY0U9iR2kjsjkJgECBAgQIECAAAECBAgQOKFACNn2Ex7U8gPCJ6emdrfrv0m0"
-    "fDWpNsjzJHa/zuPu1wn8zKV6leQiQKBXBOIu1z9SrY58NMvCP8Z/i3+ug9Z9OM9Lm2q1XX/XQZmb"
-    "EtXwdVMYFSFAgAABAgQIECBAgAABAgQIECDQXQKbNm08XC41npNn2W0tXlm9lIWXvPKic77eyj5X"
-    "/uyjD2Vh9udjj/2t7BNr35U38vMved5j72pxH+UJECBAgAABAgQIECBAgEBTBdatu/InYsEnNrXo"
-    "IorFIS67Xi/CbaGn1Gqn/WE855aFnteC41+4bt2W9S2oqyQBAgSSFtiwYfj0uMv1lkpl+N/jLtef"
-    "ix/78JykAz8oXJ5nM/H7wlptLA6N996X4eveu+ZWTIAAAQIECBAgQIAAAQIECBAgQGBeAi/b9Nib"
-    "sxBeGA+emdcJizto28tfeO4nF3fqws56xUXn7Q2lfO7jkw8t7Mz5HR0H1WezPLzw4hc9+sb5neEo"
-    "AgQIECBAgAABAgQIECCQjkCjkaewA/H/i0Ncn05HpZuTjM7GYb9dCaxwWQjloQRyiECAAIE2CIyW"
-    "BgaGnxmHrt9x6FC2L+5yPfc6vLENjZvdYrbRCC+u1cY/3OzCnVLP8HWnXCk5CRAgQIAAAQIECBAg"
-    "QIAAAQIECBQgcPFF5/5F3L3iWbF1U3eMvm9QOeS/9IoXPmZnO5f1yk2P/myplP94/PjGqSb3/UYj"
-    "y85/xYXnfqLJdZUjQIAAAQIECBAgQIAAAQItF1i/fujxWZb/VMsbnaBBHAa26/UJjJr59KFDy94W"
-    "632jmTUXUysOH25eufJ1py3mXOcQIEAgfYELytXqlU+rVofeVKkcvKVUyv4ivu5dHHOflH72Yyac"
-    "zfP85VNTO2845rM98qDh6x650JZJgAABAgQIECBAgAABAgQIECBAYLECF1/4mL/O6uUfDln2H4ut"
-    "ceR5cfD6tvgRwj/5iose/YYjH2/X7ZdvevTfl0t9T82z/J+a0TOu59+jz5Nf+cLHfKwZ9dQgQIAA"
-    "AQIECBAgQIAAAQLtFqjXS1fFnvH/xS3uKw6i1VavPu0DxSXovc4HDrzhzvgG9d9LYOWnLl9+7+YE"
-    "cohAgACBpghUq9vWDA4OXVCpDL+1UqlOhFD62/gGo22x+LqmNCiuyLfiv9fPj59S8f7iIqTR2fB1"
-    "GtdBCgIECBAgQIAAAQIECBAgQIAAAQJJC7zixY/6yimlmR+I/yvsa+L/FHvrIsMejgPce0qHSxtf"
-    "fuE5f7XIGk057WWbHnXL3i+f89T4vytvigVvXkzRuSHyLO7efVJp5klzPoup4RwCBAgQIECAAAEC"
-    "BAgQIFC0wLp1W9bnebiw6BxxF83rbrxx9HDROXqtfxwG3BXXPFv0uuP1v3LjxtFlRefQnwABAosR"
-    "WLv2slMqlaGnDw4Ovz4OXH8+hPp0fF37YKwV31iSDy6mZoLnTGdZ48empsY/nmC2tkfqa3tHDQkQ"
-    "IECAAAECBAgQIECAAAECBAgQ6EiBTZs2zv0PoHve8cc3fzC7d/Y1cWekX4iD2E+Jj51oZ6z/jEPX"
-    "f9Koz775VS/+vq+lsvjR0bwRs9zwwQ9+/WN31+99UZaH58ecPxEfe9hDZJwz+Ku44g9/K5957+Wb"
-    "Nn7zIY71FAECBAgQIECAAAECBAgQSF4g7sY5HHex7C846N2l0uG3FpyhJ9vHIbq91erwh+LPwNwb"
-    "1Iv8Wn/77XdeFAO8q8gQehMgQODEAqN9g4N3nhsHkZ8UP+HxSfG/k8fv+/47+bL8RP+l/MTFkzwi"
-    "ruurpVLjZyYmdtmE5IErZPg6yR9VoQgQIECAAAECBAgQIECAAAECBAikK/CK888+GNO9Ye779z7w"
-    "5WpeKj8z/ofmM/OQV0IIA3mW3xF39ZjMQrYvhMbfvuJF53453dVk2aZNZ94T8819xO7vvfvd/+/k"
-    "2eUP+5/xP5ivi6PZ67K8tDrk4UC8PRHXVOubzf7hJS959DdSXo9sBAgQIECAAAECBAgQIEBgvgIr"
-    "V77utBAOvXq+x7fquLjz9jv37bvu9lbVV/ehBer1sKNUuu/TwR76wBY/WyqFbbHFu+N3fH+8LwIE"
-    "CBQrsG7d5avr9WWPKpWycxqN8Kg4gHxOTPR9WXbw8fHPuFP/3KR1T7xcfTLPZ146MeHf6SN/Ig1f"
-    "H6nhNgECBAgQIECAAAECBAgQIECAAAECCxK45KLH1uIJ713QSQkf/LKXPeFbMd6nE44oGgECBAgQ"
-    "IECAAAECBAgQaJrA8uX3bo7DY6c2reDiCjXi0O344k51VjMEpqd3fr5SGf7bWOuHm1FvsTXi7tvf"
-    "Pzg4/NNxN+5PLraG8wgQIHAigbmh6hD61sTB6dXx38D4Z2l1o9FYE9+EckYcsl4fN+GIQ9b5o+Lt"
-    "lfHNQVl8bcq6dUfrE1jV48p/ZXJy7LficT0xZX4Cj6OeNnx9FIc7BAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBLpfYOPG0WV33HFwKIGVfnRiYtdXEsjR6xF2RIBCh6/nLkDcYXZ7"
-    "/MPw9RyGrwQF8gur1ZG5XY99JSgQP4UxzsPmD38g2sPi7RVzt+OnNZ4Wh6dL8eYp8TsOWmflucfj"
-    "8/f/EeeK48D1A0PW333sgSd78o/IMdlo5BdNTY19ticB5rFow9fzQHIIAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECBAgQIAAgW4SuP32Oy+Kw1Xril9Tfk3xGSSYnNz3J9Xquq/GHV4fVaRG"
-    "7P/MSuXKJ01O7vpCkTn0JnAcgcfFQd7HHec5Dxcu8O3B6W8HuX+z5vhvna8FCESvj8/OhktuvXV8"
-    "egGn9dyhc9P8vggQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ6B2BuMlnmNth"
-    "uOivf5qcHPtc0SH0nxO4oR7/z84ULELIU/jZTIFCBgIECLRT4GDcDfw1tdr4c269dafB6xPIG74+"
-    "AZCnCRAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECHSTwODglT8T11P47q1xAtyu"
-    "10n9YN39ezHO7UVHij8XF5xxxpZCd+Au2kB/AgQItFMgvu5+rK9vdmN8Q9Sedvbt5F6Grzv56slO"
-    "gAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAYIECpVISOwvfUqud9ocLjO7wFgrU"
-    "anvujrtOv62FLeZbulwu910534MdR4AAAQKLE8jz7Kvx+/xabey5X//6tbXFVenNswxf9+Z1t2oC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAIEeFKhURp4cB2x/vOilxwy7smx0tugc"
-    "+h8t0N8/E69LdvjoR4u4F161bt3lq4vorCcBAgS6XyA/kOfhl5YtO/1xtdr4h7t/vc1foeHr5puq"
-    "SIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQCBJgThsdVUCwe46dGhZCjssJ0CR"
-    "VoT7dz7NP5hAqpMajf7XJpBDBAIECHSNQNzleiYuZk+jUX5srbbzDXv3jt7bNYtr80IMX7cZXDsC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECRQgMDFxxdgjZLxTR++ie4W0HDrzh"
-    "zqMfcy8VgTzPdySSZcuGDaMrEskiBgECBDpYIMQh6/CWen323MnJ8ddMT7/p1g5eTBLRDV8ncRmE"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQINBagTzvG4kd+lrb5YTVZ0PId53w"
-    "KAcUJlCr7fiXuEP6XxUW4LuNBw4dOvDS7951iwABAgQWKHBXfEPNG2dm8kdOTu68dHr62psXeL7D"
-    "jyNg+Po4MB4mQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg0C0C69ePrMrz7JVF"
-    "rydm+NDU1PjeonPo/9AC9XqWyO7X+bYsGzXj9tCXy7MECBB4sMC+uNP1/+nvP/SIWm3s6ttuG598"
-    "8AHuL03AP0xL83M2AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgeQF6vXGZTHk"
-    "yUUHrddDIkO9RUuk3X96eufH4+DelxNIeW61eudzE8ghAgECBFIXCDHgp7Is/4XJydM3xJ2uf/2W"
-    "W64/kHroTs1n+LpTr5zcBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBOYhsGHD"
-    "6Io4jHXFPA5t9SF/G4d6P9/qJuo3RWBuiG+8KZWWWCSEsH2JJZxOgACBXhC4NX66RC2E7NQzz7zt"
-    "jF5YcJFrNHxdpL7eBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBFoscOjQgZfH"
-    "FgMtbjOP8vk18zjIIYkILF++8l0xynQCcX6kWr3yaQnkEIEAAQIpCwzEweuL8zy8c3a2b1+lMvzV"
-    "+P3WwcGhCzZsGD495eCdmM3wdSdeNZkJECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIzEtgNM4H5SPzOrSFB8XdOL86OTnxkRa2ULrJAnv3jt6b5/lbm1x2UeVCyO1+vSg5JxEg0MMC"
-    "j4xr3xxfxz94+HB2axzE/lSlMrJ5cHDL2h42adrSDV83jVIhAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAmkJVCp3Pi8mOrf4VGE8y26oF59DgoUI1Ovl67Is3LuQc1pzbP68ODh4"
-    "Xmtqq0qAAIHuFog7YvfHFT47vp6/Nc/LU/H19G/iIPbQmjXDle5eeetWZ/i6dbYqEyBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEChYIGwrOEBsnx+YmZl5Z/E5JFiowPT0m27NstL7"
-    "FnpeC46Pc27hyhbUVZIAAQK9JjA3N/zD8TV1vL8/+3q1OvLR+P3cLLug3GsQS1mv4eul6DmXAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAQKIC1eqVT4vR4oBVsV9xx809+/e/+ZvF"
-    "ptB9sQLx+o3Fc8Niz2/eefnLBwa2n9G8eioRIECg5wXKIYTnxO+PVCrrbh4cHH79unVb1ve8yjwA"
-    "DF/PA8khBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBDpNIIR8e9GZ8zyb6evL"
-    "dhedQ//FC0xNjd0YZ6//bPEVmnbmw8rl+uVNq6YQAQIECBwpcGb8N3u00SjvrVSGPxwHsZ9x5JNu"
-    "Hy1g+PpoD/cIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIdLzAunVbH5Nl+fOK"
-    "XkgcAP+DiYmxfUXn0H9pAnEgb8fSKjTn7Lg76+XV6uaTmlNNFQIECBA4hkA5Pva8+Lr/V3EI+wvx"
-    "+8VZtrn/GMf19EOGr3v68ls8AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBANwo0"
-    "Go2tcV2FzwbleZ7E0G43XuN2rqlW2/npOIj3b+3seZxeqxuNk15xnOc8TIAAAQLNFXhiLPfeSuWk"
-    "/65Wh69es+bqhze3fOdWK/wXrM6lk5wAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIBAegIDA9vPiKleVnSyOKz7l7Xajn8pOof+TREIjUYau1/Hgf5tWTba15RVKUKAAAEC8xFYH0L2"
-    "hv7+wzdXq0Ov27BhdMV8TurmYwxfd/PVtTYCBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAIGeEyiV6lvioh9W9MJTGdYt2qFb+q9effr740D9ZPHrCWcPDh44v/gcEhAgQKDnBFaHkP/2"
-    "oUMH/6tSGdmcZReUe07ggQUbvu7VK2/dBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECXScQd70+OcvCpcUvLHx5amr8E8XnkKBZAjfeOHo47nx6XbPqLaVO3P36qqWc71wCBAgQWJLA"
-    "mfF3jbdWKuv+tVodedaSKnXoyYavO/TCiU2AAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIEDgwQLl8uwr42OrH/x4+++XxmLP0P6+OrZSoFzOr4/1v9XKHvOs/ZTBwZEfm+exDiNAgACB"
-    "1gg8LoTw53EA+4PxzV9ntKZFmlUNX6d5XaQiQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgsECBC8rxhKEFntSKw/eXy9l7WlFYzWIFJibG7sjz7N3Fpri/e6kU7H6dwoWQgQCBnheI"
-    "A9gXlEr1L1cqI5sjRt4LIIave+EqWyMBAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gEDXCwwOrn9BCNmjil5oHM59SxzSvafoHPq3RiDPS+OxcqM11edfNf6s/2zc/Xrj/M9wJAECBAi0"
-    "TiCsjB948dZqdfjTlcq2R7SuTxqVDV+ncR2kIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECBAgQILAkgbgT8NYlFWjOyYdmZvrf3JxSqqQosG/fjv+Kg88fSyBb3F21sS2BHCIQIECAwAMC"
-    "8d+HZ2ZZ/YvxzTGbuhnF8HU3X11rI0CAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "6AmBwcGtPx4Hnp5a/GLz9+7f/8ap4nNI0FqBfEdr68+veqmUv2Tdui3r53e0owgQIECgTQKn5nn4"
-    "g0pl+N3r1488rE0929qmr63dNCNAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "oOkCeV7fnmVxI+Biv0KjUR8vNoLu7RCYmhr7bKUy8oUsC09qR7/j9YhvOOhvNPquiM//0vGO8TiB"
-    "ZgmEEH4/1vpQs+qpU5RAKc/z7PT7uzeOuF3KG41vPx7/Rc3D6njMqrnv+FqzKp5z3+14/6T7z/V/"
-    "5yHw0no9bIwD2BdOTIzdNI/jO+YQw9cdc6kEJUCAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECBAgQIPC9AoODIxvjEOzPfO8zbX/kU9PTu/697V01LEQgDiLuiAOJ7yuk+RFN44Dka9asufo3"
-    "brvtd+464mE3CTRdIP7M3zg5ufOGphdWsKMENmwYXTE7e+fqmZm5gey5Ae1wVhzVPrtUyjbE18Sz"
-    "42I2xO+5HfnL8dtXlj0xDmB/vlIZOj/+/fnrbgExfN0tV9I6CBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIEelKgVArb48BX4dtex+1Dd/TkBejRRddq37qhUjnpt+PyzyyY4PT+/sOv"
-    "jhn8/BV8IbQn0AsCe/eO3hvXue+B7+MseXP/wMDJ8bUxbCiXs0fGHbUfH4f3fzAe/IT4/fDjnNTN"
-    "D8ddw/NPVasjr6zVxt7fDQs1fN0NV9EaCBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIEelJg/fqRdXFHyRclsPh/jwNVf55ADhHaJrBnJoSh3XHo/nfa1vL4jUY2bhy99sYbRw8f/xDP"
-    "ECBAoF0Ce2amp7P/jt3mvv/yyK5nnnlFtV7vf1IczI7f+ZNCaDw5/jl45DFdent5COG91erwY2q1"
-    "8dFOX6Ph606/gvITIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAj0rMDsbLgy7qa5"
-    "rGiAB3a9DkXn0L+9AitW5L976FD2f2LXondyXX/HHQc2xRzvba+AbgQIEFiYwNe/fm0tnjH3/dFv"
-    "nzkwMPLIPA9PL5WyZ4SQPz0OZp/97ee67M88flLH6yuVkerk5GmvzbLRRqeur9SpweUmQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg0MsCa9Zc/fA4eL05AYPpZctO+0ACOURos8De"
-    "veMHY8u3t7ntMdvFNwBcHZ/Ij/mkBwkQIJCwwPT02H9PTY2/M+4IffHk5NgjG438UfHl7DXxde2G"
-    "GPuuhKMvMlp4dbV68Pfi8HXHzjB3bPBFXjGnESBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIEOgKgb6+mbnB69MTWMzuvXtH700ghwgFCDQasztj23oBrY9qGXdT/f5qdeTZRz3oDgEC"
-    "BDpQYG4YOw5h76nVxjaVy/lAfKPV+XEZ74vf3+jA5RwzcnzNvrhSOXh9fLIj3zRj+PqYl9WDBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBFIW2Nyf52EogYR3l0ozb0kghwgFCUxP"
-    "X3tzbP3HBbU/qm0IYftRD7hDgACBDheYmBi7J+6I/eHJyfGXnHxy/Yy4G/bz45I+HAeyZzp8aXPx"
-    "N1erQ9fGPztuANvwdRf89FkCAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBAbwlU"
-    "Kie9MK74zKJXHYe/3rVv33W3F51D/2IFSqVsR7EJvtP92evWDf/Ad+65QYAAgS4SuOmm3Yfibth/"
-    "Egexz2806uvi0kayLHy5k5cYQn5ZpTL8pk5bg+HrTrti8hIgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBDIsq0JIIQsK+9KIIcIBQvs2zf+9yFkf19wjPvaNxqZ3a9TuBAyECDQUoGp"
-    "qd374xD2+OTkzvPiJ2H8aNwR+4bYsN7Spq0rvnVwcOSy1pVvfmXD1803VZEAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIBAywQqlaGfisVT2N33I7XaNR2942bLLlJvFk5l9+sLK5Vt"
-    "j+jNS2DVBAj0okCttvNv4o7YmxqN/DFx/Xvip1LMdJpDHCDfWa2OPKtTchu+7pQrJScBAgQIECBA"
-    "gAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgACB+wTyJHb+SMLhAAA9S0lEQVT2DSEfc0EIfFtg"
-    "amrfH2dZfvO37xf4Z1+WzQ4V2F9rAgQIFCIwPT3233E37NfU67PnxgBvi9+zhQRZXNO++AkKH6xW"
-    "h+ayJ/9l+Dr5SyQgAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgfsFqtWtPxhv"
-    "JbAzZP6Fqamxz7ouBL4rcEM93t753ftF3spfddZZl64sMoHeBAgQKEpgevram+MQ9qtDqD8hDjR/"
-    "tKgcC+8bVsY3dn20E16/DV8v/Oo6gwABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gEAhAnGQKoldr/M821EIgKZJC8zM9L89BjyYQMiHz86ueE0COUQgQIBAYQJTU7u/NDU1/vMhlJ4Z"
-    "Q/xHYUEW1vjRMzMrfndhp7T/aMPX7TfXkQABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgMCCBeKu12fmeX7Bgk9s/gn7arVv3dD8sip2usBtt/3OXXGX1T0prCOEMLxhw+iKFLLIQIAA"
-    "gSIFpqZ2/NXk5N1PyLJ8OOb4ZpFZ5tc7vKBaHbpkfscWc5Th62LcdSVAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECCwIIEQGtviYGv/gk5qwcExw3iW7ZlpQWklu0Cgry/fFZdxOIGl"
-    "DBw+fPBFCeQQgQABAgkI7JmZnBzb2WjMPj6G+UwCgR4yQgj5zjiAfe5DHlTgk4avC8TXmgABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgMB8BM4669KV8bgUdoG8a8WK7G3zyeyY3hSY"
-    "mBjbl2XhD1NYfRze2xZz5ClkkYEAAQIpCExPX3vz5OTpPxFfH7fH1+p7U8h0nAwnx4zv3bhxdNlx"
-    "ni/0YcPXhfJrToAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQODEAjMzy18bjzrl"
-    "xEe2/Ii37907frDlXTTocIGwI40FhO8bGBj6uTSySEGAAIFUBEYbU1Nj18Th6x+JifamkuoYOZ58"
-    "4MDBXz7G44U/ZPi68EsgAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAIHjC5xz"
-    "zpbleZ5tOf4RbXum3mjM7mxbN406VmByctcXYvjPprCAUim/KoUcMhAgQCA1gbnX6nI5f1Icwv7T"
-    "1LJ9O08I2dXV6tC5376fyp+Gr1O5EnIQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQOIbA3XeXXxqHjyrHeKqtD+V5/qHp6WtvbmtTzTpWIM9T2f06e/rAwNYf6lhIwQkQINBCgYmJ"
-    "sTsmJ2vPiW/yur6FbZZSenkI+VtjgXwpRZp9ruHrZouqR4AAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQKB5AnkcvN7avHKLrxSHaccWf7Yze02gVlv5sbjm/0ph3aVSY1sKOWQgQIBA"
-    "mgI31Gu18cvi7xu/EvOFBDP+WLU6clFKuQxfp3Q1ZCFAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBwhEC1OvTcePe8Ix4q6Gb+d/v2jf99Qc217UiB0UYc5BtPJPr569ePnJNIFjEI"
-    "ECCQpMDU1PivxWBJvOHrwUAhhB0bNgyf/uDHi7pv+LooeX0JECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIECBAgAABAgQInEAghDyJHXvj0JNdr09wrTz9vQKl0t3vio/e/r3PtP2RcqPRGGl7Vw0J"
-    "ECDQYQKTk+Pj8ZMufinB2AOHDoXXpZLL8HUqV0IOAgQIECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAkcIDAwMPTXeffoRDxV0M795amrfHxfUXNsOFqjV9tydZfn1KSwhvpHh4mp125oU"
-    "sshAgACBlAVqtZ1vyLLw2+llzK9I5XXc8HV6Px0SESBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIEMhKpfzqFBjyvDGeZTfUU8giQ+cJNBrl3XGI794Ekp/UaNQvTyCHCAQIEEheYHJy"
-    "5/+On3rx+4kFPSWE2SQ+EcTwdWI/GeIQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQWL9+5Jyo8LwEJA4ePrz8HQnkEKFDBaan33RrCNkHUoif59nl8e/Ww1LIIgMBAgQSFwil0j2X"
-    "xIz/nFbONHa/Nnyd1k+FNAQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgSyRiNs"
-    "jQzloini0Oye2277nbuKzqF/ZwvE3VN3xBWEBFaxdnY2XJxADhEIECCQvECttufuer2+KQb9RkJh"
-    "k9j92vB1Qj8RohAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAYHNyyNg49v7xo"
-    "ibhL8EypVLq26Bz6d77A9PSuf4+r+PNEVhLf2HBB4W9sSMRCDAIECDykwK237v5qnueXPuRBbX8y"
-    "v2zt2stOaXvbIxoavj4Cw00CBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECxQuU"
-    "L4sZTio6R9yt+IZabcfXi86hf7cI3Lf7deGLiW8qOKdSWfe8woMIQIAAgQ4RqNXG3h9fOz+YUNxT"
-    "+/uXvbDIPIavi9TXmwABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgMARAtXq5pPi"
-    "gNPlRzxU2M24+/Z4Yc017jqBycmdfxZ/pr6YyMJ+KZEcYhAgQKAjBGZm+oeyLD+QStj478nmIrMY"
-    "vi5SX28CBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECRwg0Gie9PN5de8RDRd38"
-    "7NTUzn8sqrm+3SlQKmU7E1nZUyqVkR9NJIsYBAgQSF5g//43TmVZ438lFPQp1erWHywqj+HrouT1"
-    "JUCAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIHCUwAXleHfrUQ8VdCfP82sKaq1t"
-    "FwucdFL9fVkW4gBf8V8hhO3Fp5CAAAECnSMwOVl7W0z776kkDqFe2O7Xhq9T+SmQgwABAgQIECBA"
-    "gAABAgQIECBAgAABAgQIECBAgAABAgQIECBAoKcFKpXq8/M8OycBhP+q1U77eAI5ROgygZtu2n0o"
-    "hPzNKSwr/l17TrW67bEpZJGBAAECnSFwQz2+Oet/p5M1f9GGDaMrishj+LoIdT0JECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIPEggDjRd9aCHCrkbQjaeZaONQppr2vUCpVL5+rjI"
-    "exJYaCnumrotgRwiECBAoGMEarWxj2ZZ/neJBD713nsP/kQRWQxfF6GuJwECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAIEjBCqVoafHoeenHvFQUTfvCKHv3UU117f7BWq1a26Lq0zl"
-    "Z+yla9YMV7pf3QoJECDQPIE8D29sXrWlVYpvXHve0ios7uy+xZ3mLAIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIEmiUQQr49z5tVbUl1/inPZ352cHBoSUWcTOAEAl8/wfPtenp5"
-    "f3+4Ijb7/9rVUB8CBAh0ukCtdvpHKpWD/xXX8Zji1xJ+Pn5ax2vb/Ykdhq+Lv/ISECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI9LBApTJ8Xlz+cxIh+Mm4i+RPJpJFDAJtEChdunbt"
-    "Zb+1f/+bv9mGZloQIECgCwRGGyEM74pvGrs2gcUMVKt3/FCtlv1dO7OU2tlMLwIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIEHiyQb4uPpLHv9YOjuU+g6wXCyr6+5Zd0/TItkAAB"
-    "Ak0UWLbs0PuzLNzbxJJLKFV+/hJOXtSphq8XxeYkAgQIECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAksXOOOMoYEsa7x46ZVUIEBg8QIhvgFic//iz3cmAQIEekvglluuPxA/KeMjKaw6"
-    "hMaz2p3D8HW7xfUjQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg8IBAuZwPxU2v"
-    "VwAhQKBQgTOr1ZN+sdAEmhMgQKDDBOr18J40IuePX7Pm6oe3M4vh63Zq60WAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIEDgAYGBge0nx5ubgRAgULxACNnrYoq8+CQSECBAoDMEHv7w"
-    "xp/HpHclkLa8bNnMU9uZw/B1O7X1IkCAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IPCAQKlUnxu8Xg2EAIEkBJ6wbt2Vz0wiiRAECBDoAIGbbtp9KMacG8Au/KvRCD/czhCGr9uprRcB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgACB+wRG+7IsDMEgQCAdgUYj355OGkkI"
-    "ECCQvkCe5x9LIWWeZ09rZw7D1+3U1osAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIBAFKhW79wU/3gEDAIEUhLIf2r9+qHHp5RIFgIECKQsUK/PfCaRfD+UZReU25XF8HW7pPUhQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg8IBACA077PppIJCeQF6v2/06vcsiEQEC"
-    "qQpMT197c8z29QTynXrGGYMb2pXD8HW7pPUhQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgEAWq1ZFnZVn+gzAIEEhPIM+zF65bt2V9eskkIkCAQLICf5NCsjwvndeuHIav2yWtDwEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAIEoEEK4CgQBAmkKhJD1h1AeSjOdVAQI"
-    "EEhPIIT8CymkisPX57Yrh+HrdknrQ4AAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "0PMCAwMj3x8Rnt3zEAAIJCwQB7Bfs2HD8OkJRxSNAAECyQiUSo0vphAmz8Nj25XD8HW7pPUhQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBDoeYFSKbs6IuQ9DwGAQNoCD7/33vDqtCNK"
-    "R4AAgTQEGo3Gv6aRJDN8nciFEIMAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIBA"
-    "UwSq1a1nxl0ZL2xKMUUIEGipQJ7nQxs3ji5raRPFCRAg0AUCU1O798dl3J7AUs5rVwY7X7dLWh8C"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAIGeFgihMRxC1t/TCBZPoHME1t1++50X"
-    "dU5cSQkQIFCkQL63yO4P9F69du1lp7Qjh+HrdijrQYAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAg0NMCq1ZtOTXPs0t6GsHiCXSYQNyp/nUxct5hscUlQIBAEQJ7i2j64J55Xh548GOt"
-    "uG/4uhWqahIgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBA4QmDFivJr467Xpx3x"
-    "kJsECKQvcN7g4PBPpx9TQgIECBQrkOeNvcUmuL97X19u+DqFCyEDAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAgaUJbO6Pg9dbllbD2QQIFCFQKoWriuirJwECBDpJoNHIplPIG4Kd"
-    "r1O4DjIQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQWJJAtXryS2KB9Usq4mQC"
-    "BAoRCCH/8YGBoacW0lxTAgQIdIhAqZTdkUhUO18nciHEIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQILBYgTyEsG2xJzuPAIHiBfI8Hyk+hQQECBBIVyCEUhLD1/F3LsPX6f6YSEaA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIEDgxAKDg1f+TDxq44mPdAQBAqkK5Hn2"
-    "goGBK85ONZ9cBAgQKFogDj0fKDrDXP+4A/faduQotaOJHgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIECBAgAABAgR6USDPS1f34rqtmUCXCfTleZ/dr7vsoloOAQLNE4g7X9/bvGqLr9RoZA9b"
-    "/NnzP9Pw9fytHEmAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIEBg3gKVysiT48E/"
-    "Nu8THEiAQLICcffrS6rVbWuSDSgYAQIEChQolxuHC2z/ndbxtXr5d+608Ibh6xbiKk2AAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQINC7AnEAyK7XvXv5rbz7BE4KYfa13bcsKyJAgMDS"
-    "Ber1NIav40oMXy/9cqpAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAoP0CAwNX"
-    "nB1C+IX2d9aRAIHWCeRXbNgwuqJ19VUmQIBAZwqUy/lMCsnzPG/La7Sdr1O42jIQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAh0lUC53LctLqjcVYuyGAIEBg4duvNlGAgQIEDgaIF6"
-    "vbTs6EeKuRff+Gbn62LodSVAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECCweIH1"
-    "60dWhZBdvPgKziRAIF2BEN9YMWrT03QvkGQECBQgUCrVkxi+jktvy87XfQUYa0mAAAECBAgQIECA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECgawVmZ8PleZ6dXPQCY4Y7406UP10qzc4UnUV/AksV"
-    "yPPy6+KOphcstU4Tzn9MtXrw52u17MNNqKUEAQIEukKg0ejrL5UaCawlb8unjhi+TuBSi0CAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQINAdAhs2jK44dOjgFWmsJrxtenrHP6SRRQoC"
-    "SxNYt27rbyQyfJ3Fne23x9UYvl7aJXU2AQJdJJDnjbbsOH1isnD4xMcs/Qgff7B0QxUIECBAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI3Cdw6NCBl8cbZyTAMRsz7EoghwgEmiKwb9+O"
-    "/xcLfbopxZZe5Ier1SuftvQyKhAgQKA7BPI8rE5kJYfakcPwdTuU9SBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIEOgBgdE4i5MPJbLQG2q1nbckkkUMAk0RiDtO72hKoSYUCSGf2/3a"
-    "FwECBAjcL7AqBYj474Sdr1O4EDIQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "mI9ApXLn8+Jx583n2FYfEwdDx1vdQ30C7RaYmhr/0/gGhy+1u++x++XPq1SGk/j7fux8HiVAgED7"
-    "BPI8X9m+bsfvlOeZna+Pz+MZAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAskJ"
-    "pLIT7uempsb+b3I6AhFYukDI8zC29DJNqRB3us9S2em+KQtShAABAosXCGcs/tymnnlPU6sdp9jc"
-    "PwC+CBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBBYgkC1OvzDWRaetoQSTTs1"
-    "7j55TdOKKUQgMYGTTqq/J/5dm0ok1sVr1141mEgWMQgQIFCYQAilDYU1P7rx7Uffbc09w9etcVWV"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECghwRCyK5KZLlfqdVO+2giWcQg0HSB"
-    "m27afSiE/C1NL7y4gsv7+2cuW9ypziJAgEA3CYRHpLCa+PvYHe3IYfi6Hcp6ECBAgAABAgQIECBA"
-    "gAABAgQIECBAgAABAgQIECBAgAABAgQIdK3AunVbHxMX99wUFhiHjnZm2WgjhSwyEGidQP3Ncffr"
-    "e1tXf/6V49+5ywYGtp88/zMcSYAAga4USGL4Osoavu7KHy+LIkCAAAECBAgQIECAAAECBAgQIECA"
-    "AAECBAgQIECAAAECBAgQ6CqBRiNsjwtKYRPEO0Loe2dX4VoMgWMITE3t3h//yr3nGE8V8dDqcnnm"
-    "FUU01pMAAQIpCFSr29bEHGtTyFIq5be3I0cKv/S1Y516ECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgAABAgQIEGi6wBlnDA1kWeOlTS+8qILhLdPTb/rWok51EoGOEwhjMXJIIXYI+UiWXVBO"
-    "IYsMBAgQaLdAfBPa97e75/H6NRr59PGea+bjhq+bqakWAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIBATwmUy/mWLMtXJLDowzMz+bUJ5BCBQFsEJifH/yPOXn+yLc1O3OSRg4PrX3Di"
-    "wxxBgACB7hMolerJDF+HcHhvO4QNX7dDWQ8CBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAIGuExgY2H5yXNRrU1hYnmcfuO228ckUsshAoF0CpVLY0a5eJ+qT52H7iY7xPAECBLpTIH9i"
-    "IuuqT08fnmhHFsPX7VDWgwABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAoOsEyuWZ"
-    "S+KiVqewsDh8PZ5CDhkItFNg375dfxF3v/6XdvZ8iF5PGRwcfsZDPO8pAgQIdKvAjySysK9n2Z6Z"
-    "dmQxfN0OZT0IECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgS6TOCCcgil4UQW9el9"
-    "+8b/NZEsYhBoq0AI6bzxIO5+fVVbF68ZAQIEChZYs2a4El+HH1VwjG+3/9q3b7T6T8PXrRZWnwAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAoOsEqtXqL8Ydd89OYWFx6GlHCjlkIFCE"
-    "wOrVK38//h2oFdH7e3vmPzM4OLLxex/3CAECBLpToK8v/9F0Vhb+o11ZDF+3S1ofAgQIECBAgAAB"
-    "AgQIECBAgAABAgQIECBAgAABAgQIECBAgACBrhEIId+ayGL+c2pq/E8TySIGgbYL3Hjj6OE8z65t"
-    "e+NjN8xLpbD92E95lAABAt0nEHf8/7lUVhV/N/tiu7IYvm6XtD4ECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIAAAQIECBAgQIAAAQJdITAwMPzMuJD/kcJi4tDTG2OOkEIWGQgUJdDff+gtsfc3i+r/oL4v"
-    "rla3nvmgx9wlQIBAFwqMzs0g/3QqCyuVMsPXqVwMOQgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgcKRB3tt125P0Cb9+6bNnK9xXYX2sCSQjccsv1B+Lu1+9KIUwIWX+j0bgihSwy"
-    "ECBAoJUC1eodPxTrn9HKHguoHZYty25cwPFLOtTO10viczIBAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgEAvCQwMXPm4LMt/JoU1xyHPN+/dO3pvCllkIFC0QKmUj8cMjaJzzPWPg+Cb"
-    "V63acmoKWWQgQIBAqwQajdILW1V74XXzvXv3jh9c+HmLO8Pw9eLcnEWAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAgQINCDAuVyaXtcdp7A0g81GuEtCeQQgUASAhMTYzdlWfiTJMJk2enL"
-    "l5dflUgWMQgQINB0gY0bR5fFN5pc1PTCiy4Y/mbRpy7iRMPXi0BzCgECBAgQIECAAAECBAgQIECA"
-    "AAECBAgQIECAAAECBAgQIECAQO8JrF8/si7uNp3IoFH+7ltv3Tnde1fBigk8lEBp7KGebfNzw1m2"
-    "ub/NPbUjQIBAWwQOHDj4s7HRmrY0m1eT3PD1vJwcRIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQKCNAo1GNhTbLWtjy+O1CiHMjh/vSY8T6FWBycmxz8WdWD+fyPrPrFQedmEiWcQg"
-    "QIBAUwXim9Eub2rBJRbL89JfL7HEgk638/WCuBxMgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIECDQiwKrVm05NcvC5jTWHj45NbX7S2lkkYJAagIhod2v8+1RJ09NSB4CBAgsRWBg4MrH"
-    "xfN/Yik1mnzu/lrtmv9scs2HLGf4+iF5PEmAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIEAgbne9rO/VcZfH01KwKJXCjhRyyEAgRYFabeUfxVxfSyTbEyqVoZ9MJIsYBAgQaIpAqVQe"
-    "joVSemPJp2Ke0JTFzbOI4et5QjmMAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECg"
-    "VwU29+d5uDKF1ed59m/79u36yxSyyEAgTYHR2RDy3elku2/363TiSEKAAIElCAwODm+Ic84vXUKJ"
-    "pp8af0f7aNOLnqCg4esTAHmaAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECgtwUG"
-    "Bx92URQ4KwWFuPv2G2OOtu7umMK6ZSCwEIHZ2f498Y0Kdy7knBYe+6xqdfiJLayvNAECBNomEF9b"
-    "fz02W9a2hidoFPPMLFuW/9kJDmv604avm06qIAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAgQIECAQBcJ5FmWb0thPXHwurZq1el/kEIWGQikLHDbbb9zV/z78nupZAwhJPEakoqHHAQIdKbA"
-    "+vVDj4/J596QltLX5/buHT/Y7kCGr9strh8BAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgEDHCFQqQz8Zd1WcGzYq/CvmuPbGG0cPFx5EAAIdIVDeFWPOphE131SpbHtEGlmkIECAwKIE"
-    "8no9vy6emdTccaORfWhRq1niSUkhLHEtTidAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECDQVIE8z69uasHFF7u7VJrZs/jTnUmgtwQmJ6/5Wtz9+o8SWXVfltWHE8kiBgECBBYsUK0O"
-    "XxJP+pEFn9jaEw6XSuVCPhHE8HVrL6zqBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECHSoQB42eGIc3n5lC/Ljr9Tv27bvu9hSyyECgcwTyHQllfdVZZ126MqE8ohAgQGBeAmvWDFfi"
-    "70O/Pa+D23vQJ2q1a25rb8v7uxm+LkJdTwIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAgeQFGo1wVSIhG6VSPp5IFjEIdIzA1NTY/41h/yaRwKfMzCx/bSJZxCBAgMA8BUZL/f3Zu+LB"
-    "q+d5QhsPy9/dxmZHtTJ8fRSHOwQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgSy"
-    "rFLZ9og8z38xEYuPTEyM3ZRIFjEIdJhAOrtfxx3st5xzzpblHQYoLgECPSwwOHhgW1z+sxMkuHXV"
-    "qtM+XlQuw9dFyetLgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECCQsEBjawzXl0LA"
-    "PA/XpJBDBgKdKDA5edqfhJAl8eaFmKNy992ll3Sio8wECPSeQKUy8qPxjWi/nuLK45tZrr/xxtHD"
-    "RWUzfF2UvL4ECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQJJCpx11qUrsyy8MpFw"
-    "/1Sr7fybRLKIQaADBUYbpVLYmUrwEPKrsmzU3F4qF0QOAgSOKTA4OLwh/i70R/HJZcc8oNgHD83M"
-    "9L+lyAhexIvU15sAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQCA5gZmZFZfGUKek"
-    "ECzuOGnX6xQuhAwdLVCv978jy/IDiSzi3Gr1zp9LJIsYBAgQ+B6BdesuXx1///h4fGLt9zyZwANx"
-    "1+vf37//jVNFRjF8XaS+3gQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAkkJnHPO"
-    "luVZ1tiSSKhbarXT/jCRLGIQ6FiB6ek3fSv+vX5rKgsIIWxPJYscBAgQOFJg5crXndZoLPuzuOv1"
-    "9x35eEK3Q/w0gx1F5zF8XfQV0J8AAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQCAZ"
-    "gbvvLr807pA7mEKgEPJdWTY6m0IWGQh0ukC5XLo2ruFwIut4+sDA0FMTySIGAQIE7hNYs+bqh69Y"
-    "cfgTcfD6SamSxB25/3BiYucXi85n+LroK6A/AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIE"
-    "CBAgQIBAKgJ5CNnWRMLcdejQsrclkkUMAh0vMDExti8u4g9SWUiplNv9OpWLIQcBAtn69SOrli07"
-    "9Kk4eP20hDnq8ZMDXp9CPsPXKVwFGQgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAEC"
-    "BAoXqFaHnhtDnFd4kPsChLcdOPCGO9PIIgWB7hAolbIdCa3k/DjseE5CeUQhQKBHBQYHhzfU6+Hv"
-    "4ydu/FDKBHmevXdycvw/Usho+DqFqyADAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIBA4QJx6CiVnWhns6xvZ+EgAhDoMoF9+8b/NQ7v/WUiyyo3Go2RRLKIQYBAjwrEwetnxNfF/xuX"
-    "/5jECe4JoZzErtdzToavE/9pEY8AAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQKD1"
-    "AgMDW+d2e/zR1nc6cYc4BPWhyclrvnbiIx1BgMBCBRqNdHa/jm/4uLha3bZmoWtwPAECBJohUKmM"
-    "DMXfOf481lrbjHqtrBFC9lsp/W5k+LqVV1ttAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAgACBjhAolRpXpRK0Xg87UskiB4FuE5iaGv9EXNN/JLKukxqN+uWJZBGDAIEeERgc3LK2Uhn+"
-    "cJaF8bjkvtSXHQfEv7pixelvTCmn4euUroYsBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECbRdYv37knNj0eW1vfOyGfzs9vfPzx37KowQINEEgZFk+N3CYxFccKrw8vgY9LIkwQhAg"
-    "0PUCAwNDz8nz8r/Fhabye88JzeMnFgzt3Tt67wkPbOMBhq/biK0VAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIBAegKNRtgaU5XTSJZfk0YOKQh0r0C5nL0nrm5/IitcOzsbLk4kixgE"
-    "CHSpwODg8IZKZehDpVL+0bjEgU5ZZgjh9+MnFnw8tbyGr1O7IvIQIECAAAECBAgQIECAAAECBAgQ"
-    "IECAAAECBAgQIECAAAECBAi0TWBwcMvaELKL29bwIRrFHXC/Ojk58ZGHOMRTBAg0QWBiYuyePM+v"
-    "b0KpZpWIbwC5IJE3gDRrSeoQIJCCwNq1l51SrQ6Pxt8xvhR3/T8/hUwLyLBv2bLDly3g+LYdavi6"
-    "bdQaESBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIpCZQKvVdETM9LI1cYTzLbqin"
-    "kUUKAt0tUK+Xr8uycG8Kq4xDkedUKtXnp5BFBgIEukNg48bRZZXKyOa+vv6vxDeZvT6uKpHfdebt"
-    "Gze9zl59yy3XH5j3GW080PB1G7G1IkCAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQ"
-    "SEegWt18UpzsSWRHxfzAzMzMO9PRkYRAdwtMT7/p1iwrvS+VVcaduK9KJYscBAh0rsDAwPaT49D1"
-    "0B13HLwpvsHkrXG368FOXE0I+XVTU+OfTDW74etUr4xcBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECBAgQIECAAAECLRVoNE6+ODZY09Im8y7eeOv+/W/+5rwPdyABAksWiLuqjsUiYcmFmlAgZnlq"
-    "HJj80SaUUoIAgR4UWLv2qsFqdXi0VJrdG1/W4idpZGd2KkP8NIDPn3LK7PaU8xu+TvnqyEaAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQINAigQvKcThppEXFF1Q2DhnNlEqN6xZ0koMJ"
-    "EFiywNTU2I3xdeDPllyoSQXiTvx2v26SpTIEekWgUrnySZXK8Fv7+g7fHN/E8fq47kTeVLboK3B7"
-    "o5G98Kabdh9adIU2nNjXhh5aECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEEhK"
-    "YHCw+gtx6PmcFELFYakP1Gq7J1LIIgOBXhOIrwM74t/Bn05h3THLcwYHt3zf1NTuL6WQRwYCBNIU"
-    "WLduy/pGo+8F8c0jF8eEP3B/yjzNsAtLVc/z/EWTk2N7F3Za+482fN1+cx0JECBAgAABAgQIECBA"
-    "gAABAgQIECBAgAABAgQIECBAgAABAgQKFojDPcl8nH2el8YL5tCeQM8K1Go7Pz04OPzFOPj8+AQQ"
-    "4ktT39aY41UJZBGBAIGEBKrVrWdmWeP58c0ivxh3hv6ROHhdSiheU6KEkF8ZB68/1ZRiLS5i+LrF"
-    "wMoTIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAikJVCpDD09JvofKaSKA59/Wavt"
-    "+JcUsshAoEcFQlz3WPx+RxrrDy9Zu/aqX96//41TaeSRggCBYgRG+6rVO/5HHEh+Zpblzw2h8ZSY"
-    "oyu2tz62Z/jNqanxNx/7ufQeNXyd3jWRiAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQI"
-    "ECBAoIUCcWvZq+POkUl8NRqNa5IIIgSBHhZYvfr09x84cPA34+tCJQGG5X19M1fGHP87gSwiECDQ"
-    "RoGBgZFHlkrZs+Ibs54VwsFnh1A6vY3ti2z1vsnJnb9cZICF9jZ8vVAxxxMgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECHSsQKUyfF4csPzZNBYQvjw1teuTaWSRgkDvCtx44+jh+Npw"
-    "XRT49TQU8teuXXvZb+7f/+ZvppFHCgIEmi0wMLD9jHJ55gmNRvYD8U1hPxTrPyPLwqq5Pqm8QWwu"
-    "S6u/4lo/MjV19ytin0TeFje/FRu+np+TowgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECA"
-    "AAECBLpAIIRwVRxyyhNZyo6Yo6OGjRJxE4NA0wXK5fz6ej38r1j45KYXX3DBsLKvb9mr4mnjCz7V"
-    "CQQIJCZwQXlgYP0jyuVsY/wn/0lZlj8p/i7yfVk2+8gQ8iyZ30gKUQufOOWUxqYs2zNTSPslNDV8"
-    "vQQ8pxIgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAgVQF8jysHxwcuiDVfHIRWIhAo9H4"
-    "51tv3f3VhZxzrGPXrBmuxCGnFx3ruQIe218ul95bQF8tCRA4hsDExNgd1erQu+Iw5GXHeLqIh4az"
-    "bPTa+D1bRHM9CRCYr8AF5Wr1zGqW1R8RXz/OjgPWj8iy0ob7/8zi7eyseHv5d3ez9p6rB2T/ZNWq"
-    "lZvmPnlgvtIpHWf4OqWrIQsBAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIEGiSQBzweGrc"
-    "3PeDTSqnDIFCBUql8tww5PVLDdHfn22JNZYvtU4zzo9/P6+Pw573NKOWGgQINEegVArj9Xr+2lit"
-    "1JyKS6ryiGr1zk21Wvb+JVVxMgECxxC4oHzWWWtOnXuiXi+VZmeXnTZ3O4TZPO6Cf/r9t8unxDds"
-    "rYpvaFzZaMz9ma2KR6yM/36vir9nx9v3fa+Jj1dCaPTHHa3nTotfc38asL6P4rj/J/+jVatOe1Gn"
-    "Dl7PLcvw9XEvricIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgS6RWDNmqsfnmWH"
-    "L01kPYdmZvqWPEyeyFrEINA1AhMTu75SqQx/NC7oeSksKoRwdczxgfhtkjOFC5LlvxZ/Pn4tiShC"
-    "LFlgZua7JeIbLx64U/7Og3Ho+r7bcztWxwHrB77yOKD97dv3//ng+0c/694xBN42OXnapZOTnb2r"
-    "fwrv0DmGrYcIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQINE+gv3/mVbHafbtZ"
-    "Nq/qoiu9Z//+N04t+mwnEiDQQoGwo4XFF1r6CevWXfnMhZ7keAIECCQoEOIQ+69OTo6/Oss6e/B6"
-    "ztbwdYI/YSIRIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAg0U2A0fjp8GGpmxSXU"
-    "ipvZ5uNLON+pBAi0UGBycudfx/L/1MIWCyrdaJSuWtAJDiZAgEB6AvfEncQvqtXGR9OLtrhEhq8X"
-    "5+YsAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgACBDhGoVA5eGKM+IpG4fzo1NXZj"
-    "IlnEIEDgGAJxd9aUdr/+qXXrhn/gGDE9RIAAgU4Q+Hp819mP1Wo7/6ATws43o+Hr+Uo5jgABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAoEMFwrZUgud5ntJQZyoschBISqBWO/2GGOiW"
-    "VEI1GtnWVLLIQYAAgQUIfKbR6Hvy1NTOf1zAOR1xqOHrjrhMQhIgQIAAAQIECBAgQIAAAQIECBAg"
-    "QIAAAQIECBAgQIAAAQIECCxGoFodeVaW5T+4mHObfU4I2RdrtbG/aHZd9QgQaLbA6Gz8+7q72VUX"
-    "Wy/uxP3CanXrmYs933kECBBos0A99vuNycl9z5qeftOtbe7dlnaGr9vCrAkBAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgEARAvGj7q8uou+xe96363U49nMeJUAgJYHDh+t74tDznSlk"
-    "ioPg/VlWH0ohiwwECBA4gcAt8TXrWZOT47+cZTfMDWF35Zfh6668rBZFgAABAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECCwfv3Q46NC3Pk6ia/pFStO+4MkkghBgMAJBe64Y/c34gDhO054"
-    "YJsOCCHfvGHD8OltaqcNAQIEFiyQ5/kN/f2HfmBqavwzCz65w04wfN1hF0xcAgQIECBAgAABAgQI"
-    "ECBAgAABAgQIECBAgAABAgQIECBAgACB+QnU66Wr4pH5/I5u+VG79+4dvbflXTQgQKBpAo3G7K5Y"
-    "LJWdWx9++HC2uWmLU4gAAQJNEoifEjAZ36xyQa02tumWW64/0KSySZcxfJ305RGOAAECBAgQIECA"
-    "AAECBAgQIECAAAECBAgQIECAAAECBAgQIEBgMQLr1m1Zn+fhwsWc24Jz7i6VZt7SgrpKEiDQQoHp"
-    "6Wtvjju5fqiFLRZUutHIhjZuHF22oJMcTIAAgdYJhFj6PaVS/ri42/Uftq5NepUNX6d3TSQiQIAA"
-    "AQIECBAgQIAAAQIECBAgQIAAAQIECBAgQIAAAQIECBBYokCjUR6JuzD2L7FMU06PO0K+a9++625v"
-    "SjFFCBBoq0C9nu9oa8OHaBZfS6q3337wRQ9xiKcIECDQJoHwL41G+J+Tk+Mvm5gYu6NNTZNpY/g6"
-    "mUshCAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAQDMEVq3acmocUrykGbWaUCPu"
-    "Clne1YQ6ShAgUIDA9PSOf8iy/O8KaH3MlnFH/9dl2ai5v2PqeJAAgTYITMTXxNdMTtaeMj298/Nt"
-    "6JdkCy/CSV4WoQgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBBYrsGJF32Vx1+vT"
-    "Fnt+k8/7SK12zZebXFM5AgTaKtBIZvfrOPT42MHBO366rcvXjAABAln2zfjGtl8tl/PHTE6O7cmy"
-    "G+q9jGL4upevvrUTIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBLpMYOPG0WWNRtiS"
-    "yrJCyMdSySIHAQKLE4g7vH44nvnfizu7+WeVSvn25ldVkQABAscUOBiHrn+tVJrZUKuNj05MjN1z"
-    "zKN67EHD1z12wS2XAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQINDNAgcOHHxJHBKq"
-    "prHG/AtTU2OfTSOLFAQILF7ghnqeh52LP7+5Z8Y3dfz4wMDQU5tbVTUCBAgcJXDb3E7Xy5dnZ8eh"
-    "61/Zt++62496tsfv9PX4+i2fAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECgewTy"
-    "ELKtqSwnDi3tSCWLHAQILE1gZmbm7X19y341Vjl9aZWac3a5nM+91l3YnGqqECBA4DsC/xl/f7mu"
-    "Xu97+/T0m771nUfdOErAztdHcbhDgAABAgQIECBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECDQ"
-    "qQJxJ9ifi9k3JpJ/olb71g2JZBGDAIElCuzf/+Zvxjd37FlimaadHrO84IwztjyqaQUVIkCglwUa"
-    "cfGfzvP85ycnx8+LO13vNnj90D8Odr5+aB/PEiBAgAABAgQIECBAgAABAgQIECBAgAABAgQIECBA"
-    "gAABAgQIdIhAqZRvSyVqCGFXlu2ZSSWPHAQILF2gXK7vDqE8Egef+5debckVyqVSeShWuXLJlRQg"
-    "QKBHBfKb4y7X7wmh9PbJyWu+1qMIi1q2na8XxeYkAgQIECBAgAABAgQIECBAgAABAgQIECBAgAAB"
-    "AgQIECBAgACBlAQqlZEnxzzPSCTTXStW5L+bSBYxCBBoksC+fbsn4uD1B5tUbsll4tDkJdXqtjVL"
-    "LqQAAQI9IxBfN+6Mi31P3OX62ZOTY4+q1cZeb/B64ZffztcLN3MGAQIECBAgQIAAAQIECBAgQIAA"
-    "AQIECBAgQIAAAQIECBAgQIBAYgJ5Hq6KQ5GpfL19797xg6mEkYMAgeYJxMHFHfG15sXNq7ikSic1"
-    "GvVLY4VfW1IVJxMg0OUC+YG4wI9nWfjjZctO/8TevaP3dvmCW748w9ctJ9aAAAECBAgQIECAAAEC"
-    "BAgQIECAAAECBAgQIECAAAECBAgQIECglQIDAyOPDCG8oJU9FlC73mjM7lzA8Q4lQKCDBGq18X+u"
-    "VIY/EyM/I4XYcRj8ig0bRt9omDKFqyEDgaQEJuIb0z4SE324Vrv7M1m2ZyapdB0exvB1h19A8QkQ"
-    "IECAAAECBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECvS5QLoetcSfacgoOcRDyj6anr705hSwy"
-    "ECDQGoE8z+Pu1/9/e3fT00QQx3F8Zltj5CAHDKEtZ3wPnHwFGN8ACVc1GDDePDTxaIKK8SHEePDg"
-    "hYsXb1w88HBRDoYETDQS2m2xHhbRYlt2xv9qDOFSKLTLbPslmWzb3Zn5z2cTTr+dtVc6M3rLow7W"
-    "ajvj0muu5Z50QACBbhKoymKWJHC9IP+fFkql2Q/y3Z13gnSTtKyF8HWX3VCWgwACCCCAAAIIIIAA"
-    "AggggAACCCCAAAIIIIAAAggggAACCCCAAAII9JJALndjwBg14cqaw9B74Eot1IEAAp0R8P3+t5lM"
-    "sCGjX+7MDK2Oam8rlX8hzbTak+sRQCCxAj+k8hV56GvZGO/dwMDFxbW1fD2xq0lY4YSvE3bDKBcB"
-    "BBBAAAEEEEAAAQQQQAABBBBAAAEEEEAAAQQQQAABBBBAAAEEEEDgQCAMz12X4FHfwS9n+UkvbW/P"
-    "rJxlBcyNAAJxCEQh56mHsqnsszhmO8YcI9lsMOb76s0xruUSBBBInkColJYHPux7edPHcjptFwsF"
-    "f02pefn931+5/P8TxzgECF/HocwcCCCAAAIIIIAAAggggAACCCCAAAIIIIAAAggggAACCCCAAAII"
-    "IIAAAm0XGB6euhCG9mbbBz7xgGbmxF3piAACiRLQ+tcra/vuSdGXXCjcWn1H6iB87cLNoAYETiew"
-    "K93Xpa1K4HrVGLOaSu199P256umGpXc7BQhft1OTsRBAAAEEEEAAAQQQQAABBBBAAAEEEEAAAQQQ"
-    "QAABBBBAAAEEEEAAAQRiEwhDMy7BpMHYJmw+0ZdSySf42NyIswh0jUAUhMxkpp7LTrR33ViUHc1m"
-    "J0d9f3bJjXqoAgEEmgjU5a0dW7KL9WdpsqO1Xk+lwmhn641i8XGhST9OOSJA+NqRG0EZCCCAAAII"
-    "IIAAAggggAACCCCAAAIIIIAAAggggAACCCCAAAIIIIAAAq0I5D2lgulWenTyWq3tI6Xmw07OwdgI"
-    "IOCWwP5++kk63Yh2nD7vQmXWelEt11yohRoQ6GGBPQlTl621ZQlYf5PmS8B6S2u9KeHqTc/TXwuF"
-    "/pJSedPDRolfOuHrxN9CFoAAAggggAACCCCAAAIIIIAAAggggAACCCCAAAIIIIAAAggggAACCPSe"
-    "QCazc1VWPeLIyoNGo/HSkVooAwEEYhKoVO6Xh4ZuvZZQ5URMUx41zVguNz1SLM58OupCziOAgLIS"
-    "kg4OO0hMWp7skrYv53blWJPAdFV+rUpouibHQMLUQXSMmuepwJjw71Hr9Pd6/bdfqTz9eXhMvnWj"
-    "wB8dOMfdFW6LdwAAAABJRU5ErkJggg=="
-)
 
-def _decode(value: str) -> bytes:
-    return base64.b64decode(value.encode('ascii'))
+@lru_cache(maxsize=None)
+def asset_view(name: str) -> memoryview:
+    """Read-only view of ``static/<name>``, backed by a memory map."""
+
+    with open(STATIC_DIR / name, "rb") as handle:
+        # The mapping stays valid after the file object is closed.
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapped[: len(_LFS_POINTER_PREFIX)] == _LFS_POINTER_PREFIX:
+        raise RuntimeError(
+            f"static/{name} is a Git LFS pointer; run `git lfs pull` to fetch the image."
+        )
+    return memoryview(mapped)
+
 
 @lru_cache(maxsize=None)
-def favicon_png_bytes() -> bytes:
-    return _decode(FAVICON_PNG_BASE64)
+def static_url(name: str) -> str:
+    """URL of ``static/<name>``, versioned by content so a changed file is refetched."""
+
+    digest = hashlib.sha256(asset_view(name)).hexdigest()[:12]
+    return f"{STATIC_URL_PREFIX}/{name}?v={digest}"
+
 
 @lru_cache(maxsize=None)
+def favicon_png_bytes() -> bytes:
+    return bytes(asset_view(FAVICON_PNG))
+
+
 def sormanni_logo_png_bytes() -> bytes:
-    return _decode(SORMANNI_LOGO_PNG_BASE64)
+    return bytes(asset_view(SORMANNI_LOGO_PNG))
+
+
+__all__ = [
+    "FAVICON_PNG",
+    "SORMANNI_LOGO_PNG",
+    "STATIC_DIR",
+    "STATIC_URL_PREFIX",
+    "asset_view",
+    "favicon_png_bytes",
+    "sormanni_logo_png_bytes",
+    "static_url",
+]
@@ -0,0 +1 @@
+"""Micro-benchmarks for the sequence service clients (not shipped with the app)."""
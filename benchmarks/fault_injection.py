@@ -0,0 +1,307 @@
+"""Measure what retries and timeouts cost under realistic failure mixes.
+
+Each scenario starts a :class:`benchmarks.stand_in_server.StandInServer` that
+injects one mix of faults: connection resets, stalled responses, ``429``
+bursts, 5xx errors and truncated JSON. It then sends one batch through a
+``run_*_batch`` client. The report shows, per scenario, the batch wall time,
+the share of sequences that came back, how many attempts were retries, how
+many requests were wasted on attempts that produced nothing, and the latency
+percentiles of the logical calls (retries and backoff included).
+
+The client settings under test are the usual environment variables, so a
+sweep is one run per setting::
+
+    python -m benchmarks.fault_injection   # writes benchmarks/results/fault-injection.json
+    SEQUENCE_API_READ_TIMEOUT_SECONDS=2 SEQUENCE_API_BACKOFF_SECONDS=0.25 \\
+        python -m benchmarks.fault_injection --scenario slow --scenario 429_burst
+    python -m benchmarks.fault_injection --fault reset=0.1 --fault malformed=0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from services.api_client import client_limits
+from services.sequence_store import SequenceStore
+from services.telemetry import get_telemetry
+
+from .stand_in_server import FAULT_KINDS, LatencyProfile, StandInServer
+from .suite import (
+    RESULTS_DIR,
+    RUNNERS,
+    _git_revision,
+    _percentile_ms,
+    _run_shards,
+    make_batch,
+    write_report,
+)
+
+SCHEMA_VERSION = 1
+# Server keyword arguments per preset; ``baseline`` is the fault-free control.
+SCENARIOS: Dict[str, Dict[str, float]] = {
+    "baseline": {},
+    "resets": {"reset_rate": 0.05},
+    "slow": {"slow_rate": 0.02},
+    "429_burst": {"rate_limit_rate": 0.01, "rate_limit_burst": 8},
+    "5xx": {"error_rate": 0.05},
+    "malformed": {"malformed_rate": 0.02},
+    "mixed": {
+        "reset_rate": 0.02,
+        "slow_rate": 0.01,
+        "rate_limit_rate": 0.01,
+        "rate_limit_burst": 4,
+        "error_rate": 0.02,
+        "malformed_rate": 0.01,
+    },
+}
+_FAULT_ARGUMENTS = {kind: f"{kind}_rate" for kind in FAULT_KINDS} | {"burst": "rate_limit_burst"}
+
+
+@dataclass
+class ScenarioResult:
+    """Cost of one batch under one fault mix."""
+
+    scenario: str
+    faults: Dict[str, float]
+    sequences: int
+    seconds: float
+    succeeded: int
+    success_rate: float
+    calls: int
+    attempts: int
+    retries: int
+    wasted_requests: int
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    injected: Dict[str, int] = field(default_factory=dict)
+
+
+def parse_fault(spec: str) -> Dict[str, float]:
+    """Parse ``kind=rate`` (or ``burst=N``) into a server keyword argument."""
+
+    kind, sep, value = spec.partition("=")
+    argument = _FAULT_ARGUMENTS.get(kind.strip().lower())
+    if not sep or argument is None:
+        choices = ", ".join(sorted(_FAULT_ARGUMENTS))
+        raise ValueError(f"Fault spec {spec!r} must look like kind=rate with kind in {choices}.")
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise ValueError(f"Fault spec {spec!r} has a non-numeric value.") from exc
+    return {argument: int(number) if argument == "rate_limit_burst" else number}
+
+
+def run_scenario(
+    name: str,
+    faults: Dict[str, float],
+    *,
+    model: str,
+    size: int,
+    concurrency: int,
+    latency: LatencyProfile,
+    slow_seconds: float,
+    seed: int = 0,
+) -> ScenarioResult:
+    """Send one ``size``-sequence batch to a server injecting ``faults``."""
+
+    records = make_batch(size, 0.0, seed=seed)
+    unique_rows, _ = SequenceStore.from_records(records).unique()
+    telemetry = get_telemetry()
+    telemetry.history = max(telemetry.history, size)
+    telemetry.clear()
+
+    previous_url = os.environ.get("SEQUENCE_LIBRARIES_URL")
+    with StandInServer(
+        latency=latency, slow_seconds=slow_seconds, seed=seed, **faults
+    ) as server:
+        os.environ["SEQUENCE_LIBRARIES_URL"] = server.url
+        try:
+            started = time.perf_counter()
+            succeeded, _ = _run_shards(RUNNERS[model], unique_rows, concurrency)
+            seconds = time.perf_counter() - started
+        finally:
+            if previous_url is None:
+                os.environ.pop("SEQUENCE_LIBRARIES_URL", None)
+            else:
+                os.environ["SEQUENCE_LIBRARIES_URL"] = previous_url
+        stats = asdict(server.stats)
+
+    timings = telemetry.recent(model)
+    ok = [
+        timing
+        for timing in timings
+        if timing.error is None and (timing.status_code or 0) < 400
+    ]
+    attempts = sum(timing.attempts for timing in timings)
+    latencies = [timing.total_seconds for timing in timings]
+    return ScenarioResult(
+        scenario=name,
+        faults=dict(faults),
+        sequences=len(unique_rows),
+        seconds=seconds,
+        succeeded=succeeded,
+        success_rate=succeeded / len(unique_rows),
+        calls=len(timings),
+        attempts=attempts,
+        retries=attempts - len(timings),
+        # Only the last attempt of a successful call did useful work.
+        wasted_requests=attempts - len(ok),
+        p50_ms=_percentile_ms(latencies, 50),
+        p95_ms=_percentile_ms(latencies, 95),
+        p99_ms=_percentile_ms(latencies, 99),
+        injected={
+            counter: stats[counter]
+            for counter in (
+                "connections_reset",
+                "slow_responses",
+                "rate_limited",
+                "errors_injected",
+                "malformed_responses",
+            )
+        },
+    )
+
+
+def run(
+    scenarios: Dict[str, Dict[str, float]],
+    *,
+    model: str = "nbframe",
+    size: int = 200,
+    concurrency: int = 4,
+    latency: LatencyProfile = LatencyProfile("lognormal", 50.0, 0.4),
+    slow_seconds: float = 5.0,
+    seed: int = 0,
+    progress: Callable[[ScenarioResult], None] = lambda result: None,
+) -> Dict[str, Any]:
+    """Run every scenario and return the JSON-ready report."""
+
+    results = []
+    for name, faults in scenarios.items():
+        result = run_scenario(
+            name,
+            faults,
+            model=model,
+            size=size,
+            concurrency=concurrency,
+            latency=latency,
+            slow_seconds=slow_seconds,
+            seed=seed,
+        )
+        results.append(result)
+        progress(result)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "client": client_limits(),
+        "config": {
+            "model": model,
+            "batch_size": size,
+            "concurrency": concurrency,
+            "server_latency": asdict(latency),
+            "slow_seconds": slow_seconds,
+            "seed": seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _print_header() -> None:
+    print(
+        f"{'scenario':<12} {'seconds':>8} {'success':>8} {'calls':>6} {'retries':>8} "
+        f"{'wasted':>7} {'p50 ms':>8} {'p95 ms':>9} {'p99 ms':>9}",
+        flush=True,
+    )
+
+
+def _print_result(result: ScenarioResult) -> None:
+    print(
+        f"{result.scenario:<12} {result.seconds:>8.2f} {result.success_rate:>8.1%} "
+        f"{result.calls:>6} {result.retries:>8} {result.wasted_requests:>7} "
+        f"{result.p50_ms or 0:>8.1f} {result.p95_ms or 0:>9.1f} {result.p99_ms or 0:>9.1f}",
+        flush=True,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        dest="scenarios",
+        help="Preset fault mix; repeatable (default: all presets).",
+    )
+    parser.add_argument(
+        "--fault",
+        action="append",
+        default=[],
+        metavar="KIND=RATE",
+        help="Add a custom scenario, e.g. --fault reset=0.05 --fault burst=4. Repeatable.",
+    )
+    parser.add_argument("--model", choices=sorted(RUNNERS), default="nbframe")
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile("lognormal", 50.0, 0.4),
+        help="Stand-in processing delay (default: lognormal:50:0.4).",
+    )
+    parser.add_argument(
+        "--slow-seconds",
+        type=float,
+        default=5.0,
+        help="Stall of a slow response; set above or below the read timeout under test.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "fault-injection.json"))
+    args = parser.parse_args(argv)
+
+    try:
+        custom: Dict[str, float] = {}
+        for spec in args.fault:
+            custom.update(parse_fault(spec))
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.scenarios:
+        scenarios = {name: SCENARIOS[name] for name in args.scenarios}
+    else:
+        scenarios = {} if custom else dict(SCENARIOS)
+    if custom:
+        scenarios["custom"] = custom
+
+    limits = client_limits()
+    print(
+        f"client: {limits['max_attempts']} attempt(s), backoff {limits['backoff_seconds']}s, "
+        f"timeouts {limits['connect_timeout_seconds']}s/{limits['read_timeout_seconds']}s",
+        flush=True,
+    )
+    _print_header()
+    report = run(
+        scenarios,
+        model=args.model,
+        size=args.size,
+        concurrency=args.concurrency,
+        latency=args.latency,
+        slow_seconds=args.slow_seconds,
+        seed=args.seed,
+        progress=_print_result,
+    )
+    write_report(report, args.output)
+    print(f"Wrote {len(report['results'])} scenarios to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
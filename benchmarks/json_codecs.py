@@ -0,0 +1,97 @@
+"""Compare the JSON codecs ``post_json`` can use on each endpoint's payloads.
+
+Run with ``python -m benchmarks.json_codecs``. Codecs that are not installed
+are reported and skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any, Callable, List, Optional, Sequence
+
+from services.api_client import JsonCodec, load_json_codec
+
+from .payloads import ENDPOINTS, make_sequences, request_payload, response_payload
+
+CODECS = ("json", "orjson", "msgspec")
+
+
+def _best_per_call(func: Callable[[], Any], repeat: int) -> float:
+    number, _ = timeit.Timer(func).autorange()
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _available_codecs(names: Sequence[str]) -> List[JsonCodec]:
+    codecs = []
+    for name in names:
+        try:
+            codecs.append(load_json_codec(name))
+        except ImportError:
+            print(f"# {name}: not installed, skipped")
+    return codecs
+
+
+def run(
+    *,
+    codecs: Sequence[str] = CODECS,
+    panel_size: int = 1000,
+    repeat: int = 5,
+) -> List[dict]:
+    """Time encoding requests and decoding responses for every endpoint."""
+
+    sequence_id, sequence = make_sequences(1)[0]
+    rows = []
+    for codec in _available_codecs(codecs):
+        for endpoint in ENDPOINTS:
+            request = request_payload(endpoint, sequence_id, sequence)
+            response = codec.dumps(response_payload(endpoint, sequence_id, sequence))
+            encode = _best_per_call(lambda: codec.dumps(request), repeat)
+            decode = _best_per_call(lambda: codec.loads(response), repeat)
+            rows.append(
+                {
+                    "codec": codec.name,
+                    "endpoint": endpoint,
+                    "request_bytes": len(codec.dumps(request)),
+                    "response_bytes": len(response),
+                    "encode_us": encode * 1e6,
+                    "decode_us": decode * 1e6,
+                    "panel_ms": (encode + decode) * panel_size * 1e3,
+                }
+            )
+    return rows
+
+
+def _print_table(rows: List[dict], panel_size: int) -> None:
+    header = (
+        f"{'codec':<8} {'endpoint':<9} {'req B':>7} {'resp B':>8} "
+        f"{'encode us':>10} {'decode us':>10} {f'{panel_size} seqs ms':>14}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['codec']:<8} {row['endpoint']:<9} {row['request_bytes']:>7} "
+            f"{row['response_bytes']:>8} {row['encode_us']:>10.1f} "
+            f"{row['decode_us']:>10.1f} {row['panel_ms']:>14.1f}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codec", action="append", choices=CODECS, dest="codecs")
+    parser.add_argument("--panel-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = run(
+        codecs=args.codecs or CODECS,
+        panel_size=args.panel_size,
+        repeat=args.repeat,
+    )
+    _print_table(rows, args.panel_size)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
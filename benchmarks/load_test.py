@@ -0,0 +1,545 @@
+"""Multi-session load test for the Streamlit app.
+
+Starts ``streamlit run app.py`` as a subprocess against a
+:class:`benchmarks.stand_in_server.StandInServer` backend. It then drives
+``N`` concurrent headless sessions over the app's websocket protocol, the same
+messages a browser tab sends. Each session lands on Home, opens Sequencing,
+uploads a CSV, picks a model, runs the batch, then visits Performance and
+returns to Home::
+
+    python -m benchmarks.load_test --sessions 20 --rows 200 --model NbFrame \\
+        --latency lognormal:150:0.4 --output load.json
+
+It reports rerun latency (message sent to script finished) and end-to-end
+batch latency per session. It also reports the Streamlit server process's CPU
+and resident memory, sampled from ``/proc`` (Linux only). ``AppTest`` is not
+used because it swaps process-global runtime state on every run, so
+concurrent instances corrupt each other's sessions. Requires the
+``websockets`` package (installed alongside Streamlit's server).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import requests
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.Common_pb2 import FileUploaderState, UploadedFileInfo
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+try:
+    from websockets.asyncio.client import connect as _ws_connect
+except ImportError:  # pragma: no cover - websockets < 13
+    try:
+        from websockets import connect as _ws_connect
+    except ImportError:
+        _ws_connect = None
+
+from .payloads import make_sequences
+from .stand_in_server import LatencyProfile, StandInServer
+
+APP_DIR = Path(__file__).resolve().parent.parent
+MODELS = ("AbNatiV", "NbForge", "NbFrame", "NanoMelt")
+# Header navigation keys, see components/header.py.
+NAV_KEYS = {"Home": "home", "Sequencing": "seq", "Performance": "performance"}
+_FINISHED = {
+    ForwardMsg.FINISHED_SUCCESSFULLY,
+    ForwardMsg.FINISHED_WITH_COMPILE_ERROR,
+}
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class SessionReport:
+    session: int
+    steps: List[Dict[str, Any]] = field(default_factory=list)
+    batch_seconds: Optional[float] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def rerun_seconds(self) -> List[float]:
+        return [step["seconds"] for step in self.steps if step["step"] != "run_batch"]
+
+
+@dataclass
+class ResourceSample:
+    elapsed_seconds: float
+    cpu_percent: Optional[float]
+    rss_bytes: Optional[int]
+
+
+class HeadlessSession:
+    """One browser tab, reduced to the websocket messages the app reacts to."""
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session_id: Optional[str] = None
+        self.widgets: Dict[Tuple[str, str], Any] = {}
+        self.alerts: List[Tuple[int, str]] = []
+        self.exceptions: List[str] = []
+        self._states: Dict[str, WidgetState] = {}
+        self._ws = None
+
+    async def __aenter__(self) -> "HeadlessSession":
+        ws_url = self.base_url.replace("http", "ws", 1) + "/_stcore/stream"
+        self._ws = await _ws_connect(ws_url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._ws.close()
+
+    def widget(self, kind: str, label: str):
+        try:
+            return self.widgets[(kind, label)]
+        except KeyError:
+            raise LookupError(f"No {kind} labelled {label!r} on the page.") from None
+
+    def widget_by_key(self, kind: str, key: str):
+        for (widget_kind, _), element in self.widgets.items():
+            if widget_kind == kind and element.id.endswith(f"-{key}"):
+                return element
+        raise LookupError(f"No {kind} with key {key!r} on the page.")
+
+    def nav_button(self, page: str):
+        return self.widget_by_key("button", NAV_KEYS[page])
+
+    async def rerun(self, trigger: Optional[str] = None) -> float:
+        """Send the current widget states (plus a button trigger); time the rerun."""
+
+        states = list(self._states.values())
+        if trigger is not None:
+            states.append(WidgetState(id=trigger, trigger_value=True))
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        message.rerun_script.page_script_hash = ""
+        message.rerun_script.widget_states.widgets.extend(states)
+        started = time.perf_counter()
+        await self._ws.send(message.SerializeToString())
+        await self._receive_until(
+            lambda msg: msg.WhichOneof("type") == "script_finished"
+            and msg.script_finished in _FINISHED,
+            "script_finished",
+        )
+        return time.perf_counter() - started
+
+    def set_radio(self, element, option: str) -> None:
+        if "raw_value" in element.DESCRIPTOR.fields_by_name:
+            # Newer Streamlit releases send the formatted option, older ones its index.
+            state = WidgetState(id=element.id, string_value=option)
+        else:
+            index = list(element.options).index(option)
+            state = WidgetState(id=element.id, int_value=index)
+        self._states[element.id] = state
+
+    async def upload(self, element, name: str, data: bytes) -> None:
+        """Upload ``data`` the way the file uploader widget does, then select it."""
+
+        request_id = uuid.uuid4().hex
+        message = BackMsg()
+        message.file_urls_request.request_id = request_id
+        message.file_urls_request.file_names.append(name)
+        message.file_urls_request.session_id = self.session_id or ""
+        await self._ws.send(message.SerializeToString())
+        response = await self._receive_until(
+            lambda msg: msg.WhichOneof("type") == "file_urls_response"
+            and msg.file_urls_response.response_id == request_id,
+            "file_urls_response",
+        )
+        urls = response.file_urls_response.file_urls[0]
+        upload_url = urls.upload_url
+        if upload_url.startswith("/"):
+            upload_url = self.base_url + upload_url
+        reply = await asyncio.to_thread(
+            requests.put,
+            upload_url,
+            files={"file": (name, data, "text/csv")},
+            timeout=self.timeout,
+        )
+        reply.raise_for_status()
+        self._states[element.id] = WidgetState(
+            id=element.id,
+            file_uploader_state_value=FileUploaderState(
+                uploaded_file_info=[
+                    UploadedFileInfo(
+                        name=name, size=len(data), file_id=urls.file_id, file_urls=urls
+                    )
+                ]
+            ),
+        )
+
+    async def _receive_until(self, done, waiting_for: str) -> ForwardMsg:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timed out waiting for {waiting_for}.")
+            message = ForwardMsg()
+            message.ParseFromString(await asyncio.wait_for(self._ws.recv(), remaining))
+            self._observe(message)
+            if done(message):
+                return message
+
+    def _observe(self, message: ForwardMsg) -> None:
+        kind = message.WhichOneof("type")
+        if kind == "new_session":
+            # Every script run starts with new_session; the page is rebuilt.
+            self.session_id = message.new_session.initialize.session_id or self.session_id
+            self.widgets.clear()
+            self.alerts.clear()
+            self.exceptions.clear()
+        elif kind == "delta" and message.delta.WhichOneof("type") == "new_element":
+            element = message.delta.new_element
+            element_kind = element.WhichOneof("type")
+            if element_kind in ("button", "radio", "file_uploader"):
+                widget = getattr(element, element_kind)
+                self.widgets[(element_kind, widget.label)] = widget
+            elif element_kind == "alert":
+                self.alerts.append((element.alert.format, element.alert.body))
+            elif element_kind == "exception":
+                exception = element.exception
+                self.exceptions.append(f"{exception.type}: {exception.message}")
+
+
+def _upload_csv(rows: int, seed: int) -> bytes:
+    lines = ["sequence_id,sequence"]
+    lines += [f"s{seed}_{sid},{seq}" for sid, seq in make_sequences(rows, seed=seed)]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def run_session(
+    index: int,
+    base_url: str,
+    *,
+    model: str,
+    rows: int,
+    think_seconds: float,
+    timeout: float,
+) -> SessionReport:
+    """Walk one session through the app, timing every rerun."""
+
+    from pages.sequencing import MODEL_SELECTION_KEY
+
+    report = SessionReport(session=index)
+    rng = random.Random(index)
+
+    async def step(session: HeadlessSession, name: str, trigger=None) -> None:
+        if think_seconds:
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think_seconds)
+        trigger_id = trigger.id if trigger is not None else None
+        report.steps.append({"step": name, "seconds": await session.rerun(trigger_id)})
+        report.errors.extend(f"{name}: {error}" for error in session.exceptions)
+
+    try:
+        async with HeadlessSession(base_url, timeout) as session:
+            await step(session, "land")
+            await step(session, "open_sequencing", session.nav_button("Sequencing"))
+            uploader = next(
+                w for (kind, _), w in session.widgets.items() if kind == "file_uploader"
+            )
+            await session.upload(uploader, f"session_{index}.csv", _upload_csv(rows, index))
+            await step(session, "upload")
+            session.set_radio(session.widget_by_key("radio", MODEL_SELECTION_KEY), model)
+            await step(session, "select_model")
+            await step(session, "run_batch", session.widget("button", "Run"))
+            report.batch_seconds = report.steps[-1]["seconds"]
+            alerts = session.alerts
+            report.errors.extend(
+                f"run_batch: {body}" for level, body in alerts if level == Alert.ERROR
+            )
+            if not any(
+                level == Alert.SUCCESS and body.startswith("Processed")
+                for level, body in alerts
+            ):
+                report.errors.append("run_batch: no results were reported.")
+            await step(session, "open_performance", session.nav_button("Performance"))
+            await step(session, "back_home", session.nav_button("Home"))
+    except Exception as exc:  # noqa: BLE001 - one broken session must not stop the rest
+        report.errors.append(f"{type(exc).__name__}: {exc}")
+    return report
+
+
+def _process_usage(pid: int) -> Tuple[Optional[float], Optional[int]]:
+    """``(cpu_seconds, rss_bytes)`` of ``pid`` from ``/proc``; ``None`` elsewhere."""
+
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as handle:
+            # Field 2 (comm) may contain spaces; everything after ")" is fixed.
+            fields = handle.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm", encoding="ascii") as handle:
+            rss_pages = int(handle.read().split()[1])
+    except OSError:
+        return None, None
+    return (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS, rss_pages * _PAGE_SIZE
+
+
+async def _sample_resources(
+    pid: int, samples: List[ResourceSample], interval: float
+) -> None:
+    started = last_wall = time.perf_counter()
+    last_cpu, _ = _process_usage(pid)
+    while True:
+        await asyncio.sleep(interval)
+        wall = time.perf_counter()
+        cpu, rss = _process_usage(pid)
+        cpu_percent = (
+            100.0 * (cpu - last_cpu) / (wall - last_wall)
+            if cpu is not None and last_cpu is not None
+            else None
+        )
+        samples.append(ResourceSample(wall - started, cpu_percent, rss))
+        last_wall, last_cpu = wall, cpu
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(
+    backend_url: str,
+    port: int,
+    *,
+    log_path: Optional[str] = None,
+    startup_timeout: float = 60.0,
+) -> subprocess.Popen:
+    """Launch the app headless on ``port`` and wait until it reports healthy.
+
+    Server output goes to ``log_path`` when given and is discarded otherwise.
+    """
+
+    env = {
+        **os.environ,
+        "SEQUENCE_LIBRARIES_URL": backend_url,
+        "SEQUENCE_LOG_LEVEL": os.environ.get("SEQUENCE_LOG_LEVEL", "WARNING"),
+    }
+    log = open(log_path, "ab") if log_path else open(os.devnull, "wb")
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", "app.py",
+            "--server.headless", "true",
+            "--server.address", "127.0.0.1",
+            "--server.port", str(port),
+            # The harness is a trusted local client without a browser cookie jar.
+            "--server.enableXsrfProtection", "false",
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=APP_DIR,
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    log.close()
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(
+                f"Streamlit exited with code {process.returncode} during startup."
+            )
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/_stcore/health", timeout=1).ok:
+                return process
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    process.terminate()
+    raise RuntimeError("Streamlit did not become healthy in time.")
+
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "max": None}
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "max": float(max(values)),
+    }
+
+
+async def _drive(
+    base_url: str,
+    pid: int,
+    sessions: int,
+    ramp_seconds: float,
+    sample_seconds: float,
+    **session_options: Any,
+) -> Tuple[List[SessionReport], List[ResourceSample]]:
+    samples: List[ResourceSample] = []
+    sampler = asyncio.create_task(_sample_resources(pid, samples, sample_seconds))
+
+    async def start(index: int) -> SessionReport:
+        if ramp_seconds and sessions > 1:
+            await asyncio.sleep(ramp_seconds * index / (sessions - 1))
+        return await run_session(index, base_url, **session_options)
+
+    try:
+        reports = await asyncio.gather(*(start(index) for index in range(sessions)))
+    finally:
+        sampler.cancel()
+    return list(reports), samples
+
+
+def run(
+    *,
+    sessions: int = 10,
+    rows: int = 100,
+    model: str = "NanoMelt",
+    ramp_seconds: float = 0.0,
+    think_seconds: float = 0.0,
+    timeout: float = 600.0,
+    latency: LatencyProfile = LatencyProfile(),
+    sample_seconds: float = 0.5,
+    server_log: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run ``sessions`` concurrent sessions and return the JSON-ready report."""
+
+    if _ws_connect is None:
+        raise RuntimeError(
+            "The load test needs the 'websockets' package (pip install websockets)."
+        )
+    if model not in MODELS:
+        raise ValueError(f"Unknown model {model!r}; choose from {', '.join(MODELS)}.")
+
+    port = _free_port()
+    with StandInServer(latency=latency) as backend:
+        app = start_app(backend.url, port, log_path=server_log)
+        try:
+            _, baseline_rss = _process_usage(app.pid)
+            started = time.perf_counter()
+            reports, samples = asyncio.run(
+                _drive(
+                    f"http://127.0.0.1:{port}",
+                    app.pid,
+                    sessions,
+                    ramp_seconds,
+                    sample_seconds,
+                    model=model,
+                    rows=rows,
+                    think_seconds=think_seconds,
+                    timeout=timeout,
+                )
+            )
+            wall_seconds = time.perf_counter() - started
+        finally:
+            app.terminate()
+            app.wait(timeout=30)
+        backend_requests = backend.stats.requests
+
+    cpu = [s.cpu_percent for s in samples if s.cpu_percent is not None]
+    rss = [s.rss_bytes for s in samples if s.rss_bytes is not None]
+    batches = [
+        r.batch_seconds for r in reports if r.batch_seconds is not None and not r.errors
+    ]
+    return {
+        "config": {
+            "sessions": sessions,
+            "rows": rows,
+            "model": model,
+            "ramp_seconds": ramp_seconds,
+            "think_seconds": think_seconds,
+            "backend_latency": asdict(latency),
+            "cpu_count": os.cpu_count(),
+        },
+        "summary": {
+            "wall_seconds": wall_seconds,
+            "sessions_ok": sum(not r.errors for r in reports),
+            "sequences_per_second": rows * len(batches) / wall_seconds,
+            "backend_requests": backend_requests,
+            "rerun_seconds": _percentiles([s for r in reports for s in r.rerun_seconds]),
+            "batch_seconds": _percentiles(batches),
+            "server_cpu_percent_mean": float(np.mean(cpu)) if cpu else None,
+            "server_cpu_percent_peak": max(cpu) if cpu else None,
+            "server_rss_mib_idle": baseline_rss / 2**20 if baseline_rss else None,
+            "server_rss_mib_peak": max(rss) / 2**20 if rss else None,
+        },
+        "sessions": [
+            {**asdict(r), "rerun_seconds": _percentiles(r.rerun_seconds)} for r in reports
+        ],
+        "resources": [asdict(sample) for sample in samples],
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    summary = report["summary"]
+    print(
+        f"{report['config']['sessions']} session(s), {summary['sessions_ok']} ok, "
+        f"{summary['wall_seconds']:.1f} s wall, "
+        f"{summary['sequences_per_second']:.1f} sequences/s overall"
+    )
+    for label in ("rerun_seconds", "batch_seconds"):
+        stats = summary[label]
+        if stats["p50"] is not None:
+            print(
+                f"  {label.replace('_seconds', ''):<6} p50 {stats['p50'] * 1e3:8.0f} ms  "
+                f"p95 {stats['p95'] * 1e3:8.0f} ms  max {stats['max'] * 1e3:8.0f} ms"
+            )
+    if summary["server_cpu_percent_mean"] is not None:
+        print(
+            f"  cpu    mean {summary['server_cpu_percent_mean']:.0f}%  "
+            f"peak {summary['server_cpu_percent_peak']:.0f}% of one core (server process)"
+        )
+    if summary["server_rss_mib_peak"] is not None:
+        print(
+            f"  rss    idle {summary['server_rss_mib_idle']:.0f} MiB  "
+            f"peak {summary['server_rss_mib_peak']:.0f} MiB"
+        )
+    for session in report["sessions"]:
+        for error in session["errors"]:
+            print(f"  session {session['session']}: {error}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=100, help="Sequences per uploaded CSV.")
+    parser.add_argument("--model", choices=MODELS, default="NanoMelt")
+    parser.add_argument("--ramp-seconds", type=float, default=0.0)
+    parser.add_argument("--think-seconds", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=600.0, help="Per-rerun timeout.")
+    parser.add_argument(
+        "--latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile("lognormal", 150.0, 0.4),
+        help="Stand-in processing delay (default lognormal:150:0.4).",
+    )
+    parser.add_argument("--output", help="Write the full report as JSON.")
+    parser.add_argument("--server-log", help="Append the Streamlit server's output here.")
+    args = parser.parse_args(argv)
+
+    report = run(
+        sessions=args.sessions,
+        rows=args.rows,
+        model=args.model,
+        ramp_seconds=args.ramp_seconds,
+        think_seconds=args.think_seconds,
+        timeout=args.timeout,
+        latency=args.latency,
+        server_log=args.server_log,
+    )
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    return 0 if report["summary"]["sessions_ok"] == args.sessions else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+"""Deterministic request and response payloads shaped like each endpoint's traffic."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from services.validation import STANDARD_RESIDUES
+
+ENDPOINTS = ("abnativ", "nanomelt", "nbforge", "nbframe")
+_FRAMEWORK_LENGTH = 120
+_ATOMS_PER_RESIDUE = 8
+
+
+def make_sequences(count: int, *, seed: int = 0) -> List[Tuple[str, str]]:
+    """Return ``count`` ``(sequence_id, sequence)`` pairs of VHH-like length."""
+
+    rng = random.Random(seed)
+    return [
+        (
+            f"seq_{index:06d}",
+            "".join(rng.choices(STANDARD_RESIDUES, k=rng.randint(110, 130))),
+        )
+        for index in range(count)
+    ]
+
+
+def request_payload(endpoint: str, sequence_id: str, sequence: str) -> Dict[str, Any]:
+    """Request body the client sends to ``endpoint`` for one sequence."""
+
+    if endpoint == "abnativ":
+        return {
+            "sequence": sequence,
+            "sequence_id": sequence_id,
+            "nativeness_type": "VHH",
+            "do_align": True,
+            "is_vhh": True,
+        }
+    if endpoint == "nanomelt":
+        return {"sequence": sequence}
+    if endpoint == "nbforge":
+        return {
+            "sequence": sequence,
+            "vhh_name": sequence_id,
+            "VHH_name": sequence_id,
+            "no_minimize": False,
+            "nbframe": False,
+            "cpu": True,
+        }
+    if endpoint == "nbframe":
+        return {
+            "sequence": sequence,
+            "sequence_id": sequence_id,
+            "kinked_threshold": 0.7,
+            "extended_threshold": 0.4,
+            "mode": "sequence",
+        }
+    raise ValueError(f"Unknown endpoint {endpoint!r}.")
+
+
+def _pdb_block(sequence: str, rng: random.Random) -> str:
+    lines = []
+    serial = 1
+    for residue_index, residue in enumerate(sequence, start=1):
+        for atom in ("N", "CA", "C", "O", "CB", "CG", "CD", "CE")[:_ATOMS_PER_RESIDUE]:
+            lines.append(
+                f"ATOM  {serial:5d} {atom:<4} {residue:>3} A{residue_index:4d}    "
+                f"{rng.uniform(-50, 50):8.3f}{rng.uniform(-50, 50):8.3f}"
+                f"{rng.uniform(-50, 50):8.3f}  1.00{rng.uniform(20, 99):6.2f}"
+                f"           {atom[0]}"
+            )
+            serial += 1
+    lines.append("END")
+    return "\n".join(lines)
+
+
+def response_payload(
+    endpoint: str, sequence_id: str, sequence: str, *, seed: int = 0
+) -> Dict[str, Any]:
+    """Response body ``endpoint`` returns for one sequence, at realistic size."""
+
+    rng = random.Random(f"{seed}:{endpoint}:{sequence_id}")
+    if endpoint == "abnativ":
+        return {
+            "sequence_id": sequence_id,
+            "scores": {
+                "AbNatiV VHH Score": rng.random(),
+                "AbNatiV CDR1-VHH Score": rng.random(),
+                "AbNatiV CDR2-VHH Score": rng.random(),
+                "AbNatiV CDR3-VHH Score": rng.random(),
+            },
+            "aligned_sequence": sequence.ljust(149, "-"),
+            "residue_profile": [
+                {
+                    "position": position,
+                    "residue": residue,
+                    "score": rng.random(),
+                    "liability": rng.random() < 0.05,
+                }
+                for position, residue in enumerate(sequence, start=1)
+            ],
+        }
+    if endpoint == "nanomelt":
+        return {
+            "sequence": sequence,
+            "prediction": {
+                "ID": sequence_id,
+                "Sequence": sequence,
+                "Aligned Sequence": sequence.ljust(149, "-"),
+                "NanoMelt Tm (C)": rng.uniform(50, 80),
+            },
+        }
+    if endpoint == "nbforge":
+        return {
+            "sequence_id": sequence_id,
+            "sequence": sequence,
+            "summary": {
+                "plddt": rng.uniform(60, 95),
+                "rmsd": rng.uniform(0.2, 3.0),
+                "minimized": True,
+            },
+            "per_residue_plddt": [rng.uniform(40, 99) for _ in sequence],
+            "pdb": _pdb_block(sequence, rng),
+        }
+    if endpoint == "nbframe":
+        prob_kinked = rng.random()
+        return {
+            "sequence_id": sequence_id,
+            "sequence": sequence,
+            "prediction": {
+                "label": "kinked" if prob_kinked >= 0.7 else "extended",
+                "prob_kinked": prob_kinked,
+            },
+            "thresholds": {"kinked": 0.7, "extended": 0.4},
+        }
+    raise ValueError(f"Unknown endpoint {endpoint!r}.")
+
+
+PAYLOAD_BUILDERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "request": request_payload,
+    "response": response_payload,
+}
+
+
+__all__ = [
+    "ENDPOINTS",
+    "PAYLOAD_BUILDERS",
+    "make_sequences",
+    "request_payload",
+    "response_payload",
+]
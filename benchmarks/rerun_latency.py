@@ -0,0 +1,223 @@
+"""Script rerun latency per page, as a widget interaction sees it.
+
+Each page is opened in a headless :class:`streamlit.testing.v1.AppTest` session
+and rerun repeatedly. The report gives the first run and the p50/p95 of the
+warm reruns, once without hot reload and once with ``SEQUENCE_DEV_MODE=1``,
+which reloads the page module on every rerun. It also opens each page once
+in a fresh interpreter, where lazy page imports pay off, and counts the app
+modules that first run imported. To compare with an older ``app.py``, point
+``--app`` at a copy of it::
+
+    python -m benchmarks.rerun_latency   # writes benchmarks/results/rerun-latency.json
+    git show HEAD~1:app.py > app_before.py
+    python -m benchmarks.rerun_latency --app app_before.py --mode prod
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from streamlit.testing.v1 import AppTest
+
+from .stand_in_server import StandInServer
+from .suite import RESULTS_DIR, _git_revision, _percentile_ms, write_report
+
+SCHEMA_VERSION = 1
+PAGES = ("Home", "Sequencing", "Database", "Contact Us", "Performance")
+MODES = {"prod": "0", "dev": "1"}
+_APP_PACKAGES = ("pages", "components", "services")
+_COLD_SCRIPT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+started = time.perf_counter()
+session = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[3]))
+session.query_params["page"] = sys.argv[2]
+session.run()
+print(json.dumps({
+    "ms": (time.perf_counter() - started) * 1e3,
+    "error": str(session.exception[0].value) if session.exception else None,
+    "modules": sorted(m for m in sys.modules if m.split(".")[0] in sys.argv[4:]),
+}))
+"""
+
+
+@dataclass
+class RerunResult:
+    """First run and warm rerun timings of one page in one mode."""
+
+    app: str
+    mode: str
+    page: str
+    first_run_ms: float
+    reruns: int
+    p50_ms: Optional[float]
+    p95_ms: Optional[float]
+    mean_ms: Optional[float]
+    samples_ms: List[float] = field(default_factory=list)
+    cold_first_run_ms: Optional[float] = None
+    cold_modules: Optional[int] = None
+
+
+def measure_page(
+    app: str, page: str, mode: str, *, reruns: int, timeout: float
+) -> RerunResult:
+    """Open ``page`` in a fresh session and time ``reruns`` reruns of it."""
+
+    previous = os.environ.get("SEQUENCE_DEV_MODE")
+    os.environ["SEQUENCE_DEV_MODE"] = MODES[mode]
+    try:
+        # AppTest resolves relative paths against this file, not the cwd.
+        session = AppTest.from_file(os.path.abspath(app), default_timeout=timeout)
+        session.query_params["page"] = page
+        started = time.perf_counter()
+        session.run()
+        first_run = time.perf_counter() - started
+        if session.exception:
+            raise RuntimeError(f"{page} raised: {session.exception[0].value}")
+        samples = []
+        for _ in range(reruns):
+            started = time.perf_counter()
+            session.run()
+            samples.append(time.perf_counter() - started)
+    finally:
+        if previous is None:
+            os.environ.pop("SEQUENCE_DEV_MODE", None)
+        else:
+            os.environ["SEQUENCE_DEV_MODE"] = previous
+
+    return RerunResult(
+        app=app,
+        mode=mode,
+        page=page,
+        first_run_ms=first_run * 1e3,
+        reruns=len(samples),
+        p50_ms=_percentile_ms(samples, 50),
+        p95_ms=_percentile_ms(samples, 95),
+        mean_ms=1e3 * sum(samples) / len(samples) if samples else None,
+        samples_ms=[round(sample * 1e3, 3) for sample in samples],
+    )
+
+
+def measure_cold(app: str, page: str, *, timeout: float) -> Dict[str, Any]:
+    """First run of ``page`` in a new interpreter, and the app modules it imported."""
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _COLD_SCRIPT,
+            os.path.abspath(app),
+            page,
+            str(timeout),
+            *_APP_PACKAGES,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env={**os.environ, "SEQUENCE_DEV_MODE": "0"},
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Cold run of {page} failed: {completed.stderr.strip()[-500:]}")
+    outcome = json.loads(completed.stdout.strip().splitlines()[-1])
+    if outcome["error"]:
+        raise RuntimeError(f"{page} raised: {outcome['error']}")
+    return outcome
+
+
+def run(
+    *,
+    app: str = "app.py",
+    pages: Sequence[str] = PAGES,
+    modes: Sequence[str] = tuple(MODES),
+    reruns: int = 30,
+    timeout: float = 60.0,
+    progress: Callable[[RerunResult], None] = lambda result: None,
+) -> Dict[str, Any]:
+    """Measure every page in every mode and return the JSON-ready report."""
+
+    results = []
+    previous_url = os.environ.get("SEQUENCE_LIBRARIES_URL")
+    previous_warmup = os.environ.get("SEQUENCE_WARMUP")
+    # Pages that probe their endpoint get an instant local answer.
+    with StandInServer() as backend:
+        os.environ["SEQUENCE_LIBRARIES_URL"] = backend.url
+        os.environ["SEQUENCE_WARMUP"] = "0"
+        try:
+            for mode in modes:
+                for page in pages:
+                    result = measure_page(app, page, mode, reruns=reruns, timeout=timeout)
+                    if mode == "prod":
+                        cold = measure_cold(app, page, timeout=timeout)
+                        result.cold_first_run_ms = cold["ms"]
+                        result.cold_modules = len(cold["modules"])
+                    results.append(result)
+                    progress(result)
+        finally:
+            for name, value in (
+                ("SEQUENCE_LIBRARIES_URL", previous_url),
+                ("SEQUENCE_WARMUP", previous_warmup),
+            ):
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _print_result(result: RerunResult) -> None:
+    cold = (
+        f"  cold {result.cold_first_run_ms:7.1f} ms, {result.cold_modules} modules"
+        if result.cold_first_run_ms is not None
+        else ""
+    )
+    print(
+        f"{result.mode:<5} {result.page:<12} first {result.first_run_ms:8.1f} ms  "
+        f"p50 {result.p50_ms or 0:7.1f} ms  p95 {result.p95_ms or 0:7.1f} ms{cold}",
+        flush=True,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="app.py", help="Streamlit script to measure.")
+    parser.add_argument("--page", action="append", choices=PAGES, dest="pages")
+    parser.add_argument("--mode", action="append", choices=sorted(MODES), dest="modes")
+    parser.add_argument("--reruns", type=int, default=30)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "rerun-latency.json"))
+    args = parser.parse_args(argv)
+
+    report = run(
+        app=args.app,
+        pages=args.pages or PAGES,
+        modes=args.modes or tuple(MODES),
+        reruns=args.reruns,
+        timeout=args.timeout,
+        progress=_print_result,
+    )
+    write_report(report, args.output)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
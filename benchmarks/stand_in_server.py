@@ -0,0 +1,523 @@
+"""Local stand-in for the managed sequence services.
+
+Answers ``GET /`` and every model endpoint with a payload shaped like the real
+one (see :mod:`benchmarks.payloads`), including ``{"sequences": [...]}``
+batches answered with a ``results`` list. Latency is drawn from a configurable
+distribution per endpoint. The server can also inject faults: connection
+resets, stalled responses, 5xx errors, ``429`` rate limits (optionally in
+bursts), truncated JSON bodies and per-sequence ``failures``. It also simulates
+Cloud Run cold starts: the first call to an endpoint, and the first call after an idle gap,
+wait an extra delay. It counts the bytes that cross the socket, so client
+changes can be measured without touching Cloud Run::
+
+    python -m benchmarks.stand_in_server --port 8765 --latency lognormal:120:0.5 \\
+        --latency nbforge=lognormal:2500:0.3 --rate-limit-rate 0.02 --cold-start-seconds 5
+    SEQUENCE_LIBRARIES_URL=http://127.0.0.1:8765 streamlit run app.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import random
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .payloads import ENDPOINTS, response_payload
+
+LATENCY_KINDS = ("fixed", "uniform", "lognormal")
+_ERROR_STATUSES = (500, 502, 503)
+FAULT_RESET = "reset"
+FAULT_SLOW = "slow"
+FAULT_RATE_LIMIT = "rate_limit"
+FAULT_ERROR = "error"
+FAULT_MALFORMED = "malformed"
+FAULT_KINDS = (FAULT_RESET, FAULT_SLOW, FAULT_RATE_LIMIT, FAULT_ERROR, FAULT_MALFORMED)
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Server-side processing delay for one request.
+
+    ``fixed`` always waits ``median_ms``; ``uniform`` draws from
+    ``median_ms ± spread`` milliseconds; ``lognormal`` uses ``median_ms`` as the
+    median and ``spread`` as the log-space sigma, which gives the long right
+    tail real model inference has.
+    """
+
+    kind: str = "fixed"
+    median_ms: float = 0.0
+    spread: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.kind not in LATENCY_KINDS:
+            raise ValueError(
+                f"Unknown latency kind {self.kind!r}; choose from {', '.join(LATENCY_KINDS)}."
+            )
+        if self.median_ms < 0 or self.spread < 0:
+            raise ValueError("Latency median and spread must be non-negative.")
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """Parse ``kind:median_ms[:spread]``, e.g. ``lognormal:120:0.5``."""
+
+        kind, *numbers = spec.strip().split(":")
+        if not 1 <= len(numbers) <= 2:
+            raise ValueError(f"Latency spec {spec!r} must look like kind:median_ms[:spread].")
+        try:
+            values = [float(number) for number in numbers]
+        except ValueError as exc:
+            raise ValueError(f"Latency spec {spec!r} has a non-numeric value.") from exc
+        return cls(kind.lower(), *values)
+
+    def sample(self, rng: random.Random) -> float:
+        """Return one delay in seconds."""
+
+        if self.kind == "uniform":
+            low = max(0.0, self.median_ms - self.spread)
+            return rng.uniform(low, self.median_ms + self.spread) / 1e3
+        if self.kind == "lognormal" and self.median_ms:
+            return self.median_ms * math.exp(rng.gauss(0.0, self.spread)) / 1e3
+        return self.median_ms / 1e3
+
+
+NO_LATENCY = LatencyProfile()
+
+
+@dataclass
+class WireStats:
+    requests: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    compressed_requests: int = 0
+    compressed_responses: int = 0
+    errors_injected: int = 0
+    rate_limited: int = 0
+    failures_injected: int = 0
+    cold_starts: int = 0
+    connections_reset: int = 0
+    slow_responses: int = 0
+    malformed_responses: int = 0
+
+
+class StandInServer:
+    """Threaded HTTP server that mimics the model endpoints on localhost.
+
+    Fault rates are probabilities per request (``reset_rate``, ``slow_rate``,
+    ``error_rate``, ``rate_limit_rate``, ``malformed_rate``) or per sequence
+    (``failure_rate``); the per-request rates must sum to at most 1. A reset
+    drops the connection without answering; a slow response stalls
+    ``slow_seconds`` before the normal reply, long enough to trip a client read
+    timeout. Each drawn ``429`` starts a burst of ``rate_limit_burst``
+    consecutive ones. A malformed response is a ``200`` whose JSON is cut off
+    halfway. Draws come from one seeded generator, so a single-threaded run is
+    reproducible.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        compress_responses: bool = True,
+        compress_min_bytes: int = 1024,
+        bandwidth_mbps: Optional[float] = None,
+        latency: LatencyProfile = NO_LATENCY,
+        endpoint_latency: Optional[Dict[str, LatencyProfile]] = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        rate_limit_burst: int = 1,
+        reset_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_seconds: float = 30.0,
+        malformed_rate: float = 0.0,
+        failure_rate: float = 0.0,
+        cold_start_seconds: float = 0.0,
+        cold_idle_seconds: float = 900.0,
+        seed: int = 0,
+    ) -> None:
+        for name, rate in (
+            ("error_rate", error_rate),
+            ("rate_limit_rate", rate_limit_rate),
+            ("reset_rate", reset_rate),
+            ("slow_rate", slow_rate),
+            ("malformed_rate", malformed_rate),
+            ("failure_rate", failure_rate),
+        ):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1.")
+        if reset_rate + slow_rate + rate_limit_rate + error_rate + malformed_rate > 1.0:
+            raise ValueError("The per-request fault rates must sum to at most 1.")
+        if rate_limit_burst < 1:
+            raise ValueError("rate_limit_burst must be at least 1.")
+        if slow_seconds < 0:
+            raise ValueError("slow_seconds must be non-negative.")
+        self.compress_responses = compress_responses
+        self.compress_min_bytes = compress_min_bytes
+        self.bandwidth_mbps = bandwidth_mbps
+        self.latency = latency
+        self.endpoint_latency = dict(endpoint_latency or {})
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rate_limit_burst = rate_limit_burst
+        self.reset_rate = reset_rate
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.malformed_rate = malformed_rate
+        self.failure_rate = failure_rate
+        self.cold_start_seconds = cold_start_seconds
+        self.cold_idle_seconds = cold_idle_seconds
+        self.stats = WireStats()
+        self._stats_lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._burst_remaining = 0
+        self._last_seen: Dict[str, float] = {}
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self) -> None:
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.stats = WireStats()
+
+    def reset_cold_starts(self) -> None:
+        """Forget endpoint activity so the next call to each one is cold again."""
+
+        with self._stats_lock:
+            self._last_seen.clear()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _record(self, **deltas: int) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    def _throttle(self, nbytes: int) -> None:
+        if self.bandwidth_mbps:
+            time.sleep(nbytes * 8 / (self.bandwidth_mbps * 1_000_000))
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _cold_start_delay(self, endpoint: str) -> float:
+        """Extra seconds for this call if ``endpoint`` has no warm instance."""
+
+        now = time.monotonic()
+        with self._stats_lock:
+            last_seen = self._last_seen.get(endpoint)
+            self._last_seen[endpoint] = now
+            cold = last_seen is None or now - last_seen > self.cold_idle_seconds
+            if cold and self.cold_start_seconds:
+                self.stats.cold_starts += 1
+                return self.cold_start_seconds
+        return 0.0
+
+    def processing_delay(self, endpoint: str) -> float:
+        profile = self.endpoint_latency.get(endpoint, self.latency)
+        with self._rng_lock:
+            return profile.sample(self._rng)
+
+    def draw_fault(self) -> Optional[str]:
+        """Pick the fault for one request from :data:`FAULT_KINDS`, or ``None``."""
+
+        with self._rng_lock:
+            if self._burst_remaining:
+                self._burst_remaining -= 1
+                return FAULT_RATE_LIMIT
+            draw = self._rng.random()
+            for kind, rate in (
+                (FAULT_RESET, self.reset_rate),
+                (FAULT_SLOW, self.slow_rate),
+                (FAULT_RATE_LIMIT, self.rate_limit_rate),
+                (FAULT_ERROR, self.error_rate),
+                (FAULT_MALFORMED, self.malformed_rate),
+            ):
+                if draw < rate:
+                    if kind == FAULT_RATE_LIMIT:
+                        self._burst_remaining = self.rate_limit_burst - 1
+                    return kind
+                draw -= rate
+        return None
+
+    def inject_fault(self, kind: Optional[str]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Return the ``(status, body)`` that replaces the answer, if ``kind`` needs one."""
+
+        if kind == FAULT_RATE_LIMIT:
+            self._record(rate_limited=1)
+            return 429, {"detail": "Rate exceeded."}
+        if kind == FAULT_ERROR:
+            self._record(errors_injected=1)
+            status = _ERROR_STATUSES[int(self._random() * len(_ERROR_STATUSES))]
+            return status, {"detail": "Injected server error."}
+        return None
+
+    def respond(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        items = payload.get("sequences")
+        if isinstance(items, list):
+            return {"results": [self._respond_one(endpoint, item) for item in items]}
+        return self._respond_one(endpoint, payload)
+
+    def _respond_one(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        sequence_id = (
+            payload.get("sequence_id") or payload.get("vhh_name") or "streamlit_sequence"
+        )
+        if self.failure_rate and self._random() < self.failure_rate:
+            # Mirrors how the services report a sequence they could not process:
+            # a 200 whose body only carries ``failures``.
+            self._record(failures_injected=1)
+            return {
+                "sequence_id": sequence_id,
+                "failures": [f"Injected {endpoint} failure."],
+            }
+        return response_payload(endpoint, sequence_id, payload.get("sequence", ""))
+
+
+def _handler_for(server: StandInServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; with Nagle on, delayed
+        # ACKs add ~40 ms to every keep-alive response.
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            endpoint = self._endpoint()
+            if endpoint and endpoint not in ENDPOINTS:
+                self._send_json(404, {"detail": f"Unknown endpoint {endpoint!r}."})
+                return
+            delay = server._cold_start_delay(endpoint or "/")
+            time.sleep(delay)
+            self._send_json(
+                200, {"status": "ok", "endpoints": list(ENDPOINTS)}, delay
+            )
+
+        def do_POST(self) -> None:
+            started = time.perf_counter()
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            compressed = self.headers.get("Content-Encoding", "").lower() == "gzip"
+            server._record(
+                requests=1, request_bytes=len(body), compressed_requests=int(compressed)
+            )
+            server._throttle(len(body))
+
+            endpoint = self._endpoint()
+            if endpoint not in ENDPOINTS:
+                self._send_json(404, {"detail": f"Unknown endpoint {endpoint!r}."})
+                return
+            try:
+                payload = json.loads(gzip.decompress(body) if compressed else body)
+            except (OSError, ValueError):
+                self._send_json(400, {"detail": "Malformed request body."})
+                return
+
+            # A cold instance makes every caller wait, including those it then rejects.
+            time.sleep(server._cold_start_delay(endpoint))
+            kind = server.draw_fault()
+            if kind == FAULT_RESET:
+                server._record(connections_reset=1)
+                self._reset_connection()
+                return
+            fault = server.inject_fault(kind)
+            if fault is not None:
+                status, detail = fault
+                self._send_json(status, detail, time.perf_counter() - started)
+                return
+            if kind == FAULT_SLOW:
+                server._record(slow_responses=1)
+                time.sleep(server.slow_seconds)
+            time.sleep(server.processing_delay(endpoint))
+            self._send_json(
+                200,
+                server.respond(endpoint, payload),
+                time.perf_counter() - started,
+                truncate=kind == FAULT_MALFORMED,
+            )
+
+        def _reset_connection(self) -> None:
+            # A zero linger timeout makes close() send RST instead of FIN.
+            self.connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            self.close_connection = True
+            self.connection.close()
+
+        def _endpoint(self) -> str:
+            return self.path.split("?", 1)[0].strip("/").lower()
+
+        def _send_json(
+            self,
+            status: int,
+            payload: Dict[str, Any],
+            app_seconds: float = 0.0,
+            *,
+            truncate: bool = False,
+        ) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            if truncate:
+                server._record(malformed_responses=1)
+                body = body[: len(body) // 2]
+            accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "").lower()
+            compress = (
+                server.compress_responses
+                and accepts_gzip
+                and len(body) >= server.compress_min_bytes
+            )
+            if compress:
+                body = gzip.compress(body, compresslevel=6)
+            server._record(
+                response_bytes=len(body), compressed_responses=int(compress)
+            )
+            server._throttle(len(body))
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Server-Timing", f"app;dur={app_seconds * 1e3:.1f}")
+            if status == 429:
+                self.send_header("Retry-After", "1")
+            if compress:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            try:
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client timed out on a slow response and hung up.
+                self.close_connection = True
+
+    return Handler
+
+
+def _parse_latency_args(
+    specs: List[str],
+) -> Tuple[LatencyProfile, Dict[str, LatencyProfile]]:
+    default = NO_LATENCY
+    per_endpoint: Dict[str, LatencyProfile] = {}
+    for spec in specs:
+        endpoint, sep, profile = spec.rpartition("=")
+        if not sep:
+            default = LatencyProfile.parse(profile)
+        elif endpoint in ENDPOINTS:
+            per_endpoint[endpoint] = LatencyProfile.parse(profile)
+        else:
+            raise ValueError(f"Unknown endpoint {endpoint!r} in latency spec {spec!r}.")
+    return default, per_endpoint
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve stand-in model endpoints.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--bandwidth-mbps", type=float)
+    parser.add_argument("--no-compress-responses", action="store_true")
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="[ENDPOINT=]KIND:MEDIAN_MS[:SPREAD]",
+        help="Processing delay, e.g. lognormal:120:0.5 or nbforge=fixed:2000. Repeatable.",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limit-burst",
+        type=int,
+        default=1,
+        help="Consecutive 429 responses each time a rate limit is drawn.",
+    )
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-seconds", type=float, default=30.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--cold-start-seconds", type=float, default=0.0)
+    parser.add_argument("--cold-idle-seconds", type=float, default=900.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        latency, endpoint_latency = _parse_latency_args(args.latency)
+        server = StandInServer(
+            host=args.host,
+            port=args.port,
+            compress_responses=not args.no_compress_responses,
+            bandwidth_mbps=args.bandwidth_mbps,
+            latency=latency,
+            endpoint_latency=endpoint_latency,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            rate_limit_burst=args.rate_limit_burst,
+            reset_rate=args.reset_rate,
+            slow_rate=args.slow_rate,
+            slow_seconds=args.slow_seconds,
+            malformed_rate=args.malformed_rate,
+            failure_rate=args.failure_rate,
+            cold_start_seconds=args.cold_start_seconds,
+            cold_idle_seconds=args.cold_idle_seconds,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(f"Serving stand-in endpoints on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+__all__ = [
+    "FAULT_ERROR",
+    "FAULT_KINDS",
+    "FAULT_MALFORMED",
+    "FAULT_RATE_LIMIT",
+    "FAULT_RESET",
+    "FAULT_SLOW",
+    "LATENCY_KINDS",
+    "LatencyProfile",
+    "NO_LATENCY",
+    "StandInServer",
+    "WireStats",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,377 @@
+"""End-to-end benchmark suite for the service clients and the Sequencing pipeline.
+
+Every ``run_*_batch`` client is driven against a local
+:class:`benchmarks.stand_in_server.StandInServer`. Each case varies the batch
+size, the number of concurrent callers, the share of duplicate sequences that
+the page's dedup step absorbs, and the server's per-sequence failure rate. The
+suite also times CSV parsing, result DataFrame construction and CSV export.
+Results are written as JSON so runs on two commits can be compared::
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --size 10 --size 100000 --concurrency 8 --output big.json
+    python -m benchmarks.suite --output new.json --compare bench.json --tolerance 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.abnativ_client import run_abnativ_batch
+from services.api_client import JSON_CODEC
+from services.export import FORMAT_CSV, export_results
+from services.nanomelt_client import run_nanomelt_batch
+from services.nbforge_client import run_nbforge_batch
+from services.nbframe_client import run_nbframe_batch
+from services.result_schema import NANOMELT_SCHEMA, ColumnarBuilder
+from services.sequence_io import iter_uploaded_sequences
+from services.sequence_store import SequenceStore
+from services.telemetry import get_telemetry
+
+from .payloads import make_sequences
+from .stand_in_server import LatencyProfile, StandInServer
+
+SCHEMA_VERSION = 1
+RUNNERS: Dict[str, Callable[..., Tuple[Any, List[str]]]] = {
+    "abnativ": run_abnativ_batch,
+    "nanomelt": run_nanomelt_batch,
+    "nbforge": run_nbforge_batch,
+    "nbframe": run_nbframe_batch,
+}
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_CONCURRENCY = (1, 4)
+DEFAULT_HIT_RATIOS = (0.0, 0.5)
+DEFAULT_FAILURE_RATES = (0.0, 0.05)
+DEFAULT_TOLERANCE = 0.10
+# Default home of JSON reports; gitignored so routine runs keep the tree clean.
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class BenchmarkResult:
+    """One measured case; ``params`` identifies it across runs."""
+
+    benchmark: str
+    params: Dict[str, Any]
+    items: int
+    seconds: float
+    items_per_second: float
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return self.benchmark + json.dumps(self.params, sort_keys=True)
+
+
+def _percentile_ms(values: List[float], percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    return 1e3 * float(np.percentile(values, percentile))
+
+
+def make_batch(size: int, hit_ratio: float, *, seed: int = 0) -> List[Tuple[str, str]]:
+    """``size`` records of which roughly ``hit_ratio`` repeat an earlier sequence."""
+
+    unique_count = max(1, round(size * (1.0 - hit_ratio)))
+    records = make_sequences(unique_count, seed=seed)
+    rng = random.Random(seed)
+    records += [
+        (f"dup_{index:06d}", records[rng.randrange(unique_count)][1])
+        for index in range(size - unique_count)
+    ]
+    rng.shuffle(records)
+    return records
+
+
+def _run_shards(
+    runner: Callable[..., Tuple[Any, List[str]]],
+    unique_rows: SequenceStore,
+    concurrency: int,
+) -> Tuple[int, int]:
+    """Split ``unique_rows`` over ``concurrency`` callers; return (rows, failures)."""
+
+    shards = [
+        unique_rows[np.arange(offset, len(unique_rows), concurrency)]
+        for offset in range(min(concurrency, len(unique_rows)))
+    ]
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        outcomes = list(pool.map(lambda shard: runner(iter(shard)), shards))
+    rows = sum(len(frame) for frame, _ in outcomes if frame is not None)
+    return rows, sum(len(failures) for _, failures in outcomes)
+
+
+def bench_client(
+    server: StandInServer,
+    model: str,
+    size: int,
+    concurrency: int,
+    hit_ratio: float,
+    failure_rate: float,
+) -> BenchmarkResult:
+    """Dedup a batch like the Sequencing page does, then send the unique rows."""
+
+    records = make_batch(size, hit_ratio)
+    server.failure_rate = failure_rate
+    server.reset_stats()
+    telemetry = get_telemetry()
+    # Keep every timing of this case so p95 covers all requests, not a tail.
+    telemetry.history = max(telemetry.history, size)
+    telemetry.clear()
+
+    started = time.perf_counter()
+    store = SequenceStore.from_records(records)
+    unique_rows, _ = store.unique()
+    rows, failures = _run_shards(RUNNERS[model], unique_rows, concurrency)
+    seconds = time.perf_counter() - started
+
+    latencies = [timing.total_seconds for timing in telemetry.recent(model)]
+    return BenchmarkResult(
+        benchmark="client",
+        params={
+            "model": model,
+            "batch_size": size,
+            "concurrency": concurrency,
+            "cache_hit_ratio": hit_ratio,
+            "failure_rate": failure_rate,
+        },
+        items=size,
+        seconds=seconds,
+        items_per_second=size / seconds,
+        p50_ms=_percentile_ms(latencies, 50),
+        p95_ms=_percentile_ms(latencies, 95),
+        extra={
+            "requests": server.stats.requests,
+            "rows": rows,
+            "failures": failures,
+            "response_bytes": server.stats.response_bytes,
+        },
+    )
+
+
+def _best_of(repeat: int, action: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _local_result(benchmark: str, size: int, seconds: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        benchmark=benchmark,
+        params={"rows": size},
+        items=size,
+        seconds=seconds,
+        items_per_second=size / seconds if seconds else float("inf"),
+    )
+
+
+def bench_local(size: int, repeat: int) -> List[BenchmarkResult]:
+    """CSV parse, result-frame construction and CSV export for ``size`` rows."""
+
+    records = make_sequences(size)
+    upload = ("sequence_id,sequence\n" + "".join(f"{i},{s}\n" for i, s in records)).encode()
+    rng = random.Random(0)
+    fields = [
+        (
+            ("sequence_id", sequence_id),
+            ("sequence", sequence),
+            ("aligned_sequence", sequence.ljust(149, "-")),
+            ("nanomelt_tm_c", rng.uniform(50, 80)),
+        )
+        for sequence_id, sequence in records
+    ]
+
+    def build_frame():
+        builder = ColumnarBuilder(NANOMELT_SCHEMA)
+        for row in fields:
+            builder.add_row(row)
+        return builder.to_frame()
+
+    frame = build_frame()
+    return [
+        _local_result(
+            "csv_parse",
+            size,
+            _best_of(
+                repeat,
+                lambda: SequenceStore.from_records(
+                    iter_uploaded_sequences(io.BytesIO(upload), "batch.csv")
+                ),
+            ),
+        ),
+        _local_result("dataframe_build", size, _best_of(repeat, build_frame)),
+        _local_result(
+            "csv_export", size, _best_of(repeat, lambda: export_results(frame, FORMAT_CSV))
+        ),
+    ]
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    """Write ``report`` as indented JSON, creating the directory if needed."""
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+
+
+def run(
+    *,
+    models: Sequence[str] = tuple(RUNNERS),
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    concurrency_levels: Sequence[int] = DEFAULT_CONCURRENCY,
+    hit_ratios: Sequence[float] = DEFAULT_HIT_RATIOS,
+    failure_rates: Sequence[float] = DEFAULT_FAILURE_RATES,
+    latency: LatencyProfile = LatencyProfile(),
+    repeat: int = 3,
+    progress: Callable[[BenchmarkResult], None] = lambda result: None,
+) -> Dict[str, Any]:
+    """Run every case and return the JSON-ready report."""
+
+    results: List[BenchmarkResult] = []
+    previous_url = os.environ.get("SEQUENCE_LIBRARIES_URL")
+    with StandInServer(latency=latency) as server:
+        os.environ["SEQUENCE_LIBRARIES_URL"] = server.url
+        try:
+            for model in models:
+                for size in sizes:
+                    for concurrency in concurrency_levels:
+                        for hit_ratio in hit_ratios:
+                            for failure_rate in failure_rates:
+                                result = bench_client(
+                                    server, model, size, concurrency, hit_ratio, failure_rate
+                                )
+                                results.append(result)
+                                progress(result)
+        finally:
+            if previous_url is None:
+                os.environ.pop("SEQUENCE_LIBRARIES_URL", None)
+            else:
+                os.environ["SEQUENCE_LIBRARIES_URL"] = previous_url
+
+    for size in sizes:
+        for result in bench_local(size, repeat):
+            results.append(result)
+            progress(result)
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "environment": {
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "json_codec": JSON_CODEC.name,
+            "server_latency": asdict(latency),
+        },
+        "results": [{"key": result.key, **asdict(result)} for result in results],
+    }
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """Describe every case whose throughput fell more than ``tolerance`` below baseline."""
+
+    previous = {row["key"]: row for row in baseline.get("results", [])}
+    regressions = []
+    for row in report["results"]:
+        before = previous.get(row["key"])
+        if not before or not before["items_per_second"]:
+            continue
+        change = row["items_per_second"] / before["items_per_second"] - 1.0
+        if change < -tolerance:
+            regressions.append(
+                f"{row['key']}: {before['items_per_second']:.1f} -> "
+                f"{row['items_per_second']:.1f} items/s ({change:+.1%})"
+            )
+    return regressions
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    params = " ".join(f"{name}={value}" for name, value in result.params.items())
+    p95 = f"  p95 {result.p95_ms:8.1f} ms" if result.p95_ms is not None else ""
+    print(
+        f"{result.benchmark:<16} {params:<80} {result.items_per_second:>12.1f}/s{p95}",
+        flush=True,
+    )
+
+
+def _csv_numbers(kind: Callable[[str], Any]) -> Callable[[str], List[Any]]:
+    return lambda text: [kind(item) for item in text.split(",") if item.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", action="append", choices=sorted(RUNNERS), dest="models")
+    parser.add_argument("--size", type=int, action="append", dest="sizes")
+    parser.add_argument("--concurrency", type=int, action="append", dest="concurrency")
+    parser.add_argument("--hit-ratios", type=_csv_numbers(float), default=None)
+    parser.add_argument("--failure-rates", type=_csv_numbers(float), default=None)
+    parser.add_argument(
+        "--latency",
+        type=LatencyProfile.parse,
+        default=LatencyProfile(),
+        help="Stand-in processing delay, e.g. lognormal:50:0.4 (default: none).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of for local benchmarks.")
+    parser.add_argument("--output", default=str(RESULTS_DIR / "benchmark-results.json"))
+    parser.add_argument("--compare", metavar="BASELINE_JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    report = run(
+        models=args.models or tuple(RUNNERS),
+        sizes=args.sizes or DEFAULT_SIZES,
+        concurrency_levels=args.concurrency or DEFAULT_CONCURRENCY,
+        hit_ratios=args.hit_ratios or DEFAULT_HIT_RATIOS,
+        failure_rates=args.failure_rates or DEFAULT_FAILURE_RATES,
+        latency=args.latency,
+        repeat=args.repeat,
+        progress=_print_result,
+    )
+    write_report(report, args.output)
+    print(f"Wrote {len(report['results'])} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No throughput regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""Measure bytes on the wire and latency with and without body compression.
+
+Runs ``post_json`` against :class:`benchmarks.stand_in_server.StandInServer`
+for single-sequence requests and for batch envelopes of many sequences::
+
+    python -m benchmarks.wire_compression --bandwidth-mbps 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from typing import List, Optional, Sequence
+
+from services.api_client import post_json
+
+from .payloads import ENDPOINTS, make_sequences, request_payload
+from .stand_in_server import StandInServer
+
+SCENARIOS = (
+    ("identity", False, False),
+    ("gzip requests", True, False),
+    ("gzip both ways", True, True),
+)
+
+
+def run(
+    *,
+    batch_sizes: Sequence[int] = (1, 1000),
+    rounds: int = 5,
+    bandwidth_mbps: Optional[float] = None,
+) -> List[dict]:
+    rows = []
+    previous_url = os.environ.get("SEQUENCE_LIBRARIES_URL")
+    with StandInServer(bandwidth_mbps=bandwidth_mbps) as server:
+        os.environ["SEQUENCE_LIBRARIES_URL"] = server.url
+        try:
+            for batch_size in batch_sizes:
+                records = make_sequences(batch_size)
+                for endpoint in ENDPOINTS:
+                    items = [request_payload(endpoint, *record) for record in records]
+                    payload = items[0] if batch_size == 1 else {"sequences": items}
+                    for label, compress_requests, compress_responses in SCENARIOS:
+                        server.compress_responses = compress_responses
+                        server.reset_stats()
+                        timings = []
+                        for _ in range(rounds):
+                            started = time.perf_counter()
+                            post_json(endpoint, payload, compress=compress_requests)
+                            timings.append(time.perf_counter() - started)
+                        rows.append(
+                            {
+                                "endpoint": endpoint,
+                                "batch_size": batch_size,
+                                "scenario": label,
+                                "request_bytes": server.stats.request_bytes // rounds,
+                                "response_bytes": server.stats.response_bytes // rounds,
+                                "median_ms": statistics.median(timings) * 1e3,
+                            }
+                        )
+        finally:
+            if previous_url is None:
+                os.environ.pop("SEQUENCE_LIBRARIES_URL", None)
+            else:
+                os.environ["SEQUENCE_LIBRARIES_URL"] = previous_url
+    return rows
+
+
+def _print_table(rows: List[dict]) -> None:
+    header = (
+        f"{'endpoint':<9} {'batch':>6} {'scenario':<15} "
+        f"{'req B':>10} {'resp B':>11} {'median ms':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['endpoint']:<9} {row['batch_size']:>6} {row['scenario']:<15} "
+            f"{row['request_bytes']:>10} {row['response_bytes']:>11} "
+            f"{row['median_ms']:>10.1f}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, action="append", dest="batch_sizes")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        help="Throttle the stand-in link, e.g. to mimic a cross-region hop.",
+    )
+    args = parser.parse_args(argv)
+
+    _print_table(
+        run(
+            batch_sizes=args.batch_sizes or (1, 1000),
+            rounds=args.rounds,
+            bandwidth_mbps=args.bandwidth_mbps,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
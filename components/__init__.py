@@ -2,5 +2,6 @@
 
 from components.header import render_header
 from components.footer import render_footer
+from components.profiler import profile_rerun
 
-__all__ = ["render_header", "render_footer"]
+__all__ = ["render_header", "render_footer", "profile_rerun"]
@@ -1,32 +1,23 @@
 """Header component with logo and navigation."""
 
-from functools import lru_cache
-import base64
-
 import streamlit as st
 
 from assets import image_data
 
 
-@lru_cache(maxsize=1)
-def _logo_data_uri() -> str:
-    """Return inline data URI for the Sormanni logo."""
-    encoded = base64.b64encode(image_data.sormanni_logo_png_bytes()).decode("ascii")
-    return f"data:image/png;base64,{encoded}"
-
-
 def render_header():
     """Render the header with logo and navigation tabs."""
     col1, col2 = st.columns([1, 3])
 
     with col1:
         st.markdown(
-            f'<img src="{_logo_data_uri()}" width="150" alt="Sormanni logo" />',
+            f'<img src="{image_data.static_url(image_data.SORMANNI_LOGO_PNG)}" '
+            'width="150" alt="Sormanni logo" />',
             unsafe_allow_html=True,
         )
 
     with col2:
-        nav_cols = st.columns([2.7, 0.8, 0.8, 0.8, 0.8])
+        nav_cols = st.columns([1.9, 0.8, 0.8, 0.8, 0.8, 0.8])
 
         with nav_cols[0]:
             st.write("")
@@ -83,4 +74,18 @@ def render_header():
                 st.query_params["page"] = "Contact Us"
                 st.rerun()
 
+        with nav_cols[5]:
+            if st.button(
+                "Performance",
+                key="performance",
+                type=(
+                    "primary"
+                    if st.session_state.active_page == "Performance"
+                    else "secondary"
+                ),
+            ):
+                st.session_state.active_page = "Performance"
+                st.query_params["page"] = "Performance"
+                st.rerun()
+
     st.markdown("---")
@@ -0,0 +1,296 @@
+"""Opt-in timing of each phase of a script rerun.
+
+Every interaction reruns ``app.py`` from the top. With profiling on, each phase
+of the rerun (page config, page load, styles, header, the page itself) is timed
+and the breakdown is logged as a ``rerun_profile`` event. It is also shown in an
+expander at the bottom of the page and summarised on the Performance page.
+Turn it on for the whole server with ``SEQUENCE_PROFILE``, or for one browser
+tab with the ``?profile=`` query parameter:
+
+- ``timings`` (or ``1``): phase timings only; the overhead is a few clock reads.
+- ``cprofile``: also capture a :mod:`cProfile` of the rerun and show the
+  functions with the highest cumulative time.
+- ``pyinstrument``: the same with a pyinstrument call tree, if it is installed.
+
+``SEQUENCE_PROFILE=off`` also ignores the query parameter, for deployments
+where visitors should not see profiles.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from services.tracing import log_event
+
+try:
+    from pyinstrument import Profiler as _PyinstrumentProfiler
+except ImportError:  # pragma: no cover - optional dependency
+    _PyinstrumentProfiler = None
+
+MODE_OFF = "off"
+MODE_TIMINGS = "timings"
+MODE_CPROFILE = "cprofile"
+MODE_PYINSTRUMENT = "pyinstrument"
+PROFILE_MODES = (MODE_OFF, MODE_TIMINGS, MODE_CPROFILE, MODE_PYINSTRUMENT)
+PROFILE_PARAM = "profile"
+_ALIASES = {"": MODE_OFF, "0": MODE_OFF, "false": MODE_OFF, "1": MODE_TIMINGS, "true": MODE_TIMINGS}
+_HISTORY = max(16, int(os.environ.get("SEQUENCE_PROFILE_HISTORY", "200")))
+_REPORT_LINES = 30
+
+
+def _parse_mode(value: Optional[str]) -> Optional[str]:
+    mode = (value or "").strip().lower()
+    mode = _ALIASES.get(mode, mode)
+    return mode if mode in PROFILE_MODES else None
+
+
+def _env_mode() -> Optional[str]:
+    """The server-wide mode; ``None`` when unset, so the query parameter decides."""
+
+    raw = os.environ.get("SEQUENCE_PROFILE")
+    if raw is None or not raw.strip():
+        return None
+    mode = _parse_mode(raw)
+    if mode is None:
+        raise ValueError(
+            f"Unknown SEQUENCE_PROFILE {raw!r}; choose from {', '.join(PROFILE_MODES)}."
+        )
+    return mode
+
+
+@dataclass
+class RerunProfile:
+    """Phase timings of one rerun, plus the call profile when one was captured."""
+
+    page: str
+    mode: str
+    started_at: float
+    total_seconds: float
+    phases: List[Tuple[str, float]] = field(default_factory=list)
+    completed: bool = True
+    report: Optional[str] = None
+
+
+class RerunProfiler:
+    """Times the phases of one rerun; a no-op when ``mode`` is ``off``."""
+
+    def __init__(self, mode: str = MODE_OFF) -> None:
+        if mode == MODE_PYINSTRUMENT and _PyinstrumentProfiler is None:
+            mode = MODE_CPROFILE
+        self.mode = mode
+        self.page = ""
+        self.phases: List[Tuple[str, float]] = []
+        self._started = time.perf_counter()
+        self._started_at = time.time()
+        self._call_profiler = None
+
+    @classmethod
+    def from_request(cls) -> "RerunProfiler":
+        """Profiler for this rerun, per ``SEQUENCE_PROFILE`` or ``?profile=``."""
+
+        mode = _env_mode()
+        if mode is None:
+            mode = _parse_mode(st.query_params.get(PROFILE_PARAM)) or MODE_OFF
+        return cls(mode)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != MODE_OFF
+
+    def start(self) -> "RerunProfiler":
+        try:
+            if self.mode == MODE_CPROFILE:
+                self._call_profiler = cProfile.Profile()
+                self._call_profiler.enable()
+            elif self.mode == MODE_PYINSTRUMENT:
+                self._call_profiler = _PyinstrumentProfiler(async_mode="disabled")
+                self._call_profiler.start()
+        except (RuntimeError, ValueError):
+            # Another profiler is already active in this thread.
+            self._call_profiler = None
+        self._started = time.perf_counter()
+        self._started_at = time.time()
+        return self
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def finish(self, *, completed: bool = True) -> Optional[RerunProfile]:
+        """Stop timing, record the profile and log it; ``None`` when disabled."""
+
+        if not self.enabled:
+            return None
+        total = time.perf_counter() - self._started
+        profile = RerunProfile(
+            page=self.page,
+            mode=self.mode,
+            started_at=self._started_at,
+            total_seconds=total,
+            phases=list(self.phases),
+            completed=completed,
+            report=self._stop_call_profiler(),
+        )
+        get_profile_history().add(profile)
+        log_event(
+            "rerun_profile",
+            page=profile.page,
+            mode=profile.mode,
+            completed=completed,
+            total_ms=round(total * 1e3, 3),
+            phases={name: round(seconds * 1e3, 3) for name, seconds in profile.phases},
+        )
+        return profile
+
+    def _stop_call_profiler(self) -> Optional[str]:
+        profiler, self._call_profiler = self._call_profiler, None
+        if profiler is None:
+            return None
+        if self.mode == MODE_PYINSTRUMENT:
+            profiler.stop()
+            return profiler.output_text(unicode=True, color=False)
+        profiler.disable()
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(
+            _REPORT_LINES
+        )
+        return buffer.getvalue()
+
+
+class ProfileHistory:
+    """Recent rerun profiles shared by every session, for the Performance page."""
+
+    def __init__(self, history: int = _HISTORY) -> None:
+        self._profiles: Deque[RerunProfile] = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def add(self, profile: RerunProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def recent(self) -> List[RerunProfile]:
+        with self._lock:
+            return list(self._profiles)
+
+    def summary(self) -> pd.DataFrame:
+        """One row per phase: reruns that ran it and its mean/p50/p95 milliseconds."""
+
+        samples: Dict[str, List[float]] = {}
+        for profile in self.recent():
+            for name, seconds in profile.phases:
+                samples.setdefault(name, []).append(seconds)
+            samples.setdefault("total", []).append(profile.total_seconds)
+        rows = [
+            {
+                "phase": name,
+                "reruns": len(values),
+                "mean_ms": 1e3 * float(np.mean(values)),
+                "p50_ms": 1e3 * float(np.percentile(values, 50)),
+                "p95_ms": 1e3 * float(np.percentile(values, 95)),
+            }
+            for name, values in samples.items()
+        ]
+        return pd.DataFrame(rows, columns=["phase", "reruns", "mean_ms", "p50_ms", "p95_ms"])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+_history: Optional[ProfileHistory] = None
+_history_lock = threading.Lock()
+
+
+def get_profile_history() -> ProfileHistory:
+    """Return the process-wide history shared by every session."""
+
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = ProfileHistory()
+        return _history
+
+
+@contextlib.contextmanager
+def profile_rerun() -> Iterator[RerunProfiler]:
+    """Profile the enclosed rerun and show the breakdown when it completes.
+
+    A rerun cut short by ``st.rerun()`` or ``st.stop()`` is still recorded,
+    marked incomplete, but has nothing left to render into.
+    """
+
+    profiler = RerunProfiler.from_request().start()
+    try:
+        yield profiler
+    except BaseException:
+        profiler.finish(completed=False)
+        raise
+    profile = profiler.finish()
+    if profile is not None:
+        render_profile(profile)
+
+
+def render_profile(profile: RerunProfile) -> None:
+    """Show one rerun's phase breakdown (and call profile) in an expander."""
+
+    with st.expander(f"Rerun profile: {profile.total_seconds * 1e3:.1f} ms"):
+        accounted = sum(seconds for _, seconds in profile.phases)
+        phases = profile.phases + [("other", max(0.0, profile.total_seconds - accounted))]
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    "phase": [name for name, _ in phases],
+                    "ms": [seconds * 1e3 for _, seconds in phases],
+                    "share": [
+                        seconds / profile.total_seconds if profile.total_seconds else 0.0
+                        for _, seconds in phases
+                    ],
+                }
+            ),
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "ms": st.column_config.NumberColumn("ms", format="%.1f"),
+                "share": st.column_config.ProgressColumn(
+                    "share", min_value=0.0, max_value=1.0, format="percent"
+                ),
+            },
+        )
+        if profile.report:
+            st.code(profile.report, language="text")
+
+
+__all__ = [
+    "MODE_CPROFILE",
+    "MODE_OFF",
+    "MODE_PYINSTRUMENT",
+    "MODE_TIMINGS",
+    "PROFILE_MODES",
+    "PROFILE_PARAM",
+    "ProfileHistory",
+    "RerunProfile",
+    "RerunProfiler",
+    "get_profile_history",
+    "profile_rerun",
+    "render_profile",
+]
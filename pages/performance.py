@@ -0,0 +1,185 @@
+"""Performance page: client-side latency, throughput and background activity."""
+
+from __future__ import annotations
+
+import pandas as pd
+import streamlit as st
+
+from components.profiler import PROFILE_PARAM, get_profile_history
+from services.api_client import client_limits
+from services.metrics import (
+    API_IN_FLIGHT,
+    BATCH_ACTIVE,
+    BATCH_DEDUPLICATED,
+    BATCH_QUEUE_DEPTH,
+    CACHE_REQUESTS,
+    RESULTS_SPILL_READS,
+)
+from services.result_store import get_result_store
+from services.telemetry import REQUEST_TAG, get_telemetry
+from services.warmup import get_warmer
+
+REFRESH_SECONDS = 2
+WINDOW_OPTIONS = {"1 min": 60, "5 min": 300, "15 min": 900, "1 hour": 3600}
+WINDOW_KEY = "performance_window"
+INCLUDE_WARMUP_KEY = "performance_include_warmup"
+_PERCENT_COLUMNS = ("retry_rate", "failure_rate")
+
+
+def _cache_hit_ratios():
+    totals = {}
+    for (cache, result), count in CACHE_REQUESTS.values().items():
+        hits, lookups = totals.get(cache, (0.0, 0.0))
+        totals[cache] = (hits + (count if result == "hit" else 0.0), lookups + count)
+    return {
+        cache: (hits / lookups if lookups else None, int(lookups))
+        for cache, (hits, lookups) in sorted(totals.items())
+    }
+
+
+def _render_latency(window_label: str, include_warmup: bool) -> None:
+    tags = None if include_warmup else {REQUEST_TAG}
+    summary = get_telemetry().window_summary(
+        WINDOW_OPTIONS[window_label], include_tags=tags
+    )
+    st.subheader(f"Endpoints — last {window_label}")
+    if summary.empty:
+        st.info("No requests in this window yet.")
+        return
+
+    for column in _PERCENT_COLUMNS:
+        summary[column] = summary[column] * 100
+    st.dataframe(
+        summary,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "per_minute": st.column_config.NumberColumn("req/min", format="%.2f"),
+            "p50_ms": st.column_config.NumberColumn("p50 ms", format="%.0f"),
+            "p95_ms": st.column_config.NumberColumn("p95 ms", format="%.0f"),
+            "p99_ms": st.column_config.NumberColumn("p99 ms", format="%.0f"),
+            "ttfb_p50_ms": st.column_config.NumberColumn("TTFB p50 ms", format="%.0f"),
+            "retry_rate": st.column_config.NumberColumn("retries %", format="%.1f"),
+            "failure_rate": st.column_config.NumberColumn("failures %", format="%.1f"),
+        },
+    )
+
+
+def _render_activity() -> None:
+    st.subheader("Activity")
+    in_flight = sum(API_IN_FLIGHT.values().values())
+    active_batches = {
+        model: int(count) for (model,), count in BATCH_ACTIVE.values().items() if count
+    }
+    queued = int(sum(BATCH_QUEUE_DEPTH.values().values()))
+    warmer = get_warmer()
+    probes = [endpoint for endpoint, status in warmer.status().items() if status.in_flight]
+
+    cols = st.columns(4)
+    cols[0].metric("In-flight requests", int(in_flight))
+    cols[1].metric("Active batches", sum(active_batches.values()))
+    cols[2].metric("Queued sequences", queued)
+    cols[3].metric("Warm-up probes running", len(probes))
+    if active_batches:
+        st.caption(
+            "Batches: "
+            + ", ".join(f"{model} × {count}" for model, count in active_batches.items())
+        )
+    st.caption(
+        "Keep-warm heartbeat: "
+        + ("running" if warmer.heartbeat_active else "idle")
+        + (f" · probing {', '.join(probes)}" if probes else "")
+    )
+
+
+def _render_caches() -> None:
+    st.subheader("Caches (since start)")
+    ratios = _cache_hit_ratios()
+    stats = get_result_store().stats()
+    cols = st.columns(max(1, len(ratios)) + 2)
+    for col, (cache, (ratio, lookups)) in zip(cols, ratios.items()):
+        col.metric(
+            f"{cache.replace('_', ' ')} hit ratio",
+            f"{ratio:.0%}" if ratio is not None else "—",
+            help=f"{lookups} lookup(s)",
+        )
+    cols[-2].metric(
+        "Duplicates not sent",
+        f"{int(sum(BATCH_DEDUPLICATED.values().values()))}",
+        help="Sequences that reused the result of an identical sequence in the same run.",
+    )
+    cols[-1].metric(
+        "Stored results",
+        f"{(stats.resident_bytes + stats.spilled_bytes) / 2**20:.1f} MiB",
+        help=(
+            f"{stats.resident_entries} resident, {stats.spilled_entries} spilled; "
+            f"budget {stats.memory_budget_bytes / 2**20:.0f} MiB; "
+            f"{int(RESULTS_SPILL_READS.value())} read(s) from disk"
+        ),
+    )
+
+
+def _render_rerun_profiles() -> None:
+    summary = get_profile_history().summary()
+    with st.expander("Script reruns"):
+        if summary.empty:
+            st.caption(
+                f"No profiled reruns yet. Set SEQUENCE_PROFILE=timings or open the app "
+                f"with ?{PROFILE_PARAM}=1 to time each phase of a rerun."
+            )
+            return
+        st.dataframe(
+            summary,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "mean_ms": st.column_config.NumberColumn("mean ms", format="%.1f"),
+                "p50_ms": st.column_config.NumberColumn("p50 ms", format="%.1f"),
+                "p95_ms": st.column_config.NumberColumn("p95 ms", format="%.1f"),
+            },
+        )
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def _live_panel(window_label: str, include_warmup: bool) -> None:
+    # Only this fragment reruns on the timer; the rest of the app stays put.
+    _render_latency(window_label, include_warmup)
+    _render_activity()
+    _render_caches()
+
+
+def render():
+    """Render the performance page."""
+    st.header("Performance")
+    st.caption(
+        f"Client-side view of this app process, refreshed every {REFRESH_SECONDS} s."
+    )
+
+    controls = st.columns([2, 1])
+    with controls[0]:
+        window_label = st.radio(
+            "Window",
+            options=list(WINDOW_OPTIONS),
+            index=1,
+            horizontal=True,
+            key=WINDOW_KEY,
+        )
+    with controls[1]:
+        include_warmup = st.toggle(
+            "Include warm-up probes", value=False, key=INCLUDE_WARMUP_KEY
+        )
+
+    _live_panel(window_label, include_warmup)
+
+    _render_rerun_profiles()
+
+    with st.expander("Client limits"):
+        limits = client_limits()
+        st.table(
+            pd.DataFrame(
+                {
+                    "setting": [name.replace("_", " ") for name in limits],
+                    "value": [str(value) for value in limits.values()],
+                }
+            ).set_index("setting")
+        )
@@ -2,21 +2,52 @@
 
 from __future__ import annotations
 
-import csv
-import io
-from typing import List, Tuple
+import functools
+import itertools
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 try:
     import pandas as pd
 except ImportError:  # pragma: no cover - pandas should be part of Streamlit stack
     pd = None
 
+import numpy as np
+
 import streamlit as st
 
-from services.abnativ_client import run_abnativ
+from services.abnativ_client import run_abnativ_batch
 from services.nbforge_client import run_nbforge_batch
 from services.nbframe_client import run_nbframe_batch
+from services.export import (
+    EXPORT_FORMATS,
+    cached_export,
+    discard_cached_exports,
+    export_filename,
+)
+from services.framework_screen import (
+    DEFAULT_PRESCREEN_MODE,
+    PRESCREEN_MODES,
+    PRESCREEN_OFF,
+    PRESCREEN_SKIP,
+    PRESCREEN_WARN,
+)
+from services.metrics import BATCH_DEDUPLICATED, OutcomeCallback
 from services.nanomelt_client import run_nanomelt_batch
+from services.result_store import get_result_store
+from services.sequence_io import SUPPORTED_UPLOAD_TYPES, iter_uploaded_sequences
+from services.sequence_store import SequenceStore
+from services.validation import (
+    ABNATIV_MIN_SEQUENCE_LENGTH,
+    MODEL_RECOMMENDED_MIN_LENGTH,
+    MODEL_RULES as ENDPOINT_RULES,
+    ValidationReport,
+    clean_sequence,
+    inspect_sequences,
+    prepare_sequence,
+    validate_store,
+)
+from services.tracing import run_context, span
+from services.warmup import get_warmer
 
 
 MODEL_ABNATIV = "AbNatiV"
@@ -24,8 +55,20 @@ MODEL_NBFORGE = "NbForge"
 MODEL_NBFRAME = "NbFrame"
 MODEL_NANOMELT = "NanoMelt"
 MODEL_OPTIONS = [MODEL_ABNATIV, MODEL_NBFORGE, MODEL_NBFRAME, MODEL_NANOMELT]
-ABNATIV_MIN_SEQUENCE_LENGTH = 95
-MODEL_RECOMMENDED_MIN_LENGTH = 95
+MODEL_ENDPOINTS = {
+    MODEL_ABNATIV: "abnativ",
+    MODEL_NBFORGE: "nbforge",
+    MODEL_NBFRAME: "nbframe",
+    MODEL_NANOMELT: "nanomelt",
+}
+BIG_BATCH_SIZE = 50
+FRAMEWORK_SCREEN_MODELS = {MODEL_NBFORGE, MODEL_NBFRAME}
+PRESCREEN_LABELS = {
+    PRESCREEN_WARN: "Warn",
+    PRESCREEN_SKIP: "Skip flagged sequences",
+    PRESCREEN_OFF: "Off",
+}
+MODEL_RULES = {model: ENDPOINT_RULES[MODEL_ENDPOINTS[model]] for model in MODEL_OPTIONS}
 MODEL_NOTES = {
     MODEL_ABNATIV: "AbNatiV expects a full variable-domain sequence (>= 95 aa).",
     MODEL_NBFORGE: "NbForge works best with full VHH sequences; short fragments may fail ANARCI numbering.",
@@ -34,119 +77,175 @@ MODEL_NOTES = {
 }
 
 
-RESULT_DF_KEY = "sequencing_results_df"
-RESULT_CSV_KEY = "sequencing_results_csv"
+RESULT_TOKEN_KEY = "sequencing_results_token"
 DOWNLOAD_COUNTER_KEY = "sequencing_download_counter"
 RESULT_FILENAME_KEY = "sequencing_results_filename"
+EXPORT_FORMAT_KEY = "sequencing_export_format"
+MODEL_SELECTION_KEY = "sequencing_model"
+WARMED_KEY = "sequencing_endpoints_warmed"
 
 
-def _parse_csv_sequences(uploaded_file) -> List[Tuple[str, str]]:
-    text = uploaded_file.getvalue().decode("utf-8")
-    reader = csv.DictReader(io.StringIO(text))
-    if not reader.fieldnames:
-        raise ValueError("Uploaded CSV must include headers with a sequence column.")
-
-    normalized = {name.lower(): name for name in reader.fieldnames}
-    sequence_col = next(
-        (
-            original
-            for key, original in normalized.items()
-            if key in {"sequence", "heavy_chain", "heavychain", "vh", "vh_sequence"}
-        ),
-        None,
-    )
-    if not sequence_col:
-        raise ValueError(
-            "CSV needs a sequence column named 'sequence', 'heavy_chain', or 'vh'."
-        )
-
-    id_col = next(
-        (
-            original
-            for key, original in normalized.items()
-            if key in {"id", "name", "sequence_id"}
-        ),
-        None,
-    )
-
-    sequences: List[Tuple[str, str]] = []
-    for idx, row in enumerate(reader, start=1):
-        seq_value = (row.get(sequence_col) or "").strip()
-        if not seq_value:
-            continue
-        sequence_id = (
-            (row.get(id_col) or f"csv_sequence_{idx}")
-            if id_col
-            else f"csv_sequence_{idx}"
-        )
-        sequences.append((sequence_id, seq_value))
-
-    if not sequences:
-        raise ValueError("No valid sequences were found in the uploaded CSV.")
-
-    return sequences
+def _warm_selected_model() -> None:
+    model = st.session_state.get(MODEL_SELECTION_KEY, MODEL_OPTIONS[0])
+    get_warmer().warm([MODEL_ENDPOINTS[model]])
 
 
 def _gather_sequences(
     heavy_chain_sequence: str, uploaded_file
-) -> List[Tuple[str, str]]:
-    sequences: List[Tuple[str, str]] = []
+) -> Iterator[Tuple[str, str]]:
+    sources: List[Iterable[Tuple[str, str]]] = []
 
     if uploaded_file is not None:
-        sequences.extend(_parse_csv_sequences(uploaded_file))
+        sources.append(iter_uploaded_sequences(uploaded_file, uploaded_file.name))
 
     manual_sequence = heavy_chain_sequence.strip().replace("\n", "")
     if manual_sequence:
-        sequences.append(("manual_sequence", manual_sequence))
+        sources.append([("manual_sequence", manual_sequence)])
 
-    if not sequences:
-        raise ValueError("Provide a sequence in the text area or upload a CSV file.")
+    if not sources:
+        raise ValueError("Provide a sequence in the text area or upload a sequence file.")
 
-    return sequences
+    return itertools.chain.from_iterable(sources)
 
 
-def _looks_like_valid_protein_sequence(sequence: str) -> bool:
-    allowed = set("ACDEFGHIKLMNPQRSTVWY")
-    return bool(sequence) and all(residue in allowed for residue in sequence.upper())
+def _sequence_checks(sequence: str) -> tuple[str, int, int]:
+    cleaned = clean_sequence(sequence).upper()
+    checks = inspect_sequences([cleaned])
+    return cleaned, int(checks.lengths[0]), int(checks.invalid_counts[0])
 
 
 def _abnativ_sequence_status(sequence: str) -> tuple[str, str]:
-    cleaned = sequence.strip().replace("\n", "").upper()
+    cleaned, length, invalid_count = _sequence_checks(sequence)
     if not cleaned:
         return (
             "info",
             f"AbNatiV expects a full variable-domain sequence (>= {ABNATIV_MIN_SEQUENCE_LENGTH} aa).",
         )
-    if not _looks_like_valid_protein_sequence(cleaned):
+    if invalid_count:
         return ("warning", "Sequence has non-standard amino-acid characters.")
-    if len(cleaned) < ABNATIV_MIN_SEQUENCE_LENGTH:
+    if length < ABNATIV_MIN_SEQUENCE_LENGTH:
         return (
             "warning",
-            f"Sequence length is {len(cleaned)} aa. AbNatiV usually needs >= {ABNATIV_MIN_SEQUENCE_LENGTH} aa.",
+            f"Sequence length is {length} aa. AbNatiV usually needs >= {ABNATIV_MIN_SEQUENCE_LENGTH} aa.",
         )
-    return ("success", f"Sequence length is {len(cleaned)} aa. Looks valid for AbNatiV.")
+    return ("success", f"Sequence length is {length} aa. Looks valid for AbNatiV.")
 
 
 def _model_sequence_status(model: str, sequence: str) -> tuple[str, str]:
     if model == MODEL_ABNATIV:
         return _abnativ_sequence_status(sequence)
 
-    cleaned = sequence.strip().replace("\n", "").upper()
+    cleaned, length, invalid_count = _sequence_checks(sequence)
     if not cleaned:
         return ("info", MODEL_NOTES[model])
-    if not _looks_like_valid_protein_sequence(cleaned):
+    if invalid_count:
         return ("warning", "Sequence has non-standard amino-acid characters.")
-    if len(cleaned) < MODEL_RECOMMENDED_MIN_LENGTH:
+    if length < MODEL_RECOMMENDED_MIN_LENGTH:
         return (
             "warning",
-            f"Sequence length is {len(cleaned)} aa. Full domains (>= {MODEL_RECOMMENDED_MIN_LENGTH} aa) are recommended.",
+            f"Sequence length is {length} aa. Full domains (>= {MODEL_RECOMMENDED_MIN_LENGTH} aa) are recommended.",
+        )
+    return ("success", f"Sequence length is {length} aa. Input looks good for {model}.")
+
+
+def _run_abnativ(
+    sequences: Iterable[Tuple[str, str]], on_outcome: OutcomeCallback
+) -> Tuple[pd.DataFrame | None, List[str]]:
+    rules = MODEL_RULES[MODEL_ABNATIV]
+    cleaned = (
+        (sequence_id, prepare_sequence(sequence_value, rules))
+        for sequence_id, sequence_value in sequences
+    )
+    return run_abnativ_batch(cleaned, nativeness_type="VH2", on_outcome=on_outcome)
+
+
+def _run_model(
+    model: str, sequences: Iterable[Tuple[str, str]], on_outcome: OutcomeCallback
+) -> Tuple[pd.DataFrame | None, List[str]]:
+    """Stream ``sequences`` through the selected model's client."""
+
+    if model == MODEL_ABNATIV:
+        return _run_abnativ(sequences, on_outcome)
+    if model == MODEL_NBFORGE:
+        return run_nbforge_batch(sequences, on_outcome=on_outcome)
+    if model == MODEL_NBFRAME:
+        return run_nbframe_batch(sequences, on_outcome=on_outcome)
+    return run_nanomelt_batch(sequences, on_outcome=on_outcome)
+
+
+def _expand_duplicates(
+    results_df,
+    failures: List[str],
+    outcomes: List[Optional[bool]],
+    rows: SequenceStore,
+    unique_rows: SequenceStore,
+    inverse: np.ndarray,
+) -> Tuple[pd.DataFrame | None, List[str]]:
+    """Give every row in ``rows`` the result of its unique sequence, under its own ID.
+
+    ``outcomes`` holds the runner's outcome for each unique row in dispatch
+    order, so the n-th result row and the n-th failure belong to the n-th
+    ``True`` and ``False`` outcome; user IDs do not have to be unique.
+    """
+
+    unique_count = len(unique_rows)
+    sequence_ids = np.array(
+        [rows.sequence_id(row) for row in range(len(rows))], dtype=object
+    )
+    if len(rows) > unique_count:
+        st.caption(
+            f"{len(rows) - unique_count} duplicate sequence(s) were sent once and reuse that result."
+        )
+    outcome_codes = np.array(
+        [-1 if outcome is None else int(outcome) for outcome in outcomes],
+        dtype=np.int8,
+    )
+
+    if results_df is not None and not results_df.empty:
+        result_row = np.full(unique_count, -1, dtype=np.int64)
+        result_row[np.flatnonzero(outcome_codes == 1)] = np.arange(len(results_df))
+        taken = result_row[inverse]
+        present = taken >= 0
+        results_df = results_df.iloc[taken[present]].reset_index(drop=True)
+        results_df["sequence_id"] = sequence_ids[present]
+
+    if not failures or len(rows) == unique_count:
+        return results_df, failures
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[order], np.arange(unique_count + 1))
+    expanded: List[str] = []
+    for failure, unique_row in zip(failures, np.flatnonzero(outcome_codes == 0)):
+        # Failures read "<submitted id>: <message>"; relabel the copies.
+        prefix = f"{unique_rows.sequence_id(unique_row)}: "
+        message = failure[len(prefix) :] if failure.startswith(prefix) else failure
+        expanded.extend(
+            f"{sequence_ids[row]}: {message}"
+            for row in order[bounds[unique_row] : bounds[unique_row + 1]]
         )
-    return ("success", f"Sequence length is {len(cleaned)} aa. Input looks good for {model}.")
+    return results_df, expanded
+
+
+def _render_validation(report: ValidationReport) -> None:
+    if report.issues.empty:
+        return
+
+    if report.rejected:
+        st.warning(
+            f"{report.rejected} of {report.total} sequence(s) failed validation and will be skipped."
+        )
+    else:
+        st.info(
+            f"{len(report.issues)} validation warning(s); these sequences may fail remotely."
+        )
+    with st.expander("Validation details", expanded=not report.accepted):
+        st.dataframe(report.issues, use_container_width=True, hide_index=True)
 
 
 def _reset_results_state() -> None:
-    st.session_state.pop(RESULT_DF_KEY, None)
-    st.session_state.pop(RESULT_CSV_KEY, None)
+    token = st.session_state.pop(RESULT_TOKEN_KEY, None)
+    if token is not None:
+        get_result_store().discard(token)
+        discard_cached_exports(token)
     st.session_state.pop(RESULT_FILENAME_KEY, None)
 
 
@@ -156,16 +255,43 @@ def _next_download_key() -> str:
     return f"download_csv_{current}"
 
 
-def _store_results(results_df, csv_value: str, csv_filename: str) -> None:
-    st.session_state[RESULT_DF_KEY] = results_df
-    st.session_state[RESULT_CSV_KEY] = csv_value
-    st.session_state[RESULT_FILENAME_KEY] = csv_filename
+def _store_results(results_df, file_stem: str) -> str:
+    _reset_results_state()
+    token = get_result_store().put(results_df)
+    st.session_state[RESULT_TOKEN_KEY] = token
+    st.session_state[RESULT_FILENAME_KEY] = file_stem
+    return token
+
+
+def _load_results():
+    token = st.session_state.get(RESULT_TOKEN_KEY)
+    if token is None:
+        return None, None
+    results_df = get_result_store().get(token)
+    if results_df is None:
+        _reset_results_state()
+        return None, None
+    return results_df, token
+
+
+def _export_stored_results(token: str, file_format: str) -> bytes:
+    results_df = get_result_store().get(token)
+    if results_df is None:
+        raise RuntimeError("These results have expired; run the model again.")
+    return cached_export(token, results_df, file_format)
 
 
 def render():
     """Render the sequencing page."""
     st.header("Sequencing")
 
+    warmer = get_warmer()
+    warmer.touch()
+    if not st.session_state.get(WARMED_KEY):
+        # First visit in this session: wake the service and every model.
+        warmer.warm()
+        st.session_state[WARMED_KEY] = True
+
     if pd is None:
         st.error(
             "Pandas is required to display sequencing results. Install pandas and restart the app."
@@ -183,12 +309,22 @@ def render():
         )
 
         uploaded_file = st.file_uploader(
-            "Upload CSV File (Optional)",
-            type=["csv"],
-            help="Upload a CSV file with sequences",
+            "Upload Sequence File (Optional)",
+            type=SUPPORTED_UPLOAD_TYPES,
+            help=(
+                "Upload a CSV, FASTA or Parquet file with sequences. "
+                "CSV and FASTA files may be gzip (.gz) or zstd (.zst) compressed."
+            ),
+            on_change=_warm_selected_model,
         )
 
-        model_selection = st.radio("Select Model", options=MODEL_OPTIONS, index=0)
+        model_selection = st.radio(
+            "Select Model",
+            options=MODEL_OPTIONS,
+            index=0,
+            key=MODEL_SELECTION_KEY,
+            on_change=_warm_selected_model,
+        )
         status, message = _model_sequence_status(model_selection, heavy_chain_sequence)
         if status == "success":
             st.success(message)
@@ -197,179 +333,147 @@ def render():
         else:
             st.info(message)
 
+        prescreen_mode = PRESCREEN_OFF
+        if model_selection in FRAMEWORK_SCREEN_MODELS:
+            prescreen_mode = st.radio(
+                "Framework pre-screen",
+                options=PRESCREEN_MODES,
+                index=PRESCREEN_MODES.index(DEFAULT_PRESCREEN_MODE),
+                format_func=PRESCREEN_LABELS.get,
+                horizontal=True,
+                help=(
+                    "Checks conserved Cys/Trp anchors, the FR4 motif and CDR3 span locally "
+                    "to catch sequences that will fail antibody numbering before they are sent."
+                ),
+            )
+
         run_button = st.button("Run", type="primary", use_container_width=True)
 
     with right_col:
         st.subheader("Output")
         output_placeholder = st.empty()
+        export_format = st.selectbox(
+            "Download format",
+            options=list(EXPORT_FORMATS),
+            format_func=lambda key: EXPORT_FORMATS[key].label,
+            key=EXPORT_FORMAT_KEY,
+        )
         download_placeholder = st.empty()
 
-    def _render_output(df, csv_data, file_name):
+    def _render_output(df, token, file_stem):
         with output_placeholder:
             if df is not None and not df.empty:
                 st.dataframe(df, use_container_width=True)
             else:
                 st.info("Output will appear here after running the model.")
 
+        export_spec = EXPORT_FORMATS[export_format]
+        has_results = df is not None and token is not None
         with download_placeholder:
+            # Export bytes are only built when the button is clicked.
             st.download_button(
-                label="Download CSV",
-                data=csv_data or "",
-                file_name=file_name or "sequencing_results.csv",
-                mime="text/csv",
+                label=f"Download {export_spec.label}",
+                data=(
+                    functools.partial(_export_stored_results, token, export_format)
+                    if has_results
+                    else ""
+                ),
+                file_name=export_filename(
+                    file_stem or "sequencing_results", export_format
+                ),
+                mime=export_spec.mime,
                 use_container_width=True,
-                disabled=csv_data is None,
+                disabled=not has_results,
                 key=_next_download_key(),
             )
 
     st.session_state[DOWNLOAD_COUNTER_KEY] = 0
+    stored_df, stored_token = _load_results()
     _render_output(
-        st.session_state.get(RESULT_DF_KEY),
-        st.session_state.get(RESULT_CSV_KEY),
-        st.session_state.get(RESULT_FILENAME_KEY),
+        stored_df, stored_token, st.session_state.get(RESULT_FILENAME_KEY)
     )
 
     if not run_button:
         return
 
-    try:
-        sequences = _gather_sequences(heavy_chain_sequence, uploaded_file)
-    except ValueError as exc:
-        _reset_results_state()
-        st.error(str(exc))
-        return
-
-    if model_selection == MODEL_ABNATIV:
-        successes: List[Tuple[str, float]] = []
-        failures: List[str] = []
-
-        with st.spinner("Calling AbNatiV API..."):
-            for sequence_id, sequence_value in sequences:
-                cleaned = sequence_value.strip().replace("\n", "").upper()
-                if len(cleaned) < ABNATIV_MIN_SEQUENCE_LENGTH:
-                    failures.append(
-                        f"{sequence_id}: sequence too short for AbNatiV; provide a full variable-domain sequence "
-                        f"(>= {ABNATIV_MIN_SEQUENCE_LENGTH} aa)."
-                    )
-                    continue
-                if not _looks_like_valid_protein_sequence(cleaned):
-                    failures.append(
-                        f"{sequence_id}: sequence contains non-standard amino-acid characters."
-                    )
-                    continue
-                try:
-                    result = run_abnativ(
-                        cleaned,
-                        nativeness_type="VH2",
-                        output_id=sequence_id,
-                    )
-                except Exception as exc:  # pragma: no cover - surface to UI
-                    failures.append(f"{sequence_id}: {exc}")
-                    continue
-
-                successes.append((sequence_id, result.nativeness_score))
-
-        if not successes:
-            _reset_results_state()
-            _render_output(None, None, None)
-            st.error("AbNatiV processing failed for all sequences.")
-            if failures:
-                st.caption("Failure details")
-                st.code("\n".join(failures))
-            return
-
-        results_df = pd.DataFrame(
-            successes, columns=["sequence_id", "nativeness_score"]
+    with run_context() as run_id, span("sequencing_run", model=model_selection):
+        st.caption(f"Run ID `{run_id}` (sent to the services as `X-Run-ID`)")
+        _execute_run(
+            model_selection,
+            heavy_chain_sequence,
+            uploaded_file,
+            prescreen_mode,
+            _render_output,
         )
-        csv_buffer = io.StringIO()
-        results_df.to_csv(csv_buffer, index=False)
-        csv_value = csv_buffer.getvalue()
-        csv_filename = "abnativ_results.csv"
 
-        _store_results(results_df, csv_value, csv_filename)
-        _render_output(results_df, csv_value, csv_filename)
 
-        st.success(f"Processed {len(successes)} sequence(s) via AbNatiV API.")
-        if failures:
-            st.warning("Some sequences failed")
-            st.code("\n".join(failures))
-        return
-
-    if model_selection == MODEL_NBFORGE:
-        with st.spinner("Calling NbForge API..."):
-            results_df, failures = run_nbforge_batch(sequences)
+def _execute_run(
+    model_selection, heavy_chain_sequence, uploaded_file, prescreen_mode, render_output
+) -> None:
+    """Parse, validate, dispatch, collect and render one run, one span per stage."""
 
-        if results_df is None or results_df.empty:
-            _reset_results_state()
-            _render_output(None, None, None)
-            st.error("NbForge processing failed for all sequences.")
-            if failures:
-                st.caption("Failure details")
-                st.code("\n".join(failures))
-            return
-
-        csv_buffer = io.StringIO()
-        results_df.to_csv(csv_buffer, index=False)
-        csv_value = csv_buffer.getvalue()
-        csv_filename = "nbforge_results.csv"
-
-        _store_results(results_df, csv_value, csv_filename)
-        _render_output(results_df, csv_value, csv_filename)
+    try:
+        with span("parse") as stage:
+            store = SequenceStore.from_records(
+                (sequence_id, clean_sequence(sequence))
+                for sequence_id, sequence in _gather_sequences(
+                    heavy_chain_sequence, uploaded_file
+                )
+            )
+            stage["sequences"] = len(store)
+        with span("validate") as stage:
+            report = validate_store(
+                store, MODEL_RULES[model_selection], framework_mode=prescreen_mode
+            )
+            stage["accepted"] = report.accepted
+            _render_validation(report)
+        if not report.accepted:
+            raise ValueError(
+                f"No sequences passed validation for {model_selection}; nothing was sent."
+            )
 
-        st.success(f"Processed {len(results_df)} sequence(s) via NbForge API.")
-        if failures:
-            st.warning("Some sequences failed")
-            st.code("\n".join(failures))
+        accepted = store[report.keep]
+        unique_rows, inverse = accepted.unique()
+        BATCH_DEDUPLICATED.inc(
+            len(accepted) - len(unique_rows), model=MODEL_ENDPOINTS[model_selection]
+        )
+        if len(unique_rows) >= BIG_BATCH_SIZE:
+            get_warmer().warm([MODEL_ENDPOINTS[model_selection]])
+        with span("dispatch", sequences=len(unique_rows)) as stage, st.spinner(
+            f"Calling {model_selection} API..."
+        ):
+            outcomes: List[Optional[bool]] = []
+            results_df, failures = _run_model(
+                model_selection, unique_rows, outcomes.append
+            )
+            stage["failures"] = len(failures)
+        with span("collect"):
+            results_df, failures = _expand_duplicates(
+                results_df, failures, outcomes, accepted, unique_rows, inverse
+            )
+    except ValueError as exc:
+        _reset_results_state()
+        render_output(None, None, None)
+        st.error(str(exc))
         return
 
-    if model_selection == MODEL_NBFRAME:
-        with st.spinner("Calling NbFrame API..."):
-            results_df, failures = run_nbframe_batch(sequences)
-
+    with span("render", rows=0 if results_df is None else len(results_df)):
         if results_df is None or results_df.empty:
             _reset_results_state()
-            _render_output(None, None, None)
-            st.error("NbFrame processing failed for all sequences.")
+            render_output(None, None, None)
+            st.error(f"{model_selection} processing failed for all sequences.")
             if failures:
                 st.caption("Failure details")
                 st.code("\n".join(failures))
             return
 
-        csv_buffer = io.StringIO()
-        results_df.to_csv(csv_buffer, index=False)
-        csv_value = csv_buffer.getvalue()
-        csv_filename = "nbframe_results.csv"
-
-        _store_results(results_df, csv_value, csv_filename)
-        _render_output(results_df, csv_value, csv_filename)
+        file_stem = f"{model_selection.lower()}_results"
+        token = _store_results(results_df, file_stem)
+        render_output(results_df, token, file_stem)
 
-        st.success(f"Processed {len(results_df)} sequence(s) via NbFrame API.")
+        st.success(
+            f"Processed {len(results_df)} sequence(s) via {model_selection} API."
+        )
         if failures:
             st.warning("Some sequences failed")
             st.code("\n".join(failures))
-        return
-
-    with st.spinner("Calling NanoMelt API..."):
-        results_df, failures = run_nanomelt_batch(sequences)
-
-    if results_df is None or results_df.empty:
-        _reset_results_state()
-        _render_output(None, None, None)
-        st.error("NanoMelt processing failed for all sequences.")
-        if failures:
-            st.caption("Failure details")
-            st.code("\n".join(failures))
-        return
-
-    csv_buffer = io.StringIO()
-    results_df.to_csv(csv_buffer, index=False)
-    csv_value = csv_buffer.getvalue()
-    csv_filename = "nanomelt_results.csv"
-
-    _store_results(results_df, csv_value, csv_filename)
-    _render_output(results_df, csv_value, csv_filename)
-
-    st.success(f"Processed {len(results_df)} sequence(s) via NanoMelt API.")
-    if failures:
-        st.warning("Some sequences failed")
-        st.code("\n".join(failures))
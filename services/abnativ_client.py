@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sized, Tuple
 
+import pandas as pd
 from requests import HTTPError
 
 from .api_client import extract_failures, post_json
+from .metrics import OutcomeCallback, track_batch
+from .result_schema import ABNATIV_SCHEMA, ColumnarBuilder
+from .tracing import sequence_context
 
 
-@dataclass
+# Everything run_abnativ reads from a response; other blocks are dropped.
+_LEAN_FIELDS = frozenset({"sequence_id", "scores", "failures"})
+
+
+@dataclass(slots=True)
 class AbnativResult:
     sequence_id: str
     nativeness_score: float
-    residue_scores_path: Optional[str]
-    raw_sequence_payload: Any
+    residue_scores_path: Optional[str] = None
+    raw_sequence_payload: Any = None
 
 
 def _resolve_nativeness_score(
@@ -50,8 +58,15 @@ def run_abnativ(
     output_id: str = "streamlit_sequence",
     do_align: bool = True,
     is_vhh: bool = False,
+    keep_raw: bool = False,
+    lean: bool = False,
 ) -> AbnativResult:
-    """Score a single sequence via the managed AbNatiV Cloud Run API."""
+    """Score a single sequence via the managed AbNatiV Cloud Run API.
+
+    The response is kept on ``raw_sequence_payload`` only when ``keep_raw`` is
+    set. ``lean=True`` projects the response down to the ID, failures and the
+    scalar scores as soon as it is decoded, dropping per-residue blocks.
+    """
 
     cleaned_sequence = sequence.strip().replace("\n", "")
     if not cleaned_sequence:
@@ -66,7 +81,10 @@ def run_abnativ(
     }
 
     try:
-        response = post_json("abnativ", payload)
+        with sequence_context(output_id):
+            response = post_json(
+                "abnativ", payload, fields=_LEAN_FIELDS if lean else None
+            )
     except HTTPError as exc:
         if exc.response is not None and exc.response.status_code == 404:
             raise RuntimeError("AbNatiV API endpoint is unavailable.") from exc
@@ -78,12 +96,78 @@ def run_abnativ(
     scores_block = response.get("scores") if isinstance(response, dict) else None
     if not isinstance(scores_block, dict):
         raise RuntimeError("AbNatiV did not return a scores payload.")
+    if lean:
+        scores_block = {
+            key: value
+            for key, value in scores_block.items()
+            if not isinstance(value, (dict, list))
+        }
+        response = {**response, "scores": scores_block}
 
     nativeness_value = _resolve_nativeness_score(scores_block, nativeness_type)
 
     return AbnativResult(
         sequence_id=response.get("sequence_id", output_id),
         nativeness_score=nativeness_value,
-        residue_scores_path=None,
-        raw_sequence_payload=response,
+        raw_sequence_payload=response if keep_raw else None,
     )
+
+
+def run_abnativ_batch(
+    sequences: Iterable[Tuple[str, str]],
+    *,
+    nativeness_type: str = "VH2",
+    do_align: bool = True,
+    is_vhh: bool = False,
+    on_outcome: Optional[OutcomeCallback] = None,
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Score ``sequences`` one request at a time via the AbNatiV API.
+
+    Only the nativeness score is kept, so every request runs in lean mode.
+    ``on_outcome`` is called once per input, in order (see
+    :class:`~services.metrics.BatchTracker`).
+    """
+
+    if isinstance(sequences, Sized) and not sequences:
+        raise ValueError("At least one sequence is required to call AbNatiV.")
+
+    results = ColumnarBuilder(ABNATIV_SCHEMA)
+    failures: List[str] = []
+    processed = 0
+
+    with track_batch("abnativ", sequences, on_outcome) as batch:
+        for idx, (sequence_id, raw_value) in enumerate(sequences, start=1):
+            if not (raw_value or "").strip():
+                batch.skipped()
+                continue
+            processed += 1
+            sequence_id = sequence_id or f"sequence_{idx}"
+            try:
+                result = run_abnativ(
+                    raw_value,
+                    nativeness_type=nativeness_type,
+                    output_id=sequence_id,
+                    do_align=do_align,
+                    is_vhh=is_vhh,
+                    lean=True,
+                )
+            except Exception as exc:  # pragma: no cover - surfaced in UI
+                failures.append(f"{sequence_id}: {exc}")
+                batch.dispatched(False)
+                continue
+
+            results.add_row(
+                (
+                    ("sequence_id", sequence_id),
+                    ("nativeness_score", result.nativeness_score),
+                )
+            )
+            batch.dispatched(True)
+
+    if not processed:
+        raise ValueError("All provided sequences were empty after cleaning.")
+
+    return results.to_frame(), failures
+
+
+__all__ = ["AbnativResult", "run_abnativ", "run_abnativ_batch"]
@@ -2,22 +2,116 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import json
+import logging
 import os
+import threading
 import time
-from typing import Any, Dict
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, Iterator, Optional, Tuple, Type
 
 import requests
+import urllib3
 from requests import RequestException, Response
 
+from .cassette import MODE_REPLAY, REPLAY_BASE_URL, cassette_mode, make_adapter
+from .metrics import API_IN_FLIGHT, observe_request
+from .telemetry import RequestTimer
+from .tracing import correlation_headers, current_run_id, log_event, new_id
+
 DEFAULT_BASE_URL = os.environ.get("SEQUENCE_LIBRARIES_URL")
-_REQUEST_TIMEOUT = (10, 120)  # connect, read
+_REQUEST_TIMEOUT = (  # connect, read
+    max(0.1, float(os.environ.get("SEQUENCE_API_CONNECT_TIMEOUT_SECONDS", "10"))),
+    max(0.1, float(os.environ.get("SEQUENCE_API_READ_TIMEOUT_SECONDS", "120"))),
+)
 _RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
 _MAX_ATTEMPTS = max(1, int(os.environ.get("SEQUENCE_API_MAX_ATTEMPTS", "3")))
+CONNECTION_POOL_SIZE = 16
 _BACKOFF_SECONDS = max(0.0, float(os.environ.get("SEQUENCE_API_BACKOFF_SECONDS", "1.0")))
+_JSON_CODEC_PREFERENCE = ("orjson", "msgspec", "json")
+_GZIP_MIN_BYTES = max(0, int(os.environ.get("SEQUENCE_API_GZIP_MIN_BYTES", "2048")))
+_GZIP_LEVEL = 6
+_GZIP_DISABLED_PATHS = {
+    item.strip().strip("/").lower()
+    for item in os.environ.get("SEQUENCE_API_GZIP_DISABLED", "").split(",")
+    if item.strip()
+}
+# Whatever urllib3 can decode here: gzip/deflate, plus br/zstd when installed.
+_ACCEPT_ENCODING = urllib3.util.make_headers(accept_encoding=True)["accept-encoding"]
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Encode/decode pair used for request bodies and responses."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+    decode_errors: Tuple[Type[BaseException], ...] = (ValueError,)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    return JsonCodec("orjson", orjson.dumps, orjson.loads, (orjson.JSONDecodeError,))
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec(
+        "msgspec", encoder.encode, decoder.decode, (msgspec.DecodeError, ValueError)
+    )
+
+
+def _stdlib_codec() -> JsonCodec:
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    return JsonCodec("json", dumps, json.loads)
+
+
+_JSON_CODEC_FACTORIES: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def load_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """Return the codec called ``name``, or the fastest one installed.
+
+    ``name`` defaults to ``SEQUENCE_JSON_CODEC``; ``"auto"`` (or unset) tries
+    orjson, then msgspec, then the standard library.
+    """
+
+    requested = (name or os.environ.get("SEQUENCE_JSON_CODEC", "auto")).strip().lower()
+    if requested not in ("", "auto"):
+        if requested not in _JSON_CODEC_FACTORIES:
+            choices = ", ".join(sorted(_JSON_CODEC_FACTORIES))
+            raise ValueError(f"Unknown JSON codec {requested!r}; choose from {choices}.")
+        return _JSON_CODEC_FACTORIES[requested]()
+
+    for candidate in _JSON_CODEC_PREFERENCE:
+        try:
+            return _JSON_CODEC_FACTORIES[candidate]()
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+JSON_CODEC = load_json_codec()
 
 
 def _base_url() -> str:
     raw = os.environ.get("SEQUENCE_LIBRARIES_URL", DEFAULT_BASE_URL or "")
+    if not raw and cassette_mode() == MODE_REPLAY:
+        # Replayed responses are matched on the path, so any host will do.
+        raw = REPLAY_BASE_URL
     if not raw:
         raise RuntimeError(
             "Set the SEQUENCE_LIBRARIES_URL environment variable to point at your managed Sequence services."
@@ -26,7 +120,136 @@ def _base_url() -> str:
 
 
 def _headers() -> Dict[str, str]:
-    return {"Content-Type": "application/json"}
+    return {"Content-Type": "application/json", "Accept-Encoding": _ACCEPT_ENCODING}
+
+
+def _endpoint(path: str) -> str:
+    return path.strip("/").lower()
+
+
+def disable_request_compression(path: str) -> None:
+    """Always send uncompressed bodies to ``path`` from now on."""
+
+    _GZIP_DISABLED_PATHS.add(_endpoint(path))
+
+
+def _encode_body(
+    path: str, payload: Dict[str, Any], compress: Optional[bool]
+) -> Tuple[bytes, bytes, Dict[str, str]]:
+    """Return ``(raw_body, body_to_send, headers)``.
+
+    Bodies of at least ``_GZIP_MIN_BYTES`` are gzip-compressed unless the
+    endpoint has opted out or ``compress`` is ``False``.
+    """
+
+    raw_body = JSON_CODEC.dumps(payload)
+    headers = _headers()
+    if compress is None:
+        compress = _endpoint(path) not in _GZIP_DISABLED_PATHS
+    if not compress or len(raw_body) < _GZIP_MIN_BYTES:
+        return raw_body, raw_body, headers
+
+    headers["Content-Encoding"] = "gzip"
+    return raw_body, gzip.compress(raw_body, compresslevel=_GZIP_LEVEL, mtime=0), headers
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session whose connections report their setup time.
+
+    With a cassette configured the session records to it or replays from it;
+    see :mod:`services.cassette`.
+    """
+
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = make_adapter(CONNECTION_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+@contextlib.contextmanager
+def _instrumented(
+    endpoint: str, method: str, request_bytes: int = 0
+) -> Iterator[RequestTimer]:
+    """Time one logical request and publish it to telemetry, metrics and the log.
+
+    The timer carries a fresh request ID; callers send it (and the run ID) to
+    the backend via :func:`~services.tracing.correlation_headers`.
+    """
+
+    timer = RequestTimer(endpoint, method, request_bytes=request_bytes)
+    timer.timing.request_id = new_id()
+    timer.timing.run_id = current_run_id()
+    with API_IN_FLIGHT.track(endpoint=endpoint):
+        try:
+            with timer:
+                yield timer
+        finally:
+            observe_request(timer.timing)
+            _log_request(timer)
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1e3, 3)
+
+
+def _log_request(timer: RequestTimer) -> None:
+    timing = timer.timing
+    failed = timing.error is not None or (timing.status_code or 0) >= 400
+    log_event(
+        "api_request",
+        logging.WARNING if failed else logging.INFO,
+        request_id=timing.request_id,
+        endpoint=timing.endpoint,
+        method=timing.method,
+        tag=timing.tag,
+        attempts=timing.attempts,
+        status=timing.status_code,
+        request_bytes=timing.request_bytes,
+        response_bytes=timing.response_bytes,
+        connect_ms=_ms(timing.connect_seconds),
+        ttfb_ms=_ms(timing.ttfb_seconds),
+        download_ms=_ms(timing.download_seconds),
+        total_ms=_ms(timing.total_seconds),
+        cold_start=timing.cold_start_reason,
+        error=timing.error,
+    )
+
+
+def _send(
+    timer: RequestTimer,
+    url: str,
+    body: bytes,
+    headers: Dict[str, str],
+    timeout: Tuple[float, float] = _REQUEST_TIMEOUT,
+    resend: bool = False,
+) -> Response:
+    timer.start_attempt(resend=resend)
+    response = _get_session().post(
+        url, data=body, headers=headers, timeout=timeout, stream=True
+    )
+    timer.headers_received(response)
+    timer.read_body(response)
+    log_event(
+        "api_attempt",
+        logging.DEBUG,
+        request_id=timer.timing.request_id,
+        endpoint=timer.timing.endpoint,
+        attempt=timer.timing.attempts,
+        status=response.status_code,
+        request_bytes=len(body),
+        response_bytes=timer.timing.response_bytes,
+        ttfb_ms=_ms(timer.timing.ttfb_seconds),
+    )
+    return response
 
 
 def _response_preview(response: Response, limit: int = 500) -> str:
@@ -46,31 +269,122 @@ def _raise_http_error(response: Response, url: str) -> None:
     raise requests.HTTPError(message, response=response, request=response.request)
 
 
-def post_json(path: str, payload: Dict[str, Any]) -> Dict[str, Any] | Any:
-    """Send a JSON request to ``path`` and return the decoded payload."""
+def project_fields(payload: Any, fields: Collection[str]) -> Any:
+    """Keep only ``fields`` of a decoded response.
+
+    Top-level keys named in ``fields`` are kept whole. Other nested objects are
+    narrowed to the requested keys they carry, so fields the clients flatten
+    out of blocks such as ``scores`` or ``prediction`` survive. Lists (for
+    example a ``results`` envelope) are projected element by element.
+    """
+
+    if isinstance(payload, list):
+        return [project_fields(item, fields) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+
+    projected: Dict[str, Any] = {}
+    for key, value in payload.items():
+        if key in fields:
+            projected[key] = value
+        elif isinstance(value, dict):
+            projected[key] = {
+                nested_key: nested_value
+                for nested_key, nested_value in value.items()
+                if nested_key in fields
+            }
+        elif key == "results" and isinstance(value, list):
+            projected[key] = project_fields(value, fields)
+    return projected
+
+
+def post_json(
+    path: str,
+    payload: Dict[str, Any],
+    *,
+    fields: Optional[Collection[str]] = None,
+    compress: Optional[bool] = None,
+    max_attempts: int = _MAX_ATTEMPTS,
+    timeout: Tuple[float, float] = _REQUEST_TIMEOUT,
+) -> Dict[str, Any] | Any:
+    """Send a JSON request to ``path`` and return the decoded payload.
+
+    Large bodies are sent gzip-compressed unless ``compress=False`` or the
+    endpoint is listed in ``SEQUENCE_API_GZIP_DISABLED``; an endpoint that
+    answers ``415`` to a compressed body is retried once uncompressed and then
+    no longer compressed. Compressed responses are negotiated and decoded
+    transparently.
+
+    With ``fields`` the decoded payload is passed through
+    :func:`project_fields` before it is returned, so unrequested blocks are
+    released as soon as the body is parsed instead of living as long as the
+    caller's results.
+
+    ``max_attempts`` and ``timeout`` override the retry budget and the
+    ``(connect, read)`` timeout for this call, e.g. for warm-up probes.
+    """
 
     url = f"{_base_url()}/{path.lstrip('/')}"
+    raw_body, body, headers = _encode_body(path, payload, compress)
+    with _instrumented(_endpoint(path), "POST", len(body)) as timer:
+        headers.update(correlation_headers(timer.timing.request_id))
+        response = _post_with_retries(
+            timer, path, url, raw_body, body, headers, max_attempts, timeout
+        )
+        if not response.ok:
+            _raise_http_error(response, url)
+
+        try:
+            decoded = JSON_CODEC.loads(response.content)
+        except JSON_CODEC.decode_errors as exc:  # pragma: no cover - defensive
+            raise RuntimeError("Sequence service returned a non-JSON response.") from exc
+    if fields is None:
+        return decoded
+    return project_fields(decoded, fields)
+
+
+def _post_with_retries(
+    timer: RequestTimer,
+    path: str,
+    url: str,
+    raw_body: bytes,
+    body: bytes,
+    headers: Dict[str, str],
+    max_attempts: int = _MAX_ATTEMPTS,
+    timeout: Tuple[float, float] = _REQUEST_TIMEOUT,
+) -> Response:
+    max_attempts = max(1, max_attempts)
     last_request_error: RequestException | None = None
     response: Response | None = None
 
-    for attempt in range(1, _MAX_ATTEMPTS + 1):
+    for attempt in range(1, max_attempts + 1):
         try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers=_headers(),
-                timeout=_REQUEST_TIMEOUT,
-            )
+            response = _send(timer, url, body, headers, timeout)
+            if response.status_code == 415 and "Content-Encoding" in headers:
+                # Resent uncompressed within the same attempt; not a retry.
+                disable_request_compression(path)
+                log_event(
+                    "api_compression_fallback",
+                    logging.INFO,
+                    request_id=timer.timing.request_id,
+                    endpoint=timer.timing.endpoint,
+                    attempt=attempt,
+                )
+                body = raw_body
+                headers = {k: v for k, v in headers.items() if k != "Content-Encoding"}
+                response = _send(timer, url, body, headers, timeout, resend=True)
         except RequestException as exc:
             last_request_error = exc
-            if attempt >= _MAX_ATTEMPTS:
+            if attempt >= max_attempts:
                 raise RuntimeError(
-                    f"Request failed after {_MAX_ATTEMPTS} attempt(s) for url: {url}"
+                    f"Request failed after {max_attempts} attempt(s) for url: {url}"
                 ) from exc
+            _log_retry(timer, attempt, error=f"{type(exc).__name__}: {exc}")
             time.sleep(_BACKOFF_SECONDS * attempt)
             continue
 
-        if response.status_code in _RETRYABLE_STATUS_CODES and attempt < _MAX_ATTEMPTS:
+        if response.status_code in _RETRYABLE_STATUS_CODES and attempt < max_attempts:
+            _log_retry(timer, attempt, status=response.status_code)
             time.sleep(_BACKOFF_SECONDS * attempt)
             continue
 
@@ -79,17 +393,61 @@ def post_json(path: str, payload: Dict[str, Any]) -> Dict[str, Any] | Any:
     if response is None:
         if last_request_error is not None:
             raise RuntimeError(
-                f"Request failed after {_MAX_ATTEMPTS} attempt(s) for url: {url}"
+                f"Request failed after {max_attempts} attempt(s) for url: {url}"
             ) from last_request_error
         raise RuntimeError(f"No response received for url: {url}")
+    return response
+
+
+def _log_retry(timer: RequestTimer, attempt: int, **fields: Any) -> None:
+    log_event(
+        "api_retry",
+        logging.WARNING,
+        request_id=timer.timing.request_id,
+        endpoint=timer.timing.endpoint,
+        attempt=attempt,
+        backoff_seconds=_BACKOFF_SECONDS * attempt,
+        **fields,
+    )
+
+
+def get_json(
+    path: str = "",
+    *,
+    timeout: Tuple[float, float] = _REQUEST_TIMEOUT,
+) -> Dict[str, Any] | Any:
+    """Send a single GET to ``path`` and return the decoded payload.
 
-    if not response.ok:
-        _raise_http_error(response, url)
+    Unlike :func:`post_json` there is no retry loop; this is meant for cheap
+    health and warm-up probes. Empty bodies decode to ``None``.
+    """
 
-    try:
-        return response.json()
-    except ValueError as exc:  # pragma: no cover - defensive
-        raise RuntimeError("Sequence service returned a non-JSON response.") from exc
+    url = f"{_base_url()}/{path.lstrip('/')}"
+    with _instrumented(_endpoint(path) or "/", "GET") as timer:
+        timer.start_attempt()
+        try:
+            response = _get_session().get(
+                url,
+                headers={
+                    "Accept-Encoding": _ACCEPT_ENCODING,
+                    **correlation_headers(timer.timing.request_id),
+                },
+                timeout=timeout,
+                stream=True,
+            )
+        except RequestException as exc:
+            raise RuntimeError(f"Request failed for url: {url}") from exc
+        timer.headers_received(response)
+        content = timer.read_body(response)
+
+        if not response.ok:
+            _raise_http_error(response, url)
+        if not content:
+            return None
+        try:
+            return JSON_CODEC.loads(content)
+        except JSON_CODEC.decode_errors as exc:
+            raise RuntimeError("Sequence service returned a non-JSON response.") from exc
 
 
 def extract_results(payload: Any) -> list[Dict[str, Any]]:
@@ -114,4 +472,31 @@ def extract_failures(payload: Any) -> list[str]:
     return []
 
 
-__all__ = ["post_json", "extract_results", "extract_failures", "DEFAULT_BASE_URL"]
+def client_limits() -> Dict[str, Any]:
+    """Current retry and connection limits, for display."""
+
+    return {
+        "max_attempts": _MAX_ATTEMPTS,
+        "backoff_seconds": _BACKOFF_SECONDS,
+        "connection_pool_size": CONNECTION_POOL_SIZE,
+        "connect_timeout_seconds": _REQUEST_TIMEOUT[0],
+        "read_timeout_seconds": _REQUEST_TIMEOUT[1],
+        "gzip_min_bytes": _GZIP_MIN_BYTES,
+        "json_codec": JSON_CODEC.name,
+    }
+
+
+__all__ = [
+    "CONNECTION_POOL_SIZE",
+    "client_limits",
+    "JSON_CODEC",
+    "JsonCodec",
+    "disable_request_compression",
+    "get_json",
+    "load_json_codec",
+    "post_json",
+    "project_fields",
+    "extract_results",
+    "extract_failures",
+    "DEFAULT_BASE_URL",
+]
@@ -0,0 +1,297 @@
+"""Record and replay HTTP traffic to the managed services.
+
+With ``SEQUENCE_CASSETTE_MODE=record`` every request the shared client session
+sends is passed through to the service, and the exchange is appended to the
+cassette at ``SEQUENCE_CASSETTE``: the status, the decoded body, the timing
+headers and the measured time to first byte and download time. The cassette
+is gzip-compressed JSON lines. With ``SEQUENCE_CASSETTE_MODE=replay`` nothing
+touches the network. Replayed headers arrive after the recorded time to first
+byte and the body takes the recorded download time to read, both multiplied
+by ``SEQUENCE_CASSETTE_LATENCY_SCALE`` (``0`` for no delay). Requests are matched on method, path and JSON body. Repeated
+requests replay their recorded responses in order, so retries and transient
+errors reproduce exactly.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .telemetry import TimedHTTPAdapter
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+CASSETTE_MODES = (MODE_OFF, MODE_RECORD, MODE_REPLAY)
+# Base URL used in replay mode when SEQUENCE_LIBRARIES_URL is not set.
+REPLAY_BASE_URL = "http://cassette.invalid"
+_FORMAT_VERSION = 1
+# Response headers worth keeping; bodies are stored decoded, so no encodings.
+_KEPT_HEADERS = {
+    "content-type",
+    "retry-after",
+    "server-timing",
+    "x-server-timing",
+    "x-process-time",
+    "x-response-time",
+    "x-inference-time",
+    "x-queue-time",
+    "x-envoy-upstream-service-time",
+}
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Replay found no recorded response for a request."""
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair."""
+
+    method: str
+    path: str
+    request_key: str
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    body: str
+    body_base64: bool = False
+    ttfb_seconds: float = 0.0
+    download_seconds: float = 0.0
+    recorded_at: float = field(default_factory=time.time)
+
+    def content(self) -> bytes:
+        return base64.b64decode(self.body) if self.body_base64 else self.body.encode("utf-8")
+
+
+def request_key(method: str, url: str, body: Optional[bytes], encoding: str = "") -> str:
+    """Stable key for a request: method, path and canonical JSON body."""
+
+    if body and "gzip" in encoding.lower():
+        body = gzip.decompress(body)
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True) if body else ""
+    except ValueError:
+        canonical = body.decode("utf-8", "replace") if body else ""
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+    return f"{method.upper()} {urlsplit(url).path or '/'} {digest}"
+
+
+class Cassette:
+    """The interactions on disk, indexed for replay."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[Interaction]] = defaultdict(deque)
+        self._last: Dict[str, Interaction] = {}
+
+    def load(self) -> "Cassette":
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                record = json.loads(line)
+                if "version" in record:
+                    if record["version"] > _FORMAT_VERSION:
+                        raise ValueError(
+                            f"Cassette {self.path} uses format {record['version']}; "
+                            f"this client reads up to {_FORMAT_VERSION}."
+                        )
+                    continue
+                interaction = Interaction(**record)
+                self._queues[interaction.request_key].append(interaction)
+        return self
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def next_response(self, key: str) -> Interaction:
+        """Return the next recorded response for ``key``; the last one repeats."""
+
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            interaction = self._last.get(key)
+        if interaction is None:
+            raise CassetteMiss(f"No recorded response in {self.path} for {key}.")
+        return interaction
+
+    def append(self, interaction: Interaction) -> None:
+        line = json.dumps(asdict(interaction), separators=(",", ":")) + "\n"
+        with self._lock:
+            is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            # Each append adds a gzip member; readers see one continuous stream.
+            with gzip.open(self.path, "at", encoding="utf-8") as handle:
+                if is_new:
+                    handle.write(json.dumps({"version": _FORMAT_VERSION}) + "\n")
+                handle.write(line)
+
+
+class RecordingHTTPAdapter(TimedHTTPAdapter):
+    """Pass requests through and append each exchange to the cassette."""
+
+    def __init__(self, cassette: Cassette, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        # requests sets ``response.elapsed`` only after the adapter returns.
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        headers_at = time.perf_counter()
+        content = response.content
+        download_seconds = time.perf_counter() - headers_at
+        try:
+            body, encoded = content.decode("utf-8"), False
+        except UnicodeDecodeError:
+            body, encoded = base64.b64encode(content).decode("ascii"), True
+        self.cassette.append(
+            Interaction(
+                method=request.method,
+                path=urlsplit(request.url).path or "/",
+                request_key=request_key(
+                    request.method,
+                    request.url,
+                    request.body,
+                    request.headers.get("Content-Encoding", ""),
+                ),
+                status_code=response.status_code,
+                reason=response.reason or "",
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() in _KEPT_HEADERS
+                },
+                body=body,
+                body_base64=encoded,
+                ttfb_seconds=headers_at - started,
+                download_seconds=download_seconds,
+            )
+        )
+        return response
+
+
+class _ReplayedBody(io.RawIOBase):
+    """Recorded body that takes ``seconds`` to read, spread over its bytes."""
+
+    def __init__(self, content: bytes, seconds: float) -> None:
+        self._body = io.BytesIO(content)
+        self._size = len(content)
+        self._seconds = seconds
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self._body.readinto(buffer)
+        if size and self._seconds > 0:
+            time.sleep(self._seconds * size / self._size)
+        return size
+
+
+class ReplayHTTPAdapter(HTTPAdapter):
+    """Answer every request from the cassette without opening a connection."""
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette.next_response(
+            request_key(
+                request.method,
+                request.url,
+                request.body,
+                request.headers.get("Content-Encoding", ""),
+            )
+        )
+        # requests times ``elapsed`` around this call, so the headers "arrive"
+        # after the recorded TTFB; the download delay is spent reading the body.
+        ttfb = interaction.ttfb_seconds * self.latency_scale
+        if ttfb > 0:
+            time.sleep(ttfb)
+
+        response = requests.Response()
+        response.status_code = interaction.status_code
+        response.reason = interaction.reason
+        response.headers = CaseInsensitiveDict(interaction.headers)
+        response.raw = _ReplayedBody(
+            interaction.content(), interaction.download_seconds * self.latency_scale
+        )
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        return response
+
+
+def cassette_mode() -> str:
+    mode = os.environ.get("SEQUENCE_CASSETTE_MODE", "").strip().lower() or MODE_OFF
+    if mode not in CASSETTE_MODES:
+        raise ValueError(
+            f"Unknown SEQUENCE_CASSETTE_MODE {mode!r}; choose from {', '.join(CASSETTE_MODES)}."
+        )
+    if mode != MODE_OFF and not os.environ.get("SEQUENCE_CASSETTE"):
+        raise ValueError("Set SEQUENCE_CASSETTE to the cassette file to record or replay.")
+    return mode
+
+
+def make_adapter(pool_maxsize: int) -> HTTPAdapter:
+    """Transport adapter for the shared client session, per the cassette settings."""
+
+    mode = cassette_mode()
+    if mode == MODE_OFF:
+        return TimedHTTPAdapter(pool_maxsize=pool_maxsize)
+    cassette = Cassette(os.environ["SEQUENCE_CASSETTE"])
+    if mode == MODE_RECORD:
+        return RecordingHTTPAdapter(cassette, pool_maxsize=pool_maxsize)
+    scale = max(0.0, float(os.environ.get("SEQUENCE_CASSETTE_LATENCY_SCALE", "1.0")))
+    return ReplayHTTPAdapter(cassette.load(), latency_scale=scale)
+
+
+def summarize(path: str) -> List[Dict[str, Any]]:
+    """Per-path counts and recorded latency of a cassette, for a quick look."""
+
+    rows: Dict[str, Dict[str, Any]] = {}
+    for queue in Cassette(path).load()._queues.values():
+        for interaction in queue:
+            row = rows.setdefault(
+                interaction.path,
+                {"path": interaction.path, "interactions": 0, "errors": 0, "seconds": 0.0},
+            )
+            row["interactions"] += 1
+            row["errors"] += int(interaction.status_code >= 400)
+            row["seconds"] += interaction.ttfb_seconds + interaction.download_seconds
+    return sorted(rows.values(), key=lambda row: row["path"])
+
+
+__all__ = [
+    "CASSETTE_MODES",
+    "Cassette",
+    "CassetteMiss",
+    "Interaction",
+    "MODE_OFF",
+    "MODE_RECORD",
+    "MODE_REPLAY",
+    "REPLAY_BASE_URL",
+    "RecordingHTTPAdapter",
+    "ReplayHTTPAdapter",
+    "cassette_mode",
+    "make_adapter",
+    "request_key",
+    "summarize",
+]
@@ -0,0 +1,132 @@
+"""Command-line batch runner for the managed sequence services.
+
+Example::
+
+    python -m services.cli nbforge library.fasta.gz -o nbforge.parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .abnativ_client import run_abnativ_batch
+from .export import EXPORT_FORMATS, FORMAT_CSV, export_results
+from .framework_screen import DEFAULT_PRESCREEN_MODE, PRESCREEN_MODES
+from .nanomelt_client import run_nanomelt_batch
+from .nbforge_client import run_nbforge_batch
+from .nbframe_client import run_nbframe_batch
+from .sequence_io import iter_uploaded_sequences
+from .sequence_store import SequenceStore
+from .validation import MODEL_RULES, prepare_sequence, validate_store
+
+BatchRunner = Callable[[Iterable[Tuple[str, str]]], Tuple[pd.DataFrame, List[str]]]
+
+MODEL_RUNNERS: Dict[str, BatchRunner] = {
+    "abnativ": run_abnativ_batch,
+    "nbforge": run_nbforge_batch,
+    "nbframe": run_nbframe_batch,
+    "nanomelt": run_nanomelt_batch,
+}
+_EXTENSION_FORMATS = {
+    f".{spec.extension}": key for key, spec in EXPORT_FORMATS.items()
+} | {".feather": "arrow", ".ipc": "arrow", ".pq": "parquet"}
+
+
+def _resolve_format(output: Optional[Path], requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    if output is not None:
+        return _EXTENSION_FORMATS.get(output.suffix.lower(), FORMAT_CSV)
+    return FORMAT_CSV
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sequence-cli",
+        description="Run a sequence library through a managed model endpoint.",
+    )
+    parser.add_argument("model", choices=sorted(MODEL_RUNNERS))
+    parser.add_argument(
+        "input",
+        type=Path,
+        help="CSV, FASTA or Parquet library (CSV/FASTA may be .gz or .zst).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Output file; defaults to stdout. The format follows the extension.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(EXPORT_FORMATS),
+        help="Output format, overriding the output file extension.",
+    )
+    parser.add_argument(
+        "--prescreen",
+        choices=PRESCREEN_MODES,
+        default=DEFAULT_PRESCREEN_MODE,
+        help="Framework pre-screen for NbForge/NbFrame: flag, skip or ignore "
+        "sequences unlikely to number (default: %(default)s).",
+    )
+    return parser
+
+
+def _load_validated(path: Path, model: str, prescreen: str) -> SequenceStore:
+    """Read ``path`` and keep the rows that pass the Sequencing page's checks.
+
+    Issues are reported on stderr; raises ``ValueError`` if no row passes.
+    """
+
+    rules = MODEL_RULES[model]
+    with path.open("rb") as handle:
+        store = SequenceStore.from_records(
+            (sequence_id, prepare_sequence(sequence, rules))
+            for sequence_id, sequence in iter_uploaded_sequences(handle, path.name)
+        )
+    report = validate_store(store, rules, framework_mode=prescreen)
+    for issue in report.issues.itertuples(index=False):
+        print(f"{issue.severity}: {issue.sequence_id}: {issue.reason}", file=sys.stderr)
+    if not report.accepted:
+        raise ValueError(f"No sequences passed validation for {model}; nothing was sent.")
+    return store[report.keep]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    file_format = _resolve_format(args.output, args.format)
+
+    try:
+        records = _load_validated(args.input, args.model, args.prescreen)
+        results_df, failures = MODEL_RUNNERS[args.model](records)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    for failure in failures:
+        print(f"failed: {failure}", file=sys.stderr)
+
+    if results_df.empty:
+        print("error: processing failed for all sequences.", file=sys.stderr)
+        return 1
+
+    payload = export_results(results_df, file_format)
+    if args.output is None:
+        sys.stdout.buffer.write(payload)
+    else:
+        args.output.write_bytes(payload)
+        print(
+            f"Wrote {len(results_df)} result(s) to {args.output}",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Serialise result tables to downloadable CSV, Parquet or Arrow IPC payloads."""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from .metrics import record_cache
+
+FORMAT_CSV = "csv"
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW = "arrow"
+_COMPRESSION = "zstd"
+_PAYLOAD_CACHE_TTL_SECONDS = max(
+    0.0, float(os.environ.get("SEQUENCE_EXPORT_CACHE_TTL_SECONDS", "120"))
+)
+_PAYLOAD_CACHE_MAX_ENTRIES = 16
+
+_payload_cache: "OrderedDict[Tuple[str, str], Tuple[float, bytes]]" = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    label: str
+    extension: str
+    mime: str
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    FORMAT_CSV: ExportFormat("CSV", "csv", "text/csv"),
+    FORMAT_PARQUET: ExportFormat(
+        "Parquet", "parquet", "application/vnd.apache.parquet"
+    ),
+    FORMAT_ARROW: ExportFormat(
+        "Arrow IPC", "arrow", "application/vnd.apache.arrow.file"
+    ),
+}
+
+
+def to_arrow_table(dataframe: pd.DataFrame, *, narrow_numbers: bool = True):
+    """Build an Arrow table with concrete column types.
+
+    Object columns are narrowed with pandas' nullable dtypes first; columns that
+    still mix types (for example numbers and error strings) are stored as text.
+    With ``narrow_numbers`` off, numeric columns keep their dtype so the table
+    reads back exactly as it was written.
+    """
+
+    import pyarrow as pa
+
+    typed = dataframe.reset_index(drop=True).convert_dtypes(
+        convert_integer=narrow_numbers, convert_floating=narrow_numbers
+    )
+    arrays = []
+    for column in typed.columns:
+        series = typed[column]
+        try:
+            arrays.append(pa.Array.from_pandas(series))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(
+                pa.Array.from_pandas(series.astype("string"), type=pa.string())
+            )
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in typed.columns])
+
+
+def _to_parquet(dataframe: pd.DataFrame) -> bytes:
+    import pyarrow.parquet as pq
+
+    buffer = io.BytesIO()
+    pq.write_table(to_arrow_table(dataframe), buffer, compression=_COMPRESSION)
+    return buffer.getvalue()
+
+
+def _to_arrow(dataframe: pd.DataFrame) -> bytes:
+    import pyarrow as pa
+
+    table = to_arrow_table(dataframe)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=_COMPRESSION)
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def export_results(dataframe: pd.DataFrame, file_format: str = FORMAT_CSV) -> bytes:
+    """Return ``dataframe`` serialised as ``file_format`` bytes."""
+
+    if file_format == FORMAT_CSV:
+        return dataframe.to_csv(index=False).encode("utf-8")
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {file_format}")
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - pyarrow ships with Streamlit
+        raise RuntimeError(
+            f"{EXPORT_FORMATS[file_format].label} export requires the 'pyarrow' package."
+        ) from exc
+
+    if file_format == FORMAT_PARQUET:
+        return _to_parquet(dataframe)
+    return _to_arrow(dataframe)
+
+
+def _prune_payload_cache(now: float) -> None:
+    expired = [
+        key
+        for key, (created, _) in _payload_cache.items()
+        if now - created > _PAYLOAD_CACHE_TTL_SECONDS
+    ]
+    for key in expired:
+        del _payload_cache[key]
+    while len(_payload_cache) > _PAYLOAD_CACHE_MAX_ENTRIES:
+        _payload_cache.popitem(last=False)
+
+
+def cached_export(
+    cache_key: str, dataframe: pd.DataFrame, file_format: str = FORMAT_CSV
+) -> bytes:
+    """Serialise ``dataframe`` on demand, reusing bytes built in the last few minutes.
+
+    ``cache_key`` must change whenever the underlying results change; repeated
+    clicks on the same download then skip re-serialisation.
+    """
+
+    key = (cache_key, file_format)
+    now = time.monotonic()
+    with _payload_cache_lock:
+        _prune_payload_cache(now)
+        cached = _payload_cache.get(key)
+        if cached is not None:
+            _payload_cache.move_to_end(key)
+            record_cache("export", hit=True)
+            return cached[1]
+
+    record_cache("export", hit=False)
+    payload = export_results(dataframe, file_format)
+    with _payload_cache_lock:
+        _payload_cache[key] = (now, payload)
+        _prune_payload_cache(now)
+    return payload
+
+
+def discard_cached_exports(cache_key: str) -> None:
+    """Drop every cached payload built for ``cache_key``."""
+
+    with _payload_cache_lock:
+        for key in [key for key in _payload_cache if key[0] == cache_key]:
+            del _payload_cache[key]
+
+
+def export_filename(stem: str, file_format: str = FORMAT_CSV) -> str:
+    return f"{stem}.{EXPORT_FORMATS[file_format].extension}"
+
+
+__all__ = [
+    "EXPORT_FORMATS",
+    "ExportFormat",
+    "FORMAT_ARROW",
+    "FORMAT_CSV",
+    "FORMAT_PARQUET",
+    "cached_export",
+    "discard_cached_exports",
+    "export_filename",
+    "export_results",
+    "to_arrow_table",
+]
@@ -0,0 +1,92 @@
+"""Local framework-motif pre-screen for antibody variable domains.
+
+A cheap stand-in for HMM-based numbering: it looks for the hallmark anchors
+that ANARCI relies on (the FR1 and FR3 cysteines, the FR2 tryptophan and the
+FR4 ``WGxG`` motif) and checks that the CDR3 between them has a plausible
+length. Sequences missing anchors are very likely to fail remote numbering in
+NbForge and NbFrame.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import List
+
+PRESCREEN_OFF = "off"
+PRESCREEN_WARN = "warn"
+PRESCREEN_SKIP = "skip"
+PRESCREEN_MODES = [PRESCREEN_WARN, PRESCREEN_SKIP, PRESCREEN_OFF]
+DEFAULT_PRESCREEN_MODE = (
+    os.environ.get("SEQUENCE_PRESCREEN_MODE", PRESCREEN_WARN).strip().lower()
+)
+if DEFAULT_PRESCREEN_MODE not in PRESCREEN_MODES:
+    DEFAULT_PRESCREEN_MODE = PRESCREEN_WARN
+
+# Windows are 0-based offsets. FR1 Cys (Kabat H22) tolerates a short leader or
+# a few missing N-terminal residues; the others are placed relative to it.
+_CYS1_WINDOW = (15, 32)
+_TRP_AFTER_CYS1 = (9, 21)
+_CYS2_AFTER_CYS1 = (60, 84)
+_FR4_AFTER_CYS2 = (3, 40)
+_CDR3_SPAN = (2, 36)
+
+_FR2_MOTIF = re.compile(r"W[VFYILA][RKQ][QEKRH]")
+_CYS2_MOTIF = re.compile(r"[YFHLW][YFHCRWS]C")
+_FR4_MOTIF = re.compile(r"W[GSARE].[GQRS]")
+
+
+def _find(pattern: "re.Pattern[str]", sequence: str, start: int, stop: int) -> int:
+    match = pattern.search(sequence, max(0, start), max(0, stop))
+    return match.start() if match else -1
+
+
+def screen_framework(sequence: str) -> List[str]:
+    """Return reasons ``sequence`` is unlikely to number; empty when it looks fine."""
+
+    sequence = sequence.upper()
+    cys1 = sequence.find("C", *_CYS1_WINDOW)
+    if cys1 < 0:
+        return ["no conserved FR1 cysteine near position 22"]
+
+    reasons: List[str] = []
+    trp = _find(
+        _FR2_MOTIF, sequence, cys1 + _TRP_AFTER_CYS1[0], cys1 + _TRP_AFTER_CYS1[1] + 4
+    )
+    if trp < 0 and sequence.find(
+        "W", cys1 + _TRP_AFTER_CYS1[0], cys1 + _TRP_AFTER_CYS1[1]
+    ) < 0:
+        reasons.append("no conserved FR2 tryptophan near position 36")
+
+    cys2_motif = _find(
+        _CYS2_MOTIF,
+        sequence,
+        cys1 + _CYS2_AFTER_CYS1[0] - 2,
+        cys1 + _CYS2_AFTER_CYS1[1] + 1,
+    )
+    if cys2_motif < 0:
+        reasons.append("no conserved FR3 cysteine near position 92")
+        return reasons
+
+    cys2 = cys2_motif + 2
+    fr4 = _find(
+        _FR4_MOTIF, sequence, cys2 + _FR4_AFTER_CYS2[0], cys2 + _FR4_AFTER_CYS2[1] + 4
+    )
+    if fr4 < 0:
+        reasons.append("no FR4 W-G-x-G motif after the CDR3")
+        return reasons
+
+    cdr3_span = fr4 - cys2 - 1
+    if not _CDR3_SPAN[0] <= cdr3_span <= _CDR3_SPAN[1]:
+        reasons.append(f"implausible CDR3 span of {cdr3_span} residues")
+    return reasons
+
+
+__all__ = [
+    "DEFAULT_PRESCREEN_MODE",
+    "PRESCREEN_MODES",
+    "PRESCREEN_OFF",
+    "PRESCREEN_SKIP",
+    "PRESCREEN_WARN",
+    "screen_framework",
+]
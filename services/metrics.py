@@ -0,0 +1,510 @@
+"""In-process metrics registry with a Prometheus text exposition.
+
+Counters, gauges and histograms are kept per label set in plain dictionaries
+guarded by one lock; rendering happens only when ``/metrics`` is scraped or the
+text file is dumped. Set ``SEQUENCE_METRICS_PORT`` to serve ``/metrics`` from a
+daemon thread, and/or ``SEQUENCE_METRICS_FILE`` to rewrite a textfile-collector
+file every ``SEQUENCE_METRICS_DUMP_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .telemetry import REQUEST_TAG, RequestTiming
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_DUMP_SECONDS = max(1.0, float(os.environ.get("SEQUENCE_METRICS_DUMP_SECONDS", "15")))
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str], lock: threading.Lock
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = lock
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}."
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _render_samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape(self.help_text)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str], lock: threading.Lock
+    ) -> None:
+        super().__init__(name, help_text, labelnames, lock)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def values(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def _render_samples(self) -> Iterable[str]:
+        for key, value in sorted(self.values().items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    @contextlib.contextmanager
+    def track(self, **labels: object) -> Iterator[None]:
+        """Count the block as in progress while it runs."""
+
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str],
+        lock: threading.Lock,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames, lock)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * len(self.buckets)
+                self._sums[key] = 0.0
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._sums[key] += value
+
+    def snapshot(self) -> Dict[LabelValues, Tuple[List[int], float]]:
+        """Per label set: cumulative bucket counts (last one is the total) and sum."""
+
+        with self._lock:
+            snapshot = {}
+            for key, counts in self._counts.items():
+                cumulative, running = [], 0
+                for count in counts:
+                    running += count
+                    cumulative.append(running)
+                snapshot[key] = (cumulative, self._sums[key])
+            return snapshot
+
+    def _render_samples(self) -> Iterable[str]:
+        for key, (cumulative, total) in sorted(self.snapshot().items()):
+            for bound, count in zip(self.buckets, cumulative):
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {count}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative[-1]}"
+
+
+class MetricsRegistry:
+    """Named metrics that render together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._values_lock = threading.Lock()
+
+    def _register(self, cls, name: str, help_text: str, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(
+                    name, help_text, labelnames, self._values_lock, **kwargs
+                )
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered differently.")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+API_REQUESTS = REGISTRY.counter(
+    "sequence_api_requests_total",
+    "Requests to the managed endpoints by final HTTP status ('error' if none).",
+    ("endpoint", "method", "status"),
+)
+API_RETRIES = REGISTRY.counter(
+    "sequence_api_retries_total",
+    "Extra attempts made after a retryable failure.",
+    ("endpoint",),
+)
+API_COLD_STARTS = REGISTRY.counter(
+    "sequence_api_cold_starts_total",
+    "Requests classified as probable Cloud Run cold starts.",
+    ("endpoint",),
+)
+API_LATENCY = REGISTRY.histogram(
+    "sequence_api_request_duration_seconds",
+    "Total time per request, including retries and backoff.",
+    ("endpoint", "method"),
+)
+API_TTFB = REGISTRY.histogram(
+    "sequence_api_ttfb_seconds",
+    "Time from sending the final attempt to its response headers.",
+    ("endpoint", "method"),
+)
+API_BACKGROUND_REQUESTS = REGISTRY.counter(
+    "sequence_api_background_requests_total",
+    "Warm-up and other tagged background requests, kept out of the request series.",
+    ("endpoint", "tag", "status", "cold_start"),
+)
+API_IN_FLIGHT = REGISTRY.gauge(
+    "sequence_api_in_flight_requests",
+    "Requests currently waiting on a managed endpoint.",
+    ("endpoint",),
+)
+BATCH_SEQUENCES = REGISTRY.counter(
+    "sequence_batch_sequences_total",
+    "Sequences dispatched by the batch runners, by outcome.",
+    ("model", "outcome"),
+)
+BATCH_ACTIVE = REGISTRY.gauge(
+    "sequence_batch_active",
+    "Batch runs currently in progress.",
+    ("model",),
+)
+BATCH_DEDUPLICATED = REGISTRY.counter(
+    "sequence_batch_deduplicated_total",
+    "Accepted sequences not sent because an identical one in the same run was.",
+    ("model",),
+)
+BATCH_QUEUE_DEPTH = REGISTRY.gauge(
+    "sequence_batch_queue_depth",
+    "Sequences of in-progress batches that have not been dispatched yet.",
+    ("model",),
+)
+RESULTS_RESIDENT_BYTES = REGISTRY.gauge(
+    "sequence_results_resident_bytes",
+    "Bytes of result tables held in memory by the shared result store.",
+)
+RESULTS_SPILLED_BYTES = REGISTRY.gauge(
+    "sequence_results_spilled_bytes",
+    "Bytes of result tables spilled to Arrow IPC files by the shared result store.",
+)
+RESULTS_SPILL_READS = REGISTRY.counter(
+    "sequence_results_spill_reads_total",
+    "Result tables read back from a spilled Arrow IPC file.",
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "sequence_cache_requests_total",
+    "Lookups in the export payload cache.",
+    ("cache", "result"),
+)
+
+
+def observe_request(timing: RequestTiming) -> None:
+    """Fold one finished request into the API metrics.
+
+    Only requests made on behalf of users (tag ``"request"``) feed the request,
+    latency, retry and cold-start series; warm-up probes are counted apart.
+    """
+
+    status = str(timing.status_code) if timing.status_code is not None else "error"
+    if timing.tag != REQUEST_TAG:
+        API_BACKGROUND_REQUESTS.inc(
+            endpoint=timing.endpoint,
+            tag=timing.tag,
+            status=status,
+            cold_start="true" if timing.cold_start else "false",
+        )
+        return
+    API_REQUESTS.inc(endpoint=timing.endpoint, method=timing.method, status=status)
+    API_LATENCY.observe(
+        timing.total_seconds, endpoint=timing.endpoint, method=timing.method
+    )
+    if timing.ttfb_seconds is not None:
+        API_TTFB.observe(
+            timing.ttfb_seconds, endpoint=timing.endpoint, method=timing.method
+        )
+    if timing.attempts > 1:
+        API_RETRIES.inc(timing.attempts - 1, endpoint=timing.endpoint)
+    if timing.cold_start:
+        API_COLD_STARTS.inc(endpoint=timing.endpoint)
+
+
+def record_cache(cache: str, hit: bool, count: int = 1) -> None:
+    if count:
+        CACHE_REQUESTS.inc(count, cache=cache, result="hit" if hit else "miss")
+
+
+# Called once per input, in order: True for a result row, False for a failure
+# and None for an input skipped before dispatch.
+OutcomeCallback = Callable[[Optional[bool]], None]
+
+
+class BatchTracker:
+    """Keep batch gauges and counters current while a runner dispatches.
+
+    Runners report every input exactly once, through :meth:`dispatched` or
+    :meth:`skipped`, so ``on_outcome`` sees one outcome per input in order.
+    """
+
+    def __init__(
+        self, model: str, total: Optional[int], on_outcome: Optional[OutcomeCallback] = None
+    ) -> None:
+        self.model = model
+        self._remaining = total
+        self._on_outcome = on_outcome
+
+    def dispatched(self, ok: bool) -> None:
+        BATCH_SEQUENCES.inc(model=self.model, outcome="ok" if ok else "failed")
+        self._advance(ok)
+
+    def skipped(self) -> None:
+        self._advance(None)
+
+    def _advance(self, outcome: Optional[bool]) -> None:
+        if self._remaining:
+            self._remaining -= 1
+            BATCH_QUEUE_DEPTH.dec(model=self.model)
+        if self._on_outcome is not None:
+            self._on_outcome(outcome)
+
+
+@contextlib.contextmanager
+def track_batch(
+    model: str, sequences: object, on_outcome: Optional[OutcomeCallback] = None
+) -> Iterator[BatchTracker]:
+    """Mark a batch as active; queue depth is tracked when ``sequences`` is sized."""
+
+    total = len(sequences) if hasattr(sequences, "__len__") else None
+    tracker = BatchTracker(model, total, on_outcome)
+    BATCH_ACTIVE.inc(model=model)
+    if total:
+        BATCH_QUEUE_DEPTH.inc(total, model=model)
+    try:
+        yield tracker
+    finally:
+        BATCH_ACTIVE.dec(model=model)
+        if tracker._remaining:
+            BATCH_QUEUE_DEPTH.dec(tracker._remaining, model=model)
+
+
+def write_metrics_file(path: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """Atomically replace ``path`` with the current exposition."""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    scratch = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    scratch.write_text(registry.render(), encoding="utf-8")
+    os.replace(scratch, target)
+
+
+def _handler_for(registry: MetricsRegistry) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def start_metrics_server(
+    port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` on ``host:port`` from a daemon thread."""
+
+    server = ThreadingHTTPServer((host, port), _handler_for(registry))
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    return server
+
+
+def _dump_loop(path: str, interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            write_metrics_file(path)
+        except OSError:
+            pass
+
+
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def start_metrics_exporters() -> None:
+    """Start the exporters configured through the environment, once per process."""
+
+    global _exporters_started
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+
+        port = os.environ.get("SEQUENCE_METRICS_PORT", "").strip()
+        if port:
+            host = os.environ.get("SEQUENCE_METRICS_HOST", "127.0.0.1")
+            try:
+                start_metrics_server(int(port), host)
+            except (OSError, ValueError):
+                # Another process (e.g. a second Streamlit worker) owns the port.
+                pass
+
+        path = os.environ.get("SEQUENCE_METRICS_FILE", "").strip()
+        if path:
+            threading.Thread(
+                target=_dump_loop,
+                args=(path, _DUMP_SECONDS),
+                name="metrics-dump",
+                daemon=True,
+            ).start()
+            atexit.register(write_metrics_file, path)
+
+
+__all__ = [
+    "API_BACKGROUND_REQUESTS",
+    "API_COLD_STARTS",
+    "API_IN_FLIGHT",
+    "API_LATENCY",
+    "API_REQUESTS",
+    "API_RETRIES",
+    "API_TTFB",
+    "BATCH_ACTIVE",
+    "BATCH_DEDUPLICATED",
+    "BATCH_QUEUE_DEPTH",
+    "BATCH_SEQUENCES",
+    "BatchTracker",
+    "CACHE_REQUESTS",
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LATENCY_BUCKETS",
+    "MetricsRegistry",
+    "OutcomeCallback",
+    "REGISTRY",
+    "RESULTS_RESIDENT_BYTES",
+    "RESULTS_SPILLED_BYTES",
+    "RESULTS_SPILL_READS",
+    "observe_request",
+    "record_cache",
+    "start_metrics_exporters",
+    "start_metrics_server",
+    "track_batch",
+    "write_metrics_file",
+]
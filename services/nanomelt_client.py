@@ -2,93 +2,151 @@
 
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+import itertools
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Sized,
+    Tuple,
+)
 
 import pandas as pd
 from requests import HTTPError
 
 from .api_client import post_json
+from .metrics import BatchTracker, OutcomeCallback, track_batch
+from .result_schema import NANOMELT_SCHEMA, RAW_RESPONSE_COLUMN, ColumnarBuilder
+from .tracing import sequence_context
 
 
 def _normalize_sequences(
-    sequences: Sequence[Tuple[str, str]],
-) -> List[dict]:
-    records: List[dict] = []
-
+    sequences: Iterable[Tuple[str, str]], batch: BatchTracker
+) -> Iterator[dict]:
     for idx, (sequence_id, raw_value) in enumerate(sequences, start=1):
         cleaned_sequence = (raw_value or "").strip().replace("\n", "")
         if not cleaned_sequence:
+            batch.skipped()
             continue
 
-        records.append(
-            {
-                "sequence_id": sequence_id or f"sequence_{idx}",
-                "sequence": cleaned_sequence,
-            }
-        )
+        yield {
+            "sequence_id": sequence_id or f"sequence_{idx}",
+            "sequence": cleaned_sequence,
+        }
+
+
+_RENAME_MAP = {
+    "ID": "sequence_id",
+    "Sequence": "sequence",
+    "Aligned Sequence": "aligned_sequence",
+    "NanoMelt Tm (C)": "nanomelt_tm_c",
+}
+
+
+def _projection(fields: Optional[Collection[str]]) -> Optional[Set[str]]:
+    if fields is None:
+        return None
+    projection = set(fields) | {"sequence"}
+    # Accept either the column names or the service's own prediction keys.
+    projection.update(
+        source for source, column in _RENAME_MAP.items() if column in projection
+    )
+    return projection
 
-    return records
+
+def _prediction_fields(
+    sequence_id: str, sequence: str, prediction: Dict[str, Any]
+) -> Iterator[Tuple[str, Any]]:
+    """Yield prediction fields under their column names.
+
+    The echoed ``ID``/``Sequence`` never replace the submitted identifiers, so
+    each row keeps the ``sequence_id`` it was sent with.
+    """
+
+    for key, value in prediction.items():
+        name = _RENAME_MAP.get(key, key)
+        if name not in {"sequence_id", "sequence"}:
+            yield name, value
+    yield "sequence_id", sequence_id
+    yield "sequence", sequence
 
 
 def run_nanomelt_batch(
-    sequences: Sequence[Tuple[str, str]],
+    sequences: Iterable[Tuple[str, str]],
+    *,
+    keep_raw: bool = False,
+    fields: Optional[Collection[str]] = None,
+    on_outcome: Optional[OutcomeCallback] = None,
 ) -> Tuple[pd.DataFrame, List[str]]:
-    """Run NanoMelt predictions for ``sequences`` using the remote API."""
+    """Run NanoMelt predictions for ``sequences`` using the remote API.
 
-    if not sequences:
-        raise ValueError("At least one sequence is required to call NanoMelt.")
+    Pass ``keep_raw=True`` to also keep each full response in a ``raw_response``
+    column. ``fields`` limits the response to those field names as soon as it
+    is decoded; ``sequence_id`` and ``sequence`` are always kept.
+    ``on_outcome`` is called once per input, in order (see
+    :class:`~services.metrics.BatchTracker`).
+    """
 
-    seq_records = _normalize_sequences(sequences)
-    if not seq_records:
-        raise ValueError("All provided sequences were empty after cleaning.")
+    if isinstance(sequences, Sized) and not sequences:
+        raise ValueError("At least one sequence is required to call NanoMelt.")
 
-    results: List[dict] = []
+    projection = _projection(fields)
+    results = ColumnarBuilder(NANOMELT_SCHEMA)
     failures: List[str] = []
+    processed = 0
+
+    with track_batch("nanomelt", sequences, on_outcome) as batch:
+        for record in _normalize_sequences(sequences, batch):
+            processed += 1
+            payload = {"sequence": record["sequence"]}
+            try:
+                with sequence_context(record["sequence_id"]):
+                    response = post_json("nanomelt", payload, fields=projection)
+            except HTTPError as exc:
+                if exc.response is not None and exc.response.status_code == 404:
+                    failures.append(
+                        f"{record['sequence_id']}: NanoMelt API endpoint is unavailable."
+                    )
+                else:
+                    failures.append(f"{record['sequence_id']}: {exc}")
+                batch.dispatched(False)
+                continue
+            except Exception as exc:  # pragma: no cover - surfaced in UI
+                failures.append(f"{record['sequence_id']}: {exc}")
+                batch.dispatched(False)
+                continue
 
-    for record in seq_records:
-        payload = {"sequence": record["sequence"]}
-        try:
-            response = post_json("nanomelt", payload)
-        except HTTPError as exc:
-            if exc.response is not None and exc.response.status_code == 404:
+            prediction = (
+                response.get("prediction") if isinstance(response, dict) else None
+            )
+            if not isinstance(prediction, dict):
                 failures.append(
-                    f"{record['sequence_id']}: NanoMelt API endpoint is unavailable."
+                    f"{record['sequence_id']}: NanoMelt response missing prediction."
                 )
-            else:
-                failures.append(f"{record['sequence_id']}: {exc}")
-            continue
-        except Exception as exc:  # pragma: no cover - surfaced in UI
-            failures.append(f"{record['sequence_id']}: {exc}")
-            continue
+                batch.dispatched(False)
+                continue
 
-        prediction = response.get("prediction") if isinstance(response, dict) else None
-        if not isinstance(prediction, dict):
-            failures.append(
-                f"{record['sequence_id']}: NanoMelt response missing prediction."
+            row_fields = _prediction_fields(
+                record["sequence_id"],
+                response.get("sequence", record["sequence"]),
+                prediction,
             )
-            continue
+            if keep_raw:
+                row_fields = itertools.chain(
+                    row_fields, [(RAW_RESPONSE_COLUMN, response)]
+                )
+            results.add_row(row_fields)
+            batch.dispatched(True)
 
-        row = {
-            "sequence_id": record["sequence_id"],
-            "sequence": response.get("sequence", record["sequence"]),
-        }
-        row.update(prediction)
-        results.append(row)
-
-    dataframe = pd.DataFrame(results)
-    rename_map = {
-        "ID": "sequence_id",
-        "Sequence": "sequence",
-        "Aligned Sequence": "aligned_sequence",
-        "NanoMelt Tm (C)": "nanomelt_tm_c",
-    }
-    present_map = {
-        src: dest for src, dest in rename_map.items() if src in dataframe.columns
-    }
-    if present_map:
-        dataframe = dataframe.rename(columns=present_map)
-
-    return dataframe.reset_index(drop=True), failures
+    if not processed:
+        raise ValueError("All provided sequences were empty after cleaning.")
+
+    return results.to_frame(), failures
 
 
 __all__ = ["run_nanomelt_batch"]
@@ -2,113 +2,162 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Tuple
+import itertools
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Sized,
+    Tuple,
+)
 
 import pandas as pd
 from requests import HTTPError
 
 from .api_client import post_json
+from .metrics import BatchTracker, OutcomeCallback, track_batch
+from .result_schema import NBFORGE_SCHEMA, RAW_RESPONSE_COLUMN, ColumnarBuilder
+from .tracing import sequence_context
 
 
 def _normalize_sequences(
-    sequences: Sequence[Tuple[str, str]],
-) -> List[dict]:
-    records: List[dict] = []
-
+    sequences: Iterable[Tuple[str, str]], batch: BatchTracker
+) -> Iterator[dict]:
     for idx, (sequence_id, raw_value) in enumerate(sequences, start=1):
         cleaned_sequence = (raw_value or "").strip().replace("\n", "")
         if not cleaned_sequence:
+            batch.skipped()
             continue
 
-        records.append(
-            {
-                "sequence_id": sequence_id or f"sequence_{idx}",
-                "sequence": cleaned_sequence,
-            }
-        )
+        yield {
+            "sequence_id": sequence_id or f"sequence_{idx}",
+            "sequence": cleaned_sequence,
+        }
+
+
+_NESTED_BLOCKS = ("summary", "prediction", "result", "scores")
+
 
-    return records
+def _response_fields(
+    sequence_id: str, sequence: str, response: Dict[str, Any]
+) -> Iterator[Tuple[str, Any]]:
+    """Yield the scalar fields of ``response`` in the order they should win.
 
+    An echoed ``sequence_id`` never replaces the submitted one, so each row
+    keeps the ID it was sent with.
+    """
 
-def _flatten_response(sequence_id: str, sequence: str, response: Dict[str, Any]) -> Dict[str, Any]:
-    row: Dict[str, Any] = {"sequence_id": sequence_id, "sequence": sequence}
+    yield "sequence_id", sequence_id
+    yield "sequence", sequence
 
-    for key in ("summary", "prediction", "result", "scores"):
+    for key in _NESTED_BLOCKS:
         block = response.get(key)
         if isinstance(block, dict):
             for nested_key, nested_value in block.items():
                 if not isinstance(nested_value, (dict, list, tuple, set)):
-                    row[nested_key] = nested_value
+                    yield nested_key, nested_value
 
     for key, value in response.items():
-        if key in {"summary", "prediction", "result", "scores"}:
+        if key in _NESTED_BLOCKS:
             continue
         if not isinstance(value, (dict, list, tuple, set)):
-            row[key] = value
+            yield key, value
 
-    row["sequence"] = response.get("sequence", row["sequence"])
-    row["sequence_id"] = response.get("sequence_id", row["sequence_id"])
-    return row
+    yield "sequence", response.get("sequence", sequence)
+    yield "sequence_id", sequence_id
+
+
+def _projection(fields: Optional[Collection[str]]) -> Optional[Set[str]]:
+    if fields is None:
+        return None
+    return set(fields) | {"sequence_id", "sequence"}
 
 
 def run_nbforge_batch(
-    sequences: Sequence[Tuple[str, str]],
+    sequences: Iterable[Tuple[str, str]],
     *,
     use_gpu: bool = False,
     gpu_device: str = "",
     minimize: bool = True,
     include_nbframe: bool = False,
+    keep_raw: bool = False,
+    fields: Optional[Collection[str]] = None,
+    on_outcome: Optional[OutcomeCallback] = None,
 ) -> Tuple[pd.DataFrame, List[str]]:
-    """Run NbForge predictions for ``sequences`` via the remote API."""
+    """Run NbForge predictions for ``sequences`` via the remote API.
 
-    if not sequences:
-        raise ValueError("At least one sequence is required to call NbForge.")
+    Only scalar fields are kept as typed columns; pass ``keep_raw=True`` to also
+    keep each full response in a ``raw_response`` column. ``fields`` limits the
+    response to those field names as soon as it is decoded; ``sequence_id`` and
+    ``sequence`` are always kept. ``on_outcome`` is called once per input, in
+    order (see :class:`~services.metrics.BatchTracker`).
+    """
 
-    seq_records = _normalize_sequences(sequences)
-    if not seq_records:
-        raise ValueError("All provided sequences were empty after cleaning.")
+    if isinstance(sequences, Sized) and not sequences:
+        raise ValueError("At least one sequence is required to call NbForge.")
 
-    results: List[dict] = []
+    projection = _projection(fields)
+    results = ColumnarBuilder(NBFORGE_SCHEMA)
     failures: List[str] = []
+    processed = 0
+
+    with track_batch("nbforge", sequences, on_outcome) as batch:
+        for record in _normalize_sequences(sequences, batch):
+            processed += 1
+            payload: Dict[str, Any] = {
+                "sequence": record["sequence"],
+                "vhh_name": record["sequence_id"],
+                "VHH_name": record["sequence_id"],
+                "no_minimize": not minimize,
+                "nbframe": include_nbframe,
+                "cpu": not use_gpu,
+            }
+            if use_gpu:
+                payload["gpu"] = gpu_device or "0"
+
+            try:
+                with sequence_context(record["sequence_id"]):
+                    response = post_json("nbforge", payload, fields=projection)
+            except HTTPError as exc:
+                if exc.response is not None and exc.response.status_code == 404:
+                    failures.append(
+                        f"{record['sequence_id']}: NbForge API endpoint is unavailable."
+                    )
+                else:
+                    failures.append(f"{record['sequence_id']}: {exc}")
+                batch.dispatched(False)
+                continue
+            except Exception as exc:  # pragma: no cover - surfaced in UI
+                failures.append(f"{record['sequence_id']}: {exc}")
+                batch.dispatched(False)
+                continue
 
-    for record in seq_records:
-        payload: Dict[str, Any] = {
-            "sequence": record["sequence"],
-            "vhh_name": record["sequence_id"],
-            "VHH_name": record["sequence_id"],
-            "no_minimize": not minimize,
-            "nbframe": include_nbframe,
-            "cpu": not use_gpu,
-        }
-        if use_gpu:
-            payload["gpu"] = gpu_device or "0"
-
-        try:
-            response = post_json("nbforge", payload)
-        except HTTPError as exc:
-            if exc.response is not None and exc.response.status_code == 404:
+            if not isinstance(response, dict):
                 failures.append(
-                    f"{record['sequence_id']}: NbForge API endpoint is unavailable."
+                    f"{record['sequence_id']}: NbForge returned a non-JSON payload."
                 )
-            else:
-                failures.append(f"{record['sequence_id']}: {exc}")
-            continue
-        except Exception as exc:  # pragma: no cover - surfaced in UI
-            failures.append(f"{record['sequence_id']}: {exc}")
-            continue
+                batch.dispatched(False)
+                continue
 
-        if not isinstance(response, dict):
-            failures.append(
-                f"{record['sequence_id']}: NbForge returned a non-JSON payload."
+            row_fields = _response_fields(
+                record["sequence_id"], record["sequence"], response
             )
-            continue
+            if keep_raw:
+                row_fields = itertools.chain(
+                    row_fields, [(RAW_RESPONSE_COLUMN, response)]
+                )
+            results.add_row(row_fields)
+            batch.dispatched(True)
 
-        results.append(
-            _flatten_response(record["sequence_id"], record["sequence"], response)
-        )
+    if not processed:
+        raise ValueError("All provided sequences were empty after cleaning.")
 
-    dataframe = pd.DataFrame(results)
-    return dataframe.reset_index(drop=True), failures
+    return results.to_frame(), failures
 
 
 __all__ = ["run_nbforge_batch"]
@@ -2,113 +2,169 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Tuple
+import itertools
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Sized,
+    Tuple,
+)
 
 import pandas as pd
 from requests import HTTPError
 
 from .api_client import post_json
+from .metrics import BatchTracker, OutcomeCallback, track_batch
+from .result_schema import NBFRAME_SCHEMA, RAW_RESPONSE_COLUMN, ColumnarBuilder
+from .tracing import sequence_context
 
 
 def _normalize_sequences(
-    sequences: Sequence[Tuple[str, str]],
-) -> List[dict]:
-    records: List[dict] = []
-
+    sequences: Iterable[Tuple[str, str]], batch: BatchTracker
+) -> Iterator[dict]:
     for idx, (sequence_id, raw_value) in enumerate(sequences, start=1):
         cleaned_sequence = (raw_value or "").strip().replace("\n", "")
         if not cleaned_sequence:
+            batch.skipped()
             continue
 
-        records.append(
-            {
-                "sequence_id": sequence_id or f"sequence_{idx}",
-                "sequence": cleaned_sequence,
-            }
-        )
+        yield {
+            "sequence_id": sequence_id or f"sequence_{idx}",
+            "sequence": cleaned_sequence,
+        }
+
+
+_NESTED_BLOCKS = ("prediction", "result", "scores", "probabilities", "thresholds")
 
-    return records
 
+def _response_fields(
+    sequence_id: str, sequence: str, response: Dict[str, Any]
+) -> Iterator[Tuple[str, Any]]:
+    """Yield the scalar fields of ``response`` in the order they should win.
 
-def _flatten_response(sequence_id: str, sequence: str, response: Dict[str, Any]) -> Dict[str, Any]:
-    row: Dict[str, Any] = {"sequence_id": sequence_id, "sequence": sequence}
+    An echoed ``sequence_id`` never replaces the submitted one, so each row
+    keeps the ID it was sent with.
+    """
 
-    for key in ("prediction", "result", "scores", "probabilities", "thresholds"):
+    yield "sequence_id", sequence_id
+    yield "sequence", sequence
+    seen: Dict[str, Any] = {}
+
+    for key in _NESTED_BLOCKS:
         block = response.get(key)
         if isinstance(block, dict):
             for nested_key, nested_value in block.items():
                 if not isinstance(nested_value, (dict, list, tuple, set)):
-                    row[nested_key] = nested_value
+                    seen[nested_key] = nested_value
+                    yield nested_key, nested_value
 
     for key, value in response.items():
-        if key in {"prediction", "result", "scores", "probabilities", "thresholds"}:
+        if key in _NESTED_BLOCKS:
             continue
         if not isinstance(value, (dict, list, tuple, set)):
-            row[key] = value
+            seen[key] = value
+            yield key, value
+
+    yield "sequence", response.get("sequence", sequence)
+    yield "sequence_id", sequence_id
+    if "probability" not in seen and "prob_kinked" in seen:
+        yield "probability", seen["prob_kinked"]
+
 
-    row["sequence"] = response.get("sequence", row["sequence"])
-    row["sequence_id"] = response.get("sequence_id", row["sequence_id"])
-    if "probability" not in row and "prob_kinked" in row:
-        row["probability"] = row["prob_kinked"]
-    return row
+def _projection(fields: Optional[Collection[str]]) -> Optional[Set[str]]:
+    if fields is None:
+        return None
+    projection = set(fields) | {"sequence_id", "sequence"}
+    if "probability" in projection:
+        # ``probability`` falls back to ``prob_kinked`` when it is absent.
+        projection.add("prob_kinked")
+    return projection
 
 
 def run_nbframe_batch(
-    sequences: Sequence[Tuple[str, str]],
+    sequences: Iterable[Tuple[str, str]],
     *,
     kinked_threshold: float = 0.70,
     extended_threshold: float = 0.40,
+    keep_raw: bool = False,
+    fields: Optional[Collection[str]] = None,
+    on_outcome: Optional[OutcomeCallback] = None,
 ) -> Tuple[pd.DataFrame, List[str]]:
-    """Run NbFrame sequence predictions via the remote API."""
+    """Run NbFrame sequence predictions via the remote API.
 
-    if not sequences:
+    Only scalar fields are kept as typed columns; pass ``keep_raw=True`` to also
+    keep each full response in a ``raw_response`` column. ``fields`` limits the
+    response to those field names as soon as it is decoded; ``sequence_id`` and
+    ``sequence`` are always kept. ``on_outcome`` is called once per input, in
+    order (see :class:`~services.metrics.BatchTracker`).
+    """
+
+    if isinstance(sequences, Sized) and not sequences:
         raise ValueError("At least one sequence is required to call NbFrame.")
 
     if extended_threshold > kinked_threshold:
         raise ValueError("Extended threshold cannot be greater than kinked threshold.")
 
-    seq_records = _normalize_sequences(sequences)
-    if not seq_records:
-        raise ValueError("All provided sequences were empty after cleaning.")
-
-    results: List[dict] = []
+    projection = _projection(fields)
+    results = ColumnarBuilder(NBFRAME_SCHEMA)
     failures: List[str] = []
+    processed = 0
+
+    with track_batch("nbframe", sequences, on_outcome) as batch:
+        for record in _normalize_sequences(sequences, batch):
+            processed += 1
+            payload: Dict[str, Any] = {
+                "sequence": record["sequence"],
+                "sequence_id": record["sequence_id"],
+                "kinked_threshold": kinked_threshold,
+                "extended_threshold": extended_threshold,
+                "mode": "sequence",
+            }
 
-    for record in seq_records:
-        payload: Dict[str, Any] = {
-            "sequence": record["sequence"],
-            "sequence_id": record["sequence_id"],
-            "kinked_threshold": kinked_threshold,
-            "extended_threshold": extended_threshold,
-            "mode": "sequence",
-        }
+            try:
+                with sequence_context(record["sequence_id"]):
+                    response = post_json("nbframe", payload, fields=projection)
+            except HTTPError as exc:
+                if exc.response is not None and exc.response.status_code == 404:
+                    failures.append(
+                        f"{record['sequence_id']}: NbFrame API endpoint is unavailable."
+                    )
+                else:
+                    failures.append(f"{record['sequence_id']}: {exc}")
+                batch.dispatched(False)
+                continue
+            except Exception as exc:  # pragma: no cover - surfaced in UI
+                failures.append(f"{record['sequence_id']}: {exc}")
+                batch.dispatched(False)
+                continue
 
-        try:
-            response = post_json("nbframe", payload)
-        except HTTPError as exc:
-            if exc.response is not None and exc.response.status_code == 404:
+            if not isinstance(response, dict):
                 failures.append(
-                    f"{record['sequence_id']}: NbFrame API endpoint is unavailable."
+                    f"{record['sequence_id']}: NbFrame returned a non-JSON payload."
                 )
-            else:
-                failures.append(f"{record['sequence_id']}: {exc}")
-            continue
-        except Exception as exc:  # pragma: no cover - surfaced in UI
-            failures.append(f"{record['sequence_id']}: {exc}")
-            continue
+                batch.dispatched(False)
+                continue
 
-        if not isinstance(response, dict):
-            failures.append(
-                f"{record['sequence_id']}: NbFrame returned a non-JSON payload."
+            row_fields = _response_fields(
+                record["sequence_id"], record["sequence"], response
             )
-            continue
+            if keep_raw:
+                row_fields = itertools.chain(
+                    row_fields, [(RAW_RESPONSE_COLUMN, response)]
+                )
+            results.add_row(row_fields)
+            batch.dispatched(True)
 
-        results.append(
-            _flatten_response(record["sequence_id"], record["sequence"], response)
-        )
+    if not processed:
+        raise ValueError("All provided sequences were empty after cleaning.")
 
-    dataframe = pd.DataFrame(results)
-    return dataframe.reset_index(drop=True), failures
+    return results.to_frame(), failures
 
 
 __all__ = ["run_nbframe_batch"]
@@ -0,0 +1,97 @@
+"""Typed result schemas and a columnar builder for batch client outputs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnSpec:
+    name: str
+    dtype: str
+
+
+SEQUENCE_ID = ColumnSpec("sequence_id", "string")
+SEQUENCE = ColumnSpec("sequence", "string")
+
+ABNATIV_SCHEMA: Tuple[ColumnSpec, ...] = (
+    SEQUENCE_ID,
+    ColumnSpec("nativeness_score", "float64"),
+)
+NANOMELT_SCHEMA: Tuple[ColumnSpec, ...] = (
+    SEQUENCE_ID,
+    SEQUENCE,
+    ColumnSpec("aligned_sequence", "string"),
+    ColumnSpec("nanomelt_tm_c", "float64"),
+)
+NBFORGE_SCHEMA: Tuple[ColumnSpec, ...] = (SEQUENCE_ID, SEQUENCE)
+NBFRAME_SCHEMA: Tuple[ColumnSpec, ...] = (
+    SEQUENCE_ID,
+    SEQUENCE,
+    ColumnSpec("prob_kinked", "float64"),
+    ColumnSpec("probability", "float64"),
+)
+RAW_RESPONSE_COLUMN = "raw_response"
+
+
+class ColumnarBuilder:
+    """Accumulate rows straight into per-column lists.
+
+    Columns declared in ``schema`` get their dtype up front; any other scalar
+    fields a response carries become extra columns typed by pandas once, when
+    the frame is built. Missing values are padded with ``None``.
+    """
+
+    __slots__ = ("_dtypes", "_columns", "_rows")
+
+    def __init__(self, schema: Sequence[ColumnSpec]) -> None:
+        self._dtypes: Dict[str, str] = {spec.name: spec.dtype for spec in schema}
+        self._columns: Dict[str, List[Any]] = {spec.name: [] for spec in schema}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add_row(self, fields: Iterable[Tuple[str, Any]]) -> None:
+        """Append one row; a later value for the same field replaces an earlier one."""
+
+        row_length = self._rows + 1
+        for name, value in fields:
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = [None] * self._rows
+            if len(column) == row_length:
+                column[-1] = value
+            else:
+                column.append(value)
+        for column in self._columns.values():
+            if len(column) < row_length:
+                column.append(None)
+        self._rows = row_length
+
+    def to_frame(self) -> pd.DataFrame:
+        data = {}
+        for name, values in self._columns.items():
+            dtype = self._dtypes.get(name)
+            if dtype is None:
+                data[name] = pd.Series(values, dtype=None if values else object)
+                continue
+            try:
+                data[name] = pd.Series(values, dtype=dtype)
+            except (TypeError, ValueError):
+                data[name] = pd.Series(values, dtype=object)
+        return pd.DataFrame(data, index=pd.RangeIndex(self._rows))
+
+
+__all__ = [
+    "ABNATIV_SCHEMA",
+    "ColumnSpec",
+    "ColumnarBuilder",
+    "NANOMELT_SCHEMA",
+    "NBFORGE_SCHEMA",
+    "NBFRAME_SCHEMA",
+    "RAW_RESPONSE_COLUMN",
+]
@@ -0,0 +1,346 @@
+"""Process-wide store for per-session result tables with a shared memory budget.
+
+Every Streamlit session in the process keeps its results here rather than in
+``st.session_state``. Tables stay resident while they fit the budget; idle or
+oversized ones are spilled to uncompressed Arrow IPC files that are
+memory-mapped back on access, and anything untouched for longer than the TTL
+is evicted. A table read back keeps its columns in the mapping instead of
+copying them onto the heap, so text columns return Arrow-backed. Files are written and read outside the store's lock, so one
+session's spill never stalls another session's lookup.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .export import to_arrow_table
+from .metrics import RESULTS_RESIDENT_BYTES, RESULTS_SPILLED_BYTES, RESULTS_SPILL_READS
+
+_MEMORY_BUDGET_BYTES = int(
+    max(1.0, float(os.environ.get("SEQUENCE_RESULTS_MEMORY_BUDGET_MB", "512")))
+    * 1024
+    * 1024
+)
+_TTL_SECONDS = max(60.0, float(os.environ.get("SEQUENCE_RESULTS_TTL_SECONDS", "14400")))
+_IDLE_SPILL_SECONDS = max(
+    0.0, float(os.environ.get("SEQUENCE_RESULTS_IDLE_SPILL_SECONDS", "600"))
+)
+
+
+@dataclass
+class _Entry:
+    nbytes: int
+    last_access: float
+    dataframe: Optional[pd.DataFrame] = None
+    path: Optional[Path] = None
+    spilled_bytes: int = 0
+    spilling: bool = False
+    # The last frame read back from ``path``, reused while any caller holds it.
+    loaded: Optional["weakref.ReferenceType[pd.DataFrame]"] = None
+
+
+@dataclass(frozen=True)
+class ResultStoreStats:
+    resident_bytes: int
+    spilled_bytes: int
+    resident_entries: int
+    spilled_entries: int
+    memory_budget_bytes: int
+    spills: int
+    evictions: int
+
+
+_Spill = Tuple[_Entry, pd.DataFrame, Path]
+
+
+def _arrow_string_dtype(data_type) -> Optional[pd.StringDtype]:
+    """Keep text columns in Arrow memory when pandas would copy them to objects."""
+
+    import pyarrow as pa
+
+    if pd.get_option("future.infer_string"):
+        # pandas' default ``str`` dtype is already Arrow-backed.
+        return None
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def _frame_nbytes(dataframe: pd.DataFrame) -> int:
+    return int(dataframe.memory_usage(index=True, deep=True).sum())
+
+
+class ResultStore:
+    """Thread-safe token → DataFrame store bounded by ``memory_budget_bytes``.
+
+    The lock only guards bookkeeping: spilling to disk and reading spilled
+    tables back both happen after it is released. With ``publish_metrics``
+    the resident and spilled byte counts are kept in the metrics registry.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_budget_bytes: int = _MEMORY_BUDGET_BYTES,
+        ttl_seconds: float = _TTL_SECONDS,
+        idle_spill_seconds: float = _IDLE_SPILL_SECONDS,
+        max_resident_entry_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        publish_metrics: bool = False,
+    ) -> None:
+        self.memory_budget_bytes = memory_budget_bytes
+        self.ttl_seconds = ttl_seconds
+        self.idle_spill_seconds = idle_spill_seconds
+        self.max_resident_entry_bytes = (
+            max_resident_entry_bytes
+            if max_resident_entry_bytes is not None
+            else memory_budget_bytes // 4
+        )
+        self.publish_metrics = publish_metrics
+        self._spill_root = spill_dir or os.environ.get("SEQUENCE_RESULTS_SPILL_DIR")
+        self._spill_dir: Optional[Path] = None
+        self._entries: Dict[str, _Entry] = {}
+        self._resident_bytes = 0
+        self._spilled_bytes = 0
+        self._spilling_bytes = 0
+        self._spills = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def put(self, dataframe: pd.DataFrame) -> str:
+        """Store ``dataframe`` and return the token used to fetch it later."""
+
+        token = uuid.uuid4().hex
+        entry = _Entry(
+            nbytes=_frame_nbytes(dataframe),
+            last_access=time.monotonic(),
+            dataframe=dataframe,
+        )
+        with self._lock:
+            self._entries[token] = entry
+            self._resident_bytes += entry.nbytes
+            spills = self._sweep(entry.last_access)
+            self._publish()
+        self._write_spills(spills)
+        return token
+
+    def get(self, token: str) -> Optional[pd.DataFrame]:
+        """Return the table for ``token`` or ``None`` once it has been evicted."""
+
+        now = time.monotonic()
+        with self._lock:
+            spills = self._sweep(now)
+            entry = self._entries.get(token)
+            dataframe = path = None
+            if entry is not None:
+                entry.last_access = now
+                dataframe = entry.dataframe
+                if dataframe is None and entry.loaded is not None:
+                    dataframe = entry.loaded()
+                path = entry.path
+            self._publish()
+        self._write_spills(spills)
+        if entry is None or dataframe is not None:
+            return dataframe
+
+        try:
+            dataframe = self._load(path)
+        except FileNotFoundError:
+            # Discarded or evicted while the file was being read.
+            return None
+        if self.publish_metrics:
+            RESULTS_SPILL_READS.inc()
+        with self._lock:
+            spills = []
+            if entry.path == path:
+                entry.loaded = weakref.ref(dataframe)
+                if entry.nbytes <= self.max_resident_entry_bytes:
+                    self._readmit(entry, dataframe)
+                    spills = self._sweep(now)
+                self._publish()
+        self._write_spills(spills)
+        return dataframe
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(token, None)
+            if entry is not None:
+                self._drop(entry)
+                self._publish()
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                self._drop(entry)
+            self._entries.clear()
+            if self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+            self._publish()
+
+    def stats(self) -> ResultStoreStats:
+        with self._lock:
+            spilled_entries = sum(1 for entry in self._entries.values() if entry.path)
+            return ResultStoreStats(
+                resident_bytes=self._resident_bytes,
+                spilled_bytes=self._spilled_bytes,
+                resident_entries=len(self._entries) - spilled_entries,
+                spilled_entries=spilled_entries,
+                memory_budget_bytes=self.memory_budget_bytes,
+                spills=self._spills,
+                evictions=self._evictions,
+            )
+
+    def _sweep(self, now: float) -> List[_Spill]:
+        """Evict expired entries and claim the ones to spill; call with the lock held.
+
+        Claimed entries stay resident until :meth:`_write_spills` has written
+        them, so readers keep getting the in-memory table meanwhile.
+        """
+
+        spills: List[_Spill] = []
+        for token, entry in list(self._entries.items()):
+            idle = now - entry.last_access
+            if idle > self.ttl_seconds:
+                del self._entries[token]
+                self._drop(entry)
+                self._evictions += 1
+            elif entry.dataframe is not None and (
+                idle > self.idle_spill_seconds
+                or entry.nbytes > self.max_resident_entry_bytes
+            ):
+                self._claim(entry, spills)
+
+        if self._resident_bytes - self._spilling_bytes <= self.memory_budget_bytes:
+            return spills
+        resident = sorted(
+            (
+                entry
+                for entry in self._entries.values()
+                if entry.dataframe is not None and not entry.spilling
+            ),
+            key=lambda entry: entry.last_access,
+        )
+        for entry in resident:
+            if self._resident_bytes - self._spilling_bytes <= self.memory_budget_bytes:
+                break
+            self._claim(entry, spills)
+        return spills
+
+    def _claim(self, entry: _Entry, spills: List[_Spill]) -> None:
+        if entry.spilling:
+            return
+        entry.spilling = True
+        self._spilling_bytes += entry.nbytes
+        spills.append((entry, entry.dataframe, self._spill_path()))
+
+    def _spill_path(self) -> Path:
+        if self._spill_dir is None:
+            self._spill_dir = Path(
+                tempfile.mkdtemp(prefix="sequence-results-", dir=self._spill_root)
+            )
+        return self._spill_dir / f"{uuid.uuid4().hex}.arrow"
+
+    def _write_spills(self, spills: List[_Spill]) -> None:
+        """Write claimed entries to disk without the lock, then swap them out."""
+
+        for entry, dataframe, path in spills:
+            try:
+                self._write(dataframe, path)
+                spilled_bytes = path.stat().st_size
+            except OSError:
+                # Keep the table resident; a later sweep will try again.
+                path.unlink(missing_ok=True)
+                spilled_bytes = None
+            with self._lock:
+                entry.spilling = False
+                self._spilling_bytes -= entry.nbytes
+                if spilled_bytes is None:
+                    continue
+                if entry.dataframe is not dataframe:
+                    # Discarded or evicted while it was being written.
+                    path.unlink(missing_ok=True)
+                    continue
+                entry.path = path
+                entry.spilled_bytes = spilled_bytes
+                entry.dataframe = None
+                entry.loaded = weakref.ref(dataframe)
+                self._resident_bytes -= entry.nbytes
+                self._spilled_bytes += spilled_bytes
+                self._spills += 1
+                self._publish()
+
+    @staticmethod
+    def _write(dataframe: pd.DataFrame, path: Path) -> None:
+        import pyarrow as pa
+
+        table = to_arrow_table(dataframe, narrow_numbers=False)
+        # Uncompressed IPC so the file can be memory-mapped without a decode step.
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @staticmethod
+    def _load(path: Path) -> pd.DataFrame:
+        import pyarrow as pa
+
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        # Numeric columns without nulls and Arrow-backed strings are zero-copy
+        # views of the mapping; the buffers keep it alive after ``source`` closes.
+        return table.to_pandas(split_blocks=True, types_mapper=_arrow_string_dtype)
+
+    def _readmit(self, entry: _Entry, dataframe: pd.DataFrame) -> None:
+        self._remove_file(entry)
+        entry.dataframe = dataframe
+        entry.loaded = None
+        self._resident_bytes += entry.nbytes
+
+    def _drop(self, entry: _Entry) -> None:
+        if entry.dataframe is not None:
+            self._resident_bytes -= entry.nbytes
+            entry.dataframe = None
+        entry.loaded = None
+        self._remove_file(entry)
+
+    def _remove_file(self, entry: _Entry) -> None:
+        if entry.path is not None:
+            entry.path.unlink(missing_ok=True)
+            entry.path = None
+            self._spilled_bytes -= entry.spilled_bytes
+            entry.spilled_bytes = 0
+
+    def _publish(self) -> None:
+        if self.publish_metrics:
+            RESULTS_RESIDENT_BYTES.set(self._resident_bytes)
+            RESULTS_SPILLED_BYTES.set(self._spilled_bytes)
+
+
+_store: Optional[ResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """Return the process-wide store shared by every session."""
+
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore(publish_metrics=True)
+            atexit.register(_store.clear)
+        return _store
+
+
+__all__ = ["ResultStore", "ResultStoreStats", "get_result_store"]
@@ -0,0 +1,338 @@
+"""Streaming readers that turn uploaded sequence libraries into records."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+from pathlib import PurePath
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+SEQUENCE_COLUMN_ALIASES = frozenset(
+    {"sequence", "heavy_chain", "heavychain", "vh", "vh_sequence"}
+)
+ID_COLUMN_ALIASES = frozenset({"id", "name", "sequence_id"})
+_READ_CHUNK_BYTES = 1 << 16
+_PARQUET_BATCH_ROWS = 8192
+
+FORMAT_CSV = "csv"
+FORMAT_FASTA = "fasta"
+FORMAT_PARQUET = "parquet"
+CSV_SUFFIXES = frozenset({".csv"})
+FASTA_SUFFIXES = frozenset({".fasta", ".fa", ".faa", ".fas", ".fna"})
+PARQUET_SUFFIXES = frozenset({".parquet", ".pq"})
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+# Extensions for ``st.file_uploader``, which matches only the last one
+# (``library.fasta.gz`` is accepted as ``gz``).
+SUPPORTED_UPLOAD_TYPES = sorted(
+    suffix.lstrip(".")
+    for suffix in CSV_SUFFIXES | FASTA_SUFFIXES | PARQUET_SUFFIXES | set(COMPRESSION_SUFFIXES)
+)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_PARQUET_MAGIC = b"PAR1"
+
+SequenceRecord = Tuple[str, str]
+
+
+class _BorrowedStream(io.RawIOBase):
+    """Read-only view over a caller-owned binary stream that never closes it."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        return size
+
+
+def _rewind(stream: BinaryIO) -> None:
+    if stream.seekable():
+        stream.seek(0)
+
+
+def _peek(stream: BinaryIO, size: int = 4) -> bytes:
+    _rewind(stream)
+    head = stream.read(size)
+    _rewind(stream)
+    return head
+
+
+def _decompressed(stream: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """Wrap ``stream`` in a streaming decompressor for ``compression``."""
+
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ValueError(
+                "Reading .zst uploads requires the 'zstandard' package."
+            ) from exc
+        return zstandard.ZstdDecompressor().stream_reader(stream, closefd=False)
+    return stream
+
+
+def _open_text(stream: BinaryIO) -> io.TextIOWrapper:
+    """Decode ``stream`` incrementally without materialising the whole payload."""
+
+    buffered = io.BufferedReader(_BorrowedStream(stream), _READ_CHUNK_BYTES)
+    return io.TextIOWrapper(buffered, encoding="utf-8-sig", newline="")
+
+
+def _resolve_columns(
+    fieldnames: Sequence[str], source: str = "CSV"
+) -> Tuple[str, Optional[str]]:
+    normalized = {name.strip().lower(): name for name in fieldnames}
+    sequence_col = next(
+        (
+            original
+            for key, original in normalized.items()
+            if key in SEQUENCE_COLUMN_ALIASES
+        ),
+        None,
+    )
+    if not sequence_col:
+        raise ValueError(
+            f"{source} needs a sequence column named 'sequence', 'heavy_chain', or 'vh'."
+        )
+
+    id_col = next(
+        (original for key, original in normalized.items() if key in ID_COLUMN_ALIASES),
+        None,
+    )
+    return sequence_col, id_col
+
+
+def _close(text_stream: io.TextIOWrapper, decompressor: Optional[BinaryIO]) -> None:
+    """Close the text view and the decompressor this module opened under it."""
+
+    text_stream.close()
+    if decompressor is not None:
+        decompressor.close()
+
+
+def _iter_csv_rows(
+    text_stream: io.TextIOWrapper,
+    reader: csv.DictReader,
+    sequence_col: str,
+    id_col: Optional[str],
+    decompressor: Optional[BinaryIO] = None,
+) -> Iterator[SequenceRecord]:
+    found = False
+    try:
+        for idx, row in enumerate(reader, start=1):
+            seq_value = (row.get(sequence_col) or "").strip()
+            if not seq_value:
+                continue
+            sequence_id = (
+                (row.get(id_col) or f"csv_sequence_{idx}")
+                if id_col
+                else f"csv_sequence_{idx}"
+            )
+            found = True
+            yield sequence_id, seq_value
+    finally:
+        _close(text_stream, decompressor)
+
+    if not found:
+        raise ValueError("No valid sequences were found in the uploaded CSV.")
+
+
+def iter_csv_sequences(stream: BinaryIO) -> Iterator[SequenceRecord]:
+    """Lazily yield ``(sequence_id, sequence)`` records from a CSV byte stream.
+
+    Headers are validated eagerly so column errors surface before dispatch; rows
+    are decoded and parsed only as the returned iterator is consumed.
+    """
+
+    return _csv_records(stream)
+
+
+def _csv_records(
+    stream: BinaryIO, decompressor: Optional[BinaryIO] = None
+) -> Iterator[SequenceRecord]:
+    _rewind(stream)
+    text_stream = _open_text(stream)
+    reader = csv.DictReader(text_stream)
+    try:
+        if not reader.fieldnames:
+            raise ValueError(
+                "Uploaded CSV must include headers with a sequence column."
+            )
+        sequence_col, id_col = _resolve_columns(reader.fieldnames)
+    except Exception:
+        _close(text_stream, decompressor)
+        raise
+
+    return _iter_csv_rows(text_stream, reader, sequence_col, id_col, decompressor)
+
+
+def _iter_fasta_records(
+    text_stream: io.TextIOWrapper, decompressor: Optional[BinaryIO] = None
+) -> Iterator[SequenceRecord]:
+    sequence_id: Optional[str] = None
+    chunks: List[str] = []
+    found = False
+    idx = 0
+
+    try:
+        for line in text_stream:
+            line = line.strip()
+            if not line or line.startswith(";"):
+                continue
+            if line.startswith(">"):
+                if sequence_id is not None and chunks:
+                    found = True
+                    yield sequence_id, "".join(chunks)
+                idx += 1
+                header = line[1:].split(maxsplit=1)
+                sequence_id = header[0] if header else f"fasta_sequence_{idx}"
+                chunks = []
+                continue
+            if sequence_id is None:
+                raise ValueError("FASTA input must start with a '>' header line.")
+            chunks.append(line)
+
+        if sequence_id is not None and chunks:
+            found = True
+            yield sequence_id, "".join(chunks)
+    finally:
+        _close(text_stream, decompressor)
+
+    if not found:
+        raise ValueError("No valid sequences were found in the uploaded FASTA.")
+
+
+def iter_fasta_sequences(stream: BinaryIO) -> Iterator[SequenceRecord]:
+    """Lazily yield records from a FASTA byte stream with multi-line entries.
+
+    The record ID is the first whitespace-delimited token of each header.
+    """
+
+    _rewind(stream)
+    return _iter_fasta_records(_open_text(stream))
+
+
+def _iter_parquet_batches(
+    parquet_file, sequence_col: str, id_col: Optional[str]
+) -> Iterator[SequenceRecord]:
+    columns = [sequence_col] + ([id_col] if id_col else [])
+    found = False
+    idx = 0
+
+    for batch in parquet_file.iter_batches(
+        batch_size=_PARQUET_BATCH_ROWS, columns=columns
+    ):
+        seq_values = batch.column(0).to_pylist()
+        id_values = batch.column(1).to_pylist() if id_col else None
+        for offset, raw_value in enumerate(seq_values):
+            idx += 1
+            seq_value = (str(raw_value) if raw_value is not None else "").strip()
+            if not seq_value:
+                continue
+            raw_id = id_values[offset] if id_values is not None else None
+            sequence_id = raw_id is not None and str(raw_id).strip()
+            found = True
+            yield sequence_id or f"parquet_sequence_{idx}", seq_value
+
+    if not found:
+        raise ValueError("No valid sequences were found in the uploaded Parquet file.")
+
+
+def iter_parquet_sequences(stream: BinaryIO) -> Iterator[SequenceRecord]:
+    """Lazily yield records from a Parquet file, reading only the ID and sequence columns."""
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - pyarrow ships with Streamlit
+        raise ValueError("Reading Parquet uploads requires the 'pyarrow' package.") from exc
+
+    _rewind(stream)
+    try:
+        parquet_file = pq.ParquetFile(stream)
+    except Exception as exc:
+        raise ValueError(f"Could not read the uploaded Parquet file: {exc}") from exc
+
+    sequence_col, id_col = _resolve_columns(parquet_file.schema_arrow.names, "Parquet file")
+    return _iter_parquet_batches(parquet_file, sequence_col, id_col)
+
+
+def _detect_format(name: str, stream: BinaryIO) -> Tuple[str, Optional[str]]:
+    """Return ``(format, compression)`` from the file name, falling back to magic bytes."""
+
+    suffixes = [suffix.lower() for suffix in PurePath(name or "").suffixes]
+    compression = COMPRESSION_SUFFIXES.get(suffixes[-1]) if suffixes else None
+    if compression:
+        suffixes = suffixes[:-1]
+
+    head = _peek(stream)
+    if compression is None:
+        if head.startswith(_GZIP_MAGIC):
+            compression = "gzip"
+        elif head.startswith(_ZSTD_MAGIC):
+            compression = "zstd"
+
+    last = suffixes[-1] if suffixes else ""
+    if last in PARQUET_SUFFIXES or (compression is None and head == _PARQUET_MAGIC):
+        if compression:
+            raise ValueError(
+                "Compressed Parquet uploads are not supported; Parquet is already compressed."
+            )
+        return FORMAT_PARQUET, None
+    if last in FASTA_SUFFIXES:
+        return FORMAT_FASTA, compression
+    if last in CSV_SUFFIXES:
+        return FORMAT_CSV, compression
+
+    decoded = _decompressed(stream, compression)
+    try:
+        first_char = decoded.read(1)
+    finally:
+        if decoded is not stream:
+            decoded.close()
+        _rewind(stream)
+    return (FORMAT_FASTA if first_char in {b">", b";"} else FORMAT_CSV), compression
+
+
+def iter_uploaded_sequences(stream: BinaryIO, name: str = "") -> Iterator[SequenceRecord]:
+    """Lazily yield records from a CSV, FASTA or Parquet upload.
+
+    CSV and FASTA inputs may be gzip- or zstd-compressed; the format is taken from
+    ``name`` (for example ``library.fasta.gz``) and falls back to sniffing the
+    leading bytes when the extension is missing or ambiguous.
+    """
+
+    file_format, compression = _detect_format(name, stream)
+    if file_format == FORMAT_PARQUET:
+        return iter_parquet_sequences(stream)
+
+    _rewind(stream)
+    source = _decompressed(stream, compression)
+    decompressor = source if source is not stream else None
+    if file_format == FORMAT_FASTA:
+        return _iter_fasta_records(_open_text(source), decompressor)
+    return _csv_records(source, decompressor)
+
+
+__all__ = [
+    "COMPRESSION_SUFFIXES",
+    "CSV_SUFFIXES",
+    "FASTA_SUFFIXES",
+    "PARQUET_SUFFIXES",
+    "SequenceRecord",
+    "SUPPORTED_UPLOAD_TYPES",
+    "iter_csv_sequences",
+    "iter_fasta_sequences",
+    "iter_parquet_sequences",
+    "iter_uploaded_sequences",
+    "SEQUENCE_COLUMN_ALIASES",
+    "ID_COLUMN_ALIASES",
+]
@@ -0,0 +1,267 @@
+"""Compact, integer-encoded container for large sequence libraries.
+
+Residues live in one immutable ``bytes`` buffer (one ``uint8`` per residue) and
+IDs in a second UTF-8 buffer; rows are ``(start, end)`` offset pairs into
+each. Slicing, masking and de-duplication only build new offset arrays;
+de-duplication hashes rows with vectorised NumPy passes over the residue
+buffer. Python strings are produced only for the row currently being
+dispatched.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+_CHUNK_RECORDS = 65536
+# FNV-1 64-bit prime; any odd multiplier works, collisions are checked anyway.
+_HASH_MULTIPLIER = np.uint64(0x100000001B3)
+
+
+def _flush_residues(chunks: List[bytes], pending: List[str]) -> None:
+    if pending:
+        chunks.append("".join(pending).encode("ascii", errors="replace"))
+        pending.clear()
+
+
+def _flush_ids(chunks: List[bytes], pending: List[bytes]) -> None:
+    if pending:
+        chunks.append(b"".join(pending))
+        pending.clear()
+
+
+class SequenceStore:
+    """Read-only table of ``(sequence_id, sequence)`` rows backed by shared buffers."""
+
+    __slots__ = ("_residues", "_starts", "_ends", "_ids", "_id_starts", "_id_ends")
+
+    def __init__(
+        self,
+        residues: bytes,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        ids: bytes,
+        id_starts: np.ndarray,
+        id_ends: np.ndarray,
+    ) -> None:
+        self._residues = residues
+        self._starts = starts
+        self._ends = ends
+        self._ids = ids
+        self._id_starts = id_starts
+        self._id_ends = id_ends
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Tuple[str, str]],
+        *,
+        chunk_records: int = _CHUNK_RECORDS,
+    ) -> "SequenceStore":
+        """Encode a record stream without keeping per-row Python objects.
+
+        Residues are stored as ASCII; anything else becomes ``?`` so it is still
+        reported as a non-standard residue by validation.
+        """
+
+        residue_chunks: List[bytes] = []
+        id_chunks: List[bytes] = []
+        pending_residues: List[str] = []
+        pending_ids: List[bytes] = []
+        lengths = array("q")
+        id_lengths = array("q")
+
+        for sequence_id, sequence in records:
+            pending_residues.append(sequence)
+            lengths.append(len(sequence))
+            encoded_id = sequence_id.encode("utf-8")
+            pending_ids.append(encoded_id)
+            id_lengths.append(len(encoded_id))
+            if len(pending_residues) >= chunk_records:
+                _flush_residues(residue_chunks, pending_residues)
+                _flush_ids(id_chunks, pending_ids)
+        _flush_residues(residue_chunks, pending_residues)
+        _flush_ids(id_chunks, pending_ids)
+
+        ends = np.cumsum(np.frombuffer(lengths, dtype=np.int64))
+        id_ends = np.cumsum(np.frombuffer(id_lengths, dtype=np.int64))
+        return cls(
+            b"".join(residue_chunks),
+            ends - np.frombuffer(lengths, dtype=np.int64),
+            ends,
+            b"".join(id_chunks),
+            id_ends - np.frombuffer(id_lengths, dtype=np.int64),
+            id_ends,
+        )
+
+    def __len__(self) -> int:
+        return int(self._starts.size)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        residues, ids = self._residues, self._ids
+        for start, end, id_start, id_end in zip(
+            self._starts.tolist(),
+            self._ends.tolist(),
+            self._id_starts.tolist(),
+            self._id_ends.tolist(),
+        ):
+            yield (
+                ids[id_start:id_end].decode("utf-8"),
+                residues[start:end].decode("ascii"),
+            )
+
+    def __getitem__(self, rows) -> "SequenceStore":
+        """Return a view over ``rows`` (a slice, boolean mask or index array)."""
+
+        return SequenceStore(
+            self._residues,
+            self._starts[rows],
+            self._ends[rows],
+            self._ids,
+            self._id_starts[rows],
+            self._id_ends[rows],
+        )
+
+    @property
+    def residues(self) -> np.ndarray:
+        """The shared residue buffer as a read-only ``uint8`` array."""
+
+        return np.frombuffer(self._residues, dtype=np.uint8)
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self._ends
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self._ends - self._starts
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes referenced by this view, including the offset arrays."""
+
+        offsets = (
+            self._starts.nbytes
+            + self._ends.nbytes
+            + self._id_starts.nbytes
+            + self._id_ends.nbytes
+        )
+        return len(self._residues) + len(self._ids) + offsets
+
+    def sequence_id(self, row: int) -> str:
+        return self._ids[self._id_starts[row] : self._id_ends[row]].decode("utf-8")
+
+    def sequence(self, row: int) -> str:
+        return self._residues[self._starts[row] : self._ends[row]].decode("ascii")
+
+    def sequence_key(self, row: int) -> memoryview:
+        """Zero-copy view of the row's residues; hashable and comparable by content."""
+
+        return memoryview(self._residues)[self._starts[row] : self._ends[row]]
+
+    def unique(self) -> Tuple["SequenceStore", np.ndarray]:
+        """Return ``(unique_rows, inverse)`` keeping first occurrences in order.
+
+        ``inverse[i]`` is the row in ``unique_rows`` that holds row ``i``'s sequence.
+        Rows are grouped by a vectorised rolling hash; only rows whose hash
+        matches an earlier row are compared byte for byte.
+        """
+
+        residues = self.residues
+        lengths = self.lengths
+        hashes = _row_hashes(residues, self._starts, lengths)
+        _, first, labels = np.unique(hashes, return_index=True, return_inverse=True)
+        labels = labels.reshape(-1)
+
+        duplicates = np.flatnonzero(first[labels] != np.arange(len(self)))
+        originals = first[labels[duplicates]]
+        same = lengths[duplicates] == lengths[originals]
+        same[same] = _rows_match(
+            residues,
+            self._starts[duplicates[same]],
+            self._starts[originals[same]],
+            lengths[duplicates[same]],
+        )
+        if not same.all():
+            labels = self._split_collisions(labels, np.unique(labels[duplicates[~same]]))
+            _, first, labels = np.unique(labels, return_index=True, return_inverse=True)
+            labels = labels.reshape(-1)
+
+        by_first = np.argsort(first, kind="stable")
+        rank = np.empty(first.size, dtype=np.int64)
+        rank[by_first] = np.arange(first.size)
+        return self[first[by_first]], rank[labels]
+
+    def _split_collisions(self, labels: np.ndarray, collided: np.ndarray) -> np.ndarray:
+        """Relabel rows of hash groups that hold more than one distinct sequence."""
+
+        labels = labels.astype(np.int64, copy=True)
+        next_label = int(labels.max()) + 1
+        for label in collided.tolist():
+            rows = np.flatnonzero(labels == label)
+            slots: Dict[bytes, int] = {}
+            for row in rows.tolist():
+                key = bytes(self.sequence_key(row))
+                if not slots:
+                    slots[key] = label
+                elif key not in slots:
+                    slots[key] = next_label
+                    next_label += 1
+                labels[row] = slots[key]
+        return labels
+
+
+def _column_passes(lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows by descending length, and how many of them reach each column.
+
+    Walking columns over that order touches each residue once, and every pass
+    works on a prefix of the rows.
+    """
+
+    order = np.argsort(-lengths, kind="stable")
+    descending = lengths[order]
+    columns = int(descending[0]) if descending.size else 0
+    reach = np.searchsorted(-descending, -np.arange(columns), side="left")
+    return order, reach
+
+
+def _row_hashes(residues: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """64-bit polynomial hash of each row, seeded with its length."""
+
+    order, reach = _column_passes(lengths)
+    hashes = lengths[order].astype(np.uint64)
+    positions = starts[order]
+    for count in reach.tolist():
+        # uint64 arithmetic wraps, which is the modulus we want.
+        hashes[:count] = hashes[:count] * _HASH_MULTIPLIER + residues[positions[:count]]
+        positions[:count] += 1
+    out = np.empty_like(hashes)
+    out[order] = hashes
+    return out
+
+
+def _rows_match(
+    residues: np.ndarray, starts_a: np.ndarray, starts_b: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    """Whether each pair of equal-length rows holds the same residues."""
+
+    order, reach = _column_passes(lengths)
+    positions_a = starts_a[order]
+    positions_b = starts_b[order]
+    match = np.ones(order.size, dtype=bool)
+    for count in reach.tolist():
+        match[:count] &= residues[positions_a[:count]] == residues[positions_b[:count]]
+        positions_a[:count] += 1
+        positions_b[:count] += 1
+    out = np.empty_like(match)
+    out[order] = match
+    return out
+
+
+__all__ = ["SequenceStore"]
@@ -0,0 +1,448 @@
+"""Per-request latency attribution for calls to the managed endpoints.
+
+``post_json`` and ``get_json`` wrap every call in a :class:`RequestTimer`. The
+timer records connect time (measured inside urllib3 by
+:class:`TimedHTTPAdapter`), time to first byte, body download, total time,
+attempts and any timing headers the backend returns. The process-wide
+:class:`TelemetryRegistry` flags probable cold starts: the first call to an
+endpoint, a call after a long idle gap, or a TTFB far above that endpoint's
+recent median. It also aggregates the timings per endpoint.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+_HISTORY = max(16, int(os.environ.get("SEQUENCE_TELEMETRY_HISTORY", "512")))
+_COLD_IDLE_SECONDS = max(
+    0.0, float(os.environ.get("SEQUENCE_COLD_START_IDLE_SECONDS", "900"))
+)
+_OUTLIER_FACTOR = 3.0
+_OUTLIER_MIN_SECONDS = 1.0
+_IDLE_SLOWDOWN_FACTOR = 1.5
+_BASELINE_SAMPLES = 5
+_BASELINE_WINDOW = 50
+_TIMING_HEADERS = {
+    "server-timing",
+    "x-server-timing",
+    "x-process-time",
+    "x-response-time",
+    "x-inference-time",
+    "x-queue-time",
+    "x-envoy-upstream-service-time",
+}
+
+COLD_FIRST_CALL = "first call"
+COLD_AFTER_IDLE = "after idle"
+COLD_TTFB_OUTLIER = "ttfb outlier"
+SUMMARY_COLUMNS = [
+    "endpoint",
+    "requests",
+    "errors",
+    "cold_starts",
+    "retries",
+    "connect_ms_mean",
+    "ttfb_ms_p50",
+    "ttfb_ms_p95",
+    "total_ms_p50",
+    "total_ms_p95",
+    "cold_ttfb_ms_mean",
+    "seconds_since_last",
+]
+WINDOW_COLUMNS = [
+    "endpoint",
+    "requests",
+    "per_minute",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "ttfb_p50_ms",
+    "retry_rate",
+    "failure_rate",
+    "cold_starts",
+]
+
+
+# Tag of requests made on behalf of users; background probes use their own.
+REQUEST_TAG = "request"
+
+
+@dataclass
+class RequestTiming:
+    """Timing breakdown of one logical request, across all of its attempts."""
+
+    endpoint: str
+    method: str
+    started_at: float
+    tag: str = REQUEST_TAG
+    attempts: int = 0
+    connections_opened: int = 0
+    connect_seconds: float = 0.0
+    ttfb_seconds: Optional[float] = None
+    download_seconds: Optional[float] = None
+    total_seconds: float = 0.0
+    status_code: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    error: Optional[str] = None
+    timing_headers: Dict[str, str] = field(default_factory=dict)
+    cold_start: bool = False
+    cold_start_reason: Optional[str] = None
+    request_id: Optional[str] = None
+    run_id: Optional[str] = None
+
+
+_current_timer: contextvars.ContextVar[Optional["RequestTimer"]] = contextvars.ContextVar(
+    "sequence_request_timer", default=None
+)
+_request_tag: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "sequence_request_tag", default=REQUEST_TAG
+)
+
+
+@contextlib.contextmanager
+def request_tag(tag: str) -> Iterator[None]:
+    """Label requests made inside the block, e.g. ``"warmup"`` probes."""
+
+    token = _request_tag.set(tag)
+    try:
+        yield
+    finally:
+        _request_tag.reset(token)
+
+
+class RequestTimer:
+    """Collect one request's timings; recorded on exit from the ``with`` block."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        *,
+        request_bytes: int = 0,
+        registry: Optional["TelemetryRegistry"] = None,
+    ) -> None:
+        self.timing = RequestTiming(
+            endpoint=endpoint,
+            method=method,
+            started_at=time.time(),
+            tag=_request_tag.get(),
+            request_bytes=request_bytes,
+        )
+        self._registry = registry
+        self._started = 0.0
+        self._attempt_connect = 0.0
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> "RequestTimer":
+        self._started = time.perf_counter()
+        self._token = _current_timer.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_timer.reset(self._token)
+        self.timing.total_seconds = time.perf_counter() - self._started
+        if exc is not None and self.timing.error is None:
+            self.timing.error = f"{exc_type.__name__}: {exc}"
+        (self._registry or get_telemetry()).record(self.timing)
+
+    def start_attempt(self, *, resend: bool = False) -> None:
+        """Start timing a send; a ``resend`` stays part of the current attempt."""
+
+        if not resend:
+            self.timing.attempts += 1
+        self._attempt_connect = 0.0
+
+    def add_connect(self, seconds: float) -> None:
+        self.timing.connections_opened += 1
+        self.timing.connect_seconds += seconds
+        self._attempt_connect += seconds
+
+    def headers_received(self, response: Response) -> None:
+        """Note status, TTFB and timing headers once the response head arrives."""
+
+        self.timing.status_code = response.status_code
+        # ``elapsed`` runs from sending the request to parsing the headers,
+        # including any connect of this attempt.
+        self.timing.ttfb_seconds = max(
+            0.0, response.elapsed.total_seconds() - self._attempt_connect
+        )
+        self.timing.timing_headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() in _TIMING_HEADERS
+        }
+
+    def read_body(self, response: Response) -> bytes:
+        """Read a streamed body, timing the download."""
+
+        started = time.perf_counter()
+        content = response.content
+        self.timing.download_seconds = time.perf_counter() - started
+        self.timing.response_bytes = len(content)
+        return content
+
+
+def _note_connect(seconds: float) -> None:
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.add_connect(seconds)
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _note_connect(time.perf_counter() - started)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _note_connect(time.perf_counter() - started)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Adapter whose new connections report TCP/TLS setup time to the active timer."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+@dataclass
+class _EndpointHistory:
+    timings: Deque[RequestTiming]
+    requests: int = 0
+    errors: int = 0
+    cold_starts: int = 0
+    retries: int = 0
+    last_seen: Optional[float] = None
+
+
+class TelemetryRegistry:
+    """Thread-safe per-endpoint history with cold-start classification."""
+
+    def __init__(
+        self,
+        *,
+        history: int = _HISTORY,
+        idle_seconds: float = _COLD_IDLE_SECONDS,
+        outlier_factor: float = _OUTLIER_FACTOR,
+        outlier_min_seconds: float = _OUTLIER_MIN_SECONDS,
+    ) -> None:
+        self.history = history
+        self.idle_seconds = idle_seconds
+        self.outlier_factor = outlier_factor
+        self.outlier_min_seconds = outlier_min_seconds
+        self._endpoints: Dict[str, _EndpointHistory] = {}
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming) -> None:
+        with self._lock:
+            entry = self._endpoints.get(timing.endpoint)
+            if entry is None:
+                entry = self._endpoints[timing.endpoint] = _EndpointHistory(
+                    deque(maxlen=self.history)
+                )
+            self._classify(entry, timing)
+            entry.timings.append(timing)
+            entry.requests += 1
+            entry.retries += max(0, timing.attempts - 1)
+            entry.errors += int(timing.error is not None)
+            entry.cold_starts += int(timing.cold_start)
+            entry.last_seen = timing.started_at + timing.total_seconds
+
+    def _classify(self, entry: _EndpointHistory, timing: RequestTiming) -> None:
+        ttfb = timing.ttfb_seconds
+        if ttfb is None:
+            return
+
+        warm = [
+            sample.ttfb_seconds
+            for sample in list(entry.timings)[-_BASELINE_WINDOW:]
+            if sample.ttfb_seconds is not None and not sample.cold_start
+        ]
+        baseline = float(np.median(warm)) if len(warm) >= _BASELINE_SAMPLES else None
+
+        if entry.last_seen is None:
+            idle_reason: Optional[str] = COLD_FIRST_CALL
+        elif timing.started_at - entry.last_seen > self.idle_seconds:
+            idle_reason = COLD_AFTER_IDLE
+        else:
+            idle_reason = None
+
+        if idle_reason and (baseline is None or ttfb > baseline * _IDLE_SLOWDOWN_FACTOR):
+            timing.cold_start, timing.cold_start_reason = True, idle_reason
+        elif (
+            baseline is not None
+            and ttfb > baseline * self.outlier_factor
+            and ttfb - baseline > self.outlier_min_seconds
+        ):
+            timing.cold_start, timing.cold_start_reason = True, COLD_TTFB_OUTLIER
+
+    def recent(
+        self, endpoint: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[RequestTiming]:
+        """Return recorded timings, oldest first, for one endpoint or all of them."""
+
+        with self._lock:
+            if endpoint is not None:
+                entry = self._endpoints.get(endpoint)
+                timings = list(entry.timings) if entry else []
+            else:
+                timings = sorted(
+                    (t for entry in self._endpoints.values() for t in entry.timings),
+                    key=lambda timing: timing.started_at,
+                )
+        return timings[-limit:] if limit else timings
+
+    def summary(self) -> pd.DataFrame:
+        """One row per endpoint; latency percentiles cover the recent history."""
+
+        now = time.time()
+        rows = []
+        with self._lock:
+            for endpoint, entry in sorted(self._endpoints.items()):
+                timings = list(entry.timings)
+                ttfb = [t.ttfb_seconds for t in timings if t.ttfb_seconds is not None]
+                total = [t.total_seconds for t in timings]
+                cold = [
+                    t.ttfb_seconds
+                    for t in timings
+                    if t.cold_start and t.ttfb_seconds is not None
+                ]
+                rows.append(
+                    {
+                        "endpoint": endpoint,
+                        "requests": entry.requests,
+                        "errors": entry.errors,
+                        "cold_starts": entry.cold_starts,
+                        "retries": entry.retries,
+                        "connect_ms_mean": 1e3 * float(
+                            np.mean([t.connect_seconds for t in timings])
+                        ),
+                        "ttfb_ms_p50": _percentile_ms(ttfb, 50),
+                        "ttfb_ms_p95": _percentile_ms(ttfb, 95),
+                        "total_ms_p50": _percentile_ms(total, 50),
+                        "total_ms_p95": _percentile_ms(total, 95),
+                        "cold_ttfb_ms_mean": 1e3 * float(np.mean(cold)) if cold else None,
+                        "seconds_since_last": (
+                            now - entry.last_seen if entry.last_seen is not None else None
+                        ),
+                    }
+                )
+        return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+    def window_summary(
+        self, window_seconds: float, *, include_tags: Optional[Iterable[str]] = None
+    ) -> pd.DataFrame:
+        """Per-endpoint rates and latency percentiles over the last ``window_seconds``.
+
+        ``include_tags`` restricts the rows to e.g. ``{"request"}`` so warm-up
+        probes do not skew user-facing latency.
+        """
+
+        cutoff = time.time() - window_seconds
+        tags = set(include_tags) if include_tags is not None else None
+        rows = []
+        with self._lock:
+            histories = {
+                endpoint: [
+                    t
+                    for t in entry.timings
+                    if t.started_at >= cutoff and (tags is None or t.tag in tags)
+                ]
+                for endpoint, entry in sorted(self._endpoints.items())
+            }
+        for endpoint, timings in histories.items():
+            if not timings:
+                continue
+            total = [t.total_seconds for t in timings]
+            ttfb = [t.ttfb_seconds for t in timings if t.ttfb_seconds is not None]
+            failed = sum(
+                1
+                for t in timings
+                if t.error is not None or (t.status_code or 0) >= 400
+            )
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "requests": len(timings),
+                    "per_minute": 60.0 * len(timings) / window_seconds,
+                    "p50_ms": _percentile_ms(total, 50),
+                    "p95_ms": _percentile_ms(total, 95),
+                    "p99_ms": _percentile_ms(total, 99),
+                    "ttfb_p50_ms": _percentile_ms(ttfb, 50),
+                    "retry_rate": sum(t.attempts > 1 for t in timings) / len(timings),
+                    "failure_rate": failed / len(timings),
+                    "cold_starts": sum(t.cold_start for t in timings),
+                }
+            )
+        return pd.DataFrame(rows, columns=WINDOW_COLUMNS)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _percentile_ms(values: List[float], percentile: float) -> Optional[float]:
+    if not values:
+        return None
+    return 1e3 * float(np.percentile(values, percentile))
+
+
+_registry: Optional[TelemetryRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_telemetry() -> TelemetryRegistry:
+    """Return the process-wide registry shared by every session."""
+
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TelemetryRegistry()
+        return _registry
+
+
+__all__ = [
+    "COLD_AFTER_IDLE",
+    "COLD_FIRST_CALL",
+    "COLD_TTFB_OUTLIER",
+    "REQUEST_TAG",
+    "RequestTimer",
+    "RequestTiming",
+    "SUMMARY_COLUMNS",
+    "TelemetryRegistry",
+    "TimedHTTPAdapter",
+    "WINDOW_COLUMNS",
+    "get_telemetry",
+    "request_tag",
+]
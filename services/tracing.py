@@ -0,0 +1,215 @@
+"""Correlation IDs, structured JSON logs and optional OpenTelemetry spans.
+
+Each Sequencing run gets a run ID and every HTTP call a request ID; both are
+sent to the backend as ``X-Run-ID``/``X-Request-ID`` headers and appear on
+every log line, so a slow UI run can be matched to Cloud Run logs. Logs go to
+the ``sequence`` logger as one JSON object per line. When the
+``opentelemetry`` API is installed, :func:`span` also opens a real span and the
+trace context is propagated with the request headers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    from opentelemetry import propagate as _otel_propagate
+    from opentelemetry import trace as _otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    _otel_propagate = None
+    _otel_trace = None
+
+RUN_ID_HEADER = "X-Run-ID"
+REQUEST_ID_HEADER = "X-Request-ID"
+LOGGER_NAME = "sequence"
+
+logger = logging.getLogger(LOGGER_NAME)
+# Stay silent in scripts and benchmarks until configure_logging() opts in.
+logger.addHandler(logging.NullHandler())
+
+_run_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "sequence_run_id", default=None
+)
+_sequence_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "sequence_sequence_id", default=None
+)
+_tracer = _otel_trace.get_tracer(LOGGER_NAME) if _otel_trace is not None else None
+
+
+def new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def current_run_id() -> Optional[str]:
+    return _run_id.get()
+
+
+def current_sequence_id() -> Optional[str]:
+    return _sequence_id.get()
+
+
+@contextlib.contextmanager
+def run_context(run_id: Optional[str] = None) -> Iterator[str]:
+    """Tag everything inside the block with ``run_id`` (a new one by default)."""
+
+    token = _run_id.set(run_id or new_id())
+    try:
+        yield _run_id.get()
+    finally:
+        _run_id.reset(token)
+
+
+@contextlib.contextmanager
+def sequence_context(sequence_id: str) -> Iterator[None]:
+    """Attach ``sequence_id`` to requests and log lines made inside the block."""
+
+    token = _sequence_id.set(sequence_id)
+    try:
+        yield
+    finally:
+        _sequence_id.reset(token)
+
+
+def correlation_headers(request_id: str) -> Dict[str, str]:
+    """Headers that let the backend log the same IDs as the app."""
+
+    headers = {REQUEST_ID_HEADER: request_id}
+    run_id = _run_id.get()
+    if run_id:
+        headers[RUN_ID_HEADER] = run_id
+    if _otel_propagate is not None:
+        _otel_propagate.inject(headers)
+    return headers
+
+
+def log_event(event: str, level: int = logging.INFO, /, **fields: Any) -> None:
+    """Emit one structured log line carrying the current run and sequence IDs.
+
+    ``fields`` override the context IDs but never the ``event`` name.
+    """
+
+    if not logger.isEnabledFor(level):
+        return
+    record: Dict[str, Any] = {"event": event}
+    run_id = _run_id.get()
+    if run_id:
+        record["run_id"] = run_id
+    sequence_id = _sequence_id.get()
+    if sequence_id and "sequence_id" not in fields:
+        record["sequence_id"] = sequence_id
+    record.update(fields)
+    record["event"] = event
+    logger.log(level, event, extra={"structured": record})
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """Time a stage of work and log it; also a real span when OpenTelemetry is present.
+
+    The yielded dict can be filled with extra attributes (such as row counts)
+    that are only known once the stage has run; they override same-named
+    ``attributes``, and neither can replace ``span``, ``duration_ms`` or ``error``.
+    """
+
+    extra: Dict[str, Any] = {}
+    started = time.perf_counter()
+    otel_span = (
+        _tracer.start_as_current_span(name, attributes=_otel_attributes(attributes))
+        if _tracer is not None
+        else contextlib.nullcontext()
+    )
+    error: Optional[str] = None
+    with otel_span as active:
+        try:
+            yield extra
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            if active is not None and extra:
+                active.set_attributes(_otel_attributes(extra))
+            fields = {
+                **attributes,
+                **extra,
+                "span": name,
+                "duration_ms": round((time.perf_counter() - started) * 1e3, 3),
+                "error": error,
+            }
+            log_event("span", **fields)
+
+
+def _otel_attributes(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in values.items()
+        if value is not None
+    }
+
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger and the event fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+        }
+        structured = getattr(record, "structured", None)
+        if structured:
+            # ``ts``, ``level`` and ``logger`` always describe the record itself.
+            payload.update(
+                (key, value) for key, value in structured.items() if key not in payload
+            )
+        else:
+            payload["message"] = record.getMessage()
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+def configure_logging() -> None:
+    """Attach a JSON stderr handler to the ``sequence`` logger once.
+
+    ``SEQUENCE_LOG_LEVEL`` sets the level (default ``INFO``); ``off`` silences
+    the structured logs entirely.
+    """
+
+    if any(getattr(handler, "_sequence_json", False) for handler in logger.handlers):
+        return
+    level_name = os.environ.get("SEQUENCE_LOG_LEVEL", "INFO").strip().upper()
+    if level_name == "OFF":
+        logger.disabled = True
+        return
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonLogFormatter())
+    handler._sequence_json = True  # type: ignore[attr-defined]
+    logger.addHandler(handler)
+    logger.setLevel(getattr(logging, level_name, logging.INFO))
+    logger.propagate = False
+
+
+__all__ = [
+    "JsonLogFormatter",
+    "LOGGER_NAME",
+    "REQUEST_ID_HEADER",
+    "RUN_ID_HEADER",
+    "configure_logging",
+    "correlation_headers",
+    "current_run_id",
+    "current_sequence_id",
+    "log_event",
+    "new_id",
+    "run_context",
+    "sequence_context",
+    "span",
+]
@@ -0,0 +1,275 @@
+"""Vectorised pre-validation of sequence batches before any network call."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .framework_screen import PRESCREEN_OFF, PRESCREEN_SKIP, screen_framework
+from .sequence_store import SequenceStore
+
+STANDARD_RESIDUES = "ACDEFGHIKLMNPQRSTVWY"
+SEVERITY_REJECT = "rejected"
+SEVERITY_WARNING = "warning"
+ISSUE_COLUMNS = ["sequence_id", "length", "severity", "reason"]
+_BLOCK_ROWS = 65536
+_MAX_REPORTED_POSITIONS = 5
+
+_VALID_RESIDUE = np.zeros(256, dtype=bool)
+for _residue in STANDARD_RESIDUES:
+    _VALID_RESIDUE[ord(_residue)] = True
+    _VALID_RESIDUE[ord(_residue.lower())] = True
+
+
+@dataclass(frozen=True)
+class SequenceChecks:
+    """Per-row lengths and invalid-character counts for a block of rows."""
+
+    lengths: np.ndarray
+    invalid_counts: np.ndarray
+    invalid_mask: np.ndarray
+    local_starts: np.ndarray
+
+    def invalid_positions(self, row: int, limit: int = _MAX_REPORTED_POSITIONS) -> List[int]:
+        """Return up to ``limit`` 1-based residue positions that are not standard."""
+
+        start = int(self.local_starts[row])
+        window = self.invalid_mask[start : start + int(self.lengths[row])]
+        return [int(offset) + 1 for offset in np.flatnonzero(window)[:limit]]
+
+
+@dataclass(frozen=True)
+class ModelRules:
+    min_length: int
+    reject_short: bool
+    reject_invalid: bool
+    short_reason: str
+    invalid_reason: str = "sequence contains non-standard amino-acid characters"
+    framework_screen: bool = False
+    uppercase: bool = False
+
+
+ABNATIV_MIN_SEQUENCE_LENGTH = 95
+MODEL_RECOMMENDED_MIN_LENGTH = 95
+_MODEL_LABELS = {
+    "abnativ": "AbNatiV",
+    "nbforge": "NbForge",
+    "nbframe": "NbFrame",
+    "nanomelt": "NanoMelt",
+}
+_FRAMEWORK_SCREEN_MODELS = {"nbforge", "nbframe"}
+# Keyed by endpoint name; the Sequencing page and the CLI both validate with these.
+MODEL_RULES: Dict[str, ModelRules] = {
+    "abnativ": ModelRules(
+        min_length=ABNATIV_MIN_SEQUENCE_LENGTH,
+        reject_short=True,
+        reject_invalid=True,
+        short_reason=(
+            "sequence too short for AbNatiV; provide a full variable-domain sequence "
+            f"(>= {ABNATIV_MIN_SEQUENCE_LENGTH} aa)"
+        ),
+        uppercase=True,
+    ),
+    **{
+        model: ModelRules(
+            min_length=MODEL_RECOMMENDED_MIN_LENGTH,
+            reject_short=False,
+            reject_invalid=False,
+            short_reason=(
+                f"shorter than the recommended {MODEL_RECOMMENDED_MIN_LENGTH} aa; "
+                f"{_MODEL_LABELS[model]} may fail on fragments"
+            ),
+            framework_screen=model in _FRAMEWORK_SCREEN_MODELS,
+        )
+        for model in ("nbforge", "nbframe", "nanomelt")
+    },
+}
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of validating a record stream for one model."""
+
+    keep: np.ndarray
+    issues: pd.DataFrame
+
+    @property
+    def total(self) -> int:
+        return int(self.keep.size)
+
+    @property
+    def accepted(self) -> int:
+        return int(self.keep.sum())
+
+    @property
+    def rejected(self) -> int:
+        return self.total - self.accepted
+
+
+def clean_sequence(sequence: str) -> str:
+    return (sequence or "").strip().replace("\n", "")
+
+
+def prepare_sequence(sequence: str, rules: ModelRules) -> str:
+    """Clean ``sequence`` and uppercase it when the model expects that."""
+
+    cleaned = clean_sequence(sequence)
+    return cleaned.upper() if rules.uppercase else cleaned
+
+
+def inspect_store(store: SequenceStore) -> SequenceChecks:
+    """Check lengths and alphabet for every row of ``store`` in one NumPy pass.
+
+    The lookup runs over the residue span the rows cover, so views of a larger
+    store only pay for the bytes they reference.
+    """
+
+    starts, ends = store.starts, store.ends
+    if not starts.size:
+        empty = np.zeros(0, dtype=np.int64)
+        return SequenceChecks(empty, empty, np.zeros(0, dtype=bool), empty)
+
+    low, high = int(starts.min()), int(ends.max())
+    invalid_mask = ~_VALID_RESIDUE[store.residues[low:high]]
+    prefix = np.zeros(invalid_mask.size + 1, dtype=np.int64)
+    np.cumsum(invalid_mask, out=prefix[1:])
+    local_starts, local_ends = starts - low, ends - low
+    return SequenceChecks(
+        lengths=ends - starts,
+        invalid_counts=prefix[local_ends] - prefix[local_starts],
+        invalid_mask=invalid_mask,
+        local_starts=local_starts,
+    )
+
+
+def inspect_sequences(sequences: Sequence[str]) -> SequenceChecks:
+    """Check plain strings; non-ASCII characters count as non-standard residues."""
+
+    return inspect_store(
+        SequenceStore.from_records(("", sequence) for sequence in sequences)
+    )
+
+
+def _framework_flags(
+    store: SequenceStore, candidates: np.ndarray
+) -> Tuple[np.ndarray, Dict[int, str]]:
+    flagged = np.zeros(len(store), dtype=bool)
+    reasons: Dict[int, str] = {}
+    for row in np.flatnonzero(candidates):
+        row_reasons = screen_framework(store.sequence(row))
+        if row_reasons:
+            flagged[row] = True
+            reasons[row] = "likely to fail antibody numbering: " + "; ".join(row_reasons)
+    return flagged, reasons
+
+
+def _block_issues(
+    store: SequenceStore, rules: ModelRules, framework_mode: str
+) -> Tuple[np.ndarray, List[Tuple[str, int, str, str]]]:
+    checks = inspect_store(store)
+    short = checks.lengths < rules.min_length
+    invalid = checks.invalid_counts > 0
+    keep = np.ones(len(store), dtype=bool)
+    if rules.reject_short:
+        keep &= ~short
+    if rules.reject_invalid:
+        keep &= ~invalid
+
+    framework = np.zeros(len(store), dtype=bool)
+    framework_reasons: Dict[int, str] = {}
+    if rules.framework_screen and framework_mode != PRESCREEN_OFF:
+        # Only screen rows that would otherwise be sent.
+        framework, framework_reasons = _framework_flags(store, keep & ~invalid)
+        if framework_mode == PRESCREEN_SKIP:
+            keep &= ~framework
+
+    issues: List[Tuple[str, int, str, str]] = []
+    for row in np.flatnonzero(short | invalid | framework):
+        sequence_id = store.sequence_id(row)
+        length = int(checks.lengths[row])
+        if short[row]:
+            severity = SEVERITY_REJECT if rules.reject_short else SEVERITY_WARNING
+            issues.append((sequence_id, length, severity, rules.short_reason))
+        if invalid[row]:
+            severity = SEVERITY_REJECT if rules.reject_invalid else SEVERITY_WARNING
+            positions = ", ".join(str(pos) for pos in checks.invalid_positions(row))
+            extra = int(checks.invalid_counts[row]) - _MAX_REPORTED_POSITIONS
+            suffix = f" (+{extra} more)" if extra > 0 else ""
+            issues.append(
+                (
+                    sequence_id,
+                    length,
+                    severity,
+                    f"{rules.invalid_reason} at position(s) {positions}{suffix}",
+                )
+            )
+        if framework[row]:
+            severity = (
+                SEVERITY_REJECT if framework_mode == PRESCREEN_SKIP else SEVERITY_WARNING
+            )
+            issues.append((sequence_id, length, severity, framework_reasons[row]))
+    return keep, issues
+
+
+def validate_store(
+    store: SequenceStore,
+    rules: ModelRules,
+    *,
+    framework_mode: str = PRESCREEN_OFF,
+    block_rows: int = _BLOCK_ROWS,
+) -> ValidationReport:
+    """Validate every row of ``store`` for one model, block by block.
+
+    ``report.keep`` is a boolean mask over the rows, so the accepted subset is
+    simply ``store[report.keep]``. When ``rules`` enable the framework
+    pre-screen, ``framework_mode`` decides whether sequences that are unlikely
+    to number are only flagged (``"warn"``) or dropped (``"skip"``).
+    """
+
+    masks: List[np.ndarray] = []
+    issues: List[Tuple[str, int, str, str]] = []
+    for first in range(0, len(store), block_rows):
+        block_keep, block_issues = _block_issues(
+            store[first : first + block_rows], rules, framework_mode
+        )
+        masks.append(block_keep)
+        issues.extend(block_issues)
+
+    keep = np.concatenate(masks) if masks else np.zeros(0, dtype=bool)
+    return ValidationReport(keep=keep, issues=pd.DataFrame(issues, columns=ISSUE_COLUMNS))
+
+
+def validate_records(
+    records: Iterable[Tuple[str, str]],
+    rules: ModelRules,
+    *,
+    framework_mode: str = PRESCREEN_OFF,
+) -> ValidationReport:
+    """Validate a record stream after cleaning and encoding it into a store."""
+
+    store = SequenceStore.from_records(
+        (sequence_id, clean_sequence(sequence)) for sequence_id, sequence in records
+    )
+    return validate_store(store, rules, framework_mode=framework_mode)
+
+
+__all__ = [
+    "ABNATIV_MIN_SEQUENCE_LENGTH",
+    "MODEL_RECOMMENDED_MIN_LENGTH",
+    "MODEL_RULES",
+    "ModelRules",
+    "SequenceChecks",
+    "ValidationReport",
+    "SEVERITY_REJECT",
+    "SEVERITY_WARNING",
+    "STANDARD_RESIDUES",
+    "clean_sequence",
+    "inspect_sequences",
+    "inspect_store",
+    "prepare_sequence",
+    "validate_records",
+    "validate_store",
+]
@@ -0,0 +1,231 @@
+"""Background warm-up probes and keep-warm heartbeat for the managed endpoints.
+
+Cloud Run scales idle services to zero, so whoever sends the first batch after
+a quiet spell pays every model's cold start. The app fires small probes in
+daemon threads instead: ``GET /`` plus one short canned request per model
+(``GET /`` only for NbForge), sent once with a short timeout. Probes for
+an endpoint are rate-limited process-wide, and the heartbeat only pings while
+some session has been active recently.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .api_client import get_json, post_json
+from .telemetry import request_tag
+
+ROOT_PROBE = "/"
+# 95 aa, the shortest input the Sequencing page sends to any model: enough to
+# load each model without paying for a full-size prediction.
+_WARMUP_SEQUENCE = (
+    "QVQLVESGGGLVQAGGSLRLSCAASGRTFSSYAMGWFRQAPGKEREFVAAISWSGGSTYYADSVKG"
+    "RFTISRDNAKNTVYLQMNSLKPEDTAVYY"
+)
+# NbForge predicts a full structure for any input, so it has no canned request;
+# warming it sends ``GET /`` instead.
+WARMUP_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    "abnativ": {
+        "sequence": _WARMUP_SEQUENCE,
+        "sequence_id": "warmup",
+        "nativeness_type": "VH2",
+        "do_align": False,
+        "is_vhh": True,
+    },
+    "nbframe": {
+        "sequence": _WARMUP_SEQUENCE,
+        "sequence_id": "warmup",
+        "kinked_threshold": 0.7,
+        "extended_threshold": 0.4,
+        "mode": "sequence",
+    },
+    "nanomelt": {"sequence": _WARMUP_SEQUENCE},
+}
+WARMUP_ENDPOINTS = [ROOT_PROBE, *WARMUP_PAYLOADS]
+
+_ENABLED = os.environ.get("SEQUENCE_WARMUP", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+    "off",
+}
+_PROBE_INTERVAL_SECONDS = max(
+    0.0, float(os.environ.get("SEQUENCE_WARMUP_INTERVAL_SECONDS", "600"))
+)
+_HEARTBEAT_SECONDS = max(
+    10.0, float(os.environ.get("SEQUENCE_KEEPWARM_SECONDS", "240"))
+)
+_ACTIVE_WINDOW_SECONDS = max(
+    0.0, float(os.environ.get("SEQUENCE_KEEPWARM_ACTIVE_SECONDS", "900"))
+)
+# One attempt with a short timeout: the request only has to reach the service
+# to start an instance, and a failed probe is not worth retrying.
+_PROBE_TIMEOUT_SECONDS = max(
+    0.1, float(os.environ.get("SEQUENCE_WARMUP_TIMEOUT_SECONDS", "5"))
+)
+_PROBE_TIMEOUT = (_PROBE_TIMEOUT_SECONDS, _PROBE_TIMEOUT_SECONDS)
+
+
+@dataclass
+class ProbeStatus:
+    last_started: float = 0.0
+    last_finished: float = 0.0
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+    in_flight: bool = False
+    probes: int = 0
+
+
+def _default_probe(endpoint: str) -> None:
+    payload = WARMUP_PAYLOADS.get(endpoint)
+    if payload is None:
+        get_json(ROOT_PROBE, timeout=_PROBE_TIMEOUT)
+    else:
+        post_json(
+            endpoint, payload, compress=False, max_attempts=1, timeout=_PROBE_TIMEOUT
+        )
+
+
+class EndpointWarmer:
+    """Fire rate-limited warm-up probes without ever blocking the caller."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = _ENABLED,
+        probe_interval_seconds: float = _PROBE_INTERVAL_SECONDS,
+        heartbeat_seconds: float = _HEARTBEAT_SECONDS,
+        active_window_seconds: float = _ACTIVE_WINDOW_SECONDS,
+        probe: Callable[[str], None] = _default_probe,
+    ) -> None:
+        self.enabled = enabled
+        self.probe_interval_seconds = probe_interval_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.active_window_seconds = active_window_seconds
+        self._probe = probe
+        self._status: Dict[str, ProbeStatus] = {}
+        self._last_activity = 0.0
+        self._heartbeat: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def warm(self, endpoints: Iterable[str] = WARMUP_ENDPOINTS) -> int:
+        """Start a background probe for each endpoint not probed recently.
+
+        Returns the number of probes started. Skipped entirely when no base URL
+        is configured.
+        """
+
+        if not self.enabled or not os.environ.get("SEQUENCE_LIBRARIES_URL"):
+            return 0
+
+        now = time.monotonic()
+        started = 0
+        with self._lock:
+            for endpoint in endpoints:
+                status = self._status.setdefault(endpoint, ProbeStatus())
+                if status.in_flight:
+                    continue
+                if status.probes and now - status.last_started < self.probe_interval_seconds:
+                    continue
+                status.in_flight = True
+                status.last_started = now
+                threading.Thread(
+                    target=self._run_probe,
+                    args=(endpoint, status),
+                    name=f"warmup-{endpoint.strip('/') or 'root'}",
+                    daemon=True,
+                ).start()
+                started += 1
+        return started
+
+    def touch(self) -> None:
+        """Record session activity and make sure the heartbeat is running."""
+
+        if not self.enabled:
+            return
+        with self._lock:
+            self._last_activity = time.monotonic()
+            if self._heartbeat is None or not self._heartbeat.is_alive():
+                self._heartbeat = threading.Thread(
+                    target=self._heartbeat_loop, name="keep-warm", daemon=True
+                )
+                self._heartbeat.start()
+
+    @property
+    def heartbeat_active(self) -> bool:
+        return self._heartbeat is not None and self._heartbeat.is_alive()
+
+    def status(self) -> Dict[str, ProbeStatus]:
+        with self._lock:
+            return {
+                endpoint: ProbeStatus(**vars(status))
+                for endpoint, status in self._status.items()
+            }
+
+    def _run_probe(self, endpoint: str, status: ProbeStatus) -> None:
+        started = time.monotonic()
+        error: Optional[str] = None
+        try:
+            with request_tag("warmup"):
+                self._probe(endpoint)
+        except Exception as exc:  # noqa: BLE001 - probes must never surface
+            error = str(exc)
+        finished = time.monotonic()
+        with self._lock:
+            status.in_flight = False
+            status.probes += 1
+            status.last_finished = finished
+            status.last_duration = finished - started
+            status.last_error = error
+
+    def _heartbeat_loop(self) -> None:
+        while True:
+            time.sleep(self.heartbeat_seconds)
+            with self._lock:
+                idle = time.monotonic() - self._last_activity
+            if idle > self.active_window_seconds:
+                # No session has been active for a while; let Cloud Run scale down.
+                return
+            # Root pings keep the instance alive; probe cadence stays rate-limited.
+            self._force(ROOT_PROBE)
+
+    def _force(self, endpoint: str) -> None:
+        with self._lock:
+            status = self._status.setdefault(endpoint, ProbeStatus())
+            if status.in_flight:
+                return
+            status.in_flight = True
+            status.last_started = time.monotonic()
+        if not os.environ.get("SEQUENCE_LIBRARIES_URL"):
+            with self._lock:
+                status.in_flight = False
+            return
+        self._run_probe(endpoint, status)
+
+
+_warmer: Optional[EndpointWarmer] = None
+_warmer_lock = threading.Lock()
+
+
+def get_warmer() -> EndpointWarmer:
+    """Return the process-wide warmer shared by every session."""
+
+    global _warmer
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = EndpointWarmer()
+        return _warmer
+
+
+__all__ = [
+    "EndpointWarmer",
+    "ProbeStatus",
+    "ROOT_PROBE",
+    "WARMUP_ENDPOINTS",
+    "WARMUP_PAYLOADS",
+    "get_warmer",
+]
@@ -35,10 +35,13 @@ setup(
     long_description=_read_readme(),
     long_description_content_type="text/markdown",
     url="https://huggingface.co/spaces/alihuss7/sequence",
-    packages=find_packages(exclude=("external*", "tests", "tests.*")),
+    packages=find_packages(
+        exclude=("external*", "tests", "tests.*", "benchmarks", "benchmarks.*")
+    ),
     include_package_data=True,
     python_requires=">=3.10",
     install_requires=_read_requirements(),
+    entry_points={"console_scripts": ["sequence-cli=services.cli:main"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Framework :: Streamlit",
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+import services.abnativ_client as abnativ_client
+from services.abnativ_client import run_abnativ
+from services.api_client import project_fields
+
+RESPONSE = {
+    "sequence_id": "ab1",
+    "scores": {
+        "AbNatiV VH2 Score": 0.91,
+        "framework_score": 0.8,
+        "residue_scores": [0.1, 0.2, 0.3],
+        "profile": {"cdr1": 0.5},
+    },
+    "alignment": {"aligned_sequence": "QVQL-", "numbering": list(range(128))},
+    "failures": [],
+}
+
+
+@pytest.fixture
+def requests_sent(monkeypatch):
+    sent = []
+
+    def post_json(path, payload, *, fields=None):
+        sent.append((path, payload, fields))
+        return RESPONSE if fields is None else project_fields(RESPONSE, fields)
+
+    monkeypatch.setattr(abnativ_client, "post_json", post_json)
+    return sent
+
+
+def test_project_fields_keeps_requested_keys_and_narrows_blocks():
+    payload = {"results": [RESPONSE, RESPONSE], "failures": ["x"]}
+    projected = project_fields(payload, {"sequence_id", "AbNatiV VH2 Score", "failures"})
+    assert projected == {
+        "results": [
+            {
+                "sequence_id": "ab1",
+                "scores": {"AbNatiV VH2 Score": 0.91},
+                "alignment": {},
+                "failures": [],
+            }
+        ]
+        * 2,
+        "failures": ["x"],
+    }
+
+
+def test_full_response_is_kept_only_with_keep_raw(requests_sent):
+    result = run_abnativ(" QVQL\n", output_id="ab1", keep_raw=True)
+    path, payload, fields = requests_sent[0]
+    assert (path, payload["sequence"], fields) == ("abnativ", "QVQL", None)
+    assert result.nativeness_score == pytest.approx(0.91)
+    assert result.raw_sequence_payload is RESPONSE
+    assert run_abnativ("QVQL", output_id="ab1").raw_sequence_payload is None
+
+
+def test_lean_mode_drops_alignment_and_per_residue_blocks(requests_sent):
+    result = run_abnativ("QVQL", output_id="ab1", keep_raw=True, lean=True)
+    assert requests_sent[0][2] == abnativ_client._LEAN_FIELDS
+    assert result.sequence_id == "ab1"
+    assert result.nativeness_score == pytest.approx(0.91)
+    assert result.raw_sequence_payload == {
+        "sequence_id": "ab1",
+        "scores": {"AbNatiV VH2 Score": 0.91, "framework_score": 0.8},
+        "alignment": {},
+        "failures": [],
+    }
+    # The decoded response itself is left untouched.
+    assert "residue_scores" in RESPONSE["scores"]
+
+
+def test_lean_mode_still_reports_failures(monkeypatch):
+    monkeypatch.setattr(
+        abnativ_client,
+        "post_json",
+        lambda path, payload, *, fields=None: {"failures": ["alignment failed"]},
+    )
+    with pytest.raises(RuntimeError, match="alignment failed"):
+        run_abnativ("QVQL", lean=True)
+
+
+def test_missing_score_lists_the_available_keys(monkeypatch):
+    monkeypatch.setattr(
+        abnativ_client,
+        "post_json",
+        lambda path, payload, *, fields=None: {"scores": {"humanness": 0.4}},
+    )
+    with pytest.raises(RuntimeError, match="Available keys: humanness"):
+        run_abnativ("QVQL", lean=True)
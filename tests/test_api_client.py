@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import services.api_client as api_client
+from services.api_client import post_json
+from services.tracing import JsonLogFormatter, log_event, logger, run_context, sequence_context
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Echo JSON bodies back; answer 415 to gzip bodies on ``reject_gzip`` paths."""
+
+    received = []
+    reject_gzip = set()
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        encoding = self.headers.get("Content-Encoding")
+        type(self).received.append((self.path, encoding, dict(self.headers)))
+        if encoding == "gzip":
+            if self.path.strip("/") in self.reject_gzip:
+                self._reply(415, {"detail": "gzip not supported"})
+                return
+            body = gzip.decompress(body)
+        self._reply(200, {"echo": json.loads(body)})
+
+    def _reply(self, status: int, payload: dict) -> None:
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    _Handler.received = []
+    _Handler.reject_gzip = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("SEQUENCE_LIBRARIES_URL", f"http://127.0.0.1:{httpd.server_port}")
+    monkeypatch.setattr(api_client, "_GZIP_MIN_BYTES", 256)
+    monkeypatch.setattr(api_client, "_GZIP_DISABLED_PATHS", set())
+    yield _Handler
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def timings(monkeypatch):
+    observed = []
+    monkeypatch.setattr(api_client, "observe_request", observed.append)
+    return observed
+
+
+@pytest.fixture
+def json_logs(monkeypatch):
+    """Capture the ``sequence`` logger as parsed JSON lines."""
+
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonLogFormatter())
+    monkeypatch.setattr(logger, "disabled", False)
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    yield lambda: [json.loads(line) for line in stream.getvalue().splitlines()]
+    logger.removeHandler(handler)
+    logger.setLevel(level)
+
+
+def _payload(size: int) -> dict:
+    return {"sequence": "Q" * size}
+
+
+def test_small_bodies_are_sent_uncompressed(server):
+    assert post_json("abnativ", _payload(10)) == {"echo": _payload(10)}
+    assert server.received[0][1] is None
+
+
+def test_bodies_at_the_threshold_are_gzipped(server):
+    payload = _payload(300)
+    assert post_json("abnativ", payload) == {"echo": payload}
+    assert server.received[0][1] == "gzip"
+
+
+def test_compress_false_overrides_the_threshold(server):
+    post_json("abnativ", _payload(300), compress=False)
+    assert server.received[0][1] is None
+
+
+def test_endpoints_can_opt_out(server):
+    api_client.disable_request_compression("/NbForge/")
+    post_json("nbforge", _payload(300))
+    post_json("abnativ", _payload(300))
+    assert [encoding for _, encoding, _ in server.received] == [None, "gzip"]
+
+
+def test_415_resends_uncompressed_within_one_attempt(server, timings):
+    server.reject_gzip = {"nanomelt"}
+    payload = _payload(300)
+
+    assert post_json("nanomelt", payload) == {"echo": payload}
+    assert [encoding for _, encoding, _ in server.received] == ["gzip", None]
+    assert timings[0].attempts == 1
+    assert timings[0].status_code == 200
+
+    # The endpoint is remembered as not accepting compressed bodies.
+    post_json("nanomelt", payload)
+    assert [encoding for _, encoding, _ in server.received[2:]] == [None]
+    assert "nanomelt" in api_client._GZIP_DISABLED_PATHS
+    assert timings[1].attempts == 1
+
+
+def _missing() -> api_client.JsonCodec:
+    raise ImportError("not installed")
+
+
+def _fake_codec(name: str):
+    return lambda: api_client.JsonCodec(name, api_client._stdlib_codec().dumps, json.loads)
+
+
+def test_codec_name_comes_from_the_environment(monkeypatch):
+    monkeypatch.setenv("SEQUENCE_JSON_CODEC", " JSON ")
+    codec = api_client.load_json_codec()
+    assert codec.name == "json"
+    assert codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+    assert api_client.load_json_codec("json").name == "json"
+
+
+def test_unknown_codec_is_rejected(monkeypatch):
+    monkeypatch.setenv("SEQUENCE_JSON_CODEC", "simdjson")
+    with pytest.raises(ValueError, match="choose from json, msgspec, orjson"):
+        api_client.load_json_codec()
+
+
+def test_auto_tries_orjson_then_msgspec_then_json(monkeypatch):
+    monkeypatch.delenv("SEQUENCE_JSON_CODEC", raising=False)
+    factories = {name: _fake_codec(name) for name in ("orjson", "msgspec", "json")}
+    monkeypatch.setattr(api_client, "_JSON_CODEC_FACTORIES", factories)
+    assert api_client.load_json_codec().name == "orjson"
+
+    factories["orjson"] = _missing
+    assert api_client.load_json_codec("auto").name == "msgspec"
+
+    factories["msgspec"] = _missing
+    assert api_client.load_json_codec().name == "json"
+
+
+def test_requested_codec_that_is_not_installed_raises(monkeypatch):
+    monkeypatch.setitem(api_client._JSON_CODEC_FACTORIES, "msgspec", _missing)
+    with pytest.raises(ImportError):
+        api_client.load_json_codec("msgspec")
+
+
+def _ids(headers: dict) -> tuple:
+    lowered = {key.lower(): value for key, value in headers.items()}
+    return lowered.get("x-run-id"), lowered.get("x-request-id")
+
+
+def test_run_and_request_ids_reach_the_backend_and_the_log(server, json_logs):
+    with run_context("run-1"):
+        post_json("abnativ", _payload(10))
+        post_json("nbforge", _payload(10))
+    post_json("abnativ", _payload(10))
+
+    sent = [_ids(headers) for _, _, headers in server.received]
+    assert [run_id for run_id, _ in sent] == ["run-1", "run-1", None]
+    request_ids = [request_id for _, request_id in sent]
+    assert len(set(request_ids)) == 3
+    assert all(len(request_id) == 32 for request_id in request_ids)
+
+    lines = [line for line in json_logs() if line["event"] == "api_request"]
+    assert [(line.get("run_id"), line["request_id"]) for line in lines] == sent
+
+
+def test_api_request_log_line_schema(server, json_logs):
+    with run_context("run-2"):
+        post_json("abnativ", _payload(10))
+
+    (line,) = json_logs()
+    assert set(line) == {
+        "ts", "level", "logger", "event", "run_id", "request_id", "endpoint", "method",
+        "tag", "attempts", "status", "request_bytes", "response_bytes", "connect_ms",
+        "ttfb_ms", "download_ms", "total_ms", "cold_start", "error",
+    }
+    assert (line["level"], line["logger"], line["event"]) == ("info", "sequence", "api_request")
+    assert (line["endpoint"], line["method"], line["tag"]) == ("abnativ", "POST", "request")
+    assert (line["attempts"], line["status"], line["error"]) == (1, 200, None)
+    assert isinstance(line["ts"], float) and line["total_ms"] >= line["ttfb_ms"] >= 0
+
+
+def test_log_fields_cannot_replace_the_record_metadata(json_logs):
+    with sequence_context("seq-7"):
+        log_event("custom", ts=0, level="debug", logger="other", event="renamed")
+    logger.info("plain %s", "text")
+
+    structured, plain = json_logs()
+    assert structured["event"] == "custom"
+    assert structured["sequence_id"] == "seq-7"
+    assert (structured["level"], structured["logger"]) == ("info", "sequence")
+    assert structured["ts"] > 0
+    assert plain["message"] == "plain text"
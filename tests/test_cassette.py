@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from services.cassette import (
+    Cassette,
+    CassetteMiss,
+    Interaction,
+    RecordingHTTPAdapter,
+    ReplayHTTPAdapter,
+    cassette_mode,
+    make_adapter,
+    request_key,
+    summarize,
+)
+from services.telemetry import RequestTimer, TelemetryRegistry
+
+
+class _Handler(BaseHTTPRequestHandler):
+    calls = 0
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        type(self).calls += 1
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body.get("sequence") == "flaky" and type(self).calls % 2:
+            status, payload = 503, {"detail": "warming up"}
+        else:
+            status, payload = 200, {"sequence_id": body["sequence_id"], "score": 0.5}
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Server-Timing", "inference;dur=12")
+        self.send_header("X-Unrecorded", "1")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def server():
+    _Handler.calls = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _session(adapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return session
+
+
+def _record(tmp_path, server, payloads):
+    path = str(tmp_path / "traffic.jsonl.gz")
+    session = _session(RecordingHTTPAdapter(Cassette(path)))
+    responses = [session.post(f"{server}/nbforge", json=payload) for payload in payloads]
+    return path, responses
+
+
+def test_request_key_ignores_key_order_host_and_gzip():
+    body = json.dumps({"b": 1, "a": [2, 3]}).encode()
+    reordered = json.dumps({"a": [2, 3], "b": 1}).encode()
+    key = request_key("post", "http://one/abnativ?x=1", body)
+    assert key == request_key("POST", "http://two/abnativ", reordered)
+    assert key == request_key("POST", "http://two/abnativ", gzip.compress(body), "gzip")
+    assert key != request_key("POST", "http://two/nbforge", body)
+    assert request_key("GET", "http://two", None).startswith("GET / ")
+
+
+def test_record_then_replay_without_the_server(tmp_path, server):
+    payload = {"sequence": "QVQL", "sequence_id": "ab1"}
+    path, recorded = _record(tmp_path, server, [payload])
+    assert recorded[0].json() == {"sequence_id": "ab1", "score": 0.5}
+
+    cassette = Cassette(path).load()
+    assert len(cassette) == 1
+    session = _session(ReplayHTTPAdapter(cassette, latency_scale=0))
+    replayed = session.post("http://cassette.invalid/nbforge", json=dict(reversed(payload.items())))
+
+    assert replayed.status_code == 200
+    assert replayed.json() == recorded[0].json()
+    assert replayed.headers["Server-Timing"] == "inference;dur=12"
+    assert "X-Unrecorded" not in replayed.headers
+    assert _Handler.calls == 1
+
+
+def test_repeated_requests_replay_in_order_and_the_last_repeats(tmp_path, server):
+    flaky = {"sequence": "flaky", "sequence_id": "ab2"}
+    path, recorded = _record(tmp_path, server, [flaky, flaky])
+    assert [response.status_code for response in recorded] == [503, 200]
+
+    session = _session(ReplayHTTPAdapter(Cassette(path).load(), latency_scale=0))
+    statuses = [session.post(f"{server}/nbforge", json=flaky).status_code for _ in range(3)]
+    assert statuses == [503, 200, 200]
+
+
+def test_replay_reproduces_the_recorded_ttfb_and_download_time(tmp_path):
+    path = str(tmp_path / "timed.jsonl.gz")
+    body = json.dumps({"score": 0.5}) * 200
+    key = request_key("POST", "http://any/abnativ", b"{}")
+    Cassette(path).append(
+        Interaction(
+            method="POST",
+            path="/abnativ",
+            request_key=key,
+            status_code=200,
+            reason="OK",
+            headers={},
+            body=body,
+            ttfb_seconds=0.2,
+            download_seconds=0.1,
+        )
+    )
+    session = _session(ReplayHTTPAdapter(Cassette(path).load(), latency_scale=0.5))
+
+    with RequestTimer("abnativ", "POST", registry=TelemetryRegistry()) as timer:
+        timer.start_attempt()
+        response = session.post("http://any/abnativ", data=b"{}", stream=True)
+        timer.headers_received(response)
+        assert timer.read_body(response) == body.encode()
+
+    assert timer.timing.ttfb_seconds == pytest.approx(0.1, abs=0.04)
+    assert timer.timing.download_seconds == pytest.approx(0.05, abs=0.04)
+
+
+def test_replay_miss_is_a_connection_error(tmp_path, server):
+    path, _ = _record(tmp_path, server, [{"sequence": "QVQL", "sequence_id": "ab1"}])
+    session = _session(ReplayHTTPAdapter(Cassette(path).load(), latency_scale=0))
+    with pytest.raises(CassetteMiss, match="No recorded response"):
+        session.post(f"{server}/nbforge", json={"sequence": "EVQL", "sequence_id": "ab1"})
+    assert issubclass(CassetteMiss, requests.ConnectionError)
+
+
+def test_appends_across_sessions_keep_one_version_header(tmp_path, server):
+    payload = {"sequence": "QVQL", "sequence_id": "ab1"}
+    path, _ = _record(tmp_path, server, [payload])
+    _record(tmp_path, server, [payload])
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        lines = [json.loads(line) for line in handle]
+    assert [line.get("version") for line in lines] == [1, None, None]
+    seconds = sum(line["ttfb_seconds"] + line["download_seconds"] for line in lines[1:])
+    assert summarize(path) == [
+        {"path": "/nbforge", "interactions": 2, "errors": 0, "seconds": pytest.approx(seconds)}
+    ]
+
+
+def test_newer_cassette_format_is_rejected(tmp_path):
+    path = tmp_path / "future.jsonl.gz"
+    path.write_bytes(gzip.compress(b'{"version": 99}\n'))
+    with pytest.raises(ValueError, match="format 99"):
+        Cassette(str(path)).load()
+
+
+def test_mode_comes_from_the_environment(monkeypatch, tmp_path, server):
+    monkeypatch.delenv("SEQUENCE_CASSETTE_MODE", raising=False)
+    assert cassette_mode() == "off"
+    monkeypatch.setenv("SEQUENCE_CASSETTE_MODE", "Replay")
+    monkeypatch.delenv("SEQUENCE_CASSETTE", raising=False)
+    with pytest.raises(ValueError, match="SEQUENCE_CASSETTE"):
+        cassette_mode()
+    monkeypatch.setenv("SEQUENCE_CASSETTE_MODE", "rewind")
+    with pytest.raises(ValueError, match="Unknown SEQUENCE_CASSETTE_MODE"):
+        cassette_mode()
+
+    path, _ = _record(tmp_path, server, [{"sequence": "QVQL", "sequence_id": "ab1"}])
+    monkeypatch.setenv("SEQUENCE_CASSETTE", path)
+    monkeypatch.setenv("SEQUENCE_CASSETTE_MODE", "record")
+    assert isinstance(make_adapter(4), RecordingHTTPAdapter)
+    monkeypatch.setenv("SEQUENCE_CASSETTE_MODE", "replay")
+    monkeypatch.setenv("SEQUENCE_CASSETTE_LATENCY_SCALE", "0")
+    adapter = make_adapter(4)
+    assert isinstance(adapter, ReplayHTTPAdapter)
+    assert (len(adapter.cassette), adapter.latency_scale) == (1, 0.0)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import export
+from services.export import (
+    FORMAT_ARROW,
+    FORMAT_CSV,
+    FORMAT_PARQUET,
+    cached_export,
+    discard_cached_exports,
+    export_filename,
+    export_results,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+RESULTS = pd.DataFrame(
+    {
+        "sequence_id": ["ab1", "ab2", "ab3"],
+        "score": [0.25, np.nan, 1.5],
+        "count": [1.0, np.nan, 3.0],
+        "status": [1, "HTTP 500", 2],
+    },
+    index=[10, 11, 12],
+)
+
+
+def _read(payload: bytes, file_format: str) -> pd.DataFrame:
+    if file_format == FORMAT_CSV:
+        return pd.read_csv(io.BytesIO(payload))
+    if file_format == FORMAT_PARQUET:
+        import pyarrow.parquet as pq
+
+        return pq.read_table(io.BytesIO(payload)).to_pandas()
+    return pa.ipc.open_file(pa.BufferReader(payload)).read_all().to_pandas()
+
+
+def test_csv_round_trip():
+    frame = _read(export_results(RESULTS), FORMAT_CSV)
+    assert frame["sequence_id"].tolist() == ["ab1", "ab2", "ab3"]
+    assert frame["status"].tolist() == ["1", "HTTP 500", "2"]
+    np.testing.assert_allclose(frame["score"], RESULTS["score"])
+
+
+@pytest.mark.parametrize("file_format", [FORMAT_PARQUET, FORMAT_ARROW])
+def test_columnar_round_trip(file_format):
+    payload = export_results(RESULTS, file_format)
+    frame = _read(payload, file_format)
+
+    assert frame.columns.tolist() == RESULTS.columns.tolist()
+    assert frame.index.tolist() == [0, 1, 2]
+    assert frame["sequence_id"].tolist() == ["ab1", "ab2", "ab3"]
+    np.testing.assert_allclose(frame["score"], RESULTS["score"])
+    # Missing values survive the narrowing to nullable integers.
+    assert frame["count"].tolist()[::2] == [1, 3]
+    assert pd.isna(frame["count"][1])
+    # Mixed numbers and error strings are stored as text.
+    assert frame["status"].tolist() == ["1", "HTTP 500", "2"]
+
+
+def test_to_arrow_table_narrows_numbers_unless_asked_not_to():
+    narrowed = export.to_arrow_table(RESULTS)
+    assert pa.types.is_int64(narrowed.schema.field("count").type)
+    assert pa.types.is_string(narrowed.schema.field("status").type)
+
+    kept = export.to_arrow_table(RESULTS, narrow_numbers=False)
+    assert pa.types.is_float64(kept.schema.field("count").type)
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported export format: xlsx"):
+        export_results(RESULTS, "xlsx")
+
+
+def test_cached_export_reuses_payloads_until_discarded(monkeypatch):
+    calls = []
+
+    def serialise(dataframe, file_format):
+        calls.append(file_format)
+        return f"{file_format}-{len(calls)}".encode()
+
+    monkeypatch.setattr(export, "export_results", serialise)
+    key = "test-cached-export"
+    assert cached_export(key, RESULTS, FORMAT_PARQUET) == b"parquet-1"
+    assert cached_export(key, RESULTS, FORMAT_PARQUET) == b"parquet-1"
+    assert cached_export(key, RESULTS, FORMAT_CSV) == b"csv-2"
+
+    discard_cached_exports(key)
+    assert cached_export(key, RESULTS, FORMAT_PARQUET) == b"parquet-3"
+    discard_cached_exports(key)
+
+
+def test_export_filename():
+    assert export_filename("results", FORMAT_ARROW) == "results.arrow"
+    assert export_filename("results") == "results.csv"
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from services.framework_screen import screen_framework
+
+VHH = (
+    "QVQLQESGGGLVQAGGSLRLSCAASGRTFSSYAMGWFRQAPGKEREFVAAISWSGGSTYYADSVKG"
+    "RFTISRDNAKNTVYLQMNSLKPEDTAVYYCAAGRYGSSWYPDSYDYWGQGTQVTVSS"
+)
+VH = (
+    "EVQLVESGGGLVQPGGSLRLSCAASGFTFSSYAMSWVRQAPGKGLEWVSAISWNSGSTYYADSVKG"
+    "RFTISRDNAKNTVYLQMNSLKPEDTAVYYCAKYPYYYGMDVWGQGTTVTVSS"
+)
+CYS1 = VHH.index("C")
+CYS2 = VHH.index("YYC") + 2
+FR4 = VHH.index("WGQG")
+
+
+@pytest.mark.parametrize("sequence", [VHH, VH, VHH.lower(), "MA" + VHH, VHH[3:]])
+def test_well_formed_domains_pass(sequence):
+    assert screen_framework(sequence) == []
+
+
+def test_missing_fr1_cysteine():
+    assert screen_framework(VHH.replace("C", "S", 1)) == [
+        "no conserved FR1 cysteine near position 22"
+    ]
+
+
+def test_non_antibody_sequence_fails_at_fr1():
+    assert screen_framework("MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKF" * 3) == [
+        "no conserved FR1 cysteine near position 22"
+    ]
+
+
+def test_missing_fr2_tryptophan_is_reported_with_the_rest_checked():
+    window = slice(CYS1 + 9, CYS1 + 25)
+    sequence = VHH[: window.start] + VHH[window].replace("W", "F") + VHH[window.stop :]
+    assert screen_framework(sequence) == ["no conserved FR2 tryptophan near position 36"]
+
+
+def test_missing_fr3_cysteine_stops_the_screen():
+    sequence = VHH[:CYS2] + "S" + VHH[CYS2 + 1 :]
+    assert screen_framework(sequence) == ["no conserved FR3 cysteine near position 92"]
+
+
+def test_truncated_before_fr4():
+    assert screen_framework(VHH[:FR4]) == ["no FR4 W-G-x-G motif after the CDR3"]
+
+
+def test_implausible_cdr3_span():
+    sequence = VHH[: CYS2 + 1] + "G" * 38 + VHH[FR4:]
+    assert screen_framework(sequence) == ["implausible CDR3 span of 38 residues"]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+
+from services.metrics import REGISTRY, observe_request
+from services.telemetry import REQUEST_TAG, RequestTiming
+
+
+def _timing(endpoint: str, tag: str = REQUEST_TAG, **fields) -> RequestTiming:
+    fields.setdefault("status_code", 200)
+    fields.setdefault("attempts", 1)
+    fields.setdefault("total_seconds", 0.2)
+    fields.setdefault("ttfb_seconds", 0.15)
+    return RequestTiming(endpoint=endpoint, method="POST", started_at=time.time(), tag=tag, **fields)
+
+
+def _samples(endpoint: str) -> dict:
+    """Exported samples for ``endpoint``, keyed by the full sample name."""
+
+    samples = {}
+    for line in REGISTRY.render().splitlines():
+        if line.startswith("#") or f'endpoint="{endpoint}"' not in line:
+            continue
+        name, _, value = line.rpartition(" ")
+        samples[name] = float(value)
+    return samples
+
+
+def test_user_requests_feed_the_request_series():
+    observe_request(_timing("metrics-user", attempts=3, cold_start=True, status_code=503))
+
+    samples = _samples("metrics-user")
+    assert samples['sequence_api_requests_total{endpoint="metrics-user",method="POST",status="503"}'] == 1
+    assert samples['sequence_api_retries_total{endpoint="metrics-user"}'] == 2
+    assert samples['sequence_api_cold_starts_total{endpoint="metrics-user"}'] == 1
+    assert samples['sequence_api_request_duration_seconds_count{endpoint="metrics-user",method="POST"}'] == 1
+    assert samples['sequence_api_ttfb_seconds_bucket{endpoint="metrics-user",method="POST",le="0.25"}'] == 1
+    assert not any("background" in name for name in samples)
+
+
+def test_warmup_probes_are_counted_apart():
+    observe_request(_timing("metrics-warm", tag="warmup", attempts=2, cold_start=True))
+    observe_request(_timing("metrics-warm", tag="warmup", status_code=None, ttfb_seconds=None))
+
+    samples = _samples("metrics-warm")
+    assert samples == {
+        'sequence_api_background_requests_total{endpoint="metrics-warm",tag="warmup",status="200",cold_start="true"}': 1,
+        'sequence_api_background_requests_total{endpoint="metrics-warm",tag="warmup",status="error",cold_start="false"}': 1,
+    }
+
+
+def test_background_counter_is_exported_with_help_and_type():
+    text = REGISTRY.render()
+    assert "# HELP sequence_api_background_requests_total " in text
+    assert "# TYPE sequence_api_background_requests_total counter" in text
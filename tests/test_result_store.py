@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import types
+
+import pandas as pd
+import pytest
+
+import services.result_store as result_store
+from services.metrics import RESULTS_RESIDENT_BYTES, RESULTS_SPILLED_BYTES, RESULTS_SPILL_READS
+from services.result_store import ResultStore
+
+
+def _frame(rows: int = 100, tag: str = "a") -> pd.DataFrame:
+    return pd.DataFrame(
+        {"sequence_id": [f"{tag}{i}" for i in range(rows)], "score": [float(i) for i in range(rows)]}
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = types.SimpleNamespace(now=1000.0)
+    fake.monotonic = lambda: fake.now
+    monkeypatch.setattr(result_store, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def make(**kwargs):
+        kwargs.setdefault("memory_budget_bytes", 1 << 30)
+        kwargs.setdefault("ttl_seconds", 3600.0)
+        kwargs.setdefault("idle_spill_seconds", 600.0)
+        store = ResultStore(spill_dir=str(tmp_path), **kwargs)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.clear()
+
+
+def test_put_and_get_keep_the_same_frame(make_store, clock):
+    store = make_store()
+    frame = _frame()
+    token = store.put(frame)
+    assert store.get(token) is frame
+    assert store.get("missing") is None
+    stats = store.stats()
+    assert (stats.resident_entries, stats.spilled_entries, stats.spills) == (1, 0, 0)
+    assert stats.resident_bytes == result_store._frame_nbytes(frame)
+
+
+def test_least_recent_table_spills_when_over_budget(make_store, clock):
+    nbytes = result_store._frame_nbytes(_frame())
+    store = make_store(memory_budget_bytes=int(nbytes * 1.5), max_resident_entry_bytes=nbytes)
+    first = store.put(_frame(tag="a"))
+    clock.now += 1
+    second = store.put(_frame(tag="b"))
+
+    stats = store.stats()
+    assert (stats.resident_entries, stats.spilled_entries, stats.spills) == (1, 1, 1)
+    assert stats.resident_bytes == nbytes
+    assert stats.spilled_bytes > 0
+    assert store._entries[first].path is not None
+    assert store._entries[second].dataframe is not None
+
+
+def test_spilled_table_is_readmitted_on_access(make_store, clock):
+    store = make_store(idle_spill_seconds=10.0)
+    frame = _frame()
+    token = store.put(frame)
+    clock.now += 11
+    store.get("missing")
+    assert store.stats().spilled_entries == 1
+    path = store._entries[token].path
+    del frame
+
+    loaded = store.get(token)
+    pd.testing.assert_frame_equal(loaded, _frame())
+    stats = store.stats()
+    assert (stats.resident_entries, stats.spilled_entries, stats.spilled_bytes) == (1, 0, 0)
+    assert not path.exists()
+    assert store.get(token) is loaded
+
+
+def test_oversized_table_stays_on_disk_and_reuses_the_loaded_frame(make_store, clock):
+    store = make_store(max_resident_entry_bytes=1)
+    token = store.put(_frame())
+    stats = store.stats()
+    assert (stats.resident_bytes, stats.spilled_entries) == (0, 1)
+
+    reads = RESULTS_SPILL_READS.value()
+    loaded = store.get(token)
+    pd.testing.assert_frame_equal(loaded, _frame())
+    assert store.get(token) is loaded
+    assert store.stats().spilled_entries == 1
+    # Only the metrics-publishing store counts disk reads.
+    assert RESULTS_SPILL_READS.value() == reads
+
+
+def test_spilled_table_is_read_back_without_copying_columns(make_store, clock):
+    store = make_store(max_resident_entry_bytes=1)
+    loaded = store.get(store.put(_frame()))
+
+    assert not loaded["score"].to_numpy().flags.owndata
+    assert loaded["sequence_id"].dtype.storage == "pyarrow"
+    assert loaded["sequence_id"].tolist() == _frame()["sequence_id"].tolist()
+
+
+def test_ttl_evicts_resident_and_spilled_tables(make_store, clock, tmp_path):
+    store = make_store(ttl_seconds=100.0, idle_spill_seconds=50.0)
+    token = store.put(_frame())
+    clock.now += 60
+    store.get("missing")
+    assert store.stats().spilled_entries == 1
+
+    clock.now += 50
+    assert store.get(token) is None
+    stats = store.stats()
+    assert (stats.resident_entries, stats.spilled_entries, stats.evictions) == (0, 0, 1)
+    assert stats.spilled_bytes == 0
+    assert not list(tmp_path.rglob("*.arrow"))
+
+
+def test_discard_and_clear_remove_files(make_store, clock, tmp_path):
+    store = make_store(max_resident_entry_bytes=1)
+    first = store.put(_frame())
+    store.put(_frame(tag="b"))
+    assert len(list(tmp_path.rglob("*.arrow"))) == 2
+
+    store.discard(first)
+    assert store.get(first) is None
+    assert len(list(tmp_path.rglob("*.arrow"))) == 1
+
+    store.clear()
+    stats = store.stats()
+    assert (stats.resident_bytes, stats.spilled_bytes) == (0, 0)
+    assert not list(tmp_path.iterdir())
+
+
+def test_missing_spill_file_reads_as_evicted(make_store, clock):
+    store = make_store(max_resident_entry_bytes=1)
+    token = store.put(_frame())
+    store._entries[token].path.unlink()
+    assert store.get(token) is None
+
+
+def test_failed_spill_keeps_the_table_resident(make_store, clock, monkeypatch):
+    def fail(dataframe, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ResultStore, "_write", staticmethod(fail))
+    store = make_store(max_resident_entry_bytes=1)
+    frame = _frame()
+    token = store.put(frame)
+    assert store.get(token) is frame
+    stats = store.stats()
+    assert (stats.resident_entries, stats.spills) == (1, 0)
+
+
+def test_published_gauges_follow_the_store(make_store, clock):
+    store = make_store(max_resident_entry_bytes=1, publish_metrics=True)
+    store.put(_frame())
+    stats = store.stats()
+    assert RESULTS_RESIDENT_BYTES.value() == stats.resident_bytes == 0
+    assert RESULTS_SPILLED_BYTES.value() == stats.spilled_bytes > 0
+    store.clear()
+    assert RESULTS_SPILLED_BYTES.value() == 0
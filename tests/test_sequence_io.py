@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+import services.sequence_io as sequence_io
+from services.sequence_io import (
+    COMPRESSION_SUFFIXES,
+    CSV_SUFFIXES,
+    FASTA_SUFFIXES,
+    PARQUET_SUFFIXES,
+    SUPPORTED_UPLOAD_TYPES,
+    iter_csv_sequences,
+    iter_fasta_sequences,
+    iter_parquet_sequences,
+    iter_uploaded_sequences,
+)
+
+CSV_TEXT = "Name,Sequence\nab1,QVQLVES\nab2, EVQLLES \n,\nab3,DVQLQES\n"
+FASTA_TEXT = ">ab1 first clone\nQVQL\nVES\n; comment\n\n>ab2\nEVQLLES\n"
+EXPECTED_CSV = [("ab1", "QVQLVES"), ("ab2", "EVQLLES"), ("ab3", "DVQLQES")]
+EXPECTED_FASTA = [("ab1", "QVQLVES"), ("ab2", "EVQLLES")]
+
+
+def _parquet_bytes(frame: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+def test_csv_resolves_column_aliases_and_skips_blank_rows():
+    assert list(iter_csv_sequences(io.BytesIO(CSV_TEXT.encode()))) == EXPECTED_CSV
+
+
+def test_csv_without_id_column_numbers_rows():
+    stream = io.BytesIO(b"\xef\xbb\xbfvh\nQVQL\nEVQL\n")
+    assert list(iter_csv_sequences(stream)) == [
+        ("csv_sequence_1", "QVQL"),
+        ("csv_sequence_2", "EVQL"),
+    ]
+
+
+def test_csv_header_errors_surface_before_iteration():
+    with pytest.raises(ValueError, match="sequence column"):
+        iter_csv_sequences(io.BytesIO(b"name,score\na,1\n"))
+
+
+def test_csv_is_parsed_lazily():
+    records = iter_csv_sequences(io.BytesIO(CSV_TEXT.encode()))
+    assert next(records) == EXPECTED_CSV[0]
+
+
+def test_csv_without_sequences_raises_once_consumed():
+    records = iter_csv_sequences(io.BytesIO(b"sequence\n\n"))
+    with pytest.raises(ValueError, match="No valid sequences"):
+        list(records)
+
+
+def test_fasta_joins_multiline_records_and_uses_first_header_token():
+    assert list(iter_fasta_sequences(io.BytesIO(FASTA_TEXT.encode()))) == EXPECTED_FASTA
+
+
+def test_fasta_requires_a_header():
+    with pytest.raises(ValueError, match="must start with a '>'"):
+        list(iter_fasta_sequences(io.BytesIO(b"QVQL\n")))
+
+
+def test_parquet_reads_only_the_sequence_and_id_columns():
+    payload = _parquet_bytes(
+        pd.DataFrame(
+            {
+                "id": ["ab1", None, "ab3"],
+                "score": [1.0, 2.0, 3.0],
+                "sequence": ["QVQL", "EVQL", None],
+            }
+        )
+    )
+    assert list(iter_parquet_sequences(io.BytesIO(payload))) == [
+        ("ab1", "QVQL"),
+        ("parquet_sequence_2", "EVQL"),
+    ]
+
+
+def test_parquet_keeps_falsy_ids():
+    payload = _parquet_bytes(pd.DataFrame({"id": [0, 1], "sequence": ["QVQL", "EVQL"]}))
+    assert list(iter_parquet_sequences(io.BytesIO(payload))) == [("0", "QVQL"), ("1", "EVQL")]
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Gzip readers opened by ``iter_uploaded_sequences``."""
+
+    readers = []
+
+    def decompressed(stream, compression):
+        readers.append(gzip.GzipFile(fileobj=stream, mode="rb"))
+        return readers[-1]
+
+    monkeypatch.setattr(sequence_io, "_decompressed", decompressed)
+    return readers
+
+
+@pytest.mark.parametrize("name, text", [("a.csv.gz", CSV_TEXT), ("a.fa.gz", FASTA_TEXT)])
+def test_decompressor_is_closed_with_the_records(opened, name, text):
+    upload = io.BytesIO(gzip.compress(text.encode()))
+    records = iter_uploaded_sequences(upload, name)
+    assert not opened[-1].closed
+
+    list(records)
+    assert opened[-1].closed
+    assert not upload.closed
+
+
+def test_decompressor_is_closed_on_a_header_error(opened):
+    with pytest.raises(ValueError, match="sequence column"):
+        iter_uploaded_sequences(io.BytesIO(gzip.compress(b"name\na\n")), "a.csv.gz")
+    assert opened[-1].closed
+
+
+@pytest.mark.parametrize(
+    "name", ["library.csv", "library.csv.gz", "library.csv.gzip", "library.txt", ""]
+)
+def test_uploaded_csv_by_name_or_sniffing(name):
+    payload = CSV_TEXT.encode()
+    if name.endswith(("gz", "gzip")):
+        payload = gzip.compress(payload)
+    assert list(iter_uploaded_sequences(io.BytesIO(payload), name)) == EXPECTED_CSV
+
+
+@pytest.mark.parametrize("name", ["library.fna", "library.fa.gz", "library.dat", ""])
+def test_uploaded_fasta_by_name_or_sniffing(name):
+    payload = FASTA_TEXT.encode()
+    if name.endswith(".gz"):
+        payload = gzip.compress(payload)
+    assert list(iter_uploaded_sequences(io.BytesIO(payload), name)) == EXPECTED_FASTA
+
+
+def test_gzip_is_sniffed_without_a_compression_suffix():
+    payload = gzip.compress(FASTA_TEXT.encode())
+    assert list(iter_uploaded_sequences(io.BytesIO(payload), "library.fasta")) == (
+        EXPECTED_FASTA
+    )
+
+
+def test_uploaded_zstd():
+    zstandard = pytest.importorskip("zstandard")
+    payload = zstandard.ZstdCompressor().compress(FASTA_TEXT.encode())
+    for name in ("library.fasta.zst", "library.fasta.zstd", "library"):
+        assert list(iter_uploaded_sequences(io.BytesIO(payload), name)) == EXPECTED_FASTA
+
+
+@pytest.mark.parametrize("name", ["library.parquet", "library.pq", "library"])
+def test_uploaded_parquet(name):
+    payload = _parquet_bytes(pd.DataFrame({"name": ["ab1"], "heavy_chain": ["QVQL"]}))
+    assert list(iter_uploaded_sequences(io.BytesIO(payload), name)) == [("ab1", "QVQL")]
+
+
+def test_compressed_parquet_is_rejected():
+    with pytest.raises(ValueError, match="Compressed Parquet"):
+        iter_uploaded_sequences(io.BytesIO(b"PAR1"), "library.parquet.gz")
+
+
+def test_supported_upload_types_cover_every_suffix():
+    suffixes = CSV_SUFFIXES | FASTA_SUFFIXES | PARQUET_SUFFIXES | set(COMPRESSION_SUFFIXES)
+    assert sorted(SUPPORTED_UPLOAD_TYPES) == sorted(s.lstrip(".") for s in suffixes)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import services.sequence_store as sequence_store
+from services.sequence_store import SequenceStore
+
+RECORDS = [("a", "QVQL"), ("b", "EVQL"), ("c", "QVQL"), ("d", ""), ("é", "DVQL")]
+
+
+def _reference_unique(records):
+    slots = {}
+    inverse = [slots.setdefault(sequence, len(slots)) for _, sequence in records]
+    return list(slots), inverse
+
+
+@pytest.fixture
+def store():
+    return SequenceStore.from_records(RECORDS, chunk_records=2)
+
+
+def test_round_trip(store):
+    assert len(store) == len(RECORDS)
+    assert list(store) == RECORDS
+    assert store.sequence_id(4) == "é"
+    assert store.sequence(1) == "EVQL"
+    assert bytes(store.sequence_key(2)) == b"QVQL"
+    assert store.lengths.tolist() == [4, 4, 4, 0, 4]
+
+
+def test_non_ascii_residues_become_question_marks():
+    assert list(SequenceStore.from_records([("x", "QVλL")])) == [("x", "QV?L")]
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [slice(1, 4), np.array([True, False, True, False, True]), np.array([4, 0, 0])],
+)
+def test_views_share_buffers(store, rows):
+    view = store[rows]
+    expected = [RECORDS[i] for i in np.arange(len(RECORDS))[rows]]
+    assert list(view) == expected
+    assert view.residues.base is store.residues.base or np.shares_memory(
+        view.residues, store.residues
+    )
+
+
+def test_unique_keeps_first_occurrences_in_order(store):
+    unique_rows, inverse = store.unique()
+    assert [s for _, s in unique_rows] == ["QVQL", "EVQL", "", "DVQL"]
+    assert [i for i, _ in unique_rows] == ["a", "b", "d", "é"]
+    assert inverse.tolist() == [0, 1, 0, 2, 3]
+
+
+def test_unique_of_empty_store():
+    unique_rows, inverse = SequenceStore.from_records([]).unique()
+    assert len(unique_rows) == 0
+    assert inverse.size == 0
+
+
+@pytest.mark.parametrize("multiplier", [None, 0, 1])
+def test_unique_matches_reference_even_with_hash_collisions(monkeypatch, multiplier):
+    # A zero multiplier hashes rows by length only; one hashes by residue sum.
+    if multiplier is not None:
+        monkeypatch.setattr(sequence_store, "_HASH_MULTIPLIER", np.uint64(multiplier))
+    rng = np.random.default_rng(0)
+    pool = ["".join(rng.choice(list("ACDE"), size=rng.integers(0, 7))) for _ in range(12)]
+    records = [(str(i), pool[rng.integers(len(pool))]) for i in range(300)]
+    store = SequenceStore.from_records(records)[5:]
+
+    unique_rows, inverse = store.unique()
+    expected_sequences, expected_inverse = _reference_unique(records[5:])
+    assert [s for _, s in unique_rows] == expected_sequences
+    assert inverse.tolist() == expected_inverse
+
+
+def _dispatch(monkeypatch, records, respond):
+    """Run ``records`` through the page's dedup, dispatch and expansion steps."""
+
+    sequencing = pytest.importorskip("pages.sequencing")
+    import services.nbforge_client as nbforge_client
+
+    captions, sent = [], []
+    monkeypatch.setattr(sequencing.st, "caption", captions.append)
+
+    def post_json(path, payload, *, fields=None):
+        sent.append(payload["vhh_name"])
+        return respond(payload)
+
+    monkeypatch.setattr(nbforge_client, "post_json", post_json)
+    rows = SequenceStore.from_records(records)
+    unique_rows, inverse = rows.unique()
+    outcomes = []
+    results, failures = sequencing._run_model(
+        sequencing.MODEL_NBFORGE, unique_rows, outcomes.append
+    )
+    expanded, failures = sequencing._expand_duplicates(
+        results, failures, outcomes, rows, unique_rows, inverse
+    )
+    return sent, expanded, failures, captions
+
+
+def test_duplicates_are_sent_once_under_their_first_id(monkeypatch):
+    def respond(payload):
+        if payload["sequence"] == "S3":
+            raise RuntimeError("timed out")
+        return {"score": float(payload["sequence"][1])}
+
+    sent, expanded, failures, captions = _dispatch(
+        monkeypatch, [("A", "S1"), ("B", "S1"), ("A", "S2"), ("C", "S3")], respond
+    )
+
+    assert sent == ["A", "A", "C"]
+    assert expanded[["sequence_id", "sequence", "score"]].to_dict("list") == {
+        "sequence_id": ["A", "B", "A"],
+        "sequence": ["S1", "S1", "S2"],
+        "score": [1.0, 1.0, 2.0],
+    }
+    assert failures == ["C: timed out"]
+    assert captions == ["1 duplicate sequence(s) were sent once and reuse that result."]
+
+
+def test_failures_are_repeated_for_every_copy(monkeypatch):
+    def respond(payload):
+        raise RuntimeError("HTTP 500")
+
+    sent, expanded, failures, _ = _dispatch(
+        monkeypatch, [("x", "S1"), ("y", "S1"), ("x", "S2")], respond
+    )
+
+    assert sent == ["x", "x"]
+    assert expanded.empty
+    assert failures == ["x: HTTP 500", "y: HTTP 500", "x: HTTP 500"]
+
+
+def test_expand_duplicates_skips_inputs_the_runner_dropped(monkeypatch):
+    sequencing = pytest.importorskip("pages.sequencing")
+    monkeypatch.setattr(sequencing.st, "caption", lambda text: None)
+    rows = SequenceStore.from_records([("a", ""), ("b", "S1"), ("c", "")])
+    unique_rows, inverse = rows.unique()
+    results = pd.DataFrame({"sequence_id": ["b"], "score": [1.0]})
+
+    expanded, failures = sequencing._expand_duplicates(
+        results, [], [None, True], rows, unique_rows, inverse
+    )
+
+    assert expanded.to_dict("list") == {"sequence_id": ["b"], "score": [1.0]}
+    assert failures == []
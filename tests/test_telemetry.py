@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from services.telemetry import (
+    COLD_AFTER_IDLE,
+    COLD_FIRST_CALL,
+    COLD_TTFB_OUTLIER,
+    RequestTiming,
+    TelemetryRegistry,
+)
+
+
+def _record(registry: TelemetryRegistry, started_at: float, ttfb: float | None) -> RequestTiming:
+    timing = RequestTiming(
+        endpoint="abnativ",
+        method="POST",
+        started_at=started_at,
+        attempts=1,
+        ttfb_seconds=ttfb,
+        total_seconds=ttfb or 0.0,
+        error=None if ttfb is not None else "ConnectionError",
+    )
+    registry.record(timing)
+    return timing
+
+
+@pytest.fixture
+def registry():
+    return TelemetryRegistry(idle_seconds=60.0)
+
+
+def _warm_up(registry: TelemetryRegistry, samples: int = 5, ttfb: float = 0.1) -> float:
+    """Record a first call plus ``samples`` warm calls; return the time of the last."""
+
+    _record(registry, 0.0, ttfb)
+    for second in range(1, samples + 1):
+        _record(registry, float(second), ttfb)
+    return float(samples) + ttfb
+
+
+def test_first_call_is_cold_and_the_next_is_warm(registry):
+    first = _record(registry, 0.0, 0.1)
+    second = _record(registry, 1.0, 0.1)
+
+    assert (first.cold_start, first.cold_start_reason) == (True, COLD_FIRST_CALL)
+    assert (second.cold_start, second.cold_start_reason) == (False, None)
+    assert registry.summary().loc[0, "cold_starts"] == 1
+
+
+def test_call_after_an_idle_gap_is_cold_only_when_slower(registry):
+    last = _warm_up(registry)
+
+    slow = _record(registry, last + 61.0, 0.3)
+    assert (slow.cold_start, slow.cold_start_reason) == (True, COLD_AFTER_IDLE)
+
+    fast = _record(registry, slow.started_at + 61.0, 0.12)
+    assert not fast.cold_start
+
+
+def test_idle_gap_without_a_baseline_is_cold(registry):
+    _record(registry, 0.0, 0.1)
+    timing = _record(registry, 100.0, 0.1)
+    assert (timing.cold_start, timing.cold_start_reason) == (True, COLD_AFTER_IDLE)
+
+
+def test_ttfb_far_above_the_warm_median_is_cold(registry):
+    last = _warm_up(registry)
+
+    outlier = _record(registry, last + 1.0, 2.0)
+    assert (outlier.cold_start, outlier.cold_start_reason) == (True, COLD_TTFB_OUTLIER)
+
+    # Three times the median but under a second slower is ordinary jitter.
+    jitter = _record(registry, last + 4.0, 0.5)
+    assert not jitter.cold_start
+
+
+def test_outlier_needs_enough_warm_samples(registry):
+    last = _warm_up(registry, samples=3)
+    assert not _record(registry, last + 1.0, 5.0).cold_start
+
+
+def test_failed_calls_without_ttfb_are_not_classified(registry):
+    failed = _record(registry, 0.0, None)
+    assert (failed.cold_start, failed.cold_start_reason) == (False, None)
+
+    # The failure still counts as activity, so the next call is not a first call.
+    assert not _record(registry, 1.0, 0.1).cold_start
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+
+from services.framework_screen import PRESCREEN_SKIP, PRESCREEN_WARN
+from services.sequence_store import SequenceStore
+from services.validation import (
+    MODEL_RULES,
+    SEVERITY_REJECT,
+    SEVERITY_WARNING,
+    inspect_sequences,
+    inspect_store,
+    prepare_sequence,
+    validate_records,
+    validate_store,
+)
+
+VHH = (
+    "QVQLQESGGGLVQAGGSLRLSCAASGRTFSSYAMGWFRQAPGKEREFVAAISWSGGSTYYADSVKG"
+    "RFTISRDNAKNTVYLQMNSLKPEDTAVYYCAAGRYGSSWYPDSYDYWGQGTQVTVSS"
+)
+
+
+def test_inspect_store_counts_lengths_and_invalid_residues():
+    checks = inspect_sequences(["ACDE", "acxz", "", "AC-*B"])
+    assert checks.lengths.tolist() == [4, 4, 0, 5]
+    assert checks.invalid_counts.tolist() == [0, 2, 0, 3]
+    assert checks.invalid_positions(1) == [3, 4]
+    assert checks.invalid_positions(3, limit=2) == [3, 4]
+
+
+def test_inspect_store_on_a_view_only_covers_its_rows():
+    store = SequenceStore.from_records([("a", "XXXX"), ("b", "ACDE"), ("c", "AXC")])
+    checks = inspect_store(store[1:])
+    assert checks.lengths.tolist() == [4, 3]
+    assert checks.invalid_counts.tolist() == [0, 1]
+    assert checks.invalid_positions(1) == [2]
+
+
+def test_inspect_store_empty():
+    checks = inspect_store(SequenceStore.from_records([]))
+    assert checks.lengths.size == 0
+
+
+def test_validate_store_rejects_short_and_invalid_for_abnativ():
+    store = SequenceStore.from_records(
+        [("ok", VHH), ("short", VHH[:40]), ("bad", VHH[:-1] + "X")]
+    )
+    report = validate_store(store, MODEL_RULES["abnativ"])
+    assert report.keep.tolist() == [True, False, False]
+    assert (report.total, report.accepted, report.rejected) == (3, 1, 2)
+    assert set(report.issues["sequence_id"]) == {"short", "bad"}
+    assert set(report.issues["severity"]) == {SEVERITY_REJECT}
+    bad = report.issues[report.issues["sequence_id"] == "bad"].iloc[0]
+    assert f"position(s) {len(VHH)}" in bad["reason"]
+
+
+def test_validate_store_only_warns_for_advisory_models():
+    store = SequenceStore.from_records([("short", "ACDEX")])
+    report = validate_store(store, MODEL_RULES["nanomelt"])
+    assert report.keep.tolist() == [True]
+    assert set(report.issues["severity"]) == {SEVERITY_WARNING}
+    assert len(report.issues) == 2
+
+
+def test_framework_prescreen_warns_or_skips():
+    gfp = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKF" * 3
+    records = [("vhh", VHH), ("gfp", gfp)]
+    rules = MODEL_RULES["nbframe"]
+
+    warned = validate_records(records, rules, framework_mode=PRESCREEN_WARN)
+    assert warned.keep.tolist() == [True, True]
+    flagged = warned.issues[warned.issues["reason"].str.contains("antibody numbering")]
+    assert flagged["sequence_id"].tolist() == ["gfp"]
+    assert flagged["severity"].tolist() == [SEVERITY_WARNING]
+
+    skipped = validate_records(records, rules, framework_mode=PRESCREEN_SKIP)
+    assert skipped.keep.tolist() == [True, False]
+
+
+def test_validate_store_is_consistent_across_blocks():
+    records = [(str(i), VHH if i % 3 else VHH[:50]) for i in range(10)]
+    store = SequenceStore.from_records(records)
+    whole = validate_store(store, MODEL_RULES["abnativ"])
+    blocked = validate_store(store, MODEL_RULES["abnativ"], block_rows=4)
+    np.testing.assert_array_equal(whole.keep, blocked.keep)
+    assert whole.issues.equals(blocked.issues)
+
+
+def test_prepare_sequence_uppercases_only_when_the_model_asks():
+    assert prepare_sequence(" qvql\n", MODEL_RULES["abnativ"]) == "QVQL"
+    assert prepare_sequence(" qvql\n", MODEL_RULES["nbforge"]) == "qvql"